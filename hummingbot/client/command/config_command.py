@@ -73,6 +73,9 @@ client_configs_to_display = ["autofill_import",
                              "gateway",
                              "gateway_api_host",
                              "gateway_api_port",
+                             "gateway_connection_limit",
+                             "gateway_keepalive_timeout",
+                             "gateway_request_timeout",
                              "rate_oracle_source",
                              "extra_tokens",
                              "fetch_pairs_from_all_exchanges",
@@ -85,10 +88,17 @@ client_configs_to_display = ["autofill_import",
                              "other_commands_timeout",
                              "tables_format",
                              "tick_size",
+                             "event_driven_ticks",
+                             "min_event_tick_interval",
+                             "order_book_direct_dispatch",
                              "market_data_collection",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "trades_csv",
+                             "trades_csv_max_size",
+                             "trades_csv_rotate_daily",
+                             "trades_csv_buffer_size",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
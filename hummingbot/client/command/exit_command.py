@@ -35,5 +35,9 @@ class ExitCommand:
         for notifier in self.notifiers:
             notifier.stop()
 
+        # Commits the records still queued by the markets recorder, the writes are applied from a daemon thread
+        if self.markets_recorder is not None:
+            self.markets_recorder.stop()
+
         self.app.exit()
         self.mqtt_stop()
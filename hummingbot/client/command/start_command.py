@@ -21,6 +21,7 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
@@ -32,6 +33,17 @@ if TYPE_CHECKING:
 
 
 GATEWAY_READY_TIMEOUT = 300  # seconds
+# Order updates that trigger a tick of the strategy when the clock is event driven
+STRATEGY_TICK_MARKET_EVENTS = [
+    MarketEvent.BuyOrderCreated,
+    MarketEvent.SellOrderCreated,
+    MarketEvent.OrderFilled,
+    MarketEvent.OrderCancelled,
+    MarketEvent.OrderExpired,
+    MarketEvent.OrderFailure,
+    MarketEvent.BuyOrderCompleted,
+    MarketEvent.SellOrderCompleted,
+]
 
 
 class StartCommand(GatewayChainApiManager):
@@ -257,7 +269,10 @@ class StartCommand(GatewayChainApiManager):
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            self.clock = Clock(ClockMode.REALTIME,
+                               tick_size=tick_size,
+                               event_driven=self.client_config_map.event_driven_ticks,
+                               min_event_tick_interval=self.client_config_map.min_event_tick_interval)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -267,6 +282,8 @@ class StartCommand(GatewayChainApiManager):
                         await market.cancel_all(10.0)
             if self.strategy:
                 self.clock.add_iterator(self.strategy)
+                if self.clock.event_driven:
+                    safe_ensure_future(self.wait_till_ready(self._subscribe_strategy_to_market_events))
             try:
                 self._pmm_script_iterator = self.client_config_map.pmm_script_mode.get_iterator(
                     self.strategy_name, list(self.markets.values()), self.strategy
@@ -287,6 +304,21 @@ class StartCommand(GatewayChainApiManager):
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    def _subscribe_strategy_to_market_events(self,  # type: HummingbotApplication
+                                             ):
+        """
+        Ticks the strategy, besides the fixed ticks, when the top of an order book of its markets changes or when one
+        of its orders is updated. The order books are only available once the markets are ready.
+        """
+        for market in self.markets.values():
+            if market is None:
+                continue
+            self.clock.subscribe_iterator_to_events(self.strategy, market, STRATEGY_TICK_MARKET_EVENTS)
+            for order_book in market.order_books.values():
+                self.clock.subscribe_iterator_to_events(
+                    self.strategy, order_book, [OrderBookEvent.TopOfBookChangedEvent]
+                )
+
     def _initialize_strategy(self, strategy_name: str):
         if self.is_current_strategy_script_strategy():
             self.start_script_strategy()
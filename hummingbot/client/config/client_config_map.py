@@ -13,7 +13,7 @@ from tabulate import tabulate_formats
 
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientConfigEnum, ClientFieldData
 from hummingbot.client.config.config_methods import using_exchange as using_exchange_pointer
-from hummingbot.client.config.config_validators import validate_bool, validate_float
+from hummingbot.client.config.config_validators import validate_bool, validate_float, validate_int
 from hummingbot.client.settings import (
     DEFAULT_GATEWAY_CERTS_PATH,
     DEFAULT_LOG_FILE_PATH,
@@ -184,6 +184,63 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         title = "market_data_collection"
 
 
+class TradesCSVConfigMap(BaseClientModel):
+    trades_csv_max_size: float = Field(
+        default=0,
+        ge=0,
+        description="Size in MB at which the trades CSV file of a strategy is rotated. 0 to never rotate it by size.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the size in MB at which the trades CSV file is rotated (Enter 0 to never rotate it by size)"
+            ),
+        ),
+    )
+    trades_csv_rotate_daily: bool = Field(
+        default=False,
+        description="Rotate the trades CSV file of a strategy when the UTC date changes.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Do you want to rotate the trades CSV file every day? (Yes/No)",
+        ),
+    )
+    trades_csv_buffer_size: int = Field(
+        default=64,
+        ge=1,
+        description="Size in KB of the write buffer of the trades CSV file. The buffer is also flushed after every"
+                    " batch of trades written to the database.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Set the size in KB of the trades CSV file write buffer (Default=64)",
+        ),
+    )
+
+    class Config:
+        title = "trades_csv"
+
+    @validator("trades_csv_max_size", pre=True)
+    def validate_trades_csv_max_size(cls, v: float):
+        """Used for client-friendly error output."""
+        ret = validate_float(v, min_value=0)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
+    @validator("trades_csv_rotate_daily", pre=True)
+    def validate_trades_csv_rotate_daily(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+    @validator("trades_csv_buffer_size", pre=True)
+    def validate_trades_csv_buffer_size(cls, v: int):
+        """Used for client-friendly error output."""
+        ret = validate_int(v, min_value=1)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -330,12 +387,55 @@ class PaperTradeConfigMap(BaseClientModel):
         ),
     )
 
+    paper_trade_queue_position_simulation: bool = Field(
+        default=False,
+        description="Fill the paper limit orders only after the order book volume ahead of them at their price is "
+                    "traded or canceled, with partial fills from the size of the trades.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Simulate the queue position of the paper trade limit orders? (True/False)",
+        ),
+    )
+    paper_trade_order_submit_latency: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds until a paper limit order reaches the queue, when simulating the queue position.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the paper trade order submit latency in seconds",
+        ),
+    )
+    paper_trade_order_cancel_latency: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds until the cancel of a paper limit order is effective, when simulating the queue "
+                    "position. The order can still be filled meanwhile.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the paper trade order cancel latency in seconds",
+        ),
+    )
+
     @validator("paper_trade_account_balance", pre=True)
     def validate_paper_trade_account_balance(cls, v: Union[str, Dict[str, float]]):
         if isinstance(v, str):
             v = json.loads(v)
         return v
 
+    @validator("paper_trade_queue_position_simulation", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+    @validator("paper_trade_order_submit_latency", "paper_trade_order_cancel_latency", pre=True)
+    def validate_latency(cls, v: float):
+        """Used for client-friendly error output."""
+        ret = validate_float(v, min_value=0)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
 
 class KillSwitchMode(BaseClientModel, ABC):
     @abstractmethod
@@ -595,10 +695,51 @@ class GatewayConfigMap(BaseClientModel):
             prompt=lambda cm: "Please enter your Gateway API port",
         ),
     )
+    gateway_connection_limit: int = Field(
+        default=100,
+        gt=0,
+        description="Maximum number of simultaneous connections to Gateway. Requests above it wait for a free "
+                    "connection.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the maximum number of simultaneous connections to Gateway",
+        ),
+    )
+    gateway_keepalive_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds an idle connection to Gateway is kept open to be reused by the next requests.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the seconds an idle connection to Gateway is kept open",
+        ),
+    )
+    gateway_request_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds to wait for a Gateway response before the request fails.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the Gateway request timeout in seconds",
+        ),
+    )
 
     class Config:
         title = "gateway"
 
+    @validator("gateway_connection_limit", pre=True)
+    def validate_connection_limit(cls, v: int):
+        """Used for client-friendly error output."""
+        ret = validate_int(v, min_value=0, inclusive=False)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
+    @validator("gateway_keepalive_timeout", "gateway_request_timeout", pre=True)
+    def validate_timeout(cls, v: float):
+        """Used for client-friendly error output."""
+        ret = validate_float(v, min_value=0, inclusive=False)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
 
 class GlobalTokenConfigMap(BaseClientModel):
     global_token_name: str = Field(
@@ -1118,7 +1259,35 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    event_driven_ticks: bool = Field(
+        default=False,
+        description="Besides the fixed ticks, tick the strategy as soon as the top of the order book of its markets"
+                    " changes or one of its orders is updated.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to tick the strategy on order book and order updates besides the fixed ticks? (Yes/No)"
+            ),
+        ),
+    )
+    min_event_tick_interval: float = Field(
+        default=0.1,
+        gt=0,
+        description="Minimum time in seconds between two event driven ticks of the strategy. The updates received in"
+                    " between are served by a single tick.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Enter the minimum time in seconds between two event driven ticks",
+        ),
+    )
+    order_book_direct_dispatch: bool = Field(
+        default=False,
+        description="Dispatch the order book messages of the connectors in batches from per trading pair buffers,"
+                    " instead of routing every message through a queue and a task per trading pair.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Do you want to dispatch the order book messages in batches? (Yes/No)",
+        ),
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    trades_csv: TradesCSVConfigMap = Field(default=TradesCSVConfigMap())
 
     class Config:
         title = "client_config_map"
@@ -1234,6 +1403,32 @@ class ClientConfigMap(BaseClientModel):
             raise ValueError(ret)
         return v
 
+    @validator("event_driven_ticks", pre=True)
+    def validate_event_driven_ticks(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+    @validator("order_book_direct_dispatch", pre=True)
+    def validate_order_book_direct_dispatch(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+    @validator("min_event_tick_interval", pre=True)
+    def validate_min_event_tick_interval(cls, v: float):
+        """Used for client-friendly error output."""
+        ret = validate_float(v, min_value=0, inclusive=False)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
     # === post-validations ===
 
     @root_validator()
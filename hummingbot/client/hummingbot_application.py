@@ -320,12 +320,17 @@ class HummingbotApplication(*commands):
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
 
+        trades_csv_config = self.client_config_map.trades_csv
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            write_behind=True,
+            trades_csv_max_size=int(trades_csv_config.trades_csv_max_size * 1024 * 1024) or None,
+            trades_csv_rotate_daily=trades_csv_config.trades_csv_rotate_daily,
+            trades_csv_buffer_size=trades_csv_config.trades_csv_buffer_size * 1024,
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
@@ -2,8 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +28,34 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersByExchangeOrderId(Mapping):
+    """
+    Read only view of the orders of a ClientOrderTracker, mapped by exchange order ID, backed by the exchange order ID
+    index of the tracker.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", include_cached_orders: bool):
+        self._tracker = tracker
+        self._include_cached_orders = include_cached_orders
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker.fetch_order_by_exchange_order_id(exchange_order_id, self._include_cached_orders)
+        if order is None:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([exchange_order_id
+                     for exchange_order_id in list(self._tracker._orders_by_exchange_order_id)
+                     if exchange_order_id in self])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, exchange_order_id: Any) -> bool:
+        return self._tracker.fetch_order_by_exchange_order_id(exchange_order_id, self._include_cached_orders) is not None
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -62,6 +89,13 @@ class ClientOrderTracker:
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
+        # Secondary indexes. The exchange order ID index covers active, cached and lost orders, and can keep orders
+        # that already left the tracker (e.g. expired from the cache), so its hits are validated and it is pruned when
+        # it grows. The trading pair and state indexes only cover active orders.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._active_orders_by_state: Dict[OrderState, Dict[str, InFlightOrder]] = defaultdict(dict)
+
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
         """
@@ -91,15 +125,11 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.cached_orders, **self.lost_orders}
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderId(tracker=self, include_cached_orders=True)
 
     @property
     def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
@@ -109,14 +139,11 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.lost_orders}
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderId(tracker=self, include_cached_orders=False)
 
     @property
     def current_timestamp(self) -> int:
@@ -141,15 +168,47 @@ class ClientOrderTracker:
         self._lost_order_count_limit = value
 
     def start_tracking_order(self, order: InFlightOrder):
+        previous_order = self._in_flight_orders.get(order.client_order_id)
+        if previous_order is not None and previous_order is not order:
+            self._remove_from_active_indexes(previous_order)
         self._in_flight_orders[order.client_order_id] = order
+        self._add_to_indexes(order)
+        self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        self._active_orders_by_state[order.current_state][order.client_order_id] = order
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders[client_order_id]
+            self._cached_orders[client_order_id] = order
             del self._in_flight_orders[client_order_id]
+            self._remove_from_active_indexes(order)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
+    def fetch_active_orders_by_trading_pair(self, trading_pair: str) -> List[InFlightOrder]:
+        return list(self._active_orders_by_trading_pair.get(trading_pair, {}).values())
+
+    def fetch_active_orders_by_state(self, state: OrderState) -> List[InFlightOrder]:
+        return list(self._active_orders_by_state.get(state, {}).values())
+
+    def fetch_order_by_exchange_order_id(
+        self, exchange_order_id: Optional[str], include_cached_orders: bool = True
+    ) -> Optional[InFlightOrder]:
+        """
+        Returns the active or lost order (or cached order, if `include_cached_orders` is True) with the exchange order ID
+        """
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None:
+            return None
+        if order.exchange_order_id == exchange_order_id:
+            if self._is_active_or_lost(order):
+                return order
+            if self._cached_orders.get(order.client_order_id) is order:
+                return order if include_cached_orders else None
+        # The order is not tracked anymore
+        del self._orders_by_exchange_order_id[exchange_order_id]
+        return None
+
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
         Restore in-flight orders from saved tracking states.
@@ -162,6 +221,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._add_to_indexes(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,14 +232,14 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._in_flight_orders.get(client_order_id)
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None:
+            found_order = self._cached_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self.fetch_order_by_exchange_order_id(exchange_order_id)
+            if found_order is not None and self._lost_orders.get(found_order.client_order_id) is found_order:
+                found_order = None
 
         return found_order
 
@@ -191,9 +251,9 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            found_order = self.fetch_order_by_exchange_order_id(exchange_order_id)
+            if found_order is not None and self._lost_orders.get(found_order.client_order_id) is not found_order:
+                found_order = None
 
         return found_order
 
@@ -249,6 +309,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._add_to_indexes(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -304,6 +365,52 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _add_to_indexes(self, order: InFlightOrder):
+        order.set_update_listener(self._on_order_update)
+        if order.exchange_order_id is not None:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            self._prune_exchange_order_id_index()
+
+    def _is_active_or_lost(self, order: InFlightOrder) -> bool:
+        return (self._in_flight_orders.get(order.client_order_id) is order
+                or self._lost_orders.get(order.client_order_id) is order)
+
+    def _is_tracked(self, order: InFlightOrder) -> bool:
+        return self._is_active_or_lost(order) or self._cached_orders.get(order.client_order_id) is order
+
+    def _remove_from_active_indexes(self, order: InFlightOrder):
+        for index, key in ((self._active_orders_by_trading_pair, order.trading_pair),
+                           (self._active_orders_by_state, order.current_state)):
+            orders = index.get(key)
+            if orders is not None and orders.get(order.client_order_id) is order:
+                del orders[order.client_order_id]
+                if len(orders) == 0:
+                    del index[key]
+
+    def _on_order_update(self, order: InFlightOrder, attribute: str, previous_value: Any):
+        """
+        Listener of the exchange order ID and state changes of the orders known by the tracker
+        """
+        # Copies of the orders share the listener, but only the tracked instances are indexed
+        if attribute == "exchange_order_id" and self._is_tracked(order):
+            if self._orders_by_exchange_order_id.get(previous_value) is order:
+                del self._orders_by_exchange_order_id[previous_value]
+            if order.exchange_order_id is not None:
+                self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        elif attribute == "current_state" and self._in_flight_orders.get(order.client_order_id) is order:
+            orders = self._active_orders_by_state.get(previous_value)
+            if orders is not None and orders.pop(order.client_order_id, None) is not None and len(orders) == 0:
+                del self._active_orders_by_state[previous_value]
+            self._active_orders_by_state[order.current_state][order.client_order_id] = order
+
+    def _prune_exchange_order_id_index(self):
+        # Orders that left the cache are only removed from the index when they are looked up, so the index is
+        # rebuilt when it grows well beyond the number of tracked orders
+        if len(self._orders_by_exchange_order_id) > 2 * (self.MAX_CACHE_SIZE + len(self._in_flight_orders)
+                                                         + len(self._lost_orders)):
+            for exchange_order_id in list(self._orders_by_exchange_order_id):
+                self.fetch_order_by_exchange_order_id(exchange_order_id)
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
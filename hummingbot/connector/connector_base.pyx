@@ -348,6 +348,24 @@ cdef class ConnectorBase(NetworkIterator):
         for order in orders_to_cancel:
             self.cancel(trading_pair=order.trading_pair, client_order_id=order.client_order_id)
 
+    @property
+    def is_amend_order_supported(self) -> bool:
+        """
+        Connectors that can change the price and amount of an open limit order without canceling it should return
+        True and implement amend_order.
+        """
+        return False
+
+    def amend_order(self, trading_pair: str, client_order_id: str, price: Decimal, amount: Decimal):
+        """
+        Changes the price and amount of an open limit order. The order keeps its client order id.
+        :param trading_pair: The market (e.g. BTC-USDT) of the order.
+        :param client_order_id: The internal order id (also called client_order_id)
+        :param price: The new price of the order
+        :param amount: The new total amount of the order, in base token value
+        """
+        raise NotImplementedError
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
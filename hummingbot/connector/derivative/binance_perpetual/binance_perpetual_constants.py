@@ -34,6 +34,7 @@ SERVER_TIME_PATH_URL = "v1/time"
 
 # Private API v1 Endpoints
 ORDER_URL = "v1/order"
+BATCH_ORDERS_URL = "v1/batchOrders"
 CANCEL_ALL_OPEN_ORDERS_URL = "v1/allOpenOrders"
 ACCOUNT_TRADE_LIST_URL = "v1/userTrades"
 SET_LEVERAGE_URL = "v1/leverage"
@@ -42,6 +43,8 @@ CHANGE_POSITION_MODE_URL = "v1/positionSide/dual"
 
 POST_POSITION_MODE_LIMIT_ID = f"POST{CHANGE_POSITION_MODE_URL}"
 GET_POSITION_MODE_LIMIT_ID = f"GET{CHANGE_POSITION_MODE_URL}"
+# Cancelling orders in batch has a different weight, and it is not counted in the orders limits
+BATCH_CANCEL_ORDERS_LIMIT_ID = f"DELETE{BATCH_ORDERS_URL}"
 
 # Private API v2 Endpoints
 ACCOUNT_INFO_URL = "v2/account"
@@ -81,6 +84,10 @@ ONE_DAY = 86400
 
 MAX_REQUEST = 2400
 
+# Maximum number of orders in a batch orders request
+MAX_BATCH_ORDERS_CREATE = 5
+MAX_BATCH_ORDERS_CANCEL = 10
+
 RATE_LIMITS = [
     # Pool Limits
     RateLimit(limit_id=REQUEST_WEIGHT, limit=2400, time_interval=ONE_MINUTE),
@@ -107,6 +114,12 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1),
                              LinkedLimitWeightPair(ORDERS_1MIN, weight=1),
                              LinkedLimitWeightPair(ORDERS_1SEC, weight=1)]),
+    RateLimit(limit_id=BATCH_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5),
+                             LinkedLimitWeightPair(ORDERS_1MIN, weight=MAX_BATCH_ORDERS_CREATE),
+                             LinkedLimitWeightPair(ORDERS_1SEC, weight=MAX_BATCH_ORDERS_CREATE)]),
+    RateLimit(limit_id=BATCH_CANCEL_ORDERS_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=CANCEL_ALL_OPEN_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=ACCOUNT_TRADE_LIST_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 from collections import defaultdict
 from decimal import Decimal
@@ -19,6 +20,7 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_st
     BinancePerpetualUserStreamDataSource,
 )
 from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
@@ -111,6 +113,26 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def is_batch_order_create_supported(self) -> bool:
+        return True
+
+    @property
+    def is_batch_order_cancel_supported(self) -> bool:
+        return True
+
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_BATCH_ORDERS_CREATE
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_BATCH_ORDERS_CANCEL
+
+    @property
+    def is_amend_order_supported(self) -> bool:
+        return True
+
     @property
     def funding_fee_poll_interval(self) -> int:
         return 600
@@ -228,6 +250,22 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             return True
         return False
 
+    async def _place_amend(self, order_id: str, tracked_order: InFlightOrder, price: Decimal, amount: Decimal) -> float:
+        api_params = {
+            "origClientOrderId": order_id,
+            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair),
+            "side": "BUY" if tracked_order.trade_type is TradeType.BUY else "SELL",
+            "quantity": f"{amount:f}",
+            "price": f"{price:f}",
+        }
+        amend_result = await self._api_put(
+            path_url=CONSTANTS.ORDER_URL,
+            params=api_params,
+            is_auth_required=True)
+        if "code" in amend_result:
+            raise IOError(f"{amend_result['code']} - {amend_result.get('msg')}")
+        return amend_result["updateTime"] * 1e-3
+
     async def _place_order(
             self,
             order_id: str,
@@ -240,6 +278,107 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             **kwargs,
     ) -> Tuple[str, float]:
 
+        api_params = await self._order_api_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            position_action=position_action,
+        )
+        try:
+            order_result = await self._api_post(
+                path_url=CONSTANTS.ORDER_URL,
+                data=api_params,
+                is_auth_required=True)
+            o_id = str(order_result["orderId"])
+            transact_time = order_result["updateTime"] * 1e-3
+        except IOError as e:
+            error_description = str(e)
+            is_server_overloaded = ("status is 503" in error_description
+                                    and "Unknown error, please check your request or try again later." in error_description)
+            if is_server_overloaded:
+                o_id = "UNKNOWN"
+                transact_time = time.time()
+            else:
+                raise
+        return o_id, transact_time
+
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        batch_orders = []
+        for order in orders:
+            batch_orders.append(await self._order_api_params(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                position_action=order.position,
+            ))
+        orders_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDERS_URL,
+            data={"batchOrders": json.dumps(batch_orders, separators=(",", ":"))},
+            is_auth_required=True)
+
+        place_order_results = []
+        for order, order_result in zip(orders, orders_results):
+            if "orderId" in order_result:
+                place_order_results.append(PlaceOrderResult(
+                    update_timestamp=order_result["updateTime"] * 1e-3,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(order_result["orderId"]),
+                    trading_pair=order.trading_pair,
+                ))
+            else:
+                place_order_results.append(PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                    exception=IOError(f"{order_result.get('code')} - {order_result.get('msg')}"),
+                ))
+        return place_order_results
+
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        # The batch cancelation request only accepts orders of a single symbol
+        orders_by_trading_pair = defaultdict(list)
+        for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+
+        cancel_order_results = {}
+        for trading_pair, trading_pair_orders in orders_by_trading_pair.items():
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            cancel_results = await self._api_delete(
+                path_url=CONSTANTS.BATCH_ORDERS_URL,
+                params={
+                    "symbol": symbol,
+                    "origClientOrderIdList": json.dumps([order.client_order_id for order in trading_pair_orders],
+                                                        separators=(",", ":")),
+                },
+                is_auth_required=True,
+                limit_id=CONSTANTS.BATCH_CANCEL_ORDERS_LIMIT_ID)
+            for order, cancel_result in zip(trading_pair_orders, cancel_results):
+                cancel_order_result = CancelOrderResult(client_order_id=order.client_order_id,
+                                                        trading_pair=trading_pair)
+                if cancel_result.get("code") == -2011:
+                    cancel_order_result.not_found = True
+                elif cancel_result.get("status") != "CANCELED":
+                    cancel_order_result.exception = IOError(f"{cancel_result.get('code')} - {cancel_result.get('msg')}")
+                cancel_order_results[order.client_order_id] = cancel_order_result
+        return [cancel_order_results[order.client_order_id] for order in orders]
+
+    async def _order_api_params(
+            self,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+            position_action: PositionAction,
+    ) -> Dict[str, Any]:
         amount_str = f"{amount:f}"
         price_str = f"{price:f}"
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
@@ -260,23 +399,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                 api_params["positionSide"] = "LONG" if trade_type is TradeType.BUY else "SHORT"
             else:
                 api_params["positionSide"] = "SHORT" if trade_type is TradeType.BUY else "LONG"
-        try:
-            order_result = await self._api_post(
-                path_url=CONSTANTS.ORDER_URL,
-                data=api_params,
-                is_auth_required=True)
-            o_id = str(order_result["orderId"])
-            transact_time = order_result["updateTime"] * 1e-3
-        except IOError as e:
-            error_description = str(e)
-            is_server_overloaded = ("status is 503" in error_description
-                                    and "Unknown error, please check your request or try again later." in error_description)
-            if is_server_overloaded:
-                o_id = "UNKNOWN"
-                transact_time = time.time()
-            else:
-                raise
-        return o_id, transact_time
+        return api_params
 
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         trade_updates = []
@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -113,6 +114,10 @@ class BinanceExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def is_bulk_order_status_request_supported(self) -> bool:
+        return True
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
@@ -510,6 +515,37 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _request_order_status_in_bulk(self, orders: List[InFlightOrder]) -> List[OrderUpdate]:
+        # The open orders request of a symbol weighs more than the status request of a single order, so it is only
+        # used for the trading pairs with several orders. Orders that are no longer open are not in the response.
+        orders_by_trading_pair = defaultdict(list)
+        for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+        trading_pairs = [trading_pair for trading_pair, trading_pair_orders in orders_by_trading_pair.items()
+                         if len(trading_pair_orders) > 1]
+
+        open_orders_by_trading_pair = await safe_gather(*[
+            self._api_get(
+                path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+                params={"symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)},
+                is_auth_required=True)
+            for trading_pair in trading_pairs
+        ])
+
+        order_updates = []
+        for trading_pair, open_orders in zip(trading_pairs, open_orders_by_trading_pair):
+            tracked_order_ids = {order.client_order_id for order in orders_by_trading_pair[trading_pair]}
+            for order_data in open_orders:
+                if order_data["clientOrderId"] in tracked_order_ids:
+                    order_updates.append(OrderUpdate(
+                        client_order_id=order_data["clientOrderId"],
+                        exchange_order_id=str(order_data["orderId"]),
+                        trading_pair=trading_pair,
+                        update_timestamp=order_data["updateTime"] * 1e-3,
+                        new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+                    ))
+        return order_updates
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.gate_io.gate_io_api_order_book_data_source im
 from hummingbot.connector.exchange.gate_io.gate_io_api_user_stream_data_source import GateIoAPIUserStreamDataSource
 from hummingbot.connector.exchange.gate_io.gate_io_auth import GateIoAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -104,6 +105,26 @@ class GateIoExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def is_batch_order_create_supported(self) -> bool:
+        return True
+
+    @property
+    def is_batch_order_cancel_supported(self) -> bool:
+        return True
+
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_BATCH_ORDERS_CREATE
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_BATCH_ORDERS_CANCEL
+
+    @property
+    def is_amend_order_supported(self) -> bool:
+        return True
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.MARKET, OrderType.LIMIT_MAKER]
 
@@ -192,6 +213,101 @@ class GateIoExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_api_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+
+        # RESTRequest does not support json, and if we pass a dict
+        # the underlying aiohttp will encode it to params
+        data = data
+        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
+        order_result = await self._api_post(
+            path_url=endpoint,
+            data=data,
+            is_auth_required=True,
+            limit_id=endpoint,
+        )
+        if order_result.get("status") in {"cancelled"}:
+            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+        exchange_order_id = str(order_result["id"])
+        return exchange_order_id, self.current_timestamp
+
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = []
+        for order in orders:
+            data.append(await self._order_api_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            ))
+        orders_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDERS_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDERS_PATH_URL,
+        )
+
+        place_order_results = []
+        for order, order_result in zip(orders, orders_results):
+            place_order_result = PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=None,
+                trading_pair=order.trading_pair,
+            )
+            if not order_result.get("succeeded", False):
+                place_order_result.exception = IOError({"label": order_result.get("label"),
+                                                        "message": order_result.get("message")})
+            elif order_result.get("status") in {"cancelled"}:
+                place_order_result.exception = IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+            else:
+                place_order_result.exchange_order_id = str(order_result["id"])
+            place_order_results.append(place_order_result)
+        return place_order_results
+
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = []
+        for order in orders:
+            data.append({
+                "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "id": await order.get_exchange_order_id(),
+            })
+        cancel_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDERS_CANCEL_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDERS_CANCEL_PATH_URL,
+        )
+        cancel_results = {cancel_result["id"]: cancel_result for cancel_result in cancel_results}
+
+        cancel_order_results = []
+        for order in orders:
+            cancel_result = cancel_results.get(order.exchange_order_id, {})
+            cancel_order_result = CancelOrderResult(client_order_id=order.client_order_id,
+                                                    trading_pair=order.trading_pair)
+            if cancel_result.get("label") == "ORDER_NOT_FOUND":
+                cancel_order_result.not_found = True
+            elif not cancel_result.get("succeeded", False):
+                cancel_order_result.exception = IOError({"label": cancel_result.get("label"),
+                                                         "message": cancel_result.get("message")})
+            cancel_order_results.append(cancel_order_result)
+        return cancel_order_results
+
+    async def _order_api_data(self,
+                              order_id: str,
+                              trading_pair: str,
+                              amount: Decimal,
+                              trade_type: TradeType,
+                              order_type: OrderType,
+                              price: Decimal) -> Dict[str, Any]:
         order_type_str = order_type.name.lower().split("_")[0]
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         # When type is market, it refers to different currency according to side
@@ -225,21 +341,7 @@ class GateIoExchange(ExchangePyBase):
                 data.update({
                     "amount": f"{price * amount:f}",
                 })
-
-        # RESTRequest does not support json, and if we pass a dict
-        # the underlying aiohttp will encode it to params
-        data = data
-        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
-        order_result = await self._api_post(
-            path_url=endpoint,
-            data=data,
-            is_auth_required=True,
-            limit_id=endpoint,
-        )
-        if order_result.get("status") in {"cancelled"}:
-            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
-        exchange_order_id = str(order_result["id"])
-        return exchange_order_id, self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -260,6 +362,26 @@ class GateIoExchange(ExchangePyBase):
         canceled = resp.get("status") == "cancelled"
         return canceled
 
+    async def _place_amend(self, order_id: str, tracked_order: InFlightOrder, price: Decimal, amount: Decimal) -> float:
+        exchange_order_id = await tracked_order.get_exchange_order_id()
+        params = {
+            'currency_pair': await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
+        }
+        data = {
+            "amount": f"{amount:f}",
+            "price": f"{price:f}",
+        }
+        resp = await self._api_patch(
+            path_url=CONSTANTS.ORDER_AMEND_PATH_URL.format(order_id=exchange_order_id),
+            params=params,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.ORDER_AMEND_LIMIT_ID,
+        )
+        if resp.get("status") != "open":
+            raise IOError(f"Error amending order {order_id}: {resp}")
+        return int(resp["update_time_ms"]) * 1e-3
+
     async def _update_balances(self):
         """
         Calls REST API to update total and available balances.
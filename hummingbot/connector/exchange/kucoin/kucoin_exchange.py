@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
@@ -14,6 +15,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source impo
 from hummingbot.connector.exchange.kucoin.kucoin_api_user_stream_data_source import KucoinAPIUserStreamDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -97,10 +99,22 @@ class KucoinExchange(ExchangePyBase):
     def is_cancel_request_in_exchange_synchronous(self) -> bool:
         return True
 
+    @property
+    def is_bulk_trade_updates_request_supported(self) -> bool:
+        return True
+
     @property
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def is_batch_order_create_supported(self) -> bool:
+        return True
+
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_BATCH_ORDERS_CREATE
+
     def supported_order_types(self):
         return [OrderType.MARKET, OrderType.LIMIT, OrderType.LIMIT_MAKER]
 
@@ -194,13 +208,105 @@ class KucoinExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
         path_url = CONSTANTS.ORDERS_PATH_URL
+        data = self._order_api_data(
+            order_id=order_id,
+            symbol=await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        exchange_order_id = await self._api_post(
+            path_url=path_url,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+        )
+        order_data = exchange_order_id.get("data")
+        order_id = order_data["orderId"] if order_data else None
+        return order_id, self.current_timestamp
+
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        place_order_results = {}
+        limit_orders_by_trading_pair = defaultdict(list)
+        for order in orders:
+            if order.order_type is OrderType.MARKET:
+                # The batch orders request only accepts limit orders
+                place_order_result = PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                )
+                try:
+                    place_order_result.exchange_order_id, place_order_result.update_timestamp = await self._place_order(
+                        order_id=order.client_order_id,
+                        trading_pair=order.trading_pair,
+                        amount=order.amount,
+                        trade_type=order.trade_type,
+                        order_type=order.order_type,
+                        price=order.price,
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as ex:
+                    place_order_result.exception = ex
+                place_order_results[order.client_order_id] = place_order_result
+            else:
+                limit_orders_by_trading_pair[order.trading_pair].append(order)
+
+        for trading_pair, trading_pair_orders in limit_orders_by_trading_pair.items():
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            order_list = []
+            for order in trading_pair_orders:
+                order_data = self._order_api_data(
+                    order_id=order.client_order_id,
+                    symbol=symbol,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                )
+                del order_data["symbol"]
+                order_list.append(order_data)
+            response = await self._api_post(
+                path_url=CONSTANTS.MULTI_ORDERS_PATH_URL,
+                data={"symbol": symbol, "orderList": order_list},
+                is_auth_required=True,
+                limit_id=CONSTANTS.POST_MULTI_ORDERS_LIMIT_ID,
+            )
+            orders_data = {order_data["clientOid"]: order_data for order_data in response["data"]["data"]}
+            for order in trading_pair_orders:
+                order_data = orders_data.get(order.client_order_id, {})
+                place_order_result = PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                )
+                if order_data.get("status") == "success":
+                    place_order_result.exchange_order_id = order_data["id"]
+                else:
+                    place_order_result.exception = IOError(
+                        f"Error submitting order {order.client_order_id}: {order_data.get('failMsg')}")
+                place_order_results[order.client_order_id] = place_order_result
+
+        return [place_order_results[order.client_order_id] for order in orders]
+
+    @staticmethod
+    def _order_api_data(order_id: str,
+                        symbol: str,
+                        amount: Decimal,
+                        trade_type: TradeType,
+                        order_type: OrderType,
+                        price: Decimal) -> Dict[str, Any]:
         side = trade_type.name.lower()
         order_type_str = "market" if order_type == OrderType.MARKET else "limit"
         data = {
             "size": str(amount),
             "clientOid": order_id,
             "side": side,
-            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "symbol": symbol,
             "type": order_type_str,
         }
         if order_type is OrderType.LIMIT:
@@ -208,15 +314,7 @@ class KucoinExchange(ExchangePyBase):
         elif order_type is OrderType.LIMIT_MAKER:
             data["price"] = str(price)
             data["postOnly"] = True
-        exchange_order_id = await self._api_post(
-            path_url=path_url,
-            data=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
-        )
-        order_data = exchange_order_id.get("data")
-        order_id = order_data["orderId"] if order_data else None
-        return order_id, self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -372,25 +470,13 @@ class KucoinExchange(ExchangePyBase):
             trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=fee_json["symbol"])
             self._trading_fees[trading_pair] = fee_json
 
-    async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        # This method in the base ExchangePyBase, makes an API call for each order.
+    async def _all_trade_updates_for_orders(self, orders: List[InFlightOrder]) -> List[TradeUpdate]:
         # Given the rate limit of the API method and the breadth of info provided by the method
         # the mitigation proposal is to collect all orders in one shot, then parse them
         # Note that this is limited to 500 orders (pagination)
         # An alternative for Kucoin would be to use the limit/fills that returns 24hr updates, which should
         # be sufficient, the rate limit seems better suited
-        all_trades_updates: List[TradeUpdate] = []
-        if len(orders) > 0:
-            try:
-                all_trades_updates: List[TradeUpdate] = await self._all_trades_updates(orders)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates. Error: {request_error}")
-
-            for trade_update in all_trades_updates:
-                self._order_tracker.process_trade_update(trade_update)
+        return await self._all_trades_updates(orders)
 
     async def _all_trades_updates(self, orders: List[InFlightOrder]) -> List[TradeUpdate]:
         trade_updates: List[TradeUpdate] = []
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.okx import okx_constants as CONSTANTS, okx_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest, WSPlainTextRequest
@@ -23,6 +24,7 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                  connector: 'OkxExchange',
                  api_factory: WebAssistantsFactory):
         super().__init__(trading_pairs)
+        self._order_book_create_function = lambda: FlatOrderBook()
         self._connector = connector
         self._api_factory = api_factory
 
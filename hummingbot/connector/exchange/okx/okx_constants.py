@@ -24,6 +24,8 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
+OKX_AMEND_ORDER_PATH = '/api/v5/trade/amend-order'
+OKX_BATCH_ORDERS_PATH = '/api/v5/trade/batch-orders'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
@@ -54,6 +56,10 @@ ORDER_STATE = {
     "canceled": OrderState.CANCELED,
 }
 
+# Maximum number of orders in a batch orders request
+MAX_BATCH_ORDERS_CREATE = 20
+MAX_BATCH_ORDERS_CANCEL = 20
+
 NO_LIMIT = sys.maxsize
 
 RATE_LIMITS = [
@@ -68,6 +74,8 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=60, time_interval=2),
+    RateLimit(limit_id=OKX_AMEND_ORDER_PATH, limit=60, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_ORDERS_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_BALANCE_PATH, limit=10, time_interval=2),
     RateLimit(limit_id=OKX_TRADE_FILLS_PATH, limit=60, time_interval=2),
@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.okx.okx_api_user_stream_data_source import Ok
 from hummingbot.connector.exchange.okx.okx_auth import OkxAuth
 from hummingbot.connector.exchange_base import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -96,6 +97,26 @@ class OkxExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def is_batch_order_create_supported(self) -> bool:
+        return True
+
+    @property
+    def is_batch_order_cancel_supported(self) -> bool:
+        return True
+
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_BATCH_ORDERS_CREATE
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_BATCH_ORDERS_CANCEL
+
+    @property
+    def is_amend_order_supported(self) -> bool:
+        return True
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER]
 
@@ -232,6 +253,91 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_amend(self, order_id: str, tracked_order: InFlightOrder, price: Decimal, amount: Decimal) -> float:
+        params = {
+            "clOrdId": order_id,
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair),
+            "newSz": str(amount),
+            "newPx": str(price),
+        }
+        amend_result = await self._api_post(
+            path_url=CONSTANTS.OKX_AMEND_ORDER_PATH,
+            data=params,
+            is_auth_required=True,
+        )
+        if amend_result["data"][0]["sCode"] != "0":
+            raise IOError(f"Error amending order {order_id}: {amend_result['data'][0]['sMsg']}")
+        return self.current_timestamp
+
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = []
+        for order in orders:
+            data.append({
+                "clOrdId": order.client_order_id,
+                "tdMode": "cash",
+                "ordType": "limit",
+                "side": order.trade_type.name.lower(),
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "sz": str(order.amount),
+                "px": str(order.price)
+            })
+
+        place_result = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+        )
+        orders_data = {order_data["clOrdId"]: order_data for order_data in place_result["data"]}
+
+        place_order_results = []
+        for order in orders:
+            order_data = orders_data.get(order.client_order_id)
+            place_order_result = PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=None,
+                trading_pair=order.trading_pair,
+            )
+            if order_data is None:
+                place_order_result.exception = IOError(f"Error submitting order {order.client_order_id}: "
+                                                       f"{place_result.get('msg')}")
+            elif order_data["sCode"] != "0":
+                place_order_result.exception = IOError(f"Error submitting order {order.client_order_id}: "
+                                                       f"{order_data['sMsg']}")
+            else:
+                place_order_result.exchange_order_id = str(order_data["ordId"])
+            place_order_results.append(place_order_result)
+        return place_order_results
+
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+            }
+            for order in orders
+        ]
+        cancel_result = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        orders_data = {order_data["clOrdId"]: order_data for order_data in cancel_result["data"]}
+
+        cancel_order_results = []
+        for order in orders:
+            order_data = orders_data.get(order.client_order_id)
+            cancel_order_result = CancelOrderResult(client_order_id=order.client_order_id,
+                                                    trading_pair=order.trading_pair)
+            # 51400 and 51401: the order does not exist or has already been cancelled
+            if order_data is None or order_data["sCode"] not in ["0", "51400", "51401"]:
+                cancel_order_result.exception = IOError(f"Error cancelling order {order.client_order_id}: "
+                                                        f"{order_data or cancel_result}")
+            cancel_order_results.append(cancel_order_result)
+        return cancel_order_results
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)}
 
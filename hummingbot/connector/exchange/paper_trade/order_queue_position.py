@@ -0,0 +1,74 @@
+from decimal import Decimal
+from typing import Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+s_decimal_0 = Decimal(0)
+
+
+class OrderQueuePosition:
+    """
+    Position of a resting paper limit order in the queue of its price level.
+
+    The order reaches the exchange after the submit latency. At that moment the volume of the order book at the order
+    price is taken as the queue ahead of it, and it is reduced by the trades at the order price and by the cancels of
+    the orders ahead (the queue can't be bigger than the volume left at the price level). Only the part of a trade at
+    the order price that exceeds the queue ahead fills the order.
+    """
+
+    def __init__(self, order_id: str, trading_pair: str, is_buy: bool, price: Decimal, active_timestamp: float):
+        self.order_id = order_id
+        self.trading_pair = trading_pair
+        self.is_buy = is_buy
+        self.price = price
+        self.active_timestamp = active_timestamp
+        self.queue_ahead: Optional[Decimal] = None
+        self.cancel_timestamp: Optional[float] = None
+        # Accumulated amounts of the partial fills, reported when the order is completed
+        self.base_asset_amount = s_decimal_0
+        self.quote_asset_amount = s_decimal_0
+
+    def __repr__(self) -> str:
+        return (f"OrderQueuePosition('{self.order_id}', '{self.trading_pair}', {self.is_buy}, {self.price}, "
+                f"queue_ahead={self.queue_ahead})")
+
+    def is_active(self, timestamp: float) -> bool:
+        """
+        Whether the order has reached the exchange, and can be filled.
+        """
+        return timestamp >= self.active_timestamp
+
+    def level_volume(self, order_book: OrderBook) -> Decimal:
+        """
+        Volume of the order book at the order price, on the side of the order.
+        """
+        price = float(self.price)
+        entries = order_book.bid_entries() if self.is_buy else order_book.ask_entries()
+        for entry in entries:
+            if entry.price == price:
+                return Decimal(str(entry.amount))
+            if (entry.price < price) if self.is_buy else (entry.price > price):
+                break
+        return s_decimal_0
+
+    def update_queue_ahead(self, order_book: OrderBook):
+        """
+        Takes the volume at the order price as the queue ahead when the order is activated, and afterwards only lets
+        the queue shrink to the volume left at the price level.
+        """
+        level_volume = self.level_volume(order_book)
+        self.queue_ahead = level_volume if self.queue_ahead is None else min(self.queue_ahead, level_volume)
+
+    def consume_trade(self, trade_amount: Decimal) -> Decimal:
+        """
+        Applies a trade at the order price to the queue ahead of the order.
+
+        :return: the amount of the trade left for the order once the queue ahead of it is filled
+        """
+        queue_ahead = self.queue_ahead or s_decimal_0
+        self.queue_ahead = max(s_decimal_0, queue_ahead - trade_amount)
+        return max(s_decimal_0, trade_amount - queue_ahead)
+
+    def add_fill(self, base_asset_amount: Decimal, quote_asset_amount: Decimal):
+        self.base_asset_amount += base_asset_amount
+        self.quote_asset_amount += quote_asset_amount
@@ -14,6 +14,7 @@ from libcpp.vector cimport vector
 
 from hummingbot.connector.budget_checker import BudgetChecker
 from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.exchange.paper_trade.order_queue_position import OrderQueuePosition
 from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
@@ -157,7 +158,17 @@ cdef class PaperTradeExchange(ExchangeBase):
         order_book_tracker: OrderBookTracker,
         target_market: Callable,
         exchange_name: str,
+        queue_position_simulation: bool = False,
+        order_submit_latency: float = 0.0,
+        order_cancel_latency: float = 0.0,
     ):
+        """
+        :param queue_position_simulation: when enabled a limit order is only filled by the trades at its price once
+        the volume that was ahead of it in the order book is traded or canceled, and it can be partially filled.
+        :param order_submit_latency: seconds until a limit order can be filled, when queue_position_simulation is on
+        :param order_cancel_latency: seconds until a limit order cancel is effective, the order can still be filled
+        meanwhile, when queue_position_simulation is on
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._set_order_book_tracker(order_book_tracker)
         self._budget_checker = BudgetChecker(exchange=self)
@@ -173,6 +184,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
         self.c_add_listener(self.ORDER_FILLED_EVENT_TAG, self._market_order_filled_listener)
+        self._queue_position_simulation = queue_position_simulation
+        self._order_submit_latency = order_submit_latency
+        self._order_cancel_latency = order_cancel_latency
+        self._order_queue_positions = {}
 
         # Trade volume metrics should never be gather for paper trade connector
         self._trade_volume_metric_collector = DummyMetricsCollector()
@@ -242,6 +257,10 @@ cdef class PaperTradeExchange(ExchangeBase):
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
 
+    @property
+    def order_queue_positions(self) -> Dict[str, OrderQueuePosition]:
+        return self._order_queue_positions
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         cdef:
@@ -278,10 +297,11 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            quantity = limit_order.quantity - (limit_order.filled_quantity or s_decimal_0)
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += quantity
         return _on_hold_balances
 
     @property
@@ -318,6 +338,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_tick(self, double timestamp):
         ExchangeBase.c_tick(self, timestamp)
         self.c_process_market_orders()
+        if self._queue_position_simulation:
+            self.c_process_order_queue_positions()
         self.c_process_crossed_limit_orders()
 
     cdef str c_buy(self,
@@ -370,6 +392,10 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if self._queue_position_simulation:
+                self._order_queue_positions[order_id] = OrderQueuePosition(
+                    order_id, trading_pair_str, True, quantized_price,
+                    self._current_timestamp + self._order_submit_latency)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
             BuyOrderCreatedEvent(self._current_timestamp,
@@ -430,6 +456,10 @@ cdef class PaperTradeExchange(ExchangeBase):
                 0,
                 cpp_position,
             ))
+            if self._queue_position_simulation:
+                self._order_queue_positions[order_id] = OrderQueuePosition(
+                    order_id, trading_pair_str, False, quantized_price,
+                    self._current_timestamp + self._order_submit_latency)
         safe_ensure_future(self.trigger_event_async(
             self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
             SellOrderCreatedEvent(self._current_timestamp,
@@ -629,6 +659,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if len(self._order_queue_positions) > 0:
+                self._order_queue_positions.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -637,20 +669,56 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
+    cdef c_add_limit_order_filled_quantity(self,
+                                           LimitOrdersIterator *map_it_ptr,
+                                           SingleTradingPairLimitOrdersIterator orders_it,
+                                           object fill_amount):
+        """
+        Replaces a partially filled limit order with a copy that has the new filled quantity. The copy takes the
+        same place in the orders collection, since they are sorted by price and client order id.
+        """
+        cdef:
+            SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+            CPPLimitOrder cpp_limit_order = deref(orders_it)
+            object filled_quantity = <object> cpp_limit_order.getFilledQuantity()
+
+        filled_quantity = (filled_quantity or s_decimal_0) + fill_amount
+        orders_collection_ptr.erase(orders_it)
+        orders_collection_ptr.insert(CPPLimitOrder(
+            cpp_limit_order.getClientOrderID(),
+            cpp_limit_order.getTradingPair(),
+            cpp_limit_order.getIsBuy(),
+            cpp_limit_order.getBaseCurrency(),
+            cpp_limit_order.getQuoteCurrency(),
+            cpp_limit_order.getPrice(),
+            cpp_limit_order.getQuantity(),
+            <PyObject *> filled_quantity,
+            cpp_limit_order.getCreationTimestamp(),
+            cpp_limit_order.getStatus(),
+            cpp_limit_order.getPosition(),
+        ))
+
     cdef c_process_limit_bid_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_quantity = <object> cpp_limit_order_ptr.getFilledQuantity()
+            object amount = <object> cpp_limit_order_ptr.getQuantity() - (filled_quantity or s_decimal_0)
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            bint is_partial_fill = fill_amount is not None and fill_amount < amount
+            object queue_position = self._order_queue_positions.get(order_id)
+
+        if is_partial_fill:
+            amount = fill_amount
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -709,12 +777,20 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.BUY,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if queue_position is not None:
+            queue_position.add_fill(acquired_amount, paid_amount)
+            acquired_amount = queue_position.base_asset_amount
+            paid_amount = queue_position.quote_asset_amount
+        if is_partial_fill:
+            self.c_add_limit_order_filled_quantity(map_it_ptr, orders_it, amount)
+            return
+
         self.c_trigger_event(
             self.BUY_ORDER_COMPLETED_EVENT_TAG,
             BuyOrderCompletedEvent(
@@ -731,17 +807,24 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_process_limit_ask_order(self,
                                    LimitOrders *limit_orders_map_ptr,
                                    LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
+                                   SingleTradingPairLimitOrdersIterator orders_it,
+                                   object fill_amount=None):
         cdef:
             const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
             str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
             str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
             str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
             str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
+            object filled_quantity = <object> cpp_limit_order_ptr.getFilledQuantity()
+            object amount = <object> cpp_limit_order_ptr.getQuantity() - (filled_quantity or s_decimal_0)
             object price = <object> cpp_limit_order_ptr.getPrice()
             object quote_balance = self.c_get_balance(quote_asset)
             object base_balance = self.c_get_balance(base_asset)
+            bint is_partial_fill = fill_amount is not None and fill_amount < amount
+            object queue_position = self._order_queue_positions.get(order_id)
+
+        if is_partial_fill:
+            amount = fill_amount
 
         order_candidate = OrderCandidate(
             trading_pair=trading_pair_str,
@@ -800,12 +883,20 @@ cdef class PaperTradeExchange(ExchangeBase):
                 trading_pair_str,
                 TradeType.SELL,
                 OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
+                price,
+                amount,
                 fees,
                 exchange_trade_id=str(int(self._time() * 1e6))
             ))
 
+        if queue_position is not None:
+            queue_position.add_fill(sold_amount, acquired_amount)
+            sold_amount = queue_position.base_asset_amount
+            acquired_amount = queue_position.quote_asset_amount
+        if is_partial_fill:
+            self.c_add_limit_order_filled_quantity(map_it_ptr, orders_it, amount)
+            return
+
         self.c_trigger_event(
             self.SELL_ORDER_COMPLETED_EVENT_TAG,
             SellOrderCompletedEvent(
@@ -823,12 +914,13 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
         try:
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it, fill_amount)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -858,15 +950,17 @@ cdef class PaperTradeExchange(ExchangeBase):
                 cpp_limit_order_ptr = address(deref(orders_rit))
                 if opposite_order_book_price > <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if self.c_is_limit_order_active(cpp_limit_order_ptr):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
                 if opposite_order_book_price < <object>cpp_limit_order_ptr.getPrice():
                     break
-                process_order_its.push_back(orders_it)
+                if self.c_is_limit_order_active(cpp_limit_order_ptr):
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
@@ -890,11 +984,39 @@ cdef class PaperTradeExchange(ExchangeBase):
             if map_it != limit_orders_ptr.end():
                 inc(map_it)
 
+    cdef bint c_is_limit_order_active(self, const CPPLimitOrder *cpp_limit_order_ptr):
+        """
+        Whether the limit order has reached the exchange, it is always the case without queue position simulation.
+        """
+        if len(self._order_queue_positions) == 0:
+            return True
+        queue_position = self._order_queue_positions.get(cpp_limit_order_ptr.getClientOrderID().decode("utf8"))
+        return queue_position is None or queue_position.is_active(self._current_timestamp)
+
+    cdef c_process_order_queue_positions(self):
+        """
+        Updates the queue ahead of the active limit orders with the current order book, and deletes the orders which
+        cancel is effective after the cancel latency.
+        """
+        for queue_position in list(self._order_queue_positions.values()):
+            if (queue_position.cancel_timestamp is not None
+                    and queue_position.cancel_timestamp <= self._current_timestamp):
+                self.c_cancel_order_from_orders_map(
+                    address(self._bid_limit_orders) if queue_position.is_buy else address(self._ask_limit_orders),
+                    queue_position.trading_pair,
+                    False,
+                    queue_position.order_id)
+            elif queue_position.is_active(self._current_timestamp):
+                queue_position.update_queue_ahead(self.c_get_order_book(queue_position.trading_pair))
+
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
         Trigger limit orders when incoming market orders have crossed the limit order's price.
 
+        With queue position simulation, a trade at the limit order's price also fills the order, once the queue ahead
+        of it is consumed, and only by the amount of the trade left after the queue.
+
         :param order_book_trade_event: trade event from order book
         """
         cdef:
@@ -911,31 +1033,66 @@ cdef class PaperTradeExchange(ExchangeBase):
             SingleTradingPairLimitOrdersRIterator orders_rit
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
+            list fill_amounts = []
+            size_t i
 
         if map_it == limit_orders_map_ptr.end():
             return
+        if self._queue_position_simulation:
+            # Compared with the order prices to find the orders at the trade price
+            trade_price = Decimal(str(trade_price))
+            trade_quantity = Decimal(str(trade_quantity))
 
         orders_collection_ptr = address(deref(map_it).second)
         if is_maker_buy:
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() < trade_price:
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                fill_amount = self.c_get_trade_fill_amount(cpp_limit_order_ptr, trade_price, trade_quantity)
+                if fill_amount is None or fill_amount > s_decimal_0:
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                    fill_amounts.append(fill_amount)
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() > trade_price:
                     break
-                process_order_its.push_back(orders_it)
+                fill_amount = self.c_get_trade_fill_amount(cpp_limit_order_ptr, trade_price, trade_quantity)
+                if fill_amount is None or fill_amount > s_decimal_0:
+                    process_order_its.push_back(orders_it)
+                    fill_amounts.append(fill_amount)
                 inc(orders_it)
 
-        for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+        for i in range(process_order_its.size()):
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), process_order_its[i],
+                                       fill_amounts[i])
+
+    cdef object c_get_trade_fill_amount(self,
+                                        const CPPLimitOrder *cpp_limit_order_ptr,
+                                        object trade_price,
+                                        object trade_quantity):
+        """
+        Amount of a limit order filled by a trade at its price or through it. None means the whole order is filled,
+        which is always the case for the trades through the order's price, and 0 that the order is not filled.
+        """
+        cdef:
+            str order_id
+        if <object>cpp_limit_order_ptr.getPrice() != trade_price:
+            return None if self.c_is_limit_order_active(cpp_limit_order_ptr) else s_decimal_0
+        if not self._queue_position_simulation:
+            return s_decimal_0
+        order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+        queue_position = self._order_queue_positions.get(order_id)
+        if queue_position is None or not queue_position.is_active(self._current_timestamp):
+            return s_decimal_0
+        if queue_position.queue_ahead is None:
+            queue_position.update_queue_ahead(self.c_get_order_book(queue_position.trading_pair))
+        return queue_position.consume_trade(trade_quantity)
 
     # </editor-fold>
 
@@ -1007,6 +1164,12 @@ cdef class PaperTradeExchange(ExchangeBase):
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
+        queue_position = self._order_queue_positions.get(client_order_id)
+        if queue_position is not None and self._order_cancel_latency > 0:
+            # The order is deleted by c_process_order_queue_positions once the cancel reaches the exchange
+            if queue_position.cancel_timestamp is None:
+                queue_position.cancel_timestamp = self._current_timestamp + self._order_cancel_latency
+            return
         self.c_cancel_order_from_orders_map(limit_orders_map_ptr, trading_pair_str, False, client_order_id)
 
     cdef object c_get_fee(self,
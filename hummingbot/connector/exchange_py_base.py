@@ -4,22 +4,24 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -45,6 +47,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of order status or trade updates requests in flight during an order update cycle. The requests are
+    # still subject to the throttler rate limits.
+    ORDER_UPDATE_CONCURRENCY = 10
+    # The server time is requested again only when the last sample is older than the interval, when the local clock
+    # drifted more than the maximum drift since then, or when the exchange rejected a request for its timestamp
+    TIME_SYNCHRONIZER_RESYNC_INTERVAL = 10 * MINUTE
+    TIME_SYNCHRONIZER_MAX_CLOCK_DRIFT_MS = 100.0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -61,8 +70,12 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
+        self._order_update_requests_count = 0
+        self._order_update_errors_count = 0
+        self._order_update_cycle_stats: Dict[str, float] = {}
+
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = SlidingWindowThrottler(
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
@@ -76,7 +89,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            direct_dispatch=client_config_map.order_book_direct_dispatch))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -149,6 +163,74 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_trading_required(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def is_bulk_order_status_request_supported(self) -> bool:
+        """
+        Connectors that can fetch the status of several orders with a single request (e.g. an open orders endpoint)
+        should return True and implement _request_order_status_in_bulk
+        """
+        return False
+
+    @property
+    def is_bulk_trade_updates_request_supported(self) -> bool:
+        """
+        Connectors that can fetch the fills of several orders with a single request (e.g. a my trades endpoint)
+        should return True and implement _all_trade_updates_for_orders
+        """
+        return False
+
+    @property
+    def is_batch_order_create_supported(self) -> bool:
+        """
+        Connectors that can place several orders with a single request should return True and implement _place_orders
+        """
+        return False
+
+    @property
+    def is_batch_order_cancel_supported(self) -> bool:
+        """
+        Connectors that can cancel several orders with a single request should return True and implement _place_cancels
+        """
+        return False
+
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        Maximum number of orders the exchange accepts in a single batch order creation request
+        """
+        return 1
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        """
+        Maximum number of orders the exchange accepts in a single batch order cancelation request
+        """
+        return 1
+
+    @property
+    def is_amend_order_supported(self) -> bool:
+        """
+        Connectors that can change the price and amount of an open order without canceling it should return True and
+        implement _place_amend
+        """
+        return False
+
+    @property
+    def order_update_cycle_stats(self) -> Dict[str, float]:
+        """
+        Returns the stats of the last active orders update cycle: when it finished, its duration in seconds, the number
+        of orders updated, and the number of requests issued and failed during the cycle
+        """
+        return self._order_update_cycle_stats
+
+    @property
+    def time_synchronizer_stats(self) -> Dict[str, float]:
+        """
+        Returns the offset with the server time and the round trip time of the last server time request in
+        milliseconds, the number of offset samples and when the server time was requested for the last time
+        """
+        return self._time_synchronizer.stats
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
@@ -320,6 +402,45 @@ class ExchangePyBase(ExchangeBase, ABC):
             **kwargs))
         return order_id
 
+    def batch_order_create(
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Creates a promise to create all the orders with batch order creation requests, if the exchange supports them.
+        Otherwise the orders are created one by one.
+
+        :param orders_to_create: the LimitOrder or MarketOrder objects representing the orders to create. The order IDs
+            can be blank
+
+        :return: the orders to create, with the ids assigned by the connector to them (the client ids)
+        """
+        if not self.is_batch_order_create_supported:
+            return super().batch_order_create(orders_to_create=orders_to_create)
+
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length,
+            )
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Creates a promise to cancel all the orders with batch order cancelation requests, if the exchange supports
+        them. Otherwise the orders are canceled one by one.
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        if not self.is_batch_order_cancel_supported:
+            super().batch_order_cancel(orders_to_cancel=orders_to_cancel)
+        else:
+            safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -357,6 +478,23 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def amend_order(self, trading_pair: str, client_order_id: str, price: Decimal, amount: Decimal):
+        """
+        Creates a promise to change the price and amount of an open limit order in the exchange. The order keeps its
+        client order id, and is canceled if the exchange rejects the change
+
+        :param trading_pair: the trading pair the order to amend operates with
+        :param client_order_id: the client id of the order to amend
+        :param price: the new price of the order
+        :param amount: the new total amount of the order, including the amount already filled
+
+        :return: the client id of the order to amend
+        """
+        if not self.is_amend_order_supported:
+            return super().amend_order(trading_pair, client_order_id, price, amount)
+        safe_ensure_future(self._execute_order_amend(trading_pair, client_order_id, price, amount))
+        return client_order_id
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -407,6 +545,47 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = self._track_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+        try:
+            await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+
+    def _track_and_validate_order(self,
+                                  trade_type: TradeType,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  order_type: OrderType,
+                                  price: Optional[Decimal] = None,
+                                  **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking the order with the quantized price and amount, and checks it against the trading rules
+
+        :return: the tracked order, or None if the order is not valid (it is then marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -433,37 +612,23 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            order = None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            order = None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            order = None
 
-        except asyncio.CancelledError:
-            raise
-        except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
+        return order
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -501,7 +666,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self.logger().network(
             f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
             f"{amount} {trading_pair} {price}.",
-            exc_info=True,
+            exc_info=exception,
             app_warning_msg=f"Failed to submit {trade_type.name.upper()} order to {self.name_cap}. Check API key and network connection."
         )
         self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
@@ -567,6 +732,175 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    async def _execute_order_amend(self, trading_pair: str, order_id: str, price: Decimal, amount: Decimal) -> bool:
+        """
+        Requests the exchange to change the price and amount of an active order. If the new amount is not valid or
+        the exchange rejects the change the order is canceled, so that it is not left in the book at a stale price
+
+        :param trading_pair: the trading pair the order to amend operates with
+        :param order_id: the client id of the order to amend
+        :param price: the new price of the order
+        :param amount: the new total amount of the order
+
+        :return: True if the exchange accepted the change
+        """
+        tracked_order = self._order_tracker.fetch_tracked_order(order_id)
+        if tracked_order is None or tracked_order.is_done or tracked_order.is_pending_cancel_confirmation:
+            self.logger().warning(f"Failed to amend order {order_id} (order not active)")
+            return False
+
+        price = self.quantize_order_price(trading_pair, price)
+        amount = self.quantize_order_amount(trading_pair, amount)
+        trading_rule = self._trading_rules[trading_pair]
+        if amount < trading_rule.min_order_size or amount <= tracked_order.executed_amount_base:
+            self.logger().warning(f"Amount {amount} is not valid for the order {order_id}. Canceling the order instead "
+                                  f"of amending it.")
+            await self._execute_order_cancel(order=tracked_order)
+            return False
+
+        try:
+            update_timestamp = await self._place_amend(order_id, tracked_order, price, amount)
+            tracked_order.update_with_amend(price=price, amount=amount, update_timestamp=update_timestamp)
+            self.logger().info(f"Amended order {order_id} to {amount} {trading_pair} at {price}.")
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(f"Failed to amend order {order_id}. Canceling the order.", exc_info=True)
+            await self._execute_order_cancel(order=tracked_order)
+            return False
+
+    async def _execute_batch_order_create(self, orders_to_create: List[Union[LimitOrder, MarketOrder]]):
+        """
+        Starts tracking the orders and sends the valid ones to the exchange in batches of at most
+        batch_order_create_max_size orders. The batches are sent concurrently.
+
+        :param orders_to_create: the orders to create, with their client ids already assigned
+        """
+        in_flight_orders_to_create = []
+        for order in orders_to_create:
+            in_flight_order = self._track_and_validate_order(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order.order_type(),
+                price=order.price,
+                position_action=order.position,
+            )
+            if in_flight_order is not None:
+                in_flight_orders_to_create.append(in_flight_order)
+
+        batch_size = self.batch_order_create_max_size
+        await safe_gather(*[
+            self._place_orders_and_process_updates(orders=in_flight_orders_to_create[index:index + batch_size])
+            for index in range(0, len(in_flight_orders_to_create), batch_size)
+        ])
+
+    async def _place_orders_and_process_updates(self, orders: List[InFlightOrder]):
+        try:
+            place_order_results = await self._place_orders(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            place_order_results = [
+                PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                    exception=ex,
+                )
+                for order in orders
+            ]
+
+        for order, place_order_result in zip(orders, place_order_results):
+            if place_order_result.exception is not None:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=place_order_result.exception,
+                )
+            else:
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(place_order_result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=place_order_result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        results = []
+        tracked_orders_to_cancel = []
+
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(client_order_id=order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders_to_cancel.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+
+        results.extend(await self._execute_batch_order_cancel(orders_to_cancel=tracked_orders_to_cancel))
+
+        return results
+
+    async def _execute_batch_order_cancel(self, orders_to_cancel: List[InFlightOrder]) -> List[CancellationResult]:
+        """
+        Requests the exchange to cancel the orders in batches of at most batch_order_cancel_max_size orders. The
+        batches are sent concurrently.
+
+        :return: a list of CancellationResult instances, one for each of the orders to be cancelled
+        """
+        batch_size = self.batch_order_cancel_max_size
+        batches_results = await safe_gather(*[
+            self._place_cancels_and_process_updates(orders=orders_to_cancel[index:index + batch_size])
+            for index in range(0, len(orders_to_cancel), batch_size)
+        ])
+        return [result for batch_results in batches_results for result in batch_results]
+
+    async def _place_cancels_and_process_updates(self, orders: List[InFlightOrder]) -> List[CancellationResult]:
+        try:
+            cancel_order_results = await self._place_cancels(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            cancel_order_results = [
+                CancelOrderResult(client_order_id=order.client_order_id, trading_pair=order.trading_pair, exception=ex)
+                for order in orders
+            ]
+
+        cancelation_results = []
+        for order, cancel_order_result in zip(orders, cancel_order_results):
+            success = False
+            if cancel_order_result.not_found:
+                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            elif cancel_order_result.exception is not None:
+                self.logger().error(f"Failed to cancel order {order.client_order_id}",
+                                    exc_info=cancel_order_result.exception)
+            else:
+                update_timestamp = self.current_timestamp
+                if update_timestamp is None or math.isnan(update_timestamp):
+                    update_timestamp = self._time()
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=(OrderState.CANCELED
+                               if self.is_cancel_request_in_exchange_synchronous
+                               else OrderState.PENDING_CANCEL),
+                )
+                self._order_tracker.process_order_update(order_update)
+                success = True
+            cancelation_results.append(CancellationResult(order_id=order.client_order_id, success=success))
+        return cancelation_results
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -640,6 +974,40 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Places the orders with a single batch order creation request. Required if is_batch_order_create_supported.
+
+        :param orders: the tracked orders to place, at most batch_order_create_max_size of them
+
+        :return: the result of each order, in the same order as the orders. A failed order has the exception set
+        """
+        raise NotImplementedError
+
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Cancels the orders with a single batch order cancelation request. Required if is_batch_order_cancel_supported.
+
+        :param orders: the tracked orders to cancel, at most batch_order_cancel_max_size of them
+
+        :return: the result of each cancelation, in the same order as the orders. A cancelation that failed has the
+            exception set, or not_found if the exchange does not know the order
+        """
+        raise NotImplementedError
+
+    async def _place_amend(self, order_id: str, tracked_order: InFlightOrder, price: Decimal, amount: Decimal) -> float:
+        """
+        Changes the price and amount of an open order in the exchange. Required if is_amend_order_supported.
+
+        :param order_id: the client id of the order to amend
+        :param tracked_order: the tracked order to amend
+        :param price: the new price of the order, already quantized
+        :param amount: the new total amount of the order, already quantized
+
+        :return: the timestamp of the change. An exception is raised if the exchange rejects it
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -767,14 +1135,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         Performs all required operation to keep the connector updated and synchronized with the exchange.
         It contains the backup logic to update status using API requests in case the main update source
         (the user stream data source websocket) fails.
-        It also updates the time synchronizer. This is necessary because the exchange requires
-        the time of the client to be the same as the time in the exchange.
+        It also updates the time synchronizer when its offset is outdated. This is necessary because the exchange
+        requires the time of the client to be the same as the time in the exchange.
         Executes when the _poll_notifier event is enabled by the `tick` function.
         """
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                await self._update_time_synchronizer_if_required()
 
                 # the following method is implementation-specific
                 await self._status_polling_loop_fetch_updates()
@@ -808,6 +1176,12 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().exception(f"Error requesting time from {self.name_cap} server")
                 raise
 
+    async def _update_time_synchronizer_if_required(self):
+        if self._time_synchronizer.is_resync_required(
+                max_sample_age=self.TIME_SYNCHRONIZER_RESYNC_INTERVAL,
+                max_clock_drift_ms=self.TIME_SYNCHRONIZER_MAX_CLOCK_DRIFT_MS):
+            await self._update_time_synchronizer()
+
     async def _lost_orders_update_polling_loop(self):
         """
         This loop regularly executes the update of lost orders, to keep receiving any new order fill or status change
@@ -874,6 +1248,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         kwargs["method"] = RESTMethod.DELETE
         return await self._api_request(*args, **kwargs)
 
+    async def _api_patch(self, *args, **kwargs):
+        kwargs["method"] = RESTMethod.PATCH
+        return await self._api_request(*args, **kwargs)
+
     async def _api_request_url(self, path_url: str, is_auth_required: bool = False) -> str:
         if is_auth_required:
             url = self.web_utils.private_rest_url(path_url, domain=self.domain)
@@ -951,18 +1329,40 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        if len(orders) == 0:
+            return
+        if self.is_bulk_trade_updates_request_supported:
+            await self._update_orders_fills_in_bulk(orders=orders)
+        else:
+            await self._run_order_updates_concurrently(orders=orders, update_function=self._update_order_fills)
+
+    async def _update_orders_fills_in_bulk(self, orders: List[InFlightOrder]):
+        try:
+            self._order_update_requests_count += 1
+            trade_updates = await self._all_trade_updates_for_orders(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self._order_update_errors_count += 1
+            self.logger().warning(f"Failed to fetch trade updates. Error: {request_error}", exc_info=request_error)
+            return
+        for trade_update in trade_updates:
+            self._order_tracker.process_trade_update(trade_update)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            self._order_update_requests_count += 1
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self._order_update_errors_count += 1
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -991,14 +1391,61 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
-                self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                await error_handler(order, request_error)
+        if len(orders) > 0 and self.is_bulk_order_status_request_supported:
+            orders = await self._update_orders_in_bulk(orders=orders)
+
+        async def update_order(order: InFlightOrder):
+            await self._update_order_with_error_handler(order=order, error_handler=error_handler)
+
+        await self._run_order_updates_concurrently(orders=orders, update_function=update_order)
+
+    async def _update_orders_in_bulk(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Processes the order updates returned by the bulk order status request.
+        :return: the orders not covered by the bulk request (e.g. orders no longer open), which have to be updated
+        individually
+        """
+        try:
+            self._order_update_requests_count += 1
+            order_updates = await self._request_order_status_in_bulk(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self._order_update_errors_count += 1
+            self.logger().warning(
+                f"Failed to fetch the status of the orders in bulk. Requesting them individually. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return orders
+
+        updated_order_ids = set()
+        for order_update in order_updates:
+            self._order_tracker.process_order_update(order_update)
+            updated_order_ids.add(order_update.client_order_id)
+        return [order for order in orders if order.client_order_id not in updated_order_ids]
+
+    async def _update_order_with_error_handler(self, order: InFlightOrder, error_handler: Callable):
+        try:
+            self._order_update_requests_count += 1
+            order_update = await self._request_order_status(tracked_order=order)
+            self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self._order_update_errors_count += 1
+            await error_handler(order, request_error)
+
+    async def _run_order_updates_concurrently(self, orders: List[InFlightOrder], update_function: Callable):
+        """
+        Runs the update function for each order, with at most ORDER_UPDATE_CONCURRENCY updates running at the same time
+        """
+        semaphore = asyncio.Semaphore(self.ORDER_UPDATE_CONCURRENCY)
+
+        async def bounded_update(order: InFlightOrder):
+            async with semaphore:
+                await update_function(order)
+
+        await safe_gather(*[bounded_update(order) for order in orders])
 
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
@@ -1013,9 +1460,23 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
+        start_time = self._time()
+        requests_count = self._order_update_requests_count
+        errors_count = self._order_update_errors_count
+        orders_count = len(self.in_flight_orders)
+
         await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
         await self._update_orders()
 
+        end_time = self._time()
+        self._order_update_cycle_stats = {
+            "timestamp": end_time,
+            "duration": end_time - start_time,
+            "orders": orders_count,
+            "requests": self._order_update_requests_count - requests_count,
+            "errors": self._order_update_errors_count - errors_count,
+        }
+
     async def _update_lost_orders_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
         await self._update_lost_orders()
@@ -1050,6 +1511,21 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _all_trade_updates_for_orders(self, orders: List[InFlightOrder]) -> List[TradeUpdate]:
+        """
+        Fetches the fills of all the orders with as few requests as possible.
+        Only used when is_bulk_trade_updates_request_supported is True.
+        """
+        raise NotImplementedError
+
+    async def _request_order_status_in_bulk(self, orders: List[InFlightOrder]) -> List[OrderUpdate]:
+        """
+        Fetches the status of the orders with as few requests as possible. Orders without an update in the result are
+        then requested individually with _request_order_status.
+        Only used when is_bulk_order_status_request_supported is True.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
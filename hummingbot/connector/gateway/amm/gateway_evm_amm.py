@@ -14,6 +14,7 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -29,7 +30,6 @@ from hummingbot.core.event.events import (
 from hummingbot.core.gateway import check_transaction_exceptions
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -223,10 +223,8 @@ class GatewayEVMAMM(ConnectorBase):
         Updates inflight order statuses from API results
         This is used by the MarketsRecorder class to orchestrate market classes at a higher level.
         """
-        self._order_tracker._in_flight_orders.update({
-            key: GatewayInFlightOrder.from_json(value)
-            for key, value in saved_states.items()
-        })
+        for value in saved_states.values():
+            self._order_tracker.start_tracking_order(GatewayInFlightOrder.from_json(value))
 
     def create_approval_order_id(self, token_symbol: str) -> str:
         return f"approve-{self.connector_name}-{token_symbol}"
@@ -271,6 +269,20 @@ class GatewayEVMAMM(ConnectorBase):
                 app_warning_msg=str(e)
             )
 
+    async def update_block_number(self):
+        """
+        Registers the current block number of the chain in the quote cache, so quotes from previous blocks are
+        requested again. The quote cache throttles the requests of the block number for all the connectors of the chain.
+        """
+        try:
+            await GatewayQuoteCache.get_instance().request_block_number(
+                self._get_gateway_instance(), self.chain, self.network
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().debug("Error fetching the current block number", exc_info=True)
+
     async def get_gas_estimate(self):
         """
         Gets the gas estimates for the connector.
@@ -408,7 +420,15 @@ class GatewayEVMAMM(ConnectorBase):
             return Decimal(str(price))
         return None
 
-    @async_ttl_cache(ttl=5, maxsize=10)
+    async def get_price_response(self, base: str, quote: str, amount: Decimal, side: TradeType) -> Dict[str, Any]:
+        """
+        Requests the Gateway price for the amount through the quote cache, which shares the response with any other
+        request of the same quote
+        """
+        return await GatewayQuoteCache.get_instance().get_price(
+            self._get_gateway_instance(), self.chain, self.network, self.connector_name, base, quote, amount, side
+        )
+
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -442,9 +462,7 @@ class GatewayEVMAMM(ConnectorBase):
             if test_price is not None:
                 # Grab the gas price for test net.
                 try:
-                    resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                        self.chain, self.network, self.connector_name, base, quote, amount, side
-                    )
+                    resp: Dict[str, Any] = await self.get_price_response(base, quote, amount, side)
                     gas_price_token: str = resp["gasPriceToken"]
                     gas_cost: Decimal = Decimal(resp["gasCost"])
                     self.network_transaction_fee = TokenAmount(gas_price_token, gas_cost)
@@ -456,9 +474,7 @@ class GatewayEVMAMM(ConnectorBase):
 
         # Pull the price from gateway.
         try:
-            resp: Dict[str, Any] = await self._get_gateway_instance().get_price(
-                self.chain, self.network, self.connector_name, base, quote, amount, side
-            )
+            resp: Dict[str, Any] = await self.get_price_response(base, quote, amount, side)
             return self.parse_price_response(base, quote, amount, side, price_response=resp)
         except asyncio.CancelledError:
             raise
@@ -641,14 +657,11 @@ class GatewayEVMAMM(ConnectorBase):
         tx_hash_list: List[str] = await safe_gather(*[
             tracked_approval.get_exchange_order_id() for tracked_approval in tracked_approvals
         ])
-        transaction_states: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
+        transaction_states: List[Union[Dict[str, Any], Exception]] = await self._get_gateway_instance().get_transaction_statuses(
+            self.chain,
+            self.network,
+            tx_hash_list
+        )
         for tracked_approval, transaction_status in zip(tracked_approvals, transaction_states):
             token_symbol: str = self.get_token_symbol_from_approval_order_id(tracked_approval.client_order_id)
             if isinstance(transaction_status, Exception):
@@ -699,14 +712,11 @@ class GatewayEVMAMM(ConnectorBase):
             "Polling for order status updates of %d canceled orders.",
             len(canceled_tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in [t.cancel_tx_hash for t in canceled_tracked_orders]
-        ], return_exceptions=True)
+        update_results: List[Union[Dict[str, Any], Exception]] = await self._get_gateway_instance().get_transaction_statuses(
+            self.chain,
+            self.network,
+            [t.cancel_tx_hash for t in canceled_tracked_orders]
+        )
         for tracked_order, update_result in zip(canceled_tracked_orders, update_results):
             if isinstance(update_result, Exception):
                 raise update_result
@@ -782,14 +792,11 @@ class GatewayEVMAMM(ConnectorBase):
             "Polling for order status updates of %d orders.",
             len(tracked_orders)
         )
-        update_results: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
-            self._get_gateway_instance().get_transaction_status(
-                self.chain,
-                self.network,
-                tx_hash
-            )
-            for tx_hash in tx_hash_list
-        ], return_exceptions=True)
+        update_results: List[Union[Dict[str, Any], Exception]] = await self._get_gateway_instance().get_transaction_statuses(
+            self.chain,
+            self.network,
+            tx_hash_list
+        )
         for tracked_order, tx_details in zip(tracked_orders, update_results):
             if isinstance(tx_details, Exception):
                 self.logger().error(f"An error occurred fetching transaction status of {tracked_order.client_order_id}")
@@ -915,6 +922,7 @@ class GatewayEVMAMM(ConnectorBase):
                 self._poll_notifier = asyncio.Event()
                 await self._poll_notifier.wait()
                 await safe_gather(
+                    self.update_block_number(),
                     self.update_balances(on_interval=True),
                     self.update_canceling_transactions(self.canceling_orders),
                     self.update_token_approval_status(self.approval_orders),
@@ -0,0 +1,141 @@
+import copy
+import time
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Tuple
+
+from hummingbot.core.data_type.common import TradeType
+
+if TYPE_CHECKING:
+    from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+
+
+class GatewayQuoteCacheKey(NamedTuple):
+    chain: str
+    network: str
+    connector: str
+    base_asset: str
+    quote_asset: str
+    side: TradeType
+    amount: Decimal
+
+
+class GatewayQuoteCacheEntry(NamedTuple):
+    response: Dict[str, Any]
+    timestamp: float
+    block_number: Optional[int]
+
+
+class GatewayQuoteCache:
+    """
+    Shares the Gateway AMM price responses between the connectors and strategies that request the same quote.
+
+    Quotes are keyed by chain, network, connector, trading pair, side and amount bucket (the amount rounded to
+    `AMOUNT_SIGNIFICANT_DIGITS` significant digits, which is also the amount requested to Gateway). Concurrent requests
+    for the same quote are coalesced into a single HTTP request by the Gateway client. A quote is requested again after
+    `TTL` seconds, or when a new block number is registered for its chain and network. The block number is requested to
+    Gateway at most once every `BLOCK_NUMBER_UPDATE_INTERVAL` seconds for each chain and network, whatever the number of
+    connectors sharing the cache.
+
+    Each caller gets its own copy of the cached response.
+    """
+
+    TTL = 5.0
+    AMOUNT_SIGNIFICANT_DIGITS = 6
+    BLOCK_NUMBER_UPDATE_INTERVAL = 5.0
+
+    _shared_instance: Optional["GatewayQuoteCache"] = None
+
+    @classmethod
+    def get_instance(cls) -> "GatewayQuoteCache":
+        if cls._shared_instance is None:
+            cls._shared_instance = GatewayQuoteCache()
+        return cls._shared_instance
+
+    def __init__(self,
+                 ttl: float = TTL,
+                 amount_significant_digits: int = AMOUNT_SIGNIFICANT_DIGITS,
+                 block_number_update_interval: float = BLOCK_NUMBER_UPDATE_INTERVAL):
+        self._ttl = ttl
+        self._amount_significant_digits = amount_significant_digits
+        self._block_number_update_interval = block_number_update_interval
+        self._quotes: Dict[GatewayQuoteCacheKey, GatewayQuoteCacheEntry] = {}
+        self._block_numbers: Dict[Tuple[str, str], int] = {}
+        self._block_number_request_timestamps: Dict[Tuple[str, str], float] = {}
+
+    def amount_bucket(self, amount: Decimal) -> Decimal:
+        if not amount.is_finite() or amount == 0:
+            return amount
+        exponent = amount.adjusted() - self._amount_significant_digits + 1
+        return amount.quantize(Decimal(1).scaleb(exponent))
+
+    def block_number(self, chain: str, network: str) -> Optional[int]:
+        return self._block_numbers.get((chain, network))
+
+    def update_block_number(self, chain: str, network: str, block_number: int):
+        """
+        Registers the current block number of a chain. Quotes requested on previous blocks are no longer served.
+        """
+        current_block_number = self._block_numbers.get((chain, network))
+        if current_block_number is None or block_number > current_block_number:
+            self._block_numbers[(chain, network)] = block_number
+
+    async def request_block_number(self, gateway_instance: "GatewayHttpClient", chain: str, network: str):
+        """
+        Requests the current block number of a chain to Gateway and registers it, unless it was already requested in
+        the last `block_number_update_interval` seconds.
+        """
+        now = self._time()
+        last_request_timestamp = self._block_number_request_timestamps.get((chain, network))
+        if last_request_timestamp is not None and now - last_request_timestamp < self._block_number_update_interval:
+            return
+        # Registered before the request, so the connectors polling at the same time do not request it again
+        self._block_number_request_timestamps[(chain, network)] = now
+        chain_status = await gateway_instance.get_network_status(chain=chain, network=network)
+        block_number = chain_status.get("currentBlockNumber") if isinstance(chain_status, dict) else None
+        if block_number is not None:
+            self.update_block_number(chain, network, int(block_number))
+
+    async def get_price(
+            self,
+            gateway_instance: "GatewayHttpClient",
+            chain: str,
+            network: str,
+            connector: str,
+            base_asset: str,
+            quote_asset: str,
+            amount: Decimal,
+            side: TradeType,
+    ) -> Dict[str, Any]:
+        """
+        Returns the Gateway price response for the amount bucket of `amount`, requesting it only if there is no valid
+        cached response for it.
+        """
+        amount = self.amount_bucket(amount)
+        key = GatewayQuoteCacheKey(chain, network, connector, base_asset, quote_asset, side, amount)
+        block_number = self.block_number(chain, network)
+        now = self._time()
+        entry = self._quotes.get(key)
+
+        if entry is None or not self._is_valid(entry, now, block_number):
+            self._remove_outdated_quotes(now)
+            response = await gateway_instance.get_price(chain, network, connector, base_asset, quote_asset, amount, side)
+            entry = GatewayQuoteCacheEntry(response=response, timestamp=now, block_number=block_number)
+            self._quotes[key] = entry
+
+        return copy.deepcopy(entry.response)
+
+    def clear(self):
+        self._quotes.clear()
+        self._block_numbers.clear()
+        self._block_number_request_timestamps.clear()
+
+    def _is_valid(self, entry: GatewayQuoteCacheEntry, timestamp: float, block_number: Optional[int]) -> bool:
+        return timestamp - entry.timestamp <= self._ttl and entry.block_number == block_number
+
+    def _remove_outdated_quotes(self, timestamp: float):
+        outdated_keys = [key for key, entry in self._quotes.items() if timestamp - entry.timestamp > self._ttl]
+        for key in outdated_keys:
+            del self._quotes[key]
+
+    def _time(self) -> float:
+        return time.time()
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Dict, Optional
 
 import numpy
 
@@ -15,6 +15,7 @@ class TimeSynchronizer:
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+    The offset is calculated when a sample is registered and cached, so `time` does not iterate the samples.
     """
 
     NaN = float("nan")
@@ -22,6 +23,11 @@ class TimeSynchronizer:
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        self._cached_time_offset_ms: Optional[float] = None
+        self._last_round_trip_time_ms: float = self.NaN
+        self._last_sample_seconds_counter: Optional[float] = None
+        self._last_sample_local_clock_offset_ms: float = self.NaN
+        self._last_sample_timestamp: float = self.NaN
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -31,20 +37,66 @@ class TimeSynchronizer:
 
     @property
     def time_offset_ms(self) -> float:
-        if not self._time_offset_ms:
+        if self._cached_time_offset_ms is None:
             offset = (self._time() - self._current_seconds_counter()) * 1e3
         else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+            offset = self._cached_time_offset_ms
 
         return offset
 
+    @property
+    def round_trip_time_ms(self) -> float:
+        """
+        Returns the round trip time of the last server time request, or NaN if the server time was never requested
+        """
+        return self._last_round_trip_time_ms
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the current offset with the server time and the round trip time of the last server time request,
+        both in milliseconds, the number of registered samples and the local time of the last server time request
+        """
+        return {
+            "offset_ms": self.time_offset_ms if self._time_offset_ms else self.NaN,
+            "round_trip_time_ms": self._last_round_trip_time_ms,
+            "samples": len(self._time_offset_ms),
+            "timestamp": self._last_sample_timestamp,
+        }
+
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
+        median = numpy.median(self._time_offset_ms)
+        weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+        self._cached_time_offset_ms = float(numpy.mean([median, weighted_average]))
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._cached_time_offset_ms = None
+        self._last_sample_seconds_counter = None
+
+    def is_resync_required(self, max_sample_age: float, max_clock_drift_ms: float) -> bool:
+        """
+        Checks if the offset with the server time has to be refreshed. That is the case when there are no samples, when
+        the last server time request is older than `max_sample_age` seconds, or when the local clock drifted more than
+        `max_clock_drift_ms` from the monotonic counter since then (i.e. the system clock was adjusted or suspended).
+        Samples registered directly with `add_time_offset_ms_sample` never expire.
+
+        :param max_sample_age: maximum age in seconds of the last server time request
+        :param max_clock_drift_ms: maximum drift in milliseconds between the local clock and the monotonic counter
+
+        :return: True if the server time should be requested again
+        """
+        if not self._time_offset_ms:
+            return True
+        if self._last_sample_seconds_counter is None:
+            return False
+
+        seconds_counter = self._current_seconds_counter()
+        if seconds_counter - self._last_sample_seconds_counter > max_sample_age:
+            return True
+        local_clock_offset_ms = (self._time() - seconds_counter) * 1e3
+        return abs(local_clock_offset_ms - self._last_sample_local_clock_offset_ms) > max_clock_drift_ms
 
     def time(self) -> float:
         """
@@ -67,6 +119,10 @@ class TimeSynchronizer:
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = server_time_ms - local_server_time_pre_image_ms
             self.add_time_offset_ms_sample(time_offset_ms)
+            self._last_round_trip_time_ms = local_after_ms - local_before_ms
+            self._last_sample_seconds_counter = local_after_ms * 1e-3
+            self._last_sample_timestamp = self._time()
+            self._last_sample_local_clock_offset_ms = self._last_sample_timestamp * 1e3 - local_after_ms
         except asyncio.CancelledError:
             raise
         except Exception:
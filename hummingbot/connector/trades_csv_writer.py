@@ -0,0 +1,117 @@
+import csv
+import logging
+import os
+from datetime import datetime, timezone
+from shutil import move
+from typing import Any, Dict, IO, Optional, Sequence, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+
+class _CSVFile:
+    def __init__(self, path: str, header: Tuple[str, ...], handle: IO, opened_date: str):
+        self.path = path
+        self.header = header
+        self.handle = handle
+        self.writer = csv.writer(handle)
+        self.opened_date = opened_date
+
+
+class TradesCSVWriter:
+    """
+    Appends trade rows to CSV files through buffered file handles that are kept open.
+
+    The header of an existing file is checked only once, when the file is opened. A file with a different header is
+    moved away (`<name>_old_<timestamp>.csv`) and a new one is started. Rows are buffered until `flush` is called, so
+    callers can write the rows of a batch of trades and flush them together.
+
+    Files can also be rotated when they reach `max_file_size` bytes or, if `rotate_daily` is set, when the UTC date
+    changes. Rotated files are renamed to `<name>_<timestamp>.csv`.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 max_file_size: Optional[int] = None,
+                 rotate_daily: bool = False,
+                 buffer_size: int = 64 * 1024):
+        self._max_file_size: Optional[int] = max_file_size
+        self._rotate_daily: bool = rotate_daily
+        self._buffer_size: int = buffer_size
+        self._files: Dict[str, _CSVFile] = {}
+
+    def write_row(self, path: str, header: Sequence[str], row: Sequence[Any]):
+        header = tuple(header)
+        csv_file = self._files.get(path)
+        if csv_file is not None and (csv_file.header != header or self._needs_rotation(csv_file)):
+            self._close(csv_file)
+            if csv_file.header == header:
+                self._rotate(path)
+            csv_file = None
+        if csv_file is None:
+            csv_file = self._open(path, header)
+        csv_file.writer.writerow(row)
+
+    def flush(self):
+        for csv_file in self._files.values():
+            csv_file.handle.flush()
+
+    def close(self):
+        for csv_file in list(self._files.values()):
+            self._close(csv_file)
+
+    def _open(self, path: str, header: Tuple[str, ...]) -> _CSVFile:
+        if os.path.exists(path) and not self._file_matches_header(path, header):
+            move(path, self._available_path(path[:-4] + "_old_" + self._timestamp()))
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        handle = open(path, mode="a", newline="", buffering=self._buffer_size)
+        csv_file = _CSVFile(path=path, header=header, handle=handle, opened_date=self._current_date())
+        if write_header:
+            csv_file.writer.writerow(header)
+        self._files[path] = csv_file
+        return csv_file
+
+    def _close(self, csv_file: _CSVFile):
+        try:
+            csv_file.handle.close()
+        except Exception:
+            self.logger().error(f"Unexpected error closing {csv_file.path}.", exc_info=True)
+        self._files.pop(csv_file.path, None)
+
+    def _needs_rotation(self, csv_file: _CSVFile) -> bool:
+        if self._rotate_daily and csv_file.opened_date != self._current_date():
+            return True
+        # tell() includes the buffered rows that have not been written to the file yet
+        return self._max_file_size is not None and csv_file.handle.tell() >= self._max_file_size
+
+    def _rotate(self, path: str):
+        if os.path.exists(path):
+            move(path, self._available_path(path[:-4] + "_" + self._timestamp()))
+
+    @staticmethod
+    def _available_path(path_prefix: str) -> str:
+        path = path_prefix + ".csv"
+        index = 1
+        while os.path.exists(path):
+            path = f"{path_prefix}_{index}.csv"
+            index += 1
+        return path
+
+    @staticmethod
+    def _file_matches_header(path: str, header: Tuple[str, ...]) -> bool:
+        with open(path, newline="") as file:
+            first_row = next(csv.reader(file), None)
+        return first_row is None or tuple(first_row) == header
+
+    @staticmethod
+    def _current_date() -> str:
+        return datetime.now(timezone.utc).strftime("%Y%m%d")
+
+    @staticmethod
+    def _timestamp() -> str:
+        return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
@@ -0,0 +1,222 @@
+import asyncio
+import time
+from collections import defaultdict, deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+# Added to the wake up delay so the oldest task has left the window when the waiters are processed
+WAKE_UP_DELAY_MARGIN = 1e-3
+
+
+class LimitWindow:
+    """
+    Time ordered log of the tasks executed for one rate limit, with the running total of their weights.
+    """
+
+    def __init__(self):
+        self.entries: Deque[Tuple[float, int]] = deque()
+        self.capacity_used: int = 0
+
+    def expire(self, now: float, window_length: float):
+        entries = self.entries
+        while entries and now - entries[0][0] > window_length:
+            self.capacity_used -= entries.popleft()[1]
+
+    def add(self, timestamp: float, weight: int):
+        self.entries.append((timestamp, weight))
+        self.capacity_used += weight
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) returned by SlidingWindowThrottler.execute_task(). Entering the
+    context waits until all the rate limits of the task have capacity for it.
+    """
+
+    def __init__(self, throttler: "SlidingWindowThrottler", limits: List[Tuple[RateLimit, int]]):
+        self._throttler = throttler
+        self._limits = limits
+
+    def within_capacity(self) -> bool:
+        return self._throttler.within_capacity(self._limits)
+
+    async def acquire(self):
+        await self._throttler.acquire(self._limits)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Throttler engine with the same `execute_task(limit_id)` API as AsyncThrottler.
+
+    Instead of scanning a shared list of task logs on every check, it keeps one time ordered window per limit id with
+    the running total of the weights in it, so checking the capacity of a task only costs expiring the tasks that left
+    its windows. Tasks that have to wait are queued, and the queue is processed when the oldest task of a full window
+    leaves it, instead of polling every `retry_interval`.
+    Waiting tasks are served in arrival order: a task never goes ahead of an earlier waiting task that shares one of
+    its rate limits.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None):
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+        self._windows: Dict[str, LimitWindow] = defaultdict(LimitWindow)
+        self._waiters: Deque[Tuple[List[Tuple[RateLimit, int]], asyncio.Future]] = deque()
+        # Limit ids used by the waiting tasks
+        self._waiting_limit_ids: Set[str] = set()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+        self._wake_up_time: float = 0
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_limits = self.get_related_limits(limit_id=limit_id)
+        limits = [] if rate_limit is None else [(rate_limit, rate_limit.weight)] + related_limits
+        return SlidingWindowRequestContext(throttler=self, limits=limits)
+
+    def capacity_used(self, limit_id: str) -> int:
+        """
+        Total weight of the tasks executed for the limit id within its time window
+        """
+        rate_limit = self._id_to_limit_map.get(limit_id)
+        window = self._windows.get(limit_id)
+        if rate_limit is None or window is None:
+            return 0
+        window.expire(self._time(), self._window_length(rate_limit))
+        return window.capacity_used
+
+    def within_capacity(self, limits: List[Tuple[RateLimit, int]]) -> bool:
+        """
+        Checks if a task with the given rate limits and weights can be executed now, without waiting.
+        """
+        return not self._shares_limit_with_waiters(limits) and self._missing_capacity_limit(limits, self._time()) is None
+
+    async def acquire(self, limits: List[Tuple[RateLimit, int]]):
+        if len(limits) == 0:
+            return
+        now = self._time()
+        if not self._shares_limit_with_waiters(limits) and self._missing_capacity_limit(limits, now) is None:
+            self._register_task(limits, now)
+            return
+
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.append((limits, future))
+        self._process_waiters()
+        try:
+            await future
+        except asyncio.CancelledError:
+            self._remove_waiter(future)
+            raise
+
+    def _window_length(self, rate_limit: RateLimit) -> float:
+        return rate_limit.time_interval * (1 + self._safety_margin_pct)
+
+    def _missing_capacity_limit(self, limits: List[Tuple[RateLimit, int]], now: float) -> Optional[RateLimit]:
+        """
+        Returns the first rate limit without capacity for the weight required by the task, if any
+        """
+        for rate_limit, weight in limits:
+            window = self._windows[rate_limit.limit_id]
+            window.expire(now, self._window_length(rate_limit))
+            if window.capacity_used + weight > rate_limit.limit:
+                self._log_max_capacity_reached(rate_limit, window.capacity_used, now)
+                return rate_limit
+        return None
+
+    def _shares_limit_with_waiters(self, limits: List[Tuple[RateLimit, int]]) -> bool:
+        return any(rate_limit.limit_id in self._waiting_limit_ids for rate_limit, _ in limits)
+
+    def _register_task(self, limits: List[Tuple[RateLimit, int]], now: float):
+        for rate_limit, weight in limits:
+            self._windows[rate_limit.limit_id].add(now, weight)
+
+    def _process_waiters(self):
+        """
+        Lets the waiting tasks that fit in their windows go, in arrival order, and schedules the next check for the
+        moment the first full window frees capacity.
+        """
+        now = self._time()
+        blocked_limit_ids: Set[str] = set()
+        next_wake_up_time: Optional[float] = None
+        remaining_waiters = deque()
+
+        for limits, future in self._waiters:
+            if future.done():
+                continue
+            if any(rate_limit.limit_id in blocked_limit_ids for rate_limit, _ in limits):
+                remaining_waiters.append((limits, future))
+                blocked_limit_ids.update(rate_limit.limit_id for rate_limit, _ in limits)
+                continue
+            missing_capacity_limit = self._missing_capacity_limit(limits, now)
+            if missing_capacity_limit is None:
+                self._register_task(limits, now)
+                future.set_result(None)
+            else:
+                remaining_waiters.append((limits, future))
+                blocked_limit_ids.update(rate_limit.limit_id for rate_limit, _ in limits)
+                window = self._windows[missing_capacity_limit.limit_id]
+                if window.entries:
+                    wake_up_time = window.entries[0][0] + self._window_length(missing_capacity_limit)
+                    next_wake_up_time = (wake_up_time if next_wake_up_time is None
+                                         else min(next_wake_up_time, wake_up_time))
+
+        self._waiters = remaining_waiters
+        self._waiting_limit_ids = blocked_limit_ids
+        if next_wake_up_time is not None:
+            self._schedule_wake_up(next_wake_up_time, now)
+
+    def _schedule_wake_up(self, wake_up_time: float, now: float):
+        if self._wake_up_handle is not None:
+            if self._wake_up_time <= wake_up_time:
+                return
+            self._wake_up_handle.cancel()
+        self._wake_up_time = wake_up_time
+        self._wake_up_handle = asyncio.get_event_loop().call_later(
+            max(0.0, wake_up_time - now) + WAKE_UP_DELAY_MARGIN, self._wake_up)
+
+    def _wake_up(self):
+        self._wake_up_handle = None
+        self._process_waiters()
+
+    def _remove_waiter(self, future: asyncio.Future):
+        self._waiters = deque(waiter for waiter in self._waiters if waiter[1] is not future)
+        # The cancelled task might have been blocking the tasks queued after it
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+        self._process_waiters()
+
+    def _log_max_capacity_reached(self, rate_limit: RateLimit, capacity_used: int, now: float):
+        if AsyncRequestContextBase._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            self.logger().notify(f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per "
+                                 f"{rate_limit.time_interval}s) has almost reached. Limits used "
+                                 f"is {capacity_used} in the last "
+                                 f"{rate_limit.time_interval} seconds")
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
+    def _time(self) -> float:
+        return time.time()
@@ -10,3 +10,9 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _event_driven
+        double _min_event_tick_interval
+        object _tick_requested
+        set _pending_tick_iterators
+        dict _last_iterator_ticks
+        dict _event_subscriptions
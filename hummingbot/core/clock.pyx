@@ -3,11 +3,14 @@
 import asyncio
 import logging
 import time
-from typing import List
+from enum import Enum
+from typing import List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.pubsub import PubSub
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -21,12 +24,22 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 event_driven: bool = False,
+                 min_event_tick_interval: float = 0.1):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param event_driven: (real time mode only) besides the fixed ticks, ticks the iterators that requested it, e.g.
+        because of an event they subscribed to, as soon as possible
+        :param min_event_tick_interval: minimum time between two ticks of the same iterator in event driven mode.
+        Requests received in between are coalesced into a single tick.
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +49,12 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._event_driven = event_driven
+        self._min_event_tick_interval = min_event_tick_interval
+        self._tick_requested = asyncio.Event()
+        self._pending_tick_iterators = set()
+        self._last_iterator_ticks = {}
+        self._event_subscriptions = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -49,6 +68,14 @@ cdef class Clock:
     def tick_size(self) -> float:
         return self._tick_size
 
+    @property
+    def event_driven(self) -> bool:
+        return self._event_driven
+
+    @property
+    def min_event_tick_interval(self) -> float:
+        return self._min_event_tick_interval
+
     @property
     def child_iterators(self) -> List[TimeIterator]:
         return self._child_iterators
@@ -81,6 +108,33 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self.unsubscribe_iterator_from_events(iterator)
+        self._pending_tick_iterators.discard(iterator)
+        self._last_iterator_ticks.pop(iterator, None)
+
+    def request_tick(self, iterator: TimeIterator):
+        """
+        Asks for the iterator to be ticked before the next fixed tick. Only has an effect in event driven mode.
+        """
+        if self._event_driven:
+            self._pending_tick_iterators.add(iterator)
+            self._tick_requested.set()
+
+    def subscribe_iterator_to_events(self, iterator: TimeIterator, publisher: PubSub, event_tags: List[Enum]):
+        """
+        Requests a tick of the iterator every time the publisher triggers one of the events, e.g. an order book
+        OrderBookEvent.TopOfBookChangedEvent or the MarketEvent order updates of a connector user stream.
+        """
+        subscriptions = self._event_subscriptions.setdefault(iterator, [])
+        for event_tag in event_tags:
+            forwarder = EventForwarder(to_function=lambda _: self.request_tick(iterator))
+            publisher.add_listener(event_tag, forwarder)
+            # The publisher only keeps weak references to its listeners
+            subscriptions.append((publisher, event_tag, forwarder))
+
+    def unsubscribe_iterator_from_events(self, iterator: TimeIterator):
+        for publisher, event_tag, forwarder in self._event_subscriptions.pop(iterator, []):
+            publisher.remove_listener(event_tag, forwarder)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -107,26 +161,91 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                if self._event_driven:
+                    if await self._wait_for_event_ticks(next_tick_time):
+                        self._current_tick = time.time()
+                        if not self._run_event_ticks():
+                            return
+                        continue
+                else:
+                    # Sleep until the next tick
+                    await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                    if not self._tick_iterator(ci):
                         return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                self._pending_tick_iterators.clear()
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    def _tick_iterator(self, iterator: TimeIterator) -> bool:
+        """
+        Ticks the iterator with the current tick. Returns False if the clock has to stop.
+        """
+        cdef TimeIterator child_iterator = iterator
+        try:
+            child_iterator.c_tick(self._current_tick)
+        except StopIteration:
+            self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+            return False
+        except Exception:
+            self.logger().error("Unexpected error running clock tick.", exc_info=True)
+        if self._event_driven:
+            self._last_iterator_ticks[iterator] = self._current_tick
+        return True
+
+    def _next_event_tick_time(self) -> Optional[float]:
+        """
+        Earliest time at which one of the iterators that requested a tick can be ticked, None if there are no requests.
+        """
+        next_event_tick_time = None
+        for iterator in self._pending_tick_iterators:
+            iterator_tick_time = self._last_iterator_ticks.get(iterator, 0.0) + self._min_event_tick_interval
+            if next_event_tick_time is None or iterator_tick_time < next_event_tick_time:
+                next_event_tick_time = iterator_tick_time
+        return next_event_tick_time
+
+    async def _wait_for_event_ticks(self, next_tick_time: float) -> bool:
+        """
+        Waits until the next fixed tick, or until one of the requested event ticks is due.
+        Returns True in the latter case.
+        """
+        while True:
+            now = time.time()
+            if now >= next_tick_time:
+                return False
+            wake_up_time = next_tick_time
+            next_event_tick_time = self._next_event_tick_time()
+            if next_event_tick_time is not None:
+                if next_event_tick_time <= now:
+                    return True
+                wake_up_time = min(wake_up_time, next_event_tick_time)
+            self._tick_requested.clear()
+            try:
+                await asyncio.wait_for(self._tick_requested.wait(), timeout=wake_up_time - now)
+            except asyncio.TimeoutError:
+                pass
+
+    def _run_event_ticks(self) -> bool:
+        """
+        Ticks, in the order they were added to the clock, the iterators whose requested tick is due.
+        Returns False if the clock has to stop.
+        """
+        for ci in self._current_context:
+            if (ci in self._pending_tick_iterators
+                    and self._last_iterator_ticks.get(ci, 0.0) + self._min_event_tick_interval <= self._current_tick):
+                self._pending_tick_iterators.discard(ci)
+                if not self._tick_iterator(ci):
+                    return False
+        # Requests from iterators not in the clock context can't be served
+        self._pending_tick_iterators.intersection_update(self._current_context)
+        return True
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -5,6 +5,7 @@ from typing import Iterator
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBookDepthIndex, c_add_depth_level, c_clear_depth_index
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
@@ -175,6 +176,16 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef c_rebuild_depth_index(self, bint is_bid):
+        cdef:
+            OrderBookDepthIndex *index = ref(self._bid_depth_index) if is_bid else ref(self._ask_depth_index)
+
+        # The composite entries also change when filled orders are recorded, so the index is built from them on every
+        # query and never flagged as valid.
+        c_clear_depth_index(index)
+        for order_book_row in (self.bid_entries() if is_bid else self.ask_entries()):
+            c_add_depth_level(index, order_book_row.price, order_book_row.amount)
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -0,0 +1,20 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+
+
+cdef class FlatOrderBook(OrderBook):
+    # Both sides are sorted with the top of the book at the back of the vector, so that updates around the top of the
+    # book only shift a few entries.
+    cdef vector[OrderBookEntry] _bid_levels
+    cdef vector[OrderBookEntry] _ask_levels
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_rebuild_depth_index(self, bint is_bid)
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef c_truncate_overlap_entries(self)
+    cdef c_update_best_prices(self)
@@ -0,0 +1,197 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from typing import Iterator
+
+from libcpp.algorithm cimport stable_sort
+
+from hummingbot.core.data_type.order_book cimport OrderBookDepthIndex, c_add_depth_level, c_clear_depth_index
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+# Number of levels, counted from the top of the book, that are scanned linearly before falling back to a binary search
+# when looking for the position of a price level.
+cdef size_t TOP_OF_BOOK_SCAN_LEVELS = 16
+
+
+cdef inline bint c_is_closer_to_top(double price, double other_price, bint is_bid) noexcept:
+    return price > other_price if is_bid else price < other_price
+
+
+cdef size_t c_find_position(vector[OrderBookEntry] &levels, double price, bint is_bid) noexcept:
+    """
+    Returns the index of the first level, in vector order, that is not farther from the top of the book than the
+    given price. It is the index of the price level if it exists, or the index where it has to be inserted.
+    """
+    cdef:
+        size_t size = levels.size()
+        size_t index = size
+        size_t scan_limit = size - TOP_OF_BOOK_SCAN_LEVELS if size > TOP_OF_BOOK_SCAN_LEVELS else 0
+        size_t low = 0
+        size_t high
+        size_t middle
+
+    # Most updates touch the top of the book, which lives at the back of the vector.
+    while index > scan_limit:
+        if c_is_closer_to_top(price, levels[index - 1].getPrice(), is_bid):
+            return index
+        index -= 1
+    if index == 0:
+        return 0
+
+    high = index
+    while low < high:
+        middle = (low + high) // 2
+        if c_is_closer_to_top(price, levels[middle].getPrice(), is_bid):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef c_apply_level_diffs(vector[OrderBookEntry] &levels, vector[OrderBookEntry] &diffs, bint is_bid):
+    cdef:
+        size_t position
+        OrderBookEntry diff
+
+    for diff in diffs:
+        position = c_find_position(levels, diff.getPrice(), is_bid)
+        if position < levels.size() and levels[position].getPrice() == diff.getPrice():
+            if diff.getAmount() > 0:
+                levels[position] = diff
+            else:
+                levels.erase(levels.begin() + position)
+        elif diff.getAmount() > 0:
+            levels.insert(levels.begin() + position, diff)
+
+
+cdef c_load_levels(vector[OrderBookEntry] &levels, vector[OrderBookEntry] &entries, bint is_bid):
+    cdef:
+        size_t index
+        size_t size
+        OrderBookEntry entry
+
+    # Sort by ascending price and keep the first entry of each price, like inserting the entries into a std::set.
+    stable_sort(entries.begin(), entries.end())
+    levels.clear()
+    levels.reserve(entries.size())
+    for entry in entries:
+        if levels.empty() or levels.back().getPrice() != entry.getPrice():
+            levels.push_back(entry)
+    if not is_bid:
+        # Asks are stored by descending price to keep the best ask at the back.
+        size = levels.size()
+        for index in range(size // 2):
+            entry = levels[index]
+            levels[index] = levels[size - 1 - index]
+            levels[size - 1 - index] = entry
+
+
+cdef class FlatOrderBook(OrderBook):
+    """
+    Order book engine that keeps each side of the book in a sorted flat vector instead of a std::set.
+
+    Diffs mostly touch the levels close to the top of the book. Keeping the top of the book at the back of the vector
+    turns those updates into a short linear scan plus a small shift of contiguous memory, instead of a tree rebalance
+    and a node allocation per level. It exposes the same API as OrderBook, so connectors can choose it by setting the
+    order book create function of their data source.
+    """
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        c_apply_level_diffs(self._bid_levels, bids, True)
+        c_apply_level_diffs(self._ask_levels, asks, False)
+
+        # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: bigger wins
+        self.c_truncate_overlap_entries()
+        self.c_update_best_prices()
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+        self.c_invalidate_depth_index()
+        self.c_notify_top_of_book_change(previous_best_bid, previous_best_ask)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        c_load_levels(self._bid_levels, bids, True)
+        c_load_levels(self._ask_levels, asks, False)
+
+        if self._dex:
+            self.c_truncate_overlap_entries()
+        self._best_bid = self._best_ask = float("NaN")
+        self.c_update_best_prices()
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
+        self.c_notify_top_of_book_change(previous_best_bid, previous_best_ask)
+
+    cdef c_rebuild_depth_index(self, bint is_bid):
+        cdef:
+            vector[OrderBookEntry] *levels = &self._bid_levels if is_bid else &self._ask_levels
+            OrderBookDepthIndex *index = &self._bid_depth_index if is_bid else &self._ask_depth_index
+            size_t level = levels.size()
+
+        c_clear_depth_index(index)
+        index.prices.reserve(level)
+        index.base_volumes.reserve(level)
+        index.quote_volumes.reserve(level)
+        while level > 0:
+            level -= 1
+            c_add_depth_level(index, levels[0][level].getPrice(), levels[0][level].getAmount())
+        index.valid = True
+
+    cdef c_truncate_overlap_entries(self):
+        cdef:
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+            bint remove_ask
+
+        while not self._bid_levels.empty() and not self._ask_levels.empty():
+            top_bid = self._bid_levels.back()
+            top_ask = self._ask_levels.back()
+            if top_bid.getPrice() < top_ask.getPrice():
+                break
+            if self._dex:
+                remove_ask = top_bid.getAmount() * top_bid.getPrice() > top_ask.getAmount() * top_ask.getPrice()
+            else:
+                remove_ask = top_bid.getUpdateId() > top_ask.getUpdateId()
+            if remove_ask:
+                self._ask_levels.pop_back()
+            else:
+                self._bid_levels.pop_back()
+
+    cdef c_update_best_prices(self):
+        # Record the current best prices, for faster c_get_price() calls.
+        if not self._bid_levels.empty():
+            self._best_bid = self._bid_levels.back().getPrice()
+        if not self._ask_levels.empty():
+            self._best_ask = self._ask_levels.back().getPrice()
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        if (self._ask_levels.size() if is_buy else self._bid_levels.size()) < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t index = self._bid_levels.size()
+            OrderBookEntry entry
+        while index > 0:
+            index -= 1
+            entry = self._bid_levels[index]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t index = self._ask_levels.size()
+            OrderBookEntry entry
+        while index > 0:
+            index -= 1
+            entry = self._ask_levels[index]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
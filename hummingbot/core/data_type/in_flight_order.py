@@ -4,7 +4,7 @@ import math
 import typing
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, NamedTuple, Optional, Tuple
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -87,6 +87,10 @@ class TradeUpdate(NamedTuple):
 
 
 class InFlightOrder:
+    # Called with the order, the name of the attribute and its previous value when the exchange order id or the state
+    # of the order change. Order trackers use it to keep their order indexes up to date.
+    _update_listener: Optional[Callable[["InFlightOrder", str, Any], None]] = None
+
     def __init__(
             self,
             client_order_id: str,
@@ -127,6 +131,31 @@ class InFlightOrder:
         self.processed_by_exchange_event = asyncio.Event()
         self.check_processed_by_exchange_condition()
 
+    @property
+    def exchange_order_id(self) -> Optional[str]:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id: Optional[str]):
+        previous_exchange_order_id = self.__dict__.get("_exchange_order_id")
+        self._exchange_order_id = exchange_order_id
+        if self._update_listener is not None and previous_exchange_order_id != exchange_order_id:
+            self._update_listener(self, "exchange_order_id", previous_exchange_order_id)
+
+    @property
+    def current_state(self) -> OrderState:
+        return self._current_state
+
+    @current_state.setter
+    def current_state(self, current_state: OrderState):
+        previous_state = self.__dict__.get("_current_state")
+        self._current_state = current_state
+        if self._update_listener is not None and previous_state != current_state:
+            self._update_listener(self, "current_state", previous_state)
+
+    def set_update_listener(self, listener: Optional[Callable[["InFlightOrder", str, Any], None]]):
+        self._update_listener = listener
+
     @property
     def attributes(self) -> Tuple[Any]:
         return copy.deepcopy(
@@ -359,6 +388,22 @@ class InFlightOrder:
 
         return True
 
+    def update_with_amend(self, price: Decimal, amount: Decimal, update_timestamp: float) -> bool:
+        """
+        Updates the in flight order with the new price and amount of an amend accepted by the exchange. The order
+        keeps its client and exchange order ids
+        :return: True if the order gets updated otherwise False
+        """
+        if (price, amount) == (self.price, self.amount):
+            return False
+
+        self.price = price
+        self.amount = amount
+        self.last_update_timestamp = update_timestamp
+        self.check_filled_condition()
+
+        return True
+
     def check_filled_condition(self):
         if (abs(self.amount) - self.executed_amount_base).quantize(Decimal('1e-8')) <= 0:
             self.completely_filled_event.set()
@@ -9,6 +9,18 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef cppclass OrderBookDepthIndex:
+    # Levels from the top of the book down, with the cumulative base and quote volumes up to each level (inclusive).
+    vector[double] prices
+    vector[double] base_volumes
+    vector[double] quote_volumes
+    bint valid
+
+
+cdef void c_clear_depth_index(OrderBookDepthIndex *index) noexcept
+cdef void c_add_depth_level(OrderBookDepthIndex *index, double price, double amount) noexcept
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,10 +32,16 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_invalidate_depth_index(self)
+    cdef c_notify_top_of_book_change(self, double previous_best_bid, double previous_best_ask)
+    cdef c_rebuild_depth_index(self, bint is_bid)
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy) except NULL
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
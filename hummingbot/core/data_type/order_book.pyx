@@ -8,6 +8,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
 )
 
@@ -36,8 +37,103 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef vector[OrderBookEntry] c_raw_rows_to_entries(object rows, int64_t update_id) except *:
+    cdef:
+        vector[OrderBookEntry] entries
+        double price
+        double amount
+    entries.reserve(len(rows))
+    for row in rows:
+        price = float(row[0])
+        amount = float(row[1])
+        entries.push_back(OrderBookEntry(price, amount, update_id))
+    return entries
+
+
+cdef vector[OrderBookEntry] c_buffer_rows_to_entries(const double[:, :] rows, int64_t update_id) except *:
+    cdef:
+        vector[OrderBookEntry] entries
+        Py_ssize_t i
+        Py_ssize_t num_rows = rows.shape[0]
+    if num_rows > 0 and rows.shape[1] < 2:
+        raise ValueError(f"Order book rows must have at least 2 columns (price, amount), got {rows.shape[1]}.")
+    entries.reserve(num_rows)
+    for i in range(num_rows):
+        entries.push_back(OrderBookEntry(rows[i, 0], rows[i, 1], update_id))
+    return entries
+
+
+cdef void c_clear_depth_index(OrderBookDepthIndex *index) noexcept:
+    index.prices.clear()
+    index.base_volumes.clear()
+    index.quote_volumes.clear()
+    index.valid = False
+
+
+cdef void c_add_depth_level(OrderBookDepthIndex *index, double price, double amount) noexcept:
+    cdef:
+        double base_volume = amount
+        double quote_volume = amount * price
+    if not index.prices.empty():
+        base_volume = index.base_volumes.back() + base_volume
+        quote_volume = index.quote_volumes.back() + quote_volume
+    index.prices.push_back(price)
+    index.base_volumes.push_back(base_volume)
+    index.quote_volumes.push_back(quote_volume)
+
+
+cdef inline double c_volume_before_level(vector[double] &cumulative_volumes, size_t level) noexcept:
+    return cumulative_volumes[level - 1] if level > 0 else 0
+
+
+cdef inline double c_vwap_at_level(OrderBookDepthIndex *index, size_t level, double volume) except? -1:
+    cdef:
+        double total_volume = c_volume_before_level(index.base_volumes, level)
+        double incremental_amount = volume - total_volume
+        double total_cost = c_volume_before_level(index.quote_volumes, level) + incremental_amount * index.prices[level]
+    return total_cost / (total_volume + incremental_amount)
+
+
+cdef size_t c_first_level_reaching(vector[double] &cumulative_volumes, double volume) noexcept:
+    """
+    Returns the index of the first level at which the cumulative volume reaches the given volume, or the number of
+    levels if the book is not deep enough.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = cumulative_volumes.size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if not (cumulative_volumes[middle] >= volume):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef size_t c_levels_within_price(vector[double] &prices, double price, bint is_buy) noexcept:
+    """
+    Returns the number of levels, from the top of the book, that can be taken without going past the given price.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = prices.size()
+        size_t middle
+        bint within_price
+    while low < high:
+        middle = (low + high) // 2
+        within_price = not (prices[middle] > price) if is_buy else not (prices[middle] < price)
+        if within_price:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChangedEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -65,6 +161,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -95,11 +193,15 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_invalidate_depth_index()
+        self.c_notify_top_of_book_change(previous_best_bid, previous_best_ask)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
@@ -135,6 +237,52 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
+        self.c_notify_top_of_book_change(previous_best_bid, previous_best_ask)
+
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_index.valid = False
+        self._ask_depth_index.valid = False
+
+    cdef c_notify_top_of_book_change(self, double previous_best_bid, double previous_best_ask):
+        # NaN best prices (empty book side) are considered equal to each other.
+        if ((self._best_bid == previous_best_bid or (self._best_bid != self._best_bid
+                                                     and previous_best_bid != previous_best_bid))
+                and (self._best_ask == previous_best_ask or (self._best_ask != self._best_ask
+                                                             and previous_best_ask != previous_best_ask))):
+            return
+        self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG, self)
+
+    cdef c_rebuild_depth_index(self, bint is_bid):
+        cdef:
+            OrderBookDepthIndex *index = ref(self._bid_depth_index) if is_bid else ref(self._ask_depth_index)
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry entry
+
+        c_clear_depth_index(index)
+        if is_bid:
+            while bid_iterator != self._bid_book.rend():
+                entry = deref(bid_iterator)
+                c_add_depth_level(index, entry.getPrice(), entry.getAmount())
+                inc(bid_iterator)
+        else:
+            while ask_iterator != self._ask_book.end():
+                entry = deref(ask_iterator)
+                c_add_depth_level(index, entry.getPrice(), entry.getAmount())
+                inc(ask_iterator)
+        index.valid = True
+
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy) except NULL:
+        """
+        Returns the cumulative depth index of the side of the book taken by a buy (asks) or a sell (bids). The index is
+        rebuilt lazily, on the first query after the book changed.
+        """
+        cdef:
+            OrderBookDepthIndex *index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+        if not index.valid:
+            self.c_rebuild_depth_index(not is_buy)
+        return index
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -197,6 +345,41 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: Sequence, asks: Sequence, update_id: int):
+        """
+        Applies diffs given as raw [price, amount, ...] rows, i.e. the "bids" and "asks" lists of a parsed exchange
+        payload. Prices and amounts can be strings or numbers. The C++ entries are built in a single pass, without
+        creating intermediate OrderBookRow objects.
+        """
+        self.c_apply_diffs(c_raw_rows_to_entries(bids, update_id),
+                           c_raw_rows_to_entries(asks, update_id),
+                           update_id)
+
+    def apply_raw_snapshot(self, bids: Sequence, asks: Sequence, update_id: int):
+        """
+        Snapshot counterpart of apply_raw_diffs().
+        """
+        self.c_apply_snapshot(c_raw_rows_to_entries(bids, update_id),
+                              c_raw_rows_to_entries(asks, update_id),
+                              update_id)
+
+    def apply_float64_diffs(self, const double[:, :] bids, const double[:, :] asks, int64_t update_id):
+        """
+        Applies diffs given as 2D float64 buffers (e.g. NumPy arrays) with [price, amount] as the first two columns.
+        All rows get the same update id. The buffers are read in place, without per row Python objects.
+        """
+        self.c_apply_diffs(c_buffer_rows_to_entries(bids, update_id),
+                           c_buffer_rows_to_entries(asks, update_id),
+                           update_id)
+
+    def apply_float64_snapshot(self, const double[:, :] bids, const double[:, :] asks, int64_t update_id):
+        """
+        Snapshot counterpart of apply_float64_diffs().
+        """
+        self.c_apply_snapshot(c_buffer_rows_to_entries(bids, update_id),
+                              c_buffer_rows_to_entries(asks, update_id),
+                              update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -320,142 +503,75 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            size_t level = c_first_level_reaching(index.base_volumes, volume)
+            double cumulative_volume = c_volume_before_level(index.base_volumes, level)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        if level < index.prices.size():
+            cumulative_volume = index.base_volumes[level]
+            result_price = index.prices[level]
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double total_cost = 0
-            double total_volume = 0
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            size_t level = c_first_level_reaching(index.base_volumes, volume)
+            double total_volume = c_volume_before_level(index.base_volumes, level)
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        if level < index.prices.size():
+            total_volume = volume
+            result_vwap = c_vwap_at_level(index, level, volume)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            size_t level = c_first_level_reaching(index.quote_volumes, quote_volume)
+            double cumulative_volume = c_volume_before_level(index.quote_volumes, level)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        if level < index.prices.size():
+            cumulative_volume = index.quote_volumes[level]
+            result_price = index.prices[level]
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            size_t level = c_first_level_reaching(index.base_volumes, base_amount)
+            double cumulative_volume = c_volume_before_level(index.quote_volumes, level)
+
+        if level < index.prices.size():
+            cumulative_volume += (base_amount - c_volume_before_level(index.base_volumes, level)) * index.prices[level]
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            size_t levels = c_levels_within_price(index.prices, price, is_buy)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        if levels > 0:
+            result_price = index.prices[levels - 1]
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        return OrderBookQueryResult(price, NaN, result_price, c_volume_before_level(index.base_volumes, levels))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            size_t levels = c_levels_within_price(index.prices, price, is_buy)
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        if levels > 0:
+            result_price = index.prices[levels - 1]
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        return OrderBookQueryResult(price, NaN, result_price, c_volume_before_level(index.quote_volumes, levels))
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -475,6 +591,57 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_prices_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batched version of get_price_for_volume(). Returns the result price for each volume, NaN if the book is not
+        deep enough.
+        """
+        cdef:
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            const double[:] query_volumes = np.ascontiguousarray(volumes, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] result = np.full(query_volumes.shape[0], NaN)
+            Py_ssize_t i
+            size_t level
+
+        for i in range(query_volumes.shape[0]):
+            level = c_first_level_reaching(index.base_volumes, query_volumes[i])
+            if level < index.prices.size():
+                result[i] = index.prices[level]
+        return result
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batched version of get_vwap_for_volume(). Returns the VWAP for each volume, NaN if the book is not deep
+        enough.
+        """
+        cdef:
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            const double[:] query_volumes = np.ascontiguousarray(volumes, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] result = np.full(query_volumes.shape[0], NaN)
+            Py_ssize_t i
+            size_t level
+
+        for i in range(query_volumes.shape[0]):
+            level = c_first_level_reaching(index.base_volumes, query_volumes[i])
+            if level < index.prices.size():
+                result[i] = c_vwap_at_level(index, level, query_volumes[i])
+        return result
+
+    def get_volumes_for_prices(self, is_buy: bool, prices: np.ndarray) -> np.ndarray:
+        """
+        Batched version of get_volume_for_price(). Returns the cumulative base volume available up to each price.
+        """
+        cdef:
+            OrderBookDepthIndex *index = self.c_get_depth_index(is_buy)
+            const double[:] query_prices = np.ascontiguousarray(prices, dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] result = np.zeros(query_prices.shape[0])
+            Py_ssize_t i
+
+        for i in range(query_prices.shape[0]):
+            result[i] = c_volume_before_level(index.base_volumes,
+                                              c_levels_within_price(index.prices, query_prices[i], is_buy))
+        return result
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Set, Tuple
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+
+
+class OrderBookMessageDispatcher:
+    """
+    Queue like sink for order book diff and snapshot messages that keeps a bounded ring buffer per trading pair.
+
+    Data sources receive it in place of the asyncio.Queue passed to `listen_for_order_book_diffs` and
+    `listen_for_order_book_snapshots`, and keep calling `put_nowait`. A single consumer waits for pending trading
+    pairs and drains each buffer in one batch, instead of moving every message through a router queue and a per pair
+    queue.
+    """
+
+    def __init__(self, buffer_size: int = 1000):
+        self._buffer_size = buffer_size
+        self._buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        # Trading pairs with messages waiting to be drained, with the time the oldest of those messages arrived
+        self._pending: Dict[str, float] = {}
+        self._overflowed: Set[str] = set()
+        self._new_messages: asyncio.Event = asyncio.Event()
+
+        self._messages_received: int = 0
+        self._messages_dropped: int = 0
+        self._messages_drained: int = 0
+        self._batches_drained: int = 0
+        self._total_batch_latency: float = 0
+        self._max_batch_latency: float = 0
+        self._started_at: float = time.perf_counter()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Counters of the messages that went through the dispatcher. The batch latency is the time between the arrival
+        of the oldest message of a batch and the moment the batch was drained.
+        """
+        elapsed = time.perf_counter() - self._started_at
+        return {
+            "messages_received": self._messages_received,
+            "messages_dropped": self._messages_dropped,
+            "messages_drained": self._messages_drained,
+            "batches_drained": self._batches_drained,
+            "messages_per_second": self._messages_drained / elapsed if elapsed > 0 else 0,
+            "avg_batch_latency": (self._total_batch_latency / self._batches_drained
+                                  if self._batches_drained > 0 else 0),
+            "max_batch_latency": self._max_batch_latency,
+        }
+
+    def pending_messages(self, trading_pair: str) -> int:
+        buffer = self._buffers.get(trading_pair)
+        return 0 if buffer is None else len(buffer)
+
+    def put_nowait(self, message: OrderBookMessage):
+        trading_pair = message.trading_pair
+        buffer = self._buffers.get(trading_pair)
+        if buffer is None:
+            buffer = self._buffers[trading_pair] = deque(maxlen=self._buffer_size)
+        if len(buffer) == self._buffer_size:
+            # The oldest message is discarded, so the book has to be restored from a new snapshot
+            self._overflowed.add(trading_pair)
+            self._messages_dropped += 1
+        buffer.append(message)
+        self._messages_received += 1
+        if trading_pair not in self._pending:
+            self._pending[trading_pair] = time.perf_counter()
+            self._new_messages.set()
+
+    async def put(self, message: OrderBookMessage):
+        self.put_nowait(message)
+
+    def notify(self, trading_pair: str):
+        """
+        Flags the trading pair as pending again if it still has buffered messages, e.g. when its consumer becomes
+        ready after having skipped it.
+        """
+        if self.pending_messages(trading_pair) > 0 and trading_pair not in self._pending:
+            self._pending[trading_pair] = time.perf_counter()
+            self._new_messages.set()
+
+    async def wait_for_pending_trading_pairs(self) -> Dict[str, float]:
+        """
+        Waits until there are buffered messages and returns the pending trading pairs, with the time their oldest
+        message arrived. The trading pairs are not pending anymore after this call.
+        """
+        await self._new_messages.wait()
+        self._new_messages.clear()
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def drain(self, trading_pair: str, pending_since: float) -> Tuple[List[OrderBookMessage], bool]:
+        """
+        Removes and returns all the buffered messages of the trading pair, and whether messages were dropped because
+        the buffer was full since the previous drain.
+        """
+        buffer = self._buffers.get(trading_pair)
+        messages = list(buffer) if buffer is not None else []
+        if buffer is not None:
+            buffer.clear()
+        overflowed = trading_pair in self._overflowed
+        self._overflowed.discard(trading_pair)
+
+        if len(messages) > 0:
+            latency = time.perf_counter() - pending_since
+            self._messages_drained += len(messages)
+            self._batches_drained += 1
+            self._total_batch_latency += latency
+            self._max_batch_latency = max(self._max_batch_latency, latency)
+        return messages, overflowed
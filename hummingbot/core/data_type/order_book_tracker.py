@@ -10,9 +10,10 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_dispatcher import OrderBookMessageDispatcher
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +24,11 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Snapshot requests are rate limited by the connector's throttler. This only caps the number of requests waiting
+    # in parallel, for connectors whose data source does not go through a throttler.
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
+    SNAPSHOT_RETRY_INTERVAL: float = 5.0
+    DISPATCH_BUFFER_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +37,23 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 direct_dispatch: bool = False):
+        """
+        :param direct_dispatch: if True the data source pushes diff and snapshot messages into per trading pair ring
+            buffers, drained in batches by a single consumer task, instead of routing every message through the diff
+            stream queue and a tracking queue and task per trading pair
+        """
         self._domain: Optional[str] = domain
+        self._direct_dispatch: bool = direct_dispatch
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._order_book_init_durations: Dict[str, float] = {}
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +63,10 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._message_dispatcher: OrderBookMessageDispatcher = OrderBookMessageDispatcher(
+            buffer_size=self.DISPATCH_BUFFER_SIZE)
+        self._dispatch_counters: Dict[str, int] = defaultdict(int)
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -55,6 +77,7 @@ class OrderBookTracker:
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
+        self._order_book_dispatch_task: Optional[asyncio.Task] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -68,6 +91,38 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Trading pairs whose order book has been initialized, while the rest might still be loading.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_trading_pair_ready(trading_pair)]
+
+    @property
+    def order_book_init_durations(self) -> Dict[str, float]:
+        """
+        Seconds it took to initialize the order book of each trading pair, including the wait for rate limits.
+        """
+        return self._order_book_init_durations.copy()
+
+    @property
+    def direct_dispatch(self) -> bool:
+        return self._direct_dispatch
+
+    @property
+    def dispatch_stats(self) -> Dict[str, float]:
+        """
+        Latency and throughput counters of the direct dispatch mode: the dispatcher counters plus the number of diff
+        messages applied and rejected, and the number of price levels saved by coalescing diffs of the same batch.
+        """
+        stats = self._message_dispatcher.stats
+        for key in ("diffs_applied", "diffs_rejected", "snapshots_applied", "levels_coalesced"):
+            stats[key] = self._dispatch_counters[key]
+        return stats
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_book_ready_events and self._order_book_ready_events[trading_pair].is_set()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -83,24 +138,31 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        diff_output = self._message_dispatcher if self._direct_dispatch else self._order_book_diff_stream
+        snapshot_output = self._message_dispatcher if self._direct_dispatch else self._order_book_snapshot_stream
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self._data_source.listen_for_order_book_snapshots(self._ev_loop, snapshot_output)
         )
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
+        if self._direct_dispatch:
+            self._order_book_dispatch_task = safe_ensure_future(
+                self._order_book_dispatch_loop()
+            )
+        else:
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
+            self._order_book_snapshot_router_task = safe_ensure_future(
+                self._order_book_snapshot_router()
+            )
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
@@ -128,6 +190,12 @@ class OrderBookTracker:
         if self._order_book_snapshot_router_task is not None:
             self._order_book_snapshot_router_task.cancel()
             self._order_book_snapshot_router_task = None
+        if self._order_book_dispatch_task is not None:
+            self._order_book_dispatch_task.cancel()
+            self._order_book_dispatch_task = None
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
         if self._update_last_trade_prices_task is not None:
             self._update_last_trade_prices_task.cancel()
             self._update_last_trade_prices_task = None
@@ -138,10 +206,15 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def wait_trading_pair_ready(self, trading_pair: str):
+        await self._order_book_ready_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -174,16 +247,50 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books, requesting the snapshots of all trading pairs concurrently. Each trading pair starts
+        being tracked, and is flagged as ready, as soon as its own snapshot is loaded.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        self._order_book_init_durations.clear()
+        await safe_gather(*[
+            self._init_order_book(trading_pair=trading_pair, semaphore=semaphore)
+            for trading_pair in self._trading_pairs
+        ])
+        self.logger().info(f"Initialized {len(self._trading_pairs)} order books "
+                           f"in {time.perf_counter() - start_time:.2f} seconds.")
+        self._order_books_initialized.set()
+
+    async def _init_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore):
+        start_time = time.perf_counter()
+        while True:
+            try:
+                async with semaphore:
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                    f"Retrying after {self.SNAPSHOT_RETRY_INTERVAL:.0f} seconds."
+                )
+                await self._sleep(delay=self.SNAPSHOT_RETRY_INTERVAL)
+
+        self._order_books[trading_pair] = order_book
+        if self._direct_dispatch:
+            # Messages received while the snapshot was loading are still in the dispatcher buffer
+            self._message_dispatcher.notify(trading_pair)
+        else:
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
-        self._order_books_initialized.set()
+        self._order_book_init_durations[trading_pair] = time.perf_counter() - start_time
+        self._order_book_ready_events[trading_pair].set()
+        self.logger().info(f"Initialized order book for {trading_pair} "
+                           f"in {self._order_book_init_durations[trading_pair]:.2f} seconds. "
+                           f"{len(self._order_book_init_durations)}/{len(self._trading_pairs)} completed.")
 
     async def _order_book_diff_router(self):
         """
@@ -272,7 +379,7 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    self._apply_diff_message(order_book, message)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -295,6 +402,134 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    async def _order_book_dispatch_loop(self):
+        """
+        Consumer of the direct dispatch mode. Every time messages arrive it drains the buffer of each pending trading
+        pair in one batch, so the order books are up to date before the next tick.
+        """
+        last_message_timestamp: float = time.time()
+
+        while True:
+            try:
+                pending_trading_pairs = await self._message_dispatcher.wait_for_pending_trading_pairs()
+                for trading_pair, pending_since in pending_trading_pairs.items():
+                    if trading_pair not in self._order_books:
+                        # Kept in the buffer until the initial snapshot is loaded
+                        continue
+                    messages, overflowed = self._message_dispatcher.drain(trading_pair, pending_since)
+                    if overflowed:
+                        self.logger().warning(f"The order book messages buffer of {trading_pair} is full. "
+                                              f"Requesting a new snapshot.")
+                        self._request_order_book_resync(trading_pair)
+                    try:
+                        self._apply_message_batch(trading_pair, messages)
+                    except Exception:
+                        self.logger().network(
+                            f"Unexpected error tracking order book for {trading_pair}.",
+                            exc_info=True,
+                            app_warning_msg="Unexpected error tracking order book. Requesting a new snapshot."
+                        )
+                        self._request_order_book_resync(trading_pair)
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    stats = self.dispatch_stats
+                    self.logger().debug(f"Diff messages applied: {stats['diffs_applied']}, "
+                                        f"rejected: {stats['diffs_rejected']}, "
+                                        f"levels coalesced: {stats['levels_coalesced']}, "
+                                        f"avg batch latency: {stats['avg_batch_latency'] * 1e3:.3f} ms")
+                last_message_timestamp = now
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error dispatching order book messages.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error dispatching order book messages. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    def _apply_message_batch(self, trading_pair: str, messages: List[OrderBookMessage]):
+        """
+        Applies a batch of messages in arrival order. Consecutive diffs are merged into a single update per price
+        level, where the last amount received for each price wins, and applied at once.
+        """
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window = self._past_diffs_windows[trading_pair]
+        counters = self._dispatch_counters
+        bids: Dict[float, float] = {}
+        asks: Dict[float, float] = {}
+        levels_received: int = 0
+        last_update_id: Optional[int] = None
+
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                # Check the order book's initial update ID. If it's larger, don't bother.
+                if order_book.snapshot_uid > message.update_id:
+                    counters["diffs_rejected"] += 1
+                    continue
+                levels_received += self._coalesce_diff_message(message, bids, asks)
+                last_update_id = message.update_id
+                past_diffs_window.append(message)
+                counters["diffs_applied"] += 1
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                if last_update_id is not None:
+                    self._apply_coalesced_diffs(order_book, bids, asks, levels_received, last_update_id)
+                    bids, asks, levels_received, last_update_id = {}, {}, 0, None
+                order_book.restore_from_snapshot_and_diffs(message, list(past_diffs_window))
+                counters["snapshots_applied"] += 1
+
+        if last_update_id is not None:
+            self._apply_coalesced_diffs(order_book, bids, asks, levels_received, last_update_id)
+
+    @staticmethod
+    def _coalesce_diff_message(message: OrderBookMessage, bids: Dict[float, float], asks: Dict[float, float]) -> int:
+        if type(message) is OrderBookMessage:
+            message_bids, message_asks = message.content["bids"], message.content["asks"]
+        else:
+            message_bids, message_asks = message.bids, message.asks
+        # Levels are keyed by their float price, so different string representations of a price are merged as well
+        for row in message_bids:
+            bids[float(row[0])] = row[1]
+        for row in message_asks:
+            asks[float(row[0])] = row[1]
+        return len(message_bids) + len(message_asks)
+
+    def _apply_coalesced_diffs(self,
+                               order_book: OrderBook,
+                               bids: Dict[float, float],
+                               asks: Dict[float, float],
+                               levels_received: int,
+                               update_id: int):
+        order_book.apply_raw_diffs(list(bids.items()), list(asks.items()), update_id)
+        self._dispatch_counters["levels_coalesced"] += levels_received - len(bids) - len(asks)
+
+    def _request_order_book_resync(self, trading_pair: str):
+        resync_task = self._resync_tasks.get(trading_pair)
+        if resync_task is None or resync_task.done():
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        try:
+            snapshot: OrderBookMessage = await self._data_source._order_book_snapshot(trading_pair=trading_pair)
+            self._message_dispatcher.put_nowait(snapshot)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(f"Unexpected error requesting a new order book snapshot for {trading_pair}.",
+                                  exc_info=True)
+
+    @staticmethod
+    def _apply_diff_message(order_book: OrderBook, message: OrderBookMessage):
+        if type(message) is OrderBookMessage:
+            # The generic message stores the exchange [price, amount, ...] rows as received, so they can be applied
+            # directly without building the intermediate OrderBookRow lists.
+            order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+        else:
+            # Connector specific messages may store a different content layout and override bids/asks.
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
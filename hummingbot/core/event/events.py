@@ -37,6 +37,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookChangedEvent = 902
     OrderBookDataSourceUpdateEvent = 904
 
 
@@ -1,9 +1,13 @@
+import asyncio
+import copy
+import json
 import logging
 import re
 import ssl
+import time
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 from aiohttp import ContentTypeError
@@ -12,6 +16,8 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.latency_histogram import LatencyHistogram
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -42,8 +48,15 @@ class GatewayError(Enum):
 class GatewayHttpClient:
     """
     An HTTP client for making requests to the gateway API.
+
+    All the requests share a pooled client session whose connection limit and timeouts come from the gateway config.
+    Concurrent identical GET requests, and identical POST requests to the read only endpoints in `COALESCED_POST_PATHS`,
+    share a single HTTP request. The latency of the requests is recorded by endpoint in `latency_histograms`.
     """
 
+    REQUEST_METHODS = frozenset(["get", "post", "put", "delete"])
+    COALESCED_POST_PATHS = frozenset(["amm/price", "chain/allowances", "chain/balances", "chain/poll"])
+
     _ghc_logger: Optional[HummingbotLogger] = None
     _shared_client: Optional[aiohttp.ClientSession] = None
     _base_url: str
@@ -65,6 +78,8 @@ class GatewayHttpClient:
         if GatewayHttpClient.__instance is None:
             self._base_url = f"https://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        self._in_flight_requests: Dict[Tuple[str, str, str, bool, bool], asyncio.Future] = {}
+        self._latency_histograms: Dict[str, LatencyHistogram] = {}
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -84,8 +99,14 @@ class GatewayHttpClient:
             ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
                                     keyfile=f"{cert_path}/client_key.pem",
                                     password=Security.secrets_manager.password.get_secret_value())
-            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx)
-            cls._shared_client = aiohttp.ClientSession(connector=conn)
+            gateway_config = client_config_map.gateway
+            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx,
+                                        limit=gateway_config.gateway_connection_limit,
+                                        limit_per_host=gateway_config.gateway_connection_limit,
+                                        keepalive_timeout=gateway_config.gateway_keepalive_timeout)
+            cls._shared_client = aiohttp.ClientSession(
+                connector=conn,
+                timeout=aiohttp.ClientTimeout(total=gateway_config.gateway_request_timeout))
         return cls._shared_client
 
     @classmethod
@@ -104,6 +125,13 @@ class GatewayHttpClient:
     def base_url(self, url: str):
         self._base_url = url
 
+    @property
+    def latency_histograms(self) -> Dict[str, LatencyHistogram]:
+        """
+        Returns the latency histogram of the requests to each endpoint, by method and path (e.g. "POST chain/poll")
+        """
+        return self._latency_histograms
+
     def log_error_codes(self, resp: Dict[str, Any]):
         """
         If the API returns an error code, interpret the code, log a useful
@@ -169,29 +197,44 @@ class GatewayHttpClient:
         :param params: A dictionary of required params for the end point
         :param fail_silently: used to determine if errors will be raise or silently ignored
         :param use_body: used to determine if the request should sent the parameters in the body or as query string
-        :returns A response in json format.
+        :returns A response in json format. Each caller of a coalesced request gets its own copy of the response.
         """
+        if method != "get" and (method != "post" or path_url not in self.COALESCED_POST_PATHS):
+            return await self._execute_api_request(method, path_url, params, fail_silently, use_body)
+
+        request_key = (method, path_url, json.dumps(params, sort_keys=True, default=str), fail_silently, use_body)
+        request = self._in_flight_requests.get(request_key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self._execute_api_request(method, path_url, params, fail_silently, use_body)
+            )
+            self._in_flight_requests[request_key] = request
+            request.add_done_callback(lambda _: self._remove_in_flight_request(request_key, request))
+        # Shielded so a caller being cancelled does not cancel the request other callers are waiting for
+        response = await asyncio.shield(request)
+        # The callers share the request, so they get a copy they can modify without affecting the others
+        return copy.deepcopy(response)
+
+    async def _execute_api_request(
+            self,
+            method: str,
+            path_url: str,
+            params: Dict[str, Any],
+            fail_silently: bool,
+            use_body: bool,
+    ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         url = f"{self.base_url}/{path_url}"
         client = self._http_client(self._client_config_map)
 
         parsed_response = {}
+        start_time = time.perf_counter()
         try:
-            if method == "get":
-                if len(params) > 0:
-                    if use_body:
-                        response = await client.get(url, json=params)
-                    else:
-                        response = await client.get(url, params=params)
-                else:
-                    response = await client.get(url)
-            elif method == "post":
-                response = await client.post(url, json=params)
-            elif method == 'put':
-                response = await client.put(url, json=params)
-            elif method == 'delete':
-                response = await client.delete(url, json=params)
-            else:
+            if method not in self.REQUEST_METHODS:
                 raise ValueError(f"Unsupported request method {method}")
+            if method == "get" and not use_body:
+                response = await client.get(url, params=params if len(params) > 0 else None)
+            else:
+                response = await client.request(method.upper(), url, json=params)
             if not fail_silently and response.status == 504:
                 self.logger().network(f"The network call to {url} has timed out.")
             else:
@@ -211,7 +254,7 @@ class GatewayHttpClient:
 
         except Exception as e:
             if not fail_silently:
-                if self.is_timeout_error(e):
+                if self.is_timeout_error(e) or isinstance(e, asyncio.TimeoutError):
                     self.logger().network(f"The network call to {url} has timed out.")
                 else:
                     self.logger().network(
@@ -220,9 +263,25 @@ class GatewayHttpClient:
                         app_warning_msg=f"Call to {url} failed. See logs for more details."
                     )
                 raise e
+        finally:
+            self._record_latency(method, path_url, (time.perf_counter() - start_time) * 1e3)
 
         return parsed_response
 
+    def _remove_in_flight_request(self, request_key: Tuple[str, str, str, bool, bool], request: asyncio.Future):
+        if self._in_flight_requests.get(request_key) is request:
+            del self._in_flight_requests[request_key]
+        # Retrieving the exception prevents the event loop from logging it when no caller awaits the request anymore
+        if not request.cancelled():
+            request.exception()
+
+    def _record_latency(self, method: str, path_url: str, latency_ms: float):
+        endpoint = f"{method.upper()} {path_url}"
+        histogram = self._latency_histograms.get(endpoint)
+        if histogram is None:
+            histogram = self._latency_histograms[endpoint] = LatencyHistogram()
+        histogram.add(latency_ms)
+
     async def ping_gateway(self) -> bool:
         try:
             response: Dict[str, Any] = await self.api_request("get", "", fail_silently=True)
@@ -425,6 +484,38 @@ class GatewayHttpClient:
             request["address"] = address
         return await self.api_request("post", "chain/poll", request, fail_silently=fail_silently)  # type: ignore
 
+    async def get_transaction_statuses(
+            self,
+            chain: str,
+            network: str,
+            transaction_hashes: List[str],
+            connector: Optional[str] = None,
+            address: Optional[str] = None,
+            fail_silently: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Polls the status of several transactions. Gateway polls one transaction per request, so the distinct hashes are
+        requested concurrently, and the polls already in flight for the same transaction are shared.
+
+        :returns The status of each transaction, in the same order as the hashes, or the exception raised polling it
+        """
+        distinct_hashes: List[str] = list(dict.fromkeys(transaction_hashes))
+        statuses: List[Union[Dict[str, Any], Exception]] = await safe_gather(*[
+            self.get_transaction_status(chain, network, transaction_hash, connector, address, fail_silently)
+            for transaction_hash in distinct_hashes
+        ], return_exceptions=True)
+        status_by_hash = dict(zip(distinct_hashes, statuses))
+        result: List[Union[Dict[str, Any], Exception]] = []
+        returned_hashes = set()
+        for transaction_hash in transaction_hashes:
+            status = status_by_hash[transaction_hash]
+            if transaction_hash in returned_hashes and not isinstance(status, Exception):
+                # A repeated hash gets its own copy of the status, like the callers of a coalesced request
+                status = copy.deepcopy(status)
+            returned_hashes.add(transaction_hash)
+            result.append(status)
+        return result
+
     async def wallet_sign(
         self,
         chain: str,
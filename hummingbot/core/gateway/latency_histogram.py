@@ -0,0 +1,68 @@
+import bisect
+from typing import Dict, List, Tuple
+
+
+class LatencyHistogram:
+    """
+    Counts the latencies of the requests to an endpoint in fixed buckets, so the distribution can be monitored with a
+    constant memory usage.
+    """
+
+    # Upper bounds of the buckets in milliseconds. Latencies above the last bound are counted in an overflow bucket.
+    BUCKET_BOUNDS_MS: Tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+    def __init__(self):
+        self._bucket_counts: List[int] = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_ms(self) -> float:
+        return self._total_ms / self._count if self._count > 0 else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return self._max_ms
+
+    @property
+    def buckets(self) -> Dict[float, int]:
+        """
+        Returns the number of latencies of each bucket, by its upper bound in milliseconds (inf for the overflow one)
+        """
+        return dict(zip(self.BUCKET_BOUNDS_MS + (float("inf"),), self._bucket_counts))
+
+    def add(self, latency_ms: float):
+        self._bucket_counts[bisect.bisect_left(self.BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self._count += 1
+        self._total_ms += latency_ms
+        self._max_ms = max(self._max_ms, latency_ms)
+
+    def percentile_ms(self, percentile: float) -> float:
+        """
+        Returns the upper bound of the bucket the percentile (0 to 100) falls in, or the maximum latency if it is in the
+        overflow bucket
+        """
+        if self._count == 0:
+            return 0.0
+        rank = max(percentile / 100 * self._count, 1)
+        accumulated_count = 0
+        for bound, bucket_count in zip(self.BUCKET_BOUNDS_MS, self._bucket_counts):
+            accumulated_count += bucket_count
+            if accumulated_count >= rank:
+                return min(bound, self._max_ms)
+        return self._max_ms
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self._count,
+            "mean_ms": self.mean_ms,
+            "p50_ms": self.percentile_ms(50),
+            "p90_ms": self.percentile_ms(90),
+            "p99_ms": self.percentile_ms(99),
+            "max_ms": self._max_ms,
+        }
@@ -14,9 +14,19 @@ ctypedef unordered_map[int64_t, EventListenersCollection].iterator EventsIterato
 ctypedef pair[int64_t, EventListenersCollection] EventsPair
 
 
+cdef struct EventDispatchStats:
+    int64_t events_triggered
+    int64_t listener_calls
+    double total_dispatch_time
+    double max_dispatch_time
+
+
 cdef class PubSub:
     cdef:
         Events _events
+        dict _listener_snapshots
+        dict _listener_death_watchers
+        unordered_map[int64_t, EventDispatchStats] _dispatch_stats
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
@@ -24,4 +34,6 @@ cdef class PubSub:
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
+    cdef tuple c_get_listener_snapshot(self, int64_t event_tag)
+    cdef c_invalidate_listener_snapshots(self)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
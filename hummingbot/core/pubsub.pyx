@@ -15,7 +15,9 @@ from libcpp.vector cimport vector
 from enum import Enum
 import logging
 import random
-from typing import List
+import weakref
+from time import perf_counter
+from typing import Dict, List
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
@@ -24,6 +26,26 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
+cdef class ListenerDeathWatcher:
+    """
+    Weak reference callback that invalidates the cached listener snapshots of a PubSub when one of its listeners is
+    garbage collected. It only keeps weak references, so it never keeps the PubSub or the listener alive.
+    """
+    cdef:
+        object _pubsub_ref
+        object _listener_ref
+
+    def __init__(self, pubsub_ref: weakref.ref, listener_ref: weakref.ref):
+        self._pubsub_ref = pubsub_ref
+        self._listener_ref = listener_ref
+
+    def __call__(self, dead_ref: weakref.ref):
+        cdef PubSub pubsub = self._pubsub_ref()
+        if pubsub is not None:
+            pubsub.c_invalidate_listener_snapshots()
+            pubsub._listener_death_watchers.pop(self._listener_ref, None)
+
+
 cdef class PubSub:
     """
     PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
@@ -39,8 +61,12 @@ cdef class PubSub:
        make sense to do the GC every time.
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    3. c_get_listeners():
+       Every time. It takes O(n) already.
+
+    c_trigger_event() does not scan the listeners. It dispatches to a cached tuple with the listeners of the event tag,
+    which is rebuilt, including the dead listener GC, only after a listener is added or removed, or after a listener
+    has been garbage collected.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,6 +78,11 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        # Initialized here since subclasses do not always call PubSub.__init__()
+        self._listener_snapshots = {}
+        self._listener_death_watchers = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -67,6 +98,26 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def get_dispatch_stats(self, event_tag: Enum) -> Dict[str, float]:
+        """
+        Returns the number of events triggered for the event tag, the number of listener calls, and the total and
+        maximum time in seconds spent dispatching a single event to its listeners.
+        """
+        cdef:
+            int64_t c_event_tag = event_tag.value
+            EventDispatchStats stats = EventDispatchStats(0, 0, 0.0, 0.0)
+        if self._dispatch_stats.count(c_event_tag) > 0:
+            stats = self._dispatch_stats[c_event_tag]
+        return {
+            "events_triggered": stats.events_triggered,
+            "listener_calls": stats.listener_calls,
+            "total_dispatch_time": stats.total_dispatch_time,
+            "max_dispatch_time": stats.max_dispatch_time,
+        }
+
+    def reset_dispatch_stats(self):
+        self._dispatch_stats.clear()
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
@@ -83,6 +134,10 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._listener_snapshots.pop(event_tag, None)
+        if listener_weakref not in self._listener_death_watchers:
+            self._listener_death_watchers[listener_weakref] = PyWeakref_NewRef(
+                listener, ListenerDeathWatcher(weakref.ref(self), listener_weakref))
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +155,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._listener_snapshots.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -118,6 +174,8 @@ cdef class PubSub:
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
                 lit_to_remove.push_back(lit)
             inc(lit)
+        if lit_to_remove.size() > 0:
+            self._listener_snapshots.pop(event_tag, None)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
@@ -143,23 +201,52 @@ cdef class PubSub:
             retval.append(typed_listener)
         return retval
 
-    cdef c_trigger_event(self, int64_t event_tag, object arg):
+    cdef tuple c_get_listener_snapshot(self, int64_t event_tag):
+        cdef:
+            tuple snapshot = self._listener_snapshots.get(event_tag)
+            EventsIterator it
+            EventListenersCollection *listeners_ptr
+
+        if snapshot is not None:
+            return snapshot
+
         self.c_remove_dead_listeners(event_tag)
+        it = self._events.find(event_tag)
+        if it == self._events.end():
+            snapshot = ()
+        else:
+            listeners_ptr = address(deref(it).second)
+            snapshot = tuple(<object>pyref.get() for pyref in deref(listeners_ptr))
+        self._listener_snapshots[event_tag] = snapshot
+        return snapshot
+
+    cdef c_invalidate_listener_snapshots(self):
+        self._listener_snapshots.clear()
 
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
+            # The snapshot is immutable, so listeners are allowed to call c_add_listener() or c_remove_listener()
+            # while the event is being dispatched.
+            tuple listeners = self.c_get_listener_snapshot(event_tag)
             object listener_weafref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
+            EventDispatchStats *stats
+            int64_t listener_calls = 0
+            double start_time
+            double dispatch_time
+
+        if len(listeners) == 0:
+            self._dispatch_stats[event_tag].events_triggered += 1
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        start_time = perf_counter()
+        for listener_weafref in listeners:
+            listener = <object>PyWeakref_GetObject(listener_weafref)
+            if listener is None:
+                continue
+            typed_listener = listener
+            listener_calls += 1
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +254,12 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+        dispatch_time = perf_counter() - start_time
+        # The stats are looked up after the dispatch, since listeners might trigger events with other tags, which can
+        # rehash the stats map.
+        stats = address(self._dispatch_stats[event_tag])
+        stats.events_triggered += 1
+        stats.listener_calls += listener_calls
+        stats.total_dispatch_time += dispatch_time
+        if dispatch_time > stats.max_dispatch_time:
+            stats.max_dispatch_time = dispatch_time
@@ -14,6 +14,7 @@ class RESTMethod(Enum):
     GET = "GET"
     POST = "POST"
     PUT = "PUT"
+    PATCH = "PATCH"
     DELETE = "DELETE"
 
     def __str__(self):
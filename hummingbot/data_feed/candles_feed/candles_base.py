@@ -1,8 +1,8 @@
 import asyncio
 import os
-from collections import deque
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 
@@ -12,12 +12,14 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a fixed size CandlesStore (a ring buffer
+    with the interface of a double-ended queue) to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -46,7 +48,7 @@ class CandlesBase(NetworkBase):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesStore(columns=self.columns, max_records=max_records)
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -75,7 +77,7 @@ class CandlesBase(NetworkBase):
     @property
     def is_ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles store has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -113,9 +115,33 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns a copy of the candles stored in the _candles store as a Pandas DataFrame, that the caller
+        can modify.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return self.candles_df_view.copy()
+
+    @property
+    def candles_df_view(self) -> pd.DataFrame:
+        """
+        This property returns the candles as a Pandas DataFrame that is cached until a candle is added or updated.
+        It is shared by all the callers, so it must not be modified.
+        """
+        return self._candles.dataframe
+
+    @property
+    def candles_store(self) -> CandlesStore:
+        """
+        This property returns the store that holds the candles, for consumers that process them incrementally.
+        """
+        return self._candles
+
+    @property
+    def candles_version(self) -> int:
+        """
+        This property returns a counter that increases every time a candle is added or updated. Consumers can use it to
+        skip recomputing indicators when the candles have not changed.
+        """
+        return self._candles.version
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -125,13 +151,28 @@ class CandlesBase(NetworkBase):
         This method loads the candles from a CSV file.
         :param data_path: data path that holds the CSV file
         """
+        self.load_candles(self.read_candles_csv(data_path))
+
+    def read_candles_csv(self, data_path: str) -> np.ndarray:
+        """
+        This method reads the candles from a CSV file, without loading them.
+        :param data_path: data path that holds the CSV file
+        :return: numpy array with the candlesticks sorted from the newest to the oldest
+        """
         filename = f"candles_{self.name}_{self.interval}.csv"
         file_path = os.path.join(data_path, filename)
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File '{file_path}' does not exist.")
         df = pd.read_csv(file_path)
         df.sort_values(by="timestamp", ascending=False, inplace=True)
-        self._candles.extendleft(df.values.tolist())
+        return df.values
+
+    def load_candles(self, candles: np.ndarray):
+        """
+        This method adds historical candles before the existing ones.
+        :param candles: numpy array with the candlesticks sorted from the newest to the oldest
+        """
+        self._candles.extendleft(candles)
 
     async def fetch_candles(self,
                             start_time: Optional[int] = None,
@@ -148,7 +189,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This is an abstract method that must be implemented by a subclass to fill the _candles store with historical candles.
         """
         raise NotImplementedError
 
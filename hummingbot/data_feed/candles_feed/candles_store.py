@@ -0,0 +1,164 @@
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class CandlesStore:
+    """
+    Fixed size store of candles backed by a preallocated float64 array per column, used as a ring buffer.
+
+    It keeps the deque interface the candles feeds were written for (append, appendleft, extendleft, pop, indexing,
+    len and maxlen), so adding a candle or replacing the last one writes its values in place instead of allocating a
+    new row. Like a deque with maxlen, appending to a full store discards the candle at the opposite end.
+
+    Every change increases `version`, and the DataFrame returned by `dataframe` is only rebuilt when the version
+    changed since it was last built.
+    """
+
+    def __init__(self, columns: Sequence[str], max_records: int):
+        self._columns: List[str] = list(columns)
+        self._capacity: int = max_records
+        self._data: np.ndarray = np.zeros((len(self._columns), max_records), dtype=np.float64)
+        self._start: int = 0
+        self._size: int = 0
+        self._version: int = 0
+        self._dataframe: Optional[pd.DataFrame] = None
+        self._dataframe_version: int = -1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._data[:, self._position(index)].copy()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(self._size):
+            yield self[index]
+
+    @property
+    def maxlen(self) -> int:
+        return self._capacity
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def version(self) -> int:
+        """
+        Number of changes applied to the store. Consumers can compare it with the version they last processed to
+        skip recomputations when no candle was added or updated.
+        """
+        return self._version
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """
+        Returns the candles as a DataFrame, sorted from the oldest to the newest. The same DataFrame is returned until
+        the store changes, so it must not be modified.
+        """
+        if self._dataframe is None or self._dataframe_version != self._version:
+            self._dataframe = pd.DataFrame(self.to_array(), columns=self._columns)
+            self._dataframe_version = self._version
+        return self._dataframe
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns a copy of the candles as a 2D array with one row per candle, sorted from the oldest to the newest.
+        """
+        positions = (self._start + np.arange(self._size)) % max(self._capacity, 1)
+        return self._data[:, positions].T
+
+    def append(self, candle: Sequence[float]):
+        if self._capacity == 0:
+            return
+        if self._size == self._capacity:
+            self._start = (self._start + 1) % self._capacity
+        else:
+            self._size += 1
+        self._write(self._size - 1, candle)
+
+    def appendleft(self, candle: Sequence[float]):
+        if self._capacity == 0:
+            return
+        self._start = (self._start - 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+        self._write(0, candle)
+
+    def extend(self, candles: Iterable[Sequence[float]]):
+        """
+        Adds the candles to the right of the store, writing all of them at once.
+        """
+        candles = self._as_rows(candles)[-self._capacity:] if self._capacity > 0 else []
+        if len(candles) == 0:
+            return
+        positions = (self._start + self._size + np.arange(len(candles))) % self._capacity
+        overflow = max(self._size + len(candles) - self._capacity, 0)
+        self._start = (self._start + overflow) % self._capacity
+        self._size += len(candles) - overflow
+        self._write_positions(positions, candles)
+
+    def extendleft(self, candles: Iterable[Sequence[float]]):
+        """
+        Adds the candles to the left of the store so they end up in reverse order (like deque.extendleft), writing
+        all of them at once.
+        """
+        candles = self._as_rows(candles)[::-1][:self._capacity] if self._capacity > 0 else []
+        if len(candles) == 0:
+            return
+        self._start = (self._start - len(candles)) % self._capacity
+        self._size = min(self._size + len(candles), self._capacity)
+        positions = (self._start + np.arange(len(candles))) % self._capacity
+        self._write_positions(positions, candles)
+
+    def update_last(self, candle: Sequence[float]):
+        """
+        Replaces the values of the newest candle.
+        """
+        if self._size == 0:
+            raise IndexError("update_last on an empty candles store")
+        self._write(self._size - 1, candle)
+
+    def pop(self) -> np.ndarray:
+        if self._size == 0:
+            raise IndexError("pop from an empty candles store")
+        candle = self[-1]
+        self._size -= 1
+        self._version += 1
+        return candle
+
+    def popleft(self) -> np.ndarray:
+        if self._size == 0:
+            raise IndexError("pop from an empty candles store")
+        candle = self[0]
+        self._start = (self._start + 1) % self._capacity
+        self._size -= 1
+        self._version += 1
+        return candle
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+        self._version += 1
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("candles store index out of range")
+        return (self._start + index) % self._capacity
+
+    def _as_rows(self, candles: Iterable[Sequence[float]]) -> np.ndarray:
+        if not isinstance(candles, np.ndarray):
+            candles = list(candles)
+        return np.asarray(candles, dtype=np.float64).reshape(-1, len(self._columns))
+
+    def _write_positions(self, positions: np.ndarray, candles: np.ndarray):
+        self._data[:, positions] = candles.T
+        self._version += len(candles)
+
+    def _write(self, index: int, candle: Sequence[float]):
+        self._data[:, self._position(index)] = candle
+        self._version += 1
@@ -27,6 +27,8 @@ class KrakenSpotCandles(CandlesBase):
         if max_records > 720:
             raise Exception("Kraken only supports a maximum of 720 records.")
         super().__init__(trading_pair, interval, max_records)
+        self._candles_df_view: Optional[pd.DataFrame] = None
+        self._candles_df_view_version: int = -1
 
     @property
     def name(self):
@@ -57,10 +59,17 @@ class KrakenSpotCandles(CandlesBase):
         return CONSTANTS.INTERVALS
 
     @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
-        df["timestamp"] = df["timestamp"] * 1000
-        return df.sort_values(by="timestamp", ascending=True)
+    def candles_df_view(self) -> pd.DataFrame:
+        """
+        Kraken candles are stored with the timestamp in seconds, the view has it in milliseconds like the other candles
+        feeds. The view is cached until a candle is added or updated.
+        """
+        if self._candles_df_view is None or self._candles_df_view_version != self._candles.version:
+            df = super().candles_df_view.copy()
+            df["timestamp"] = df["timestamp"] * 1000
+            self._candles_df_view = df.sort_values(by="timestamp", ascending=True)
+            self._candles_df_view_version = self._candles.version
+        return self._candles_df_view
 
     async def check_network(self) -> NetworkStatus:
         rest_assistant = await self._api_factory.get_rest_assistant()
@@ -210,7 +219,6 @@ class KrakenSpotCandles(CandlesBase):
                                                        quote_asset_volume, n_trades, taker_buy_base_volume,
                                                        taker_buy_quote_volume]))
                     elif timestamp == int(self._candles[-1][0]):
-                        self._candles.pop()
-                        self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                       quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                       taker_buy_quote_volume]))
+                        self._candles.update_last(np.array([timestamp, open, high, low, close, volume,
+                                                            quote_asset_volume, n_trades, taker_buy_base_volume,
+                                                            taker_buy_quote_volume]))
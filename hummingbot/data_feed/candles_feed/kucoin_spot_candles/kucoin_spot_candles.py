@@ -186,8 +186,7 @@ class KucoinSpotCandles(CandlesBase):
                     # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
                     self._candles.append(candles_array)
                 elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(candles_array)
+                    self._candles.update_last(candles_array)
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
         rest_assistant = await self._api_factory.get_rest_assistant()
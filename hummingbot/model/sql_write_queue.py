@@ -0,0 +1,275 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+SQLWrite = Callable[[Session], None]
+
+_FLUSH = object()
+_STOP = object()
+
+
+def call_after_commit(session: Session, callback: Callable[[], None]):
+    """
+    Calls `callback` once the transaction of the session is committed. It is not called if the transaction is rolled
+    back, so the side effects of a write (e.g. the trades CSV rows) only happen once its records are stored, even if
+    the write is retried in another session.
+    """
+    def after_commit(_: Session):
+        try:
+            callback()
+        except Exception:
+            SQLWriteQueue.logger().error("Unexpected error after committing a database write.", exc_info=True)
+
+    event.listen(session, "after_commit", after_commit, once=True)
+
+
+class SQLWriteQueue:
+    """
+    Write-behind queue that applies database writes from a worker thread.
+
+    A write is a function that receives a session and adds or updates records in it. Writes are applied in the order
+    they were queued, and the worker commits them in batches: a batch is committed when it reaches `max_batch_size`
+    writes, when `flush_interval` seconds have passed since its first write, or when a flush is requested.
+    Writes queued with a key replace the previous write with the same key if that one has not been applied yet, which
+    turns repeated updates of the same record (e.g. the market states) into a single write per batch.
+
+    The queue is bounded. If it is full, `put` waits up to `max_put_wait` seconds for the worker to make room for the
+    write, and queues it anyway after that, so the calling thread (the event loop) is never blocked for longer and no
+    write is lost. While the worker is not running, writes are applied immediately in the calling thread.
+
+    `on_commit`, if given, is called after each batch is committed, in the thread that committed it.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 max_queue_size: int = 10000,
+                 max_batch_size: int = 500,
+                 flush_interval: float = 0.5,
+                 max_put_wait: float = 0.1,
+                 on_commit: Optional[Callable[[], None]] = None):
+        self._sql_manager: SQLConnectionManager = sql
+        self._on_commit: Optional[Callable[[], None]] = on_commit
+        # The queue itself is unbounded, the size limit is enforced by put with a bounded wait
+        self._queue: queue.Queue = queue.Queue()
+        self._max_queue_size: int = max_queue_size
+        self._max_put_wait: float = max_put_wait
+        self._queue_not_full: threading.Condition = threading.Condition()
+        self._max_batch_size: int = max_batch_size
+        self._flush_interval: float = flush_interval
+        self._keyed_writes: Dict[Hashable, SQLWrite] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+        self._writes_queued: int = 0
+        self._writes_committed: int = 0
+        self._writes_failed: int = 0
+        self._batches_committed: int = 0
+        self._queue_full_count: int = 0
+        self._max_queue_depth: int = 0
+        self._last_commit_latency: float = 0
+        self._total_commit_latency: float = 0
+        self._max_commit_latency: float = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+                "queue_full_count": self._queue_full_count,
+                "writes_queued": self._writes_queued,
+                "writes_committed": self._writes_committed,
+                "writes_failed": self._writes_failed,
+                "batches_committed": self._batches_committed,
+                "last_commit_latency": self._last_commit_latency,
+                "avg_commit_latency": (self._total_commit_latency / self._batches_committed
+                                       if self._batches_committed > 0 else 0),
+                "max_commit_latency": self._max_commit_latency,
+            }
+
+    def start(self):
+        if self.is_running:
+            return
+        self._worker = threading.Thread(target=self._run, name="SQLWriteQueue", daemon=True)
+        self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Commits all the queued writes and stops the worker thread.
+        """
+        if not self.is_running:
+            return
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+        self._worker = None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until all the writes queued before the call are committed.
+        :return: False if the timeout expired before the writes were committed
+        """
+        if not self.is_running:
+            return True
+        flushed = threading.Event()
+        self._queue.put((_FLUSH, flushed))
+        return flushed.wait(timeout)
+
+    def put(self, write: SQLWrite, key: Optional[Hashable] = None):
+        """
+        Queues a write.
+        :param write: function that adds or updates records in the session it receives
+        :param key: if not None, the write replaces any queued write with the same key that has not been applied yet
+        """
+        if not self.is_running:
+            self._commit([write])
+            return
+
+        if key is not None:
+            with self._lock:
+                already_queued = key in self._keyed_writes
+                self._keyed_writes[key] = write
+            if already_queued:
+                return
+            item = (key, None)
+        else:
+            item = (None, write)
+
+        if self._queue.qsize() >= self._max_queue_size:
+            with self._lock:
+                self._queue_full_count += 1
+            self.logger().warning("The database write queue is full. Waiting for the pending writes to be committed.")
+            with self._queue_not_full:
+                self._queue_not_full.wait_for(lambda: self._queue.qsize() < self._max_queue_size,
+                                              timeout=self._max_put_wait)
+        self._queue.put_nowait(item)
+        with self._lock:
+            self._writes_queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            writes, flush_events, stopped = self._next_batch()
+            if len(writes) > 0:
+                self._commit(writes)
+            for flushed in flush_events:
+                flushed.set()
+
+    def _next_batch(self) -> Tuple[List[SQLWrite], List[threading.Event], bool]:
+        """
+        Waits for the first write of the batch, and then collects writes until the batch is full, the flush interval
+        has passed, or a flush or stop is requested.
+        """
+        items: List[Tuple[Optional[Hashable], Optional[SQLWrite]]] = []
+        flush_events: List[threading.Event] = []
+        stopped = False
+        item = self._get()
+        deadline = time.perf_counter() + self._flush_interval
+        while True:
+            if item is _STOP:
+                # Commit everything queued before the stop request
+                self._drain_queue(items, flush_events)
+                stopped = True
+                break
+            if item[0] is _FLUSH:
+                flush_events.append(item[1])
+                break
+            items.append(item)
+            remaining = deadline - time.perf_counter()
+            if len(items) >= self._max_batch_size or remaining <= 0:
+                break
+            try:
+                item = self._get(timeout=remaining)
+            except queue.Empty:
+                break
+        return [self._resolve_write(key, write) for key, write in items], flush_events, stopped
+
+    def _get(self, block: bool = True, timeout: Optional[float] = None):
+        item = self._queue.get(block=block, timeout=timeout)
+        with self._queue_not_full:
+            self._queue_not_full.notify_all()
+        return item
+
+    def _drain_queue(self,
+                     items: List[Tuple[Optional[Hashable], Optional[SQLWrite]]],
+                     flush_events: List[threading.Event]):
+        while True:
+            try:
+                item = self._get(block=False)
+            except queue.Empty:
+                return
+            if item is _STOP:
+                continue
+            if item[0] is _FLUSH:
+                flush_events.append(item[1])
+            else:
+                items.append(item)
+
+    def _resolve_write(self, key: Optional[Hashable], write: Optional[SQLWrite]) -> SQLWrite:
+        """
+        Keyed writes are resolved when the batch is closed, so they are replaced until then
+        """
+        if key is None:
+            return write
+        with self._lock:
+            return self._keyed_writes.pop(key)
+
+    def _commit(self, writes: List[SQLWrite]):
+        start = time.perf_counter()
+        failed = 0
+        try:
+            self._apply(writes)
+        except Exception:
+            self.logger().error(f"Unexpected error committing a batch of {len(writes)} database writes. "
+                                f"Retrying the writes one by one.", exc_info=True)
+            # A single failing write must not discard the rest of the batch. The batch was rolled back, so the
+            # after commit callbacks of its writes were not called and are only called by the retry.
+            for write in writes:
+                try:
+                    self._apply([write])
+                except Exception:
+                    failed += 1
+                    self.logger().error("Unexpected error committing a database write.", exc_info=True)
+        if self._on_commit is not None:
+            try:
+                self._on_commit()
+            except Exception:
+                self.logger().error("Unexpected error after committing database writes.", exc_info=True)
+        latency = time.perf_counter() - start
+
+        with self._lock:
+            self._writes_committed += len(writes) - failed
+            self._writes_failed += failed
+            self._batches_committed += 1
+            self._last_commit_latency = latency
+            self._total_commit_latency += latency
+            self._max_commit_latency = max(self._max_commit_latency, latency)
+
+    def _apply(self, writes: List[SQLWrite]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for write in writes:
+                    write(session)
@@ -1,10 +1,10 @@
 import time
 
 import pandas as pd
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field
 
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.smart_components.indicators import BBANDS, CandlesIndicators
 from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
 from hummingbot.smart_components.strategy_frameworks.directional_trading import (
     DirectionalTradingControllerBase,
@@ -25,6 +25,7 @@ class BollingerV1(DirectionalTradingControllerBase):
     def __init__(self, config: BollingerV1Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators([BBANDS(length=self.config.bb_length, std=self.config.bb_std)])
 
     def early_stop_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -43,10 +44,8 @@ class BollingerV1(DirectionalTradingControllerBase):
         return False
 
     def get_processed_data(self) -> pd.DataFrame:
-        df = self.candles[0].candles_df
-
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+        df = self.indicators.get_processed_candles_df(self.candles[0])
 
         # Generate signal
         long_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] < self.config.bb_long_threshold
@@ -1,11 +1,10 @@
 import time
 from decimal import Decimal
 
-import pandas_ta as ta  # noqa: F401
-
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorConfig, TrailingStop
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.smart_components.indicators import NATR, CandlesIndicators
 from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
 from hummingbot.smart_components.strategy_frameworks.market_making.market_making_controller_base import (
     MarketMakingControllerBase,
@@ -26,6 +25,7 @@ class DManV1(MarketMakingControllerBase):
     def __init__(self, config: DManV1Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators([NATR(length=self.config.natr_length)])
 
     def refresh_order_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -56,8 +56,8 @@ class DManV1(MarketMakingControllerBase):
         """
         Gets the price and spread multiplier from the last candlestick.
         """
-        candles_df = self.candles[0].candles_df
-        natr = ta.natr(candles_df["high"], candles_df["low"], candles_df["close"], length=self.config.natr_length) / 100
+        candles_df = self.indicators.get_processed_candles_df(self.candles[0])
+        natr = candles_df[f"NATR_{self.config.natr_length}"] / 100
 
         candles_df["spread_multiplier"] = natr
         candles_df["price_multiplier"] = 0.0
@@ -1,11 +1,10 @@
 import time
 from decimal import Decimal
 
-import pandas_ta as ta  # noqa: F401
-
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorConfig, TrailingStop
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.smart_components.indicators import MACD, NATR, CandlesIndicators
 from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
 from hummingbot.smart_components.strategy_frameworks.market_making.market_making_controller_base import (
     MarketMakingControllerBase,
@@ -29,6 +28,10 @@ class DManV2(MarketMakingControllerBase):
     def __init__(self, config: DManV2Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators([
+            NATR(length=self.config.natr_length),
+            MACD(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal),
+        ])
 
     def refresh_order_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -59,12 +62,11 @@ class DManV2(MarketMakingControllerBase):
         """
         Gets the price and spread multiplier from the last candlestick.
         """
-        candles_df = self.candles[0].candles_df
-        natr = ta.natr(candles_df["high"], candles_df["low"], candles_df["close"], length=self.config.natr_length) / 100
+        candles_df = self.indicators.get_processed_candles_df(self.candles[0])
+        natr = candles_df[f"NATR_{self.config.natr_length}"] / 100
 
-        macd_output = ta.macd(candles_df["close"], fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macd = candles_df[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macdh = candles_df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
         macd_signal = - (macd - macd.mean()) / macd.std()
         macdh_signal = macdh.apply(lambda x: 1 if x > 0 else -1)
         max_price_shift = natr / 2
@@ -1,11 +1,10 @@
 import time
 from decimal import Decimal
 
-import pandas_ta as ta  # noqa: F401
-
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorConfig, TrailingStop
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.smart_components.indicators import BBANDS, CandlesIndicators
 from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
 from hummingbot.smart_components.strategy_frameworks.market_making.market_making_controller_base import (
     MarketMakingControllerBase,
@@ -33,6 +32,9 @@ class DManV3(MarketMakingControllerBase):
     def __init__(self, config: DManV3Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators([BBANDS(length=self.config.bb_length, std=self.config.bb_std)])
+        self._processed_data = None
+        self._processed_data_candles_version = None
 
     def refresh_order_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -62,13 +64,16 @@ class DManV3(MarketMakingControllerBase):
     def get_processed_data(self):
         """
         Gets the price and spread multiplier from the last candlestick.
+        The indicators are only recomputed when the candles changed since the last call.
         """
-        candles_df = self.candles[0].candles_df
-        bbp = ta.bbands(candles_df["close"], length=self.config.bb_length, std=self.config.bb_std)
-
-        candles_df["price_multiplier"] = bbp[f"BBM_{self.config.bb_length}_{self.config.bb_std}"]
-        candles_df["spread_multiplier"] = bbp[f"BBB_{self.config.bb_length}_{self.config.bb_std}"] / 200
-        return candles_df
+        candles_version = self.candles[0].candles_version
+        if self._processed_data is None or candles_version != self._processed_data_candles_version:
+            candles_df = self.indicators.get_processed_candles_df(self.candles[0])
+            candles_df["price_multiplier"] = candles_df[f"BBM_{self.config.bb_length}_{self.config.bb_std}"]
+            candles_df["spread_multiplier"] = candles_df[f"BBB_{self.config.bb_length}_{self.config.bb_std}"] / 200
+            self._processed_data = candles_df
+            self._processed_data_candles_version = candles_version
+        return self._processed_data
 
     def get_position_config(self, order_level: OrderLevel) -> PositionExecutorConfig:
         """
@@ -4,11 +4,11 @@ from decimal import Decimal
 from typing import List, Optional
 
 import pandas as pd
-import pandas_ta as ta  # noqa: F401
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.smart_components.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
 from hummingbot.smart_components.executors.position_executor.data_types import TrailingStop
+from hummingbot.smart_components.indicators import MACD, CandlesIndicators
 from hummingbot.smart_components.models.executor_actions import (
     CreateExecutorAction,
     ExecutorAction,
@@ -64,6 +64,8 @@ class DManV5(GenericController):
             n_levels=self.config.n_levels - 1, start=self.config.start_spread,
             ratio=self.config.spread_ratio_increase)
         self.stored_dcas = set()
+        self.macd = MACD(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal)
+        self.indicators = CandlesIndicators([self.macd])
 
     async def determine_actions(self) -> [List[ExecutorAction]]:
         """
@@ -157,17 +159,10 @@ class DManV5(GenericController):
             ))
 
     def get_signal(self):
-        candles_df = self.candles[0].candles_df
-        macd_output = ta.macd(candles_df["close"], fast=self.config.macd_fast, slow=self.config.macd_slow,
-                              signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"].apply(
-            lambda x: -1 if x > 0 else 1)
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"].apply(
-            lambda x: 1 if x > 0 else -1)
-
-        signal = macd + macdh
-        signal = signal.apply(lambda x: 1 if x == 2 else (-1 if x == -2 else 0))
-        return signal.iat[-1]
+        self.indicators.update(self.candles[0])
+        macd, macdh, _ = self.macd.values
+        signal = (-1 if macd > 0 else 1) + (1 if macdh > 0 else -1)
+        return 1 if signal == 2 else (-1 if signal == -2 else 0)
 
     def store_actions_proposal(self) -> List[StoreExecutorAction]:
         """
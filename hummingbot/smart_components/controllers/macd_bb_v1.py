@@ -5,6 +5,7 @@ import pandas as pd
 from pydantic import Field
 
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.smart_components.indicators import BBANDS, MACD, STDEV, CandlesIndicators
 from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
 from hummingbot.smart_components.strategy_frameworks.directional_trading.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -32,6 +33,11 @@ class MACDBBV1(DirectionalTradingControllerBase):
     def __init__(self, config: MACDBBV1Config):
         super().__init__(config)
         self.config = config
+        indicators = [BBANDS(length=self.config.bb_length, std=self.config.bb_std),
+                      MACD(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal)]
+        if self.config.std_span:
+            indicators.append(STDEV(length=self.config.std_span))
+        self.indicators = CandlesIndicators(indicators)
 
     def early_stop_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         """
@@ -50,11 +56,8 @@ class MACDBBV1(DirectionalTradingControllerBase):
         return False
 
     def get_processed_data(self) -> pd.DataFrame:
-        df = self.candles[0].candles_df
-
         # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
-        df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
+        df = self.indicators.get_processed_candles_df(self.candles[0])
         bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
         macdh = df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
         macd = df[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
@@ -68,7 +71,7 @@ class MACDBBV1(DirectionalTradingControllerBase):
 
         # Optional: Generate spread multiplier
         if self.config.std_span:
-            df["target"] = df["close"].rolling(self.config.std_span).std() / df["close"]
+            df["target"] = df[f"STDEV_{self.config.std_span}"] / df["close"]
         return df
 
     def extra_columns_to_show(self):
@@ -4,6 +4,7 @@ import pandas as pd
 from pydantic import Field
 
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.smart_components.indicators import BBANDS, SMA, CandlesIndicators
 from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
 from hummingbot.smart_components.strategy_frameworks.directional_trading.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
@@ -25,6 +26,9 @@ class TrendFollowerV1(DirectionalTradingControllerBase):
     def __init__(self, config: TrendFollowerV1Config):
         super().__init__(config)
         self.config = config
+        self.indicators = CandlesIndicators([SMA(length=self.config.sma_fast),
+                                             SMA(length=self.config.sma_slow),
+                                             BBANDS(length=self.config.bb_length, std=2.0)])
 
     def early_stop_condition(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
         # If an executor has an active position, should we close it based on a condition. This feature is not available
@@ -40,10 +44,7 @@ class TrendFollowerV1(DirectionalTradingControllerBase):
         return False
 
     def get_processed_data(self) -> pd.DataFrame:
-        df = self.candles[0].candles_df
-        df.ta.sma(length=self.config.sma_fast, append=True)
-        df.ta.sma(length=self.config.sma_slow, append=True)
-        df.ta.bbands(length=self.config.bb_length, std=2.0, append=True)
+        df = self.indicators.get_processed_candles_df(self.candles[0])
 
         # Generate long and short conditions
         bbp = df[f"BBP_{self.config.bb_length}_2.0"]
@@ -1,14 +1,12 @@
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
-    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -16,6 +14,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.smart_components.executors.data_types import ExecutorConfigBase
+from hummingbot.smart_components.executors.executor_scheduler import ExecutorScheduler, ExecutorTimingStats
 from hummingbot.smart_components.models.base import SmartComponentStatus
 from hummingbot.smart_components.models.executors import CloseType
 from hummingbot.smart_components.models.executors_info import ExecutorInfo
@@ -44,25 +43,8 @@ class ExecutorBase(SmartComponentBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
-        # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
-
-        # Pairs of market events and their corresponding event forwarders
-        self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
-            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
-            (MarketEvent.BuyOrderCreated, self._create_buy_order_forwarder),
-            (MarketEvent.SellOrderCreated, self._create_sell_order_forwarder),
-            (MarketEvent.OrderFilled, self._fill_order_forwarder),
-            (MarketEvent.BuyOrderCompleted, self._complete_buy_order_forwarder),
-            (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
-            (MarketEvent.OrderFailure, self._failed_order_forwarder),
-        ]
+        self.timing_stats = ExecutorTimingStats()
+        self._scheduler = ExecutorScheduler.get_instance()
 
     @property
     def status(self):
@@ -144,6 +126,12 @@ class ExecutorBase(SmartComponentBase):
         super().start()
         self.register_events()
 
+    def _schedule_control_loop(self):
+        """
+        Instead of running its own control loop, the executor is ticked by the shared ExecutorScheduler.
+        """
+        self._scheduler.add_executor(self)
+
     def stop(self):
         """
         Stops the executor and unregisters the events.
@@ -228,19 +216,15 @@ class ExecutorBase(SmartComponentBase):
 
     def register_events(self):
         """
-        Registers the events with the connectors.
+        Registers the executor in the scheduler to receive the events of its orders.
         """
-        for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.add_listener(event_pair[0], event_pair[1])
+        self._scheduler.register_events(self)
 
     def unregister_events(self):
         """
-        Unregisters the events from the connectors.
+        Unregisters the executor from the events of its orders.
         """
-        for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.remove_listener(event_pair[0], event_pair[1])
+        self._scheduler.unregister_events(self)
 
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
@@ -270,9 +254,11 @@ class ExecutorBase(SmartComponentBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        self._scheduler.track_order(self, order_id)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
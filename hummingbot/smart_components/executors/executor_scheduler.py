@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.smart_components.executors.executor_base import ExecutorBase
+
+
+@dataclass
+class ExecutorTimingStats:
+    """
+    Time spent by an executor in its control task, in seconds.
+    """
+    ticks: int = 0
+    total_time: float = 0
+    max_time: float = 0
+    last_time: float = 0
+
+    @property
+    def average_time(self) -> float:
+        return self.total_time / self.ticks if self.ticks > 0 else 0
+
+    def add(self, elapsed: float):
+        self.ticks += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.last_time = elapsed
+
+
+class ExecutorScheduler:
+    """
+    Runs the control task of all the started executors from a single task per update interval, instead of one polling
+    task per executor, and routes the order events of the connectors to the executor that placed each order.
+
+    Each tick the executors of an interval are processed concurrently: an executor that was just started runs its
+    on_start method, a terminated one runs its on_stop method and is removed, and the rest run their control task.
+    The time spent in each control task is added to the timing stats of the executor.
+
+    A single listener is added to each connector used by the executors, and an order event is only delivered to the
+    executor that registered the order id with track_order.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["ExecutorScheduler"] = None
+
+    EVENT_PROCESSORS = {
+        MarketEvent.OrderCancelled: "process_order_canceled_event",
+        MarketEvent.BuyOrderCreated: "process_order_created_event",
+        MarketEvent.SellOrderCreated: "process_order_created_event",
+        MarketEvent.OrderFilled: "process_order_filled_event",
+        MarketEvent.BuyOrderCompleted: "process_order_completed_event",
+        MarketEvent.SellOrderCompleted: "process_order_completed_event",
+        MarketEvent.OrderFailure: "process_order_failed_event",
+    }
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "ExecutorScheduler":
+        if cls._shared_instance is None:
+            cls._shared_instance = ExecutorScheduler()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._event_processors: Dict[int, str] = {event.value: name for event, name in self.EVENT_PROCESSORS.items()}
+        self._event_forwarder = SourceInfoEventForwarder(self._route_event)
+        self._reset()
+
+    def _reset(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executors_by_interval: Dict[float, List["ExecutorBase"]] = {}
+        self._tick_tasks: Dict[float, asyncio.Task] = {}
+        self._starting_executors: Set["ExecutorBase"] = set()
+        self._connectors_listeners_count: Dict[ConnectorBase, int] = {}
+        self._executors_orders: Dict["ExecutorBase", Set[str]] = {}
+        self._orders_executors: Dict[str, "ExecutorBase"] = {}
+
+    @property
+    def executors(self) -> List["ExecutorBase"]:
+        return [executor for executors in self._executors_by_interval.values() for executor in executors]
+
+    @property
+    def timing_stats(self) -> Dict[str, ExecutorTimingStats]:
+        """
+        Timing stats of the scheduled executors, by executor id.
+        """
+        return {executor.config.id: executor.timing_stats for executor in self.executors}
+
+    def add_executor(self, executor: "ExecutorBase"):
+        """
+        Schedules the control task of a started executor. The executor's on_start method is run on the next tick.
+        """
+        loop = asyncio.get_event_loop()
+        if self._loop is not loop:
+            # The executors and tasks of a previous event loop can't be run anymore
+            self._reset()
+            self._loop = loop
+        self._executors_by_interval.setdefault(executor.update_interval, []).append(executor)
+        self._starting_executors.add(executor)
+        tick_task = self._tick_tasks.get(executor.update_interval)
+        if tick_task is None or tick_task.done():
+            self._tick_tasks[executor.update_interval] = safe_ensure_future(self._tick_loop(executor.update_interval))
+
+    def register_events(self, executor: "ExecutorBase"):
+        """
+        Listens to the order events of the executor's connectors, if no other executor is using them already.
+        """
+        if executor in self._executors_orders:
+            return
+        for connector in executor.connectors.values():
+            listeners_count = self._connectors_listeners_count.get(connector, 0)
+            if listeners_count == 0:
+                for event in self.EVENT_PROCESSORS:
+                    connector.add_listener(event, self._event_forwarder)
+            self._connectors_listeners_count[connector] = listeners_count + 1
+        self._executors_orders.setdefault(executor, set())
+
+    def unregister_events(self, executor: "ExecutorBase"):
+        """
+        Stops routing the events of the executor's orders to it, and removes the listener of the connectors that are
+        not used by other executors.
+        """
+        for order_id in self._executors_orders.pop(executor, set()):
+            self._orders_executors.pop(order_id, None)
+        for connector in executor.connectors.values():
+            listeners_count = self._connectors_listeners_count.get(connector, 0)
+            if listeners_count == 1:
+                for event in self.EVENT_PROCESSORS:
+                    connector.remove_listener(event, self._event_forwarder)
+                del self._connectors_listeners_count[connector]
+            elif listeners_count > 1:
+                self._connectors_listeners_count[connector] = listeners_count - 1
+
+    def track_order(self, executor: "ExecutorBase", order_id: str):
+        """
+        Routes the events of the order to the executor.
+        """
+        executor_orders = self._executors_orders.get(executor)
+        if executor_orders is not None:
+            executor_orders.add(order_id)
+            self._orders_executors[order_id] = executor
+
+    async def tick(self, update_interval: float):
+        """
+        Runs a pass over all the executors of the update interval. The executors are run concurrently, so a slow
+        control task does not delay the rest of the executors.
+        """
+        executors = list(self._executors_by_interval.get(update_interval, []))
+        await safe_gather(*[self._tick_executor(executor) for executor in executors])
+
+    async def _tick_executor(self, executor: "ExecutorBase"):
+        if executor in self._starting_executors:
+            self._starting_executors.discard(executor)
+            try:
+                executor.on_start()
+            except Exception:
+                self.logger().exception(f"Error starting the executor {executor.config.id}.")
+                self._remove_executor(executor)
+                return
+        if executor.terminated.is_set():
+            self._remove_executor(executor)
+            try:
+                executor.on_stop()
+            except Exception:
+                self.logger().exception(f"Error stopping the executor {executor.config.id}.")
+            return
+        start = time.perf_counter()
+        try:
+            await executor.control_task()
+        except Exception as e:
+            executor.logger().error(e, exc_info=True)
+        executor.timing_stats.add(time.perf_counter() - start)
+
+    async def _tick_loop(self, update_interval: float):
+        while len(self._executors_by_interval.get(update_interval, [])) > 0:
+            await self.tick(update_interval)
+            await asyncio.sleep(update_interval)
+        self._executors_by_interval.pop(update_interval, None)
+
+    def _remove_executor(self, executor: "ExecutorBase"):
+        executors = self._executors_by_interval.get(executor.update_interval, [])
+        if executor in executors:
+            executors.remove(executor)
+        self._starting_executors.discard(executor)
+
+    def _route_event(self, event_tag: int, market: ConnectorBase, event):
+        executor = self._orders_executors.get(getattr(event, "order_id", None))
+        if executor is not None:
+            getattr(executor, self._event_processors[event_tag])(event_tag, market, event)
@@ -241,6 +241,22 @@ class PositionExecutor(ExecutorBase):
         self._open_order.order_id = order_id
         self.logger().info("Placing open order")
 
+    def amend_open_order(self, position_config: PositionExecutorConfig):
+        """
+        Moves the open order to the entry price and amount of a new position config with an order amend, so the order
+        keeps its id and place in the book. The rest of the new config (barriers and timestamp) is used for the
+        position, and the executor keeps its id.
+        """
+        self.config = position_config.copy(update={"id": self.config.id, "level_id": self.config.level_id})
+        self._strategy.amend(
+            connector_name=self.exchange,
+            trading_pair=self.trading_pair,
+            order_id=self._open_order.order_id,
+            price=self.entry_price,
+            amount=self.amount,
+        )
+        self.logger().info("Amending open order")
+
     def control_open_order_expiration(self):
         if self.end_time and self.end_time <= self._strategy.current_timestamp:
             self._strategy.cancel(
@@ -0,0 +1,15 @@
+from .candles_indicators import CandlesIndicators
+from .streaming_indicators import BBANDS, EMA, MACD, NATR, RMA, RSI, SMA, STDEV, StreamingIndicator
+
+__all__ = [
+    "CandlesIndicators",
+    "StreamingIndicator",
+    "BBANDS",
+    "EMA",
+    "MACD",
+    "NATR",
+    "RMA",
+    "RSI",
+    "SMA",
+    "STDEV",
+]
@@ -0,0 +1,94 @@
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.smart_components.indicators.streaming_indicators import StreamingIndicator
+
+
+class CandlesIndicators:
+    """
+    Keeps a set of streaming indicators in sync with a candles feed.
+
+    Each call to `update` only feeds the indicators with the candles added since the previous call, and with the new
+    values of the last processed candle if it changed. The values of the indicators are stored for each candle in a
+    store with the same size as the candles one, so they stay aligned with the candles.
+    If the candles history changes in any other way (e.g. it is cleared or historical candles are added before the
+    existing ones) the indicators are recomputed from the whole history.
+    """
+
+    def __init__(self, indicators: List[StreamingIndicator]):
+        self._indicators = indicators
+        self._columns = [column for indicator in indicators for column in indicator.columns]
+        self._values: Optional[CandlesStore] = None
+        self._candles_version: Optional[int] = None
+        self._last_timestamp: Optional[float] = None
+        self._timestamp_position = 0
+        self._inputs_positions: List[List[int]] = []
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def indicators(self) -> List[StreamingIndicator]:
+        return self._indicators
+
+    def update(self, candles: CandlesBase):
+        if candles.candles_version == self._candles_version:
+            return
+        store = candles.candles_store
+        if not self._update_incrementally(store):
+            self._recompute(store)
+        self._candles_version = candles.candles_version
+
+    def get_processed_candles_df(self, candles: CandlesBase) -> pd.DataFrame:
+        """
+        Returns a copy of the candles with a column for each indicator value.
+        """
+        self.update(candles)
+        candles_df = candles.candles_df
+        candles_df[self._columns] = self._values.to_array()
+        return candles_df
+
+    def _update_incrementally(self, store: CandlesStore) -> bool:
+        if self._values is None or self._last_timestamp is None or len(store) == 0:
+            return False
+        position = len(store) - 1
+        while position >= 0 and store[position][self._timestamp_position] > self._last_timestamp:
+            position -= 1
+        if position < 0 or store[position][self._timestamp_position] != self._last_timestamp:
+            return False
+
+        self._process_candle(store[position], is_new=False)
+        for new_position in range(position + 1, len(store)):
+            self._process_candle(store[new_position], is_new=True)
+        # If both stores are not aligned the candles before the processed ones changed too
+        return len(self._values) == len(store)
+
+    def _recompute(self, store: CandlesStore):
+        for indicator in self._indicators:
+            indicator.reset()
+        self._values = CandlesStore(columns=self._columns, max_records=store.maxlen)
+        self._last_timestamp = None
+        self._timestamp_position = store.columns.index("timestamp")
+        self._inputs_positions = [[store.columns.index(name) for name in indicator.inputs]
+                                  for indicator in self._indicators]
+        for candle in store.to_array().tolist():
+            self._process_candle(candle, is_new=True)
+
+    def _process_candle(self, candle: Sequence[float], is_new: bool):
+        values = []
+        for indicator, inputs_positions in zip(self._indicators, self._inputs_positions):
+            inputs = [candle[position] for position in inputs_positions]
+            if is_new:
+                indicator.add(*inputs)
+            else:
+                indicator.update_last(*inputs)
+            values.extend(indicator.values)
+        if is_new:
+            self._values.append(values)
+        else:
+            self._values.update_last(values)
+        self._last_timestamp = candle[self._timestamp_position]
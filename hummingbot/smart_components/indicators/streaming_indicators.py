@@ -0,0 +1,426 @@
+import math
+import sys
+from collections import deque
+from typing import List, Optional, Tuple
+
+NaN = float("nan")
+
+
+class StreamingIndicator:
+    """
+    Base class of the indicators that are updated one candle at a time.
+
+    `add` receives the inputs of a new candle and `update_last` the new inputs of the last candle, which changes until
+    the candle is closed. Both run in O(1): the indicator keeps its state up to the candle before the last one, and
+    the inputs of the last candle are only committed to that state when the next candle is added.
+
+    The formulas follow the pandas_ta implementation of each indicator (without TA-Lib), and the output columns use
+    the same names.
+    """
+    inputs: Tuple[str, ...] = ("close",)
+
+    def __init__(self):
+        self._last_inputs: Optional[Tuple[float, ...]] = None
+        self._values: Tuple[float, ...] = ()
+        self.reset()
+
+    @property
+    def columns(self) -> List[str]:
+        raise NotImplementedError
+
+    @property
+    def values(self) -> Tuple[float, ...]:
+        """
+        Returns the values of the indicator for the last candle, in the order of `columns`.
+        """
+        return self._values
+
+    @property
+    def value(self) -> float:
+        return self._values[0]
+
+    def reset(self):
+        """
+        Clears the state, to start again from the first candle.
+        """
+        self._last_inputs = None
+        self._values = (NaN,) * len(self.columns)
+
+    def add(self, *inputs: float):
+        if self._last_inputs is not None:
+            self._commit(*self._last_inputs)
+        self._last_inputs = inputs
+        self._values = self._compute(*inputs)
+
+    def update_last(self, *inputs: float):
+        if self._last_inputs is None:
+            raise ValueError("There is no candle to update.")
+        self._last_inputs = inputs
+        self._values = self._compute(*inputs)
+
+    def _compute(self, *inputs: float) -> Tuple[float, ...]:
+        """
+        Returns the values for the last candle from the committed state. It must not modify the state.
+        """
+        raise NotImplementedError
+
+    def _commit(self, *inputs: float):
+        """
+        Adds the inputs of the last candle to the state. `self._values` still holds the values computed for them.
+        """
+        raise NotImplementedError
+
+
+class RollingWindow:
+    """
+    Sum and variance of the last `length` values of a series, where the newest value can still change.
+
+    The sums are kept relative to a reference value, to avoid losing precision when the values are large compared to
+    their dispersion, and they are recomputed from the window every `length` values to cancel the accumulated
+    rounding errors.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._committed = deque(maxlen=length - 1)
+        self._reference = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._pushes_since_recompute = 0
+
+    def push(self, value: float):
+        if self._committed.maxlen == 0:
+            return
+        if len(self._committed) == self._committed.maxlen:
+            removed = self._committed[0] - self._reference
+            self._sum -= removed
+            self._sum_sq -= removed * removed
+        self._committed.append(value)
+        self._pushes_since_recompute += 1
+        if self._pushes_since_recompute >= self._length or math.isnan(self._sum):
+            self._recompute()
+        else:
+            shifted = value - self._reference
+            self._sum += shifted
+            self._sum_sq += shifted * shifted
+
+    def mean(self, last: float) -> float:
+        count = len(self._committed) + 1
+        if count < self._length:
+            return NaN
+        return self._reference + (self._sum + last - self._reference) / count
+
+    def variance(self, last: float, ddof: int) -> float:
+        count = len(self._committed) + 1
+        if count < self._length or count <= ddof:
+            return NaN
+        shifted = last - self._reference
+        total = self._sum + shifted
+        total_sq = self._sum_sq + shifted * shifted
+        return max(total_sq - total * total / count, 0.0) / (count - ddof)
+
+    def _recompute(self):
+        self._reference = self._committed[-1]
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        for value in self._committed:
+            shifted = value - self._reference
+            self._sum += shifted
+            self._sum_sq += shifted * shifted
+        self._pushes_since_recompute = 0
+
+
+class SMA(StreamingIndicator):
+    def __init__(self, length: int):
+        self._length = length
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"SMA_{self._length}"]
+
+    def reset(self):
+        super().reset()
+        self._window = RollingWindow(self._length)
+
+    def _compute(self, close: float) -> Tuple[float, ...]:
+        return (self._window.mean(close),)
+
+    def _commit(self, close: float):
+        self._window.push(close)
+
+
+class STDEV(StreamingIndicator):
+    def __init__(self, length: int, ddof: int = 1):
+        self._length = length
+        self._ddof = ddof
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"STDEV_{self._length}"]
+
+    def reset(self):
+        super().reset()
+        self._window = RollingWindow(self._length)
+
+    def _compute(self, close: float) -> Tuple[float, ...]:
+        return (math.sqrt(self._window.variance(close, self._ddof)),)
+
+    def _commit(self, close: float):
+        self._window.push(close)
+
+
+class EMA(StreamingIndicator):
+    """
+    Exponential moving average seeded with the simple average of the first `length` values, like pandas_ta's ema
+    (sma=True, adjust=False). NaN values among the first `length` values are left out of the seed.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._alpha = 2 / (length + 1)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"EMA_{self._length}"]
+
+    def reset(self):
+        super().reset()
+        self._count = 0
+        self._seed_sum = 0.0
+        self._seed_count = 0
+        self._ema = NaN
+
+    def _compute(self, close: float) -> Tuple[float, ...]:
+        if self._count < self._length - 1:
+            return (NaN,)
+        if self._count == self._length - 1:
+            seed_sum, seed_count = self._seed_sum, self._seed_count
+            if not math.isnan(close):
+                seed_sum += close
+                seed_count += 1
+            return (seed_sum / seed_count if seed_count > 0 else NaN,)
+        if math.isnan(self._ema):
+            return (close,)
+        if math.isnan(close):
+            return (self._ema,)
+        return (self._alpha * close + (1 - self._alpha) * self._ema,)
+
+    def _commit(self, close: float):
+        if self._count < self._length - 1 and not math.isnan(close):
+            self._seed_sum += close
+            self._seed_count += 1
+        self._ema = self._values[0]
+        self._count += 1
+
+
+class RMA(StreamingIndicator):
+    """
+    Wilder's moving average, computed like pandas_ta's rma: an adjusted exponential moving average with
+    alpha = 1 / length and at least `length` observations.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._decay = 1 - 1 / length
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RMA_{self._length}"]
+
+    def reset(self):
+        super().reset()
+        self._weighted_sum = 0.0
+        self._weights = 0.0
+        self._observations = 0
+
+    def _next_state(self, close: float) -> Tuple[float, float, int]:
+        weighted_sum, weights, observations = self._weighted_sum, self._weights, self._observations
+        if observations > 0:
+            weighted_sum *= self._decay
+            weights *= self._decay
+        if not math.isnan(close):
+            weighted_sum += close
+            weights += 1
+            observations += 1
+        return weighted_sum, weights, observations
+
+    def _compute(self, close: float) -> Tuple[float, ...]:
+        weighted_sum, weights, observations = self._next_state(close)
+        return (weighted_sum / weights if observations >= self._length else NaN,)
+
+    def _commit(self, close: float):
+        self._weighted_sum, self._weights, self._observations = self._next_state(close)
+
+
+class BBANDS(StreamingIndicator):
+    """
+    Bollinger Bands over a simple moving average, with the standard deviation computed with ddof=0 like pandas_ta.
+    """
+
+    def __init__(self, length: int = 5, std: float = 2.0, ddof: int = 0):
+        self._length = length
+        self._std = float(std)
+        self._ddof = ddof
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self._length}_{self._std}"
+        return [f"BBL_{suffix}", f"BBM_{suffix}", f"BBU_{suffix}", f"BBB_{suffix}", f"BBP_{suffix}"]
+
+    def reset(self):
+        super().reset()
+        self._window = RollingWindow(self._length)
+
+    def _compute(self, close: float) -> Tuple[float, ...]:
+        mid = self._window.mean(close)
+        deviations = self._std * math.sqrt(self._window.variance(close, self._ddof))
+        lower = mid - deviations
+        upper = mid + deviations
+        upper_lower_range = upper - lower
+        if upper_lower_range == 0:
+            upper_lower_range = sys.float_info.epsilon
+        bandwidth = 100 * upper_lower_range / mid
+        percent = (close - lower) / upper_lower_range
+        return lower, mid, upper, bandwidth, percent
+
+    def _commit(self, close: float):
+        self._window.push(close)
+
+
+class MACD(StreamingIndicator):
+    """
+    MACD line, histogram and signal. The signal EMA starts with the first valid MACD value, like pandas_ta.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = fast
+        self._slow = slow
+        self._signal = signal
+        self._fast_ema = EMA(fast)
+        self._slow_ema = EMA(slow)
+        self._signal_ema = EMA(signal)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self._fast}_{self._slow}_{self._signal}"
+        return [f"MACD_{suffix}", f"MACDh_{suffix}", f"MACDs_{suffix}"]
+
+    def reset(self):
+        super().reset()
+        self._fast_ema.reset()
+        self._slow_ema.reset()
+        self._signal_ema.reset()
+        self._signal_started = False
+        self._last_candle_in_signal = False
+
+    def add(self, close: float):
+        self._fast_ema.add(close)
+        self._slow_ema.add(close)
+        macd = self._fast_ema.value - self._slow_ema.value
+        self._signal_started = self._signal_started or not math.isnan(macd)
+        self._last_candle_in_signal = self._signal_started
+        if self._last_candle_in_signal:
+            self._signal_ema.add(macd)
+        self._values = self._macd_values(macd)
+
+    def update_last(self, close: float):
+        self._fast_ema.update_last(close)
+        self._slow_ema.update_last(close)
+        macd = self._fast_ema.value - self._slow_ema.value
+        if self._last_candle_in_signal:
+            self._signal_ema.update_last(macd)
+        self._values = self._macd_values(macd)
+
+    def _macd_values(self, macd: float) -> Tuple[float, ...]:
+        signal = self._signal_ema.value if self._last_candle_in_signal else NaN
+        return macd, macd - signal, signal
+
+
+class RSI(StreamingIndicator):
+    def __init__(self, length: int = 14, scalar: float = 100):
+        self._length = length
+        self._scalar = scalar
+        self._positive_avg = RMA(length)
+        self._negative_avg = RMA(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RSI_{self._length}"]
+
+    def reset(self):
+        super().reset()
+        self._positive_avg.reset()
+        self._negative_avg.reset()
+        self._previous_close = NaN
+        self._last_close = NaN
+
+    def add(self, close: float):
+        self._previous_close = self._last_close
+        self._last_close = close
+        positive, negative = self._changes(close)
+        self._positive_avg.add(positive)
+        self._negative_avg.add(negative)
+        self._values = self._rsi()
+
+    def update_last(self, close: float):
+        self._last_close = close
+        positive, negative = self._changes(close)
+        self._positive_avg.update_last(positive)
+        self._negative_avg.update_last(negative)
+        self._values = self._rsi()
+
+    def _changes(self, close: float) -> Tuple[float, float]:
+        change = close - self._previous_close
+        if math.isnan(change):
+            return NaN, NaN
+        return max(change, 0.0), min(change, 0.0)
+
+    def _rsi(self) -> Tuple[float, ...]:
+        positive_avg = self._positive_avg.value
+        return (self._scalar * positive_avg / (positive_avg + abs(self._negative_avg.value)),)
+
+
+class NATR(StreamingIndicator):
+    """
+    Normalized average true range. The true range is averaged with an EMA, the default of pandas_ta's natr.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = 14, scalar: float = 100):
+        self._length = length
+        self._scalar = scalar
+        self._atr = EMA(length)
+        super().__init__()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"NATR_{self._length}"]
+
+    def reset(self):
+        super().reset()
+        self._atr.reset()
+        self._previous_close = NaN
+        self._last_close = NaN
+
+    def add(self, high: float, low: float, close: float):
+        self._previous_close = self._last_close
+        self._last_close = close
+        self._atr.add(self._true_range(high, low))
+        self._values = (self._scalar / close * self._atr.value,)
+
+    def update_last(self, high: float, low: float, close: float):
+        self._last_close = close
+        self._atr.update_last(self._true_range(high, low))
+        self._values = (self._scalar / close * self._atr.value,)
+
+    def _true_range(self, high: float, low: float) -> float:
+        if math.isnan(self._previous_close):
+            return NaN
+        return max(high - low, abs(high - self._previous_close), abs(self._previous_close - low))
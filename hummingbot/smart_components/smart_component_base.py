@@ -47,7 +47,13 @@ class SmartComponentBase(ABC):
         if self._status == SmartComponentStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = SmartComponentStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            self._schedule_control_loop()
+
+    def _schedule_control_loop(self):
+        """
+        Schedules the execution of the control loop. Runs it in its own task by default.
+        """
+        safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
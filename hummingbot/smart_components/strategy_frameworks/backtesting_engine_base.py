@@ -68,26 +68,92 @@ class BacktestingEngineBase:
 
     @staticmethod
     def apply_tp_sl_on_tl(df: pd.DataFrame, tp: float, sl: float):
-        events = df[df["signal"] != 0].copy()
+        """
+        Finds the first time the take profit and the stop loss are reached by each signal before its time limit, and
+        the resulting close time and close type. The index of the dataframe has to be sorted.
+        """
+        signal = df["signal"].to_numpy()
+        events_positions = np.flatnonzero(signal != 0)
+        events_target = df["target"].to_numpy()[events_positions]
         if tp > 0:
-            take_profit = tp * events["target"]
+            take_profit = tp * events_target
         else:
-            take_profit = pd.Series(index=df.index)  # NaNs
+            take_profit = np.full(len(events_positions), np.nan)
         if sl > 0:
-            stop_loss = - sl * events["target"]
+            stop_loss = - sl * events_target
         else:
-            stop_loss = pd.Series(index=df.index)  # NaNs
-
-        for loc, tl in events["tl"].fillna(df.index[-1]).items():
-            df0 = df.close[loc:tl]  # path prices
-            df0 = (df0 / df.close[loc] - 1) * events.at[loc, "signal"]  # path returns
-            df.loc[loc, "stop_loss_time"] = df0[df0 < stop_loss[loc]].index.min()  # earliest stop loss.
-            df.loc[loc, "take_profit_time"] = df0[df0 > take_profit[loc]].index.min()  # earliest profit taking.
-        df["close_time"] = df[["tl", "take_profit_time", "stop_loss_time"]].dropna(how="all").min(axis=1)
-        df["close_type"] = df[["take_profit_time", "stop_loss_time", "tl"]].dropna(how="all").idxmin(axis=1)
-        df["close_type"].replace({"take_profit_time": "tp", "stop_loss_time": "sl"}, inplace=True)
+            stop_loss = np.full(len(events_positions), np.nan)
+
+        time_limits = df["tl"].iloc[events_positions]
+        if len(time_limits) > 0:
+            time_limits = time_limits.fillna(df.index[-1])
+        # Last position of the path of each event, the time limit included
+        events_ends = df.index.searchsorted(time_limits.values, side="right") - 1
+
+        take_profit_positions, stop_loss_positions = BacktestingEngineBase.get_barrier_hits(
+            close=df["close"].to_numpy(),
+            signal=signal[events_positions],
+            starts=events_positions,
+            ends=events_ends,
+            take_profit=take_profit,
+            stop_loss=stop_loss)
+
+        index_values = df.index.values
+        for column, hits_positions in (("stop_loss_time", stop_loss_positions),
+                                       ("take_profit_time", take_profit_positions)):
+            hits_times = np.full(len(df), np.datetime64("NaT"), dtype=index_values.dtype)
+            hits = hits_positions >= 0
+            hits_times[events_positions[hits]] = index_values[hits_positions[hits]]
+            df[column] = hits_times
+        # The first barrier reached closes the position, on ties take profit goes first and time limit last
+        barriers_times = df[["take_profit_time", "stop_loss_time", "tl"]].to_numpy(dtype="datetime64[ns]")
+        missing_barriers = np.isnat(barriers_times)
+        first_barriers = np.where(missing_barriers, np.iinfo(np.int64).max,
+                                  barriers_times.view(np.int64)).argmin(axis=1)
+        close_types = np.array(["tp", "sl", "tl"], dtype=object)[first_barriers]
+        close_types[missing_barriers.all(axis=1)] = np.nan
+        df["close_time"] = barriers_times[np.arange(len(df)), first_barriers]
+        df["close_type"] = close_types
         return df
 
+    @staticmethod
+    def get_barrier_hits(close: np.ndarray, signal: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                         take_profit: np.ndarray, stop_loss: np.ndarray, max_block_size: int = 2 ** 22):
+        """
+        Returns the position of the first return above the take profit and the first one below the stop loss (-1 if
+        none) in the path of each event, from its start to its end position (both included).
+
+        Instead of looping over the events, the paths of all the pending events are walked together, a block of steps
+        at a time, and an event is dropped once both barriers were hit or its path ended. The number of steps of each
+        block grows as the events are dropped, so the size of the block stays under max_block_size.
+        """
+        close = np.asarray(close, dtype=float)
+        take_profit_positions = np.full(len(starts), -1, dtype=np.int64)
+        stop_loss_positions = np.full(len(starts), -1, dtype=np.int64)
+        pending = np.arange(len(starts))
+        offset = 0
+        while len(pending) > 0:
+            steps = np.arange(offset, offset + max(1, max_block_size // len(pending)))
+            pending_starts = starts[pending, None]
+            pending_ends = ends[pending, None]
+            path_positions = pending_starts + steps
+            in_path = path_positions <= pending_ends
+            path_returns = np.take(close, path_positions, mode="clip")
+            path_returns /= close[pending_starts]
+            path_returns -= 1
+            path_returns *= signal[pending, None]
+            for hits_positions, hits in ((take_profit_positions, path_returns > take_profit[pending, None]),
+                                         (stop_loss_positions, path_returns < stop_loss[pending, None])):
+                hits &= in_path
+                new_hits = hits.any(axis=1) & (hits_positions[pending] < 0)
+                hits_positions[pending[new_hits]] = pending_starts[new_hits, 0] + offset + \
+                    hits[new_hits].argmax(axis=1)
+            offset += len(steps)
+            finished = (starts[pending] + offset > ends[pending]) | \
+                ((take_profit_positions[pending] >= 0) & (stop_loss_positions[pending] >= 0))
+            pending = pending[~finished]
+        return take_profit_positions, stop_loss_positions
+
     def load_controller_data(self, data_path: str = data_path()):
         self.controller.load_historical_data(data_path=data_path)
 
@@ -0,0 +1,185 @@
+import hashlib
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
+from hummingbot.logger import HummingbotLogger
+from hummingbot.smart_components.strategy_frameworks.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.smart_components.strategy_frameworks.controller_base import ControllerBase, ControllerConfigBase
+
+# Candles shared with the worker processes, memory-mapped once per process by _init_worker
+_shared_candles: Dict[Tuple[str, str, str], np.ndarray] = {}
+
+
+def _init_worker(candles_paths: Dict[Tuple[str, str, str], str]):
+    for candles_key, file_path in candles_paths.items():
+        _shared_candles[candles_key] = np.load(file_path, mmap_mode="r")
+
+
+def _run_backtesting(controller_class: Type[ControllerBase],
+                     engine_class: Type[BacktestingEngineBase],
+                     config: ControllerConfigBase,
+                     backtesting_params: dict) -> dict:
+    controller = controller_class(config)
+    for candles, candles_config in zip(controller.candles, config.candles_config):
+        candles.load_candles(_shared_candles[BacktestingSweep.candles_key(candles_config)])
+    engine = engine_class(controller)
+    return engine.run_backtesting(**backtesting_params)["results"]
+
+
+class BacktestingSweep:
+    """
+    Runs the backtesting of many configurations of a controller in parallel, over a pool of processes.
+
+    The candles of the configurations are read once from their CSV files and written to .npy files that every worker
+    maps in memory, so they are shared by the workers instead of being parsed again for each configuration.
+    The results of each configuration (the output of summarize_results) are appended to a CSV file as soon as they
+    are ready. The file works as a checkpoint: running the sweep again only backtests the configurations that are
+    not in it yet, identified by a hash of their parameters.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 controller_class: Type[ControllerBase],
+                 engine_class: Type[BacktestingEngineBase],
+                 configs: List[ControllerConfigBase],
+                 results_path: str,
+                 data_path: str = data_path(),
+                 max_workers: Optional[int] = None,
+                 initial_portfolio_usd: float = 1000,
+                 trade_cost: float = 0.0006,
+                 start: Optional[str] = None,
+                 end: Optional[str] = None):
+        """
+        :param controller_class: The controller to backtest.
+        :param engine_class: The backtesting engine used for each configuration.
+        :param configs: The configurations of the controller.
+        :param results_path: CSV file where the results are stored, it is also the checkpoint of the sweep.
+        :param data_path: Directory with the candles CSV files.
+        :param max_workers: Number of worker processes, the number of CPUs by default.
+        """
+        self.controller_class = controller_class
+        self.engine_class = engine_class
+        self.configs = {self.config_hash(config): config for config in configs}
+        self.results_path = results_path
+        self.data_path = data_path
+        self.max_workers = max_workers
+        self.backtesting_params = {
+            "initial_portfolio_usd": initial_portfolio_usd,
+            "trade_cost": trade_cost,
+            "start": start,
+            "end": end,
+        }
+
+    @staticmethod
+    def config_hash(config: ControllerConfigBase) -> str:
+        """
+        Identifies a configuration by its parameters, the id is excluded since it is random when not set.
+        """
+        return hashlib.sha256(config.json(exclude={"id"}, sort_keys=True).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def candles_key(candles_config: CandlesConfig) -> Tuple[str, str, str]:
+        return candles_config.connector, candles_config.trading_pair, candles_config.interval
+
+    @staticmethod
+    def results_row(config_hash: str, config: ControllerConfigBase, results: dict) -> dict:
+        """
+        Flattens the results of a backtesting in a row of the results table, with a column for each close type.
+        """
+        row = {"config_hash": config_hash, "config": config.json(exclude={"id"})}
+        for key, value in results.items():
+            if isinstance(value, pd.Series):
+                row.update({f"close_types_{close_type}": count for close_type, count in value.items()})
+            else:
+                row[key] = value
+        return row
+
+    def completed_config_hashes(self) -> Set[str]:
+        if not os.path.exists(self.results_path) or os.path.getsize(self.results_path) == 0:
+            return set()
+        return set(pd.read_csv(self.results_path, usecols=["config_hash"])["config_hash"])
+
+    def pending_config_hashes(self) -> List[str]:
+        completed = self.completed_config_hashes()
+        return [config_hash for config_hash in self.configs if config_hash not in completed]
+
+    def run(self) -> pd.DataFrame:
+        """
+        Backtests the pending configurations and returns the results of all of them, including the ones completed
+        in previous runs.
+        """
+        for _ in self.iter_results():
+            pass
+        if not os.path.exists(self.results_path):
+            return pd.DataFrame()
+        return pd.read_csv(self.results_path)
+
+    def iter_results(self) -> Iterator[dict]:
+        """
+        Backtests the pending configurations, yielding the results row of each one as it is completed and stored.
+        """
+        pending = self.pending_config_hashes()
+        if len(pending) == 0:
+            return
+        with tempfile.TemporaryDirectory() as candles_dir:
+            candles_paths = self._share_candles([self.configs[config_hash] for config_hash in pending], candles_dir)
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     initializer=_init_worker,
+                                     initargs=(candles_paths,)) as executor:
+                futures = {
+                    executor.submit(_run_backtesting, self.controller_class, self.engine_class,
+                                    self.configs[config_hash], self.backtesting_params): config_hash
+                    for config_hash in pending
+                }
+                for future in as_completed(futures):
+                    config_hash = futures[future]
+                    try:
+                        results = future.result()
+                    except Exception:
+                        self.logger().exception(f"Error backtesting the configuration {config_hash}.")
+                        continue
+                    row = self.results_row(config_hash, self.configs[config_hash], results)
+                    self._store_row(row)
+                    yield row
+
+    def _share_candles(self, configs: List[ControllerConfigBase], candles_dir: str) -> Dict[Tuple[str, str, str], str]:
+        candles_paths = {}
+        for config in configs:
+            for candles_config in config.candles_config:
+                candles_key = self.candles_key(candles_config)
+                if candles_key in candles_paths:
+                    continue
+                candles = CandlesFactory.get_candle(candles_config)
+                file_path = os.path.join(candles_dir, f"{len(candles_paths)}.npy")
+                np.save(file_path, candles.read_candles_csv(self.data_path))
+                candles_paths[candles_key] = file_path
+        return candles_paths
+
+    def _store_row(self, row: dict):
+        """
+        Appends a row to the results file. When the row has columns that are not in the file (e.g. a close type
+        that did not happen before) the file is rewritten with the new columns.
+        """
+        row_df = pd.DataFrame([row])
+        if not os.path.exists(self.results_path) or os.path.getsize(self.results_path) == 0:
+            row_df.to_csv(self.results_path, index=False)
+            return
+        columns = pd.read_csv(self.results_path, nrows=0).columns.tolist()
+        if set(row_df.columns).issubset(columns):
+            row_df.reindex(columns=columns).to_csv(self.results_path, mode="a", header=False, index=False)
+        else:
+            pd.concat([pd.read_csv(self.results_path), row_df]).to_csv(self.results_path, index=False)
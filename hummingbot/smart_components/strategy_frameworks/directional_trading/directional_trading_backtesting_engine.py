@@ -1,3 +1,6 @@
+from typing import List
+
+import numpy as np
 import pandas as pd
 
 from hummingbot.smart_components.strategy_frameworks.backtesting_engine_base import BacktestingEngineBase
@@ -6,23 +9,48 @@ from hummingbot.smart_components.strategy_frameworks.backtesting_engine_base imp
 class DirectionalTradingBacktestingEngine(BacktestingEngineBase):
     def simulate_execution(self, df, initial_portfolio_usd, trade_cost):
         executors = []
-        df["side"] = df["signal"].apply(lambda x: "BUY" if x > 0 else "SELL" if x < 0 else 0)
+        df["side"] = pd.Series(0, index=df.index, dtype=object).mask(df["signal"] > 0, "BUY").mask(df["signal"] < 0, "SELL")
         for order_level in self.controller.config.order_levels:
             df = self.apply_triple_barrier_method(df,
                                                   tp=float(order_level.triple_barrier_conf.take_profit),
                                                   sl=float(order_level.triple_barrier_conf.stop_loss),
                                                   tl=int(order_level.triple_barrier_conf.time_limit),
                                                   trade_cost=trade_cost)
-            for index, row in df[(df["side"] == order_level.side.name)].iterrows():
-                last_close_time = self.level_executors[order_level.level_id]
-                if index >= last_close_time + pd.Timedelta(seconds=order_level.cooldown_time):
-                    row["order_level"] = order_level.level_id
-                    row["amount"] = float(order_level.order_amount_usd)
-                    row["net_pnl_quote"] = row["net_pnl"] * row["amount"]
-                    executors.append(row)
-                    self.level_executors[order_level.level_id] = row["close_time"]
-        executors_df = pd.DataFrame(executors).sort_index()
+            level_df = df[(df["side"] == order_level.side.name)]
+            positions = self.filter_by_cooldown(open_times=level_df.index,
+                                                close_times=level_df["close_time"],
+                                                last_close_time=self.level_executors[order_level.level_id],
+                                                cooldown_time=order_level.cooldown_time)
+            if len(positions) > 0:
+                level_executors = level_df.iloc[positions].copy()
+                level_executors["order_level"] = order_level.level_id
+                level_executors["amount"] = float(order_level.order_amount_usd)
+                level_executors["net_pnl_quote"] = level_executors["net_pnl"] * level_executors["amount"]
+                executors.append(level_executors)
+                self.level_executors[order_level.level_id] = level_executors["close_time"].iloc[-1]
+        executors_df = pd.concat(executors).sort_index() if len(executors) > 0 else pd.DataFrame()
         executors_df["inventory"] = initial_portfolio_usd
         if len(executors_df) > 0:
             executors_df["inventory"] = initial_portfolio_usd + executors_df["net_pnl_quote"].cumsum().shift().fillna(0)
         return executors_df
+
+    @staticmethod
+    def filter_by_cooldown(open_times: pd.DatetimeIndex, close_times: pd.Series, last_close_time: pd.Timestamp,
+                           cooldown_time: int) -> List[int]:
+        """
+        Returns the positions of the signals that open an executor: the first one opened after the cooldown time
+        since the close of the previous executor of the level. Only the opened executors are visited, jumping to the
+        next one with a binary search on the (sorted) open times.
+        """
+        open_times = open_times.values.astype(np.int64)
+        close_times = close_times.values.astype(np.int64)
+        cooldown = pd.Timedelta(seconds=cooldown_time).value
+        positions = []
+        position = int(np.searchsorted(open_times, (last_close_time + pd.Timedelta(seconds=cooldown_time)).value))
+        while position < len(open_times):
+            positions.append(position)
+            if close_times[position] == pd.NaT.value:
+                break
+            next_position = int(np.searchsorted(open_times, close_times[position] + cooldown))
+            position = max(next_position, position + 1)
+        return positions
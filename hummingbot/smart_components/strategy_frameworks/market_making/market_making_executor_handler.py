@@ -5,7 +5,9 @@ from typing import Dict, Optional
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorStatus
+from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.smart_components.models.executors import CloseType
+from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
 from hummingbot.smart_components.strategy_frameworks.executor_handler_base import ExecutorHandlerBase
 from hummingbot.smart_components.strategy_frameworks.market_making.market_making_controller_base import (
     MarketMakingControllerBase,
@@ -45,6 +47,30 @@ class MarketMakingExecutorHandler(ExecutorHandlerBase):
         connector.set_position_mode(self.controller.config.position_mode)
         connector.set_leverage(trading_pair=self.controller.config.trading_pair, leverage=self.controller.config.leverage)
 
+    def amend_open_order(self, executor: PositionExecutor, order_level: OrderLevel) -> bool:
+        """
+        Refreshes the open order of an executor that has not started its position with an order amend, instead of
+        stopping the executor and creating a new one, if the connector supports order amends and the order is an
+        unfilled limit order.
+
+        :return: True if the open order was amended
+        """
+        connector = self.strategy.connectors[executor.exchange]
+        open_order = executor.open_order.order
+        if (not connector.is_amend_order_supported
+                or open_order is None
+                or not open_order.is_open
+                or not open_order.order_type.is_limit_type()
+                or open_order.executed_amount_base > Decimal("0")):
+            return False
+        position_config = self.controller.get_position_config(order_level)
+        if (position_config is None
+                or position_config.side != executor.side
+                or position_config.open_order_type != executor.open_order_type):
+            return False
+        executor.amend_open_order(position_config)
+        return True
+
     @staticmethod
     def empty_metrics_dict():
         return {"amount": Decimal("0"), "net_pnl_quote": Decimal("0"), "executors": []}
@@ -65,6 +91,8 @@ class MarketMakingExecutorHandler(ExecutorHandlerBase):
                         current_executor, order_level)
                     if closed_and_not_in_cooldown:
                         self.store_position_executor(order_level.level_id)
+                    elif order_placed_and_refresh_condition and self.amend_open_order(current_executor, order_level):
+                        continue
                     elif active_and_early_stop_condition or order_placed_and_refresh_condition:
                         current_executor.early_stop()
                     elif current_executor.executor_status == PositionExecutorStatus.ACTIVE_POSITION:
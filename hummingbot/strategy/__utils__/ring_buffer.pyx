@@ -39,6 +39,18 @@ cdef class RingBuffer:
             return np.nan
         return self._buffer[self._delimiter-1]
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        if self._is_full:
+            return self._buffer[self._delimiter]
+        return self._buffer[0]
+
+    cdef int64_t c_get_size(self):
+        if self._is_full:
+            return self._length
+        return self._delimiter
+
     cdef bint c_is_full(self):
         return self._is_full
 
@@ -61,14 +73,11 @@ cdef class RingBuffer:
         return result
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        cdef np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[:self._delimiter].copy()
+        return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
 
     def __init__(self, length):
         self._length = length
@@ -85,6 +94,13 @@ cdef class RingBuffer:
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_first_value(self):
+        return self.c_get_first_value()
+
+    @property
+    def size(self) -> int:
+        return self.c_get_size()
+
     @property
     def is_full(self):
         return self.c_is_full()
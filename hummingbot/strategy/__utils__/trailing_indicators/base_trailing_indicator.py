@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import numpy as np
 
@@ -20,12 +21,35 @@ class BaseTrailingIndicator(ABC):
         self._sampling_buffer = RingBuffer(sampling_length)
         self._processing_buffer = RingBuffer(processing_length)
         self._samples_length = 0
+        self._samples_since_reset = 0
 
     def add_sample(self, value: float):
+        removed_value = self._sampling_buffer.get_first_value() if self._sampling_buffer.is_full else None
         self._sampling_buffer.add_value(value)
+        self._samples_since_reset += 1
+        if self._samples_since_reset >= self._sampling_buffer.length:
+            # The running statistics are recomputed once per buffer length, so that the rounding errors of the
+            # incremental updates don't build up
+            self._reset_sampling_statistics()
+        else:
+            self._update_sampling_statistics(self._sampling_buffer.get_last_value(), removed_value)
         indicator_value = self._indicator_calculation()
         self._processing_buffer.add_value(indicator_value)
 
+    def _update_sampling_statistics(self, added_value: float, removed_value: Optional[float]):
+        """
+        Updates the running statistics of the indicator with a new sample, and with the oldest sample when it is
+        removed from the full sampling buffer. The indicators that compute their value from the whole sampling buffer
+        don't need to implement it.
+        """
+        pass
+
+    def _reset_sampling_statistics(self):
+        """
+        Recomputes the running statistics of the indicator from the sampling buffer.
+        """
+        self._samples_since_reset = 0
+
     @abstractmethod
     def _indicator_calculation(self) -> float:
         raise NotImplementedError
@@ -51,7 +75,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.size
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -63,6 +87,7 @@ class BaseTrailingIndicator(ABC):
     @sampling_length.setter
     def sampling_length(self, value):
         self._sampling_buffer.length = value
+        self._reset_sampling_statistics()
 
     @property
     def processing_length(self) -> int:
@@ -1,5 +1,8 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from typing import Optional
+
+import numpy as np
+
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +10,33 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        # Weighted sum of the samples and sum of the weights of the sampling buffer, like pandas ewm with adjust=True
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+
+    @property
+    def _decay(self) -> float:
+        # 1 - alpha, with a span of the sampling length
+        return 1 - 2 / (self._sampling_buffer.length + 1)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        return self._weighted_sum / self._weights_sum
+
+    def _update_sampling_statistics(self, added_value: float, removed_value: Optional[float]):
+        decay = self._decay
+        self._weighted_sum = decay * self._weighted_sum + added_value
+        self._weights_sum = decay * self._weights_sum + 1
+        if removed_value is not None:
+            removed_weight = decay ** self._sampling_buffer.length
+            self._weighted_sum -= removed_weight * removed_value
+            self._weights_sum -= removed_weight
+
+    def _reset_sampling_statistics(self):
+        super()._reset_sampling_statistics()
+        samples = self._sampling_buffer.get_as_numpy_array()
+        weights = self._decay ** np.arange(samples.size - 1, -1, -1)
+        self._weighted_sum = np.sum(weights * samples)
+        self._weights_sum = np.sum(weights)
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
@@ -1,16 +1,57 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+from typing import Optional
+
 import numpy as np
 
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Count, mean and sum of squared deviations (Welford) of the log returns of the sampling buffer
+        self._returns_count = 0
+        self._returns_mean = 0.0
+        self._returns_m2 = 0.0
+        self._last_log_price = np.nan
 
     def _indicator_calculation(self) -> float:
+        if self._returns_count > 0:
+            return max(self._returns_m2, 0.0) / self._returns_count
+        return np.nan
+
+    def _update_sampling_statistics(self, added_value: float, removed_value: Optional[float]):
+        log_price = np.log(added_value)
+        if not np.isnan(self._last_log_price):
+            self._add_return(log_price - self._last_log_price)
+        if removed_value is not None:
+            self._remove_return(np.log(self._sampling_buffer.get_first_value()) - np.log(removed_value))
+        self._last_log_price = log_price
+
+    def _reset_sampling_statistics(self):
+        super()._reset_sampling_statistics()
         prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        log_returns = np.diff(np.log(prices))
+        self._returns_count = log_returns.size
+        self._returns_mean = np.mean(log_returns) if log_returns.size > 0 else 0.0
+        self._returns_m2 = np.sum(np.square(log_returns - self._returns_mean))
+        self._last_log_price = np.log(prices[-1]) if prices.size > 0 else np.nan
+
+    def _add_return(self, log_return: float):
+        self._returns_count += 1
+        delta = log_return - self._returns_mean
+        self._returns_mean += delta / self._returns_count
+        self._returns_m2 += delta * (log_return - self._returns_mean)
+
+    def _remove_return(self, log_return: float):
+        if self._returns_count <= 1:
+            self._returns_count = 0
+            self._returns_mean = 0.0
+            self._returns_m2 = 0.0
+            return
+        self._returns_count -= 1
+        delta = log_return - self._returns_mean
+        self._returns_mean -= delta / self._returns_count
+        self._returns_m2 -= delta * (log_return - self._returns_mean)
 
     def _processing_calculation(self) -> float:
         processing_array = self._processing_buffer.get_as_numpy_array()
@@ -1,19 +1,38 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+from typing import Optional
+
 import numpy as np
 
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Sum of the squared differences between consecutive samples of the sampling buffer
+        self._squared_diffs_sum = 0.0
+        self._last_sample = np.nan
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        vol = np.sqrt(max(self._squared_diffs_sum, 0.0) / self._sampling_buffer.size)
         return vol
 
+    def _update_sampling_statistics(self, added_value: float, removed_value: Optional[float]):
+        if not np.isnan(self._last_sample):
+            self._squared_diffs_sum += (added_value - self._last_sample) ** 2
+        if removed_value is not None:
+            # The difference between the removed sample and the new first sample leaves the buffer
+            self._squared_diffs_sum -= (self._sampling_buffer.get_first_value() - removed_value) ** 2
+        self._last_sample = added_value
+
+    def _reset_sampling_statistics(self):
+        super()._reset_sampling_statistics()
+        samples = self._sampling_buffer.get_as_numpy_array()
+        self._squared_diffs_sum = np.sum(np.square(np.diff(samples)))
+        self._last_sample = samples[-1] if samples.size > 0 else np.nan
+
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
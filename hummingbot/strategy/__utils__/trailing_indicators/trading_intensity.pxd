@@ -13,16 +13,31 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _sample_timestamps
+        dict _price_levels
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        list _quote_timestamps
+        list _quote_prices
         int _sampling_length
         int _samples_length
+        bint _is_histogram_changed
+        int64_t _updates_since_reset
+        double _weights_sum
+        double _weighted_levels_sum
+        double _weighted_log_amounts_sum
+        double _weighted_squared_levels_sum
+        double _weighted_products_sum
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade(self, object sample_timestamp, double price_level, double amount)
+    cdef c_remove_sample(self, object sample_timestamp)
+    cdef c_update_price_level(self, double price_level, double amount, int trades_count)
+    cdef c_add_regression_terms(self, double price_level, double amount, int sign)
+    cdef c_reset_regression_sums(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -1,13 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-import warnings
-from decimal import Decimal
+from bisect import bisect_left, insort
 from typing import Tuple
 
 import numpy as np
-from scipy.optimize import curve_fit
-from scipy.optimize import OptimizeWarning
 
 from hummingbot.core.data_type.common import (
     PriceType,
@@ -17,6 +14,10 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+# Traded amount used for the price levels without volume, to be able to calculate its log
+cdef double MIN_TRADED_AMOUNT = 1e-10
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,11 +27,22 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
+    """
+    Estimates the trading intensity lambda(d) = alpha * exp(-kappa * d), the amount traded at a distance d from the
+    mid price, over the trades of the last `sampling_length` samples.
+
+    The traded amounts are kept in a histogram by price level, updated as trades are added and samples leave the
+    window. The intensity is fitted with a log-linear regression, ln(lambda) = ln(alpha) - kappa * d, weighted by the
+    squared amounts to approximate the least squares fit of the exponential. The sums of the regression are updated
+    with the histogram, so the fit is recomputed in constant time, and only when the histogram has changed.
+    """
 
     def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
+        self._sample_timestamps = []
+        self._price_levels = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,9 +50,9 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
-
-        warnings.simplefilter("ignore", OptimizeWarning)
+        self._quote_timestamps = []
+        self._quote_prices = []
+        self.c_reset_regression_sums()
 
     @property
     def current_value(self) -> Tuple[float, float]:
@@ -48,12 +60,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -67,53 +79,56 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        # The quotes are in descending order of timestamp
+        self._quote_timestamps = [quote["timestamp"] for quote in reversed(value)]
+        self._quote_prices = [quote["price"] for quote in reversed(value)]
+
+    @property
+    def price_levels(self) -> dict:
+        """The traded amount of each price level, over the sampling window"""
+        return {price_level: amount for price_level, (amount, _) in self._price_levels.items()}
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int latest_processed_quote_idx = -1
+            int quote_idx
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        # Ascending order of price-timestamp quotes
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(price)
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
+            # The last quote before the trade
+            quote_idx = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_idx < 0:
+                continue
+            latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+            self.c_add_trade(self._quote_timestamps[quote_idx] + 1,
+                             abs(trade.price - float(self._quote_prices[quote_idx])),
+                             trade.amount)
+
+        # There are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+        if latest_processed_quote_idx > 0:
+            del self._quote_timestamps[:latest_processed_quote_idx]
+            del self._quote_prices[:latest_processed_quote_idx]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        while len(self._sample_timestamps) > self._sampling_length:
+            self.c_remove_sample(self._sample_timestamps.pop(0))
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        if self.is_sampling_buffer_full and self._is_histogram_changed:
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,44 +138,82 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade(self, object sample_timestamp, double price_level, double amount):
+        trade_sample = self._trade_samples.get(sample_timestamp)
+        if trade_sample is None:
+            trade_sample = []
+            self._trade_samples[sample_timestamp] = trade_sample
+            insort(self._sample_timestamps, sample_timestamp)
+        trade_sample.append((price_level, amount))
+        self.c_update_price_level(price_level, amount, 1)
+
+    cdef c_remove_sample(self, object sample_timestamp):
+        for price_level, amount in self._trade_samples.pop(sample_timestamp):
+            self.c_update_price_level(price_level, -amount, -1)
+
+    cdef c_update_price_level(self, double price_level, double amount, int trades_count):
+        cdef:
+            double level_amount = 0
+            int level_trades_count = 0
+
+        level = self._price_levels.get(price_level)
+        if level is not None:
+            level_amount, level_trades_count = level
+            self.c_add_regression_terms(price_level, level_amount, -1)
+        level_amount += amount
+        level_trades_count += trades_count
+        if level_trades_count > 0:
+            self._price_levels[price_level] = (level_amount, level_trades_count)
+            self.c_add_regression_terms(price_level, level_amount, 1)
+        else:
+            del self._price_levels[price_level]
+        self._is_histogram_changed = True
+        self._updates_since_reset += 1
+
+    cdef c_add_regression_terms(self, double price_level, double amount, int sign):
+        cdef:
+            double weight = amount * amount * sign
+            double log_amount = np.log(max(amount, MIN_TRADED_AMOUNT))
+
+        self._weights_sum += weight
+        self._weighted_levels_sum += weight * price_level
+        self._weighted_log_amounts_sum += weight * log_amount
+        self._weighted_squared_levels_sum += weight * price_level * price_level
+        self._weighted_products_sum += weight * price_level * log_amount
+
+    cdef c_reset_regression_sums(self):
+        self._weights_sum = 0
+        self._weighted_levels_sum = 0
+        self._weighted_log_amounts_sum = 0
+        self._weighted_squared_levels_sum = 0
+        self._weighted_products_sum = 0
+        self._updates_since_reset = 0
+        for price_level, (amount, _) in self._price_levels.items():
+            self.c_add_regression_terms(price_level, amount, 1)
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
-
-        # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
-
-        # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+            double determinant
+            double slope
+            double intercept
+
+        self._is_histogram_changed = False
+        if self._updates_since_reset > len(self._price_levels) + self._sampling_length:
+            # Recompute the sums periodically, so that the rounding errors of the updates don't build up
+            self.c_reset_regression_sums()
+        if len(self._price_levels) < 2:
+            return
+
+        determinant = (self._weights_sum * self._weighted_squared_levels_sum
+                       - self._weighted_levels_sum * self._weighted_levels_sum)
+        if determinant <= 0 or self._weights_sum <= 0:
+            return
+        slope = (self._weights_sum * self._weighted_products_sum
+                 - self._weighted_levels_sum * self._weighted_log_amounts_sum) / determinant
+        if slope > 0:
+            # The intensity can't grow with the distance to the mid price, the best fit is then a constant one
+            slope = 0
+        intercept = (self._weighted_log_amounts_sum - slope * self._weighted_levels_sum) / self._weights_sum
+
+        self._kappa = -slope
+        self._alpha = np.exp(intercept)
@@ -68,6 +68,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
     cdef c_cancel_active_orders(self, object proposal)
     cdef c_cancel_active_orders_on_max_age_limit(self)
+    cdef bint c_amend_active_orders(self, object proposal)
     cdef bint c_to_create_orders(self, object proposal)
     cdef c_execute_orders_proposal(self, object proposal)
     cdef c_set_timers(self)
@@ -27,6 +27,7 @@ cdef class OrderTracker(TimeIterator):
     cdef LimitOrder c_get_shadow_limit_order(self, str order_id)
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity)
+    cdef c_update_limit_order(self, object market_pair, str order_id, object price, object quantity)
     cdef c_stop_tracking_limit_order(self, object market_pair, str order_id)
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity)
     cdef c_stop_tracking_market_order(self, object market_pair, str order_id)
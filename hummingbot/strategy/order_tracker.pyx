@@ -237,6 +237,29 @@ cdef class OrderTracker(TimeIterator):
                                    quantity: Decimal):
         return self.c_start_tracking_limit_order(market_pair, order_id, is_buy, price, quantity)
 
+    cdef c_update_limit_order(self, object market_pair, str order_id, object price, object quantity):
+        cdef:
+            LimitOrder limit_order = self.c_get_limit_order(market_pair, order_id)
+            LimitOrder amended_order
+
+        if limit_order is None:
+            return
+        # The amended order keeps its creation timestamp, so that its age is not reset
+        amended_order = LimitOrder(order_id,
+                                   limit_order.trading_pair,
+                                   limit_order.is_buy,
+                                   limit_order.base_currency,
+                                   limit_order.quote_currency,
+                                   price,
+                                   quantity,
+                                   creation_timestamp=limit_order.creation_timestamp,
+                                   position=limit_order.position)
+        self._tracked_limit_orders[market_pair][order_id] = amended_order
+        self._shadow_tracked_limit_orders[market_pair][order_id] = amended_order
+
+    def update_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, price: Decimal, quantity: Decimal):
+        return self.c_update_limit_order(market_pair, order_id, price, quantity)
+
     cdef c_stop_tracking_limit_order(self, object market_pair, str order_id):
         if market_pair in self._tracked_limit_orders and order_id in self._tracked_limit_orders[market_pair]:
             del self._tracked_limit_orders[market_pair][order_id]
@@ -1210,7 +1210,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     self.c_is_within_tolerance(active_sell_prices, proposal_sells):
                 to_defer_canceling = True
 
-        if not to_defer_canceling:
+        if not to_defer_canceling and self.c_amend_active_orders(proposal):
+            self.set_timers()
+        elif not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
             for order in self.active_non_hanging_orders:
                 # If is about to be added to hanging_orders then don't cancel
@@ -1234,6 +1236,36 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                                    f"ID - {order.client_order_id}")
                 self.c_cancel_order(self._market_info, order.client_order_id)
 
+    cdef bint c_amend_active_orders(self, object proposal):
+        """
+        Moves the active orders to the prices and sizes of the proposal with order amends instead of canceling them
+        and creating new ones, so that the strategy is not off the book while refreshing its orders. Only done if the
+        market supports order amends, hanging orders are disabled and the proposal has as many buys and sells as
+        there are active orders.
+        """
+        cdef:
+            object market = self._market_info.market
+            list active_orders = self.active_non_hanging_orders
+            list active_buys = sorted([o for o in active_orders if o.is_buy], key=lambda o: o.price, reverse=True)
+            list active_sells = sorted([o for o in active_orders if not o.is_buy], key=lambda o: o.price)
+            list proposal_buys, proposal_sells
+
+        if (proposal is None
+                or self._hanging_orders_enabled
+                or not market.is_amend_order_supported
+                or any(self._sb_order_tracker.c_has_in_flight_cancel(o.client_order_id) for o in active_orders)):
+            return False
+
+        proposal_buys = sorted(proposal.buys, key=lambda b: b.price, reverse=True)
+        proposal_sells = sorted(proposal.sells, key=lambda s: s.price)
+        if len(active_buys) != len(proposal_buys) or len(active_sells) != len(proposal_sells):
+            return False
+
+        for order, proposed in zip(active_buys + active_sells, proposal_buys + proposal_sells):
+            if order.price != proposed.price or order.quantity != proposed.size:
+                self.c_amend_order(self._market_info, order.client_order_id, proposed.price, proposed.size)
+        return True
+
     cdef bint c_to_create_orders(self, object proposal):
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
                                             self._hanging_orders_tracker.is_potential_hanging_order(o)]
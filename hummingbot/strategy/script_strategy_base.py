@@ -144,6 +144,24 @@ class ScriptStrategyBase(StrategyPyBase):
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.cancel_order(market_trading_pair_tuple=market_pair, order_id=order_id)
 
+    def amend(self,
+              connector_name: str,
+              trading_pair: str,
+              order_id: str,
+              price: Decimal,
+              amount: Decimal):
+        """
+        A wrapper function to amend_order. Only for connectors that support order amends (is_amend_order_supported).
+
+        :param connector_name: The name of the connector
+        :param trading_pair: The market trading pair
+        :param order_id: The identifier assigned by the client of the order to be amended
+        :param price: The new price of the order
+        :param amount: The new total amount of the order
+        """
+        market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
+        self.amend_order(market_trading_pair_tuple=market_pair, order_id=order_id, price=price, quantity=amount)
+
     def get_active_orders(self, connector_name: str) -> List[LimitOrder]:
         """
         Returns a list of active orders for a connector.
@@ -597,6 +597,24 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    cdef c_amend_order(self, object market_trading_pair_tuple, str order_id, object price, object quantity):
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+
+        if (self._sb_order_tracker.c_get_limit_order(market_trading_pair_tuple, order_id) is not None
+                and not self._sb_order_tracker.c_has_in_flight_cancel(order_id)):
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_trading_pair_tuple.trading_pair}) Amending the limit order {order_id} to "
+                f"{quantity} @ {price}."
+            )
+            market.amend_order(market_trading_pair_tuple.trading_pair, order_id, price, quantity)
+            self._sb_order_tracker.c_update_limit_order(market_trading_pair_tuple, order_id, price, quantity)
+
+    def amend_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str, price: Decimal,
+                    quantity: Decimal):
+        self.c_amend_order(market_trading_pair_tuple, order_id, price, quantity)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
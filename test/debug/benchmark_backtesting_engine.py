@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+"""
+Measures the DirectionalTradingBacktestingEngine triple barrier simulation on a synthetic year of 1m candles, and
+compares it with the previous implementation, that looped over the events with pandas:
+
+- apply_tp_sl_on_tl sliced the path of each event and wrote its barrier times with df.loc
+- simulate_execution applied the cooldown of each level with iterrows
+
+The previous implementation takes minutes on a year of candles, so it is only run on the first days of it (all of them
+when 365 is passed), checking that both produce the same executors.
+
+Usage, from the repository root:
+    PYTHONPATH=. python test/debug/benchmark_backtesting_engine.py [days compared with the previous implementation]
+"""
+
+import sys
+import time
+from decimal import Decimal
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.smart_components.executors.position_executor.data_types import TripleBarrierConf
+from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
+from hummingbot.smart_components.strategy_frameworks.directional_trading.directional_trading_backtesting_engine import (
+    DirectionalTradingBacktestingEngine,
+)
+
+MINUTES_PER_DAY = 24 * 60
+SIGNAL_PROBABILITY = 0.05
+
+
+class LoopDirectionalTradingBacktestingEngine(DirectionalTradingBacktestingEngine):
+    """
+    The previous implementation of the triple barrier simulation.
+    """
+
+    @staticmethod
+    def apply_tp_sl_on_tl(df: pd.DataFrame, tp: float, sl: float):
+        events = df[df["signal"] != 0].copy()
+        if tp > 0:
+            take_profit = tp * events["target"]
+        else:
+            take_profit = pd.Series(index=df.index, dtype=float)  # NaNs
+        if sl > 0:
+            stop_loss = - sl * events["target"]
+        else:
+            stop_loss = pd.Series(index=df.index, dtype=float)  # NaNs
+
+        for loc, tl in events["tl"].fillna(df.index[-1]).items():
+            df0 = df.close[loc:tl]  # path prices
+            df0 = (df0 / df.close[loc] - 1) * events.at[loc, "signal"]  # path returns
+            df.loc[loc, "stop_loss_time"] = df0[df0 < stop_loss[loc]].index.min()  # earliest stop loss.
+            df.loc[loc, "take_profit_time"] = df0[df0 > take_profit[loc]].index.min()  # earliest profit taking.
+        df["close_time"] = df[["tl", "take_profit_time", "stop_loss_time"]].dropna(how="all").min(axis=1)
+        df["close_type"] = df[["take_profit_time", "stop_loss_time", "tl"]].dropna(how="all").idxmin(axis=1)
+        df["close_type"].replace({"take_profit_time": "tp", "stop_loss_time": "sl"}, inplace=True)
+        return df
+
+    def simulate_execution(self, df, initial_portfolio_usd, trade_cost):
+        executors = []
+        df["side"] = df["signal"].apply(lambda x: "BUY" if x > 0 else "SELL" if x < 0 else 0)
+        for order_level in self.controller.config.order_levels:
+            df = self.apply_triple_barrier_method(df,
+                                                  tp=float(order_level.triple_barrier_conf.take_profit),
+                                                  sl=float(order_level.triple_barrier_conf.stop_loss),
+                                                  tl=int(order_level.triple_barrier_conf.time_limit),
+                                                  trade_cost=trade_cost)
+            for index, row in df[(df["side"] == order_level.side.name)].iterrows():
+                last_close_time = self.level_executors[order_level.level_id]
+                if index >= last_close_time + pd.Timedelta(seconds=order_level.cooldown_time):
+                    row["order_level"] = order_level.level_id
+                    row["amount"] = float(order_level.order_amount_usd)
+                    row["net_pnl_quote"] = row["net_pnl"] * row["amount"]
+                    executors.append(row)
+                    self.level_executors[order_level.level_id] = row["close_time"]
+        executors_df = pd.DataFrame(executors).sort_index()
+        executors_df["inventory"] = initial_portfolio_usd
+        if len(executors_df) > 0:
+            executors_df["inventory"] = initial_portfolio_usd + executors_df["net_pnl_quote"].cumsum().shift().fillna(0)
+        return executors_df
+
+
+def make_candles(days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    minutes = days * MINUTES_PER_DAY
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.0008, minutes)))
+    signal = rng.choice([-1, 0, 1], minutes, p=[SIGNAL_PROBABILITY / 2, 1 - SIGNAL_PROBABILITY, SIGNAL_PROBABILITY / 2])
+    return pd.DataFrame({
+        "timestamp": (1672531200 + np.arange(minutes) * 60) * 1000,
+        "close": close,
+        "signal": signal,
+        "target": pd.Series(close).pct_change().rolling(100).std().bfill() * 10,
+    })
+
+
+def make_controller(candles: pd.DataFrame) -> Mock:
+    controller = Mock()
+    controller.config.order_levels = [
+        OrderLevel(level=level, side=side, order_amount_usd=Decimal("10"), cooldown_time=15 * 60,
+                   triple_barrier_conf=TripleBarrierConf(take_profit=Decimal(take_profit), stop_loss=Decimal("1"),
+                                                         time_limit=time_limit))
+        for side in (TradeType.BUY, TradeType.SELL)
+        for level, (take_profit, time_limit) in enumerate([("1", 60 * 60), ("2", 12 * 60 * 60)])
+    ]
+    controller.get_processed_data = Mock(side_effect=lambda: candles.copy())
+    return controller
+
+
+def run(engine_class, candles: pd.DataFrame):
+    engine = engine_class(make_controller(candles))
+    start = time.perf_counter()
+    results = engine.run_backtesting()
+    return time.perf_counter() - start, results
+
+
+def main():
+    compared_days = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    candles = make_candles(365)
+    print(f"{len(candles)} candles, {(candles['signal'] != 0).sum()} signals, 4 order levels")
+
+    elapsed, results = run(DirectionalTradingBacktestingEngine, candles)
+    print(f"vectorized, 365 days: {elapsed:.2f}s, {len(results['executors_df'])} executors")
+
+    candles = candles.iloc[:compared_days * MINUTES_PER_DAY]
+    vectorized_elapsed, vectorized_results = run(DirectionalTradingBacktestingEngine, candles)
+    loop_elapsed, loop_results = run(LoopDirectionalTradingBacktestingEngine, candles)
+    print(f"vectorized, {compared_days} days: {vectorized_elapsed:.2f}s")
+    print(f"loop, {compared_days} days: {loop_elapsed:.2f}s ({loop_elapsed / vectorized_elapsed:.0f}x)")
+
+    # The executors built from rows lose the name of the index
+    pd.testing.assert_frame_equal(loop_results["executors_df"], vectorized_results["executors_df"], check_names=False)
+    pd.testing.assert_frame_equal(loop_results["processed_data"], vectorized_results["processed_data"])
+    print(f"same {len(vectorized_results['executors_df'])} executors and processed data")
+
+
+if __name__ == "__main__":
+    main()
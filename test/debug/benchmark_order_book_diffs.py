@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""
+Measures how many order book diffs per second can be applied through the different OrderBook ingestion paths:
+
+- rows: OrderBookMessage.bids/asks (OrderBookRow lists) followed by OrderBook.apply_diffs(), the previous path
+- raw: OrderBook.apply_raw_diffs() directly on the parsed exchange [price, amount] string rows
+- float64: OrderBook.apply_float64_diffs() on [price, amount] float64 buffers
+
+The raw path is also measured on FlatOrderBook, the sorted vector engine.
+
+Usage, from the repository root:
+    PYTHONPATH=. python test/debug/benchmark_order_book_diffs.py [number of diffs] [levels per side per diff]
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List, Type
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+BOOK_DEPTH = 1000
+MID_PRICE = 30000.0
+TICK_SIZE = 0.01
+TOP_LEVELS_MEAN = 10
+
+
+def make_side(is_bid: bool, levels: int, update_id: int) -> List[List[str]]:
+    rows = []
+    for _ in range(levels):
+        # Most updates happen close to the top of the book
+        offset = min(int(random.expovariate(1 / TOP_LEVELS_MEAN)) + 1, BOOK_DEPTH) * TICK_SIZE
+        price = MID_PRICE - offset if is_bid else MID_PRICE + offset
+        amount = 0.0 if random.random() < 0.2 else random.random() * 10
+        rows.append([f"{price:.2f}", f"{amount:.8f}"])
+    return rows
+
+
+def make_messages(count: int, levels: int) -> List[OrderBookMessage]:
+    return [
+        OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "BTC-USDT",
+            "update_id": update_id,
+            "bids": make_side(True, levels, update_id),
+            "asks": make_side(False, levels, update_id),
+        }, timestamp=float(update_id))
+        for update_id in range(1, count + 1)
+    ]
+
+
+def new_order_book(order_book_class: Type[OrderBook]) -> OrderBook:
+    order_book = order_book_class()
+    bids = [[MID_PRICE - i * TICK_SIZE, 1.0] for i in range(1, BOOK_DEPTH + 1)]
+    asks = [[MID_PRICE + i * TICK_SIZE, 1.0] for i in range(1, BOOK_DEPTH + 1)]
+    order_book.apply_raw_snapshot(bids, asks, 0)
+    return order_book
+
+
+def run(name: str,
+        messages: List[OrderBookMessage],
+        apply: Callable[[OrderBook, OrderBookMessage], None],
+        order_book_class: Type[OrderBook] = OrderBook):
+    order_book = new_order_book(order_book_class)
+    start = time.perf_counter()
+    for message in messages:
+        apply(order_book, message)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>12}: {len(messages) / elapsed:12,.0f} diffs/s ({elapsed:.3f} s)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    levels = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    random.seed(42)
+    messages = make_messages(count, levels)
+    print(f"Applying {count} diffs with {levels} levels per side on a {BOOK_DEPTH} levels book")
+
+    run("rows", messages, lambda ob, msg: ob.apply_diffs(msg.bids, msg.asks, msg.update_id))
+    apply_raw = lambda ob, msg: ob.apply_raw_diffs(msg.content["bids"], msg.content["asks"], msg.update_id)  # noqa: E731
+    run("raw", messages, apply_raw)
+    run("raw (flat)", messages, apply_raw, FlatOrderBook)
+
+    arrays = {
+        id(msg): (np.array(msg.content["bids"], dtype=np.float64), np.array(msg.content["asks"], dtype=np.float64))
+        for msg in messages
+    }
+    run("float64", messages, lambda ob, msg: ob.apply_float64_diffs(*arrays[id(msg)], msg.update_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -86,6 +86,9 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
                            "    | ∟ gateway_api_port                | 15888                |\n"
+                           "    | ∟ gateway_connection_limit        | 100                  |\n"
+                           "    | ∟ gateway_keepalive_timeout       | 30.0                 |\n"
+                           "    | ∟ gateway_request_timeout         | 60.0                 |\n"
                            "    | rate_oracle_source                | binance              |\n"
                            "    | global_token                      |                      |\n"
                            "    | ∟ global_token_name               | USDT                 |\n"
@@ -96,10 +99,17 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ other_commands_timeout          | 30                   |\n"
                            "    | tables_format                     | psql                 |\n"
                            "    | tick_size                         | 1.0                  |\n"
+                           "    | event_driven_ticks                | False                |\n"
+                           "    | min_event_tick_interval           | 0.1                  |\n"
+                           "    | order_book_direct_dispatch        | False                |\n"
                            "    | market_data_collection            |                      |\n"
                            "    | ∟ market_data_collection_enabled  | True                 |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | trades_csv                        |                      |\n"
+                           "    | ∟ trades_csv_max_size             | 0                    |\n"
+                           "    | ∟ trades_csv_rotate_daily         | False                |\n"
+                           "    | ∟ trades_csv_buffer_size          | 64                   |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
@@ -0,0 +1,84 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from test.mock.mock_cli import CLIMockingAssistant
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class ExitCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+
+    def tearDown(self) -> None:
+        self.cli_mock_assistant.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_exit_commits_the_records_queued_by_the_markets_recorder(self, engine_mock):
+        # The write-behind worker thread needs a database shared between threads
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'test.sqlite')}")
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_name="test_DB")
+        self.addCleanup(manager.engine.dispose)
+        market = MagicMock()
+        market.display_name = "test_market"
+        self.app.markets_recorder = MarketsRecorder(
+            sql=manager,
+            markets=[market],
+            config_file_path="test_config",
+            strategy_name="test_strategy",
+            market_data_collection=MarketDataCollectionConfigMap(market_data_collection_enabled=False),
+            write_behind=True,
+            write_flush_interval=10,
+        )
+        self.app.markets_recorder.start()
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair="COINALPHA-HBOT",
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        self.app.markets_recorder._did_create_order(MarketEvent.BuyOrderCreated.value, market, create_event)
+
+        with patch.object(self.app.app, "exit") as app_exit_mock:
+            self.async_run_with_timeout(self.app.exit_loop(force=True))
+
+        app_exit_mock.assert_called_once()
+        self.assertFalse(self.app.markets_recorder._write_queue.is_running)
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+        self.assertEqual(1, len(orders))
+        self.assertEqual("OID1", orders[0].id)
@@ -22,6 +22,7 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_derivat
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -139,6 +140,7 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
         self.sell_order_completed_logger = EventLogger()
         self.order_cancelled_logger = EventLogger()
         self.order_filled_logger = EventLogger()
+        self.order_failure_logger = EventLogger()
         self.funding_payment_completed_logger = EventLogger()
 
         events_and_loggers = [
@@ -146,6 +148,7 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
             (MarketEvent.SellOrderCompleted, self.sell_order_completed_logger),
             (MarketEvent.OrderCancelled, self.order_cancelled_logger),
             (MarketEvent.OrderFilled, self.order_filled_logger),
+            (MarketEvent.OrderFailure, self.order_failure_logger),
             (MarketEvent.FundingPaymentCompleted, self.funding_payment_completed_logger)]
 
         for event, logger in events_and_loggers:
@@ -2337,6 +2340,189 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
         self.assertIsInstance(limit_orders, list)
         self.assertIsInstance(limit_orders[0], LimitOrder)
 
+    def _limit_orders(self, count: int) -> List[LimitOrder]:
+        return [
+            LimitOrder(client_order_id=f"OID{i}", trading_pair=self.trading_pair, is_buy=i % 2 == 0,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000") + 2 * i, quantity=Decimal("3"), position=PositionAction.OPEN)
+            for i in range(count)
+        ]
+
+    def _track_orders(self, count: int):
+        self._simulate_trading_rules_initialized()
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=str(100 + i),
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("3"),
+                order_type=OrderType.LIMIT,
+                leverage=1,
+                position_action=PositionAction.OPEN,
+            )
+
+    def test_batch_order_create_sends_the_orders_in_a_single_request(self):
+        self._simulate_trading_rules_initialized()
+        api_post_mock = AsyncMock(return_value=[
+            {"clientOrderId": "OID0", "orderId": 100, "symbol": self.symbol, "status": "NEW",
+             "updateTime": 1640780000000},
+            {"code": -2019, "msg": "Margin is insufficient."},
+        ])
+
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            self.async_run_with_timeout(
+                self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders(2)))
+
+        api_post_mock.assert_awaited_once()
+        request_kwargs = api_post_mock.await_args.kwargs
+        self.assertEqual(CONSTANTS.BATCH_ORDERS_URL, request_kwargs["path_url"])
+        self.assertTrue(request_kwargs["is_auth_required"])
+        self.assertEqual(
+            [
+                {"symbol": self.symbol, "side": "BUY", "quantity": "3", "type": "LIMIT", "newClientOrderId": "OID0",
+                 "price": "10000", "timeInForce": CONSTANTS.TIME_IN_FORCE_GTC},
+                {"symbol": self.symbol, "side": "SELL", "quantity": "3", "type": "LIMIT", "newClientOrderId": "OID1",
+                 "price": "10002", "timeInForce": CONSTANTS.TIME_IN_FORCE_GTC},
+            ],
+            json.loads(request_kwargs["data"]["batchOrders"]))
+
+        self.assertEqual("100", self.exchange.in_flight_orders["OID0"].exchange_order_id)
+        self.assertEqual(1640780000, self.exchange.in_flight_orders["OID0"].last_update_timestamp)
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("OID1", self.order_failure_logger.event_log[0].order_id)
+
+    def test_batch_order_create_splits_the_orders_in_chunks_of_the_exchange_limit(self):
+        self._simulate_trading_rules_initialized()
+
+        async def batch_orders_response(path_url, data, **kwargs):
+            return [{"clientOrderId": order["newClientOrderId"], "orderId": int(order["newClientOrderId"][3:]),
+                     "status": "NEW", "updateTime": 1640780000000}
+                    for order in json.loads(data["batchOrders"])]
+
+        api_post_mock = AsyncMock(side_effect=batch_orders_response)
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            self.async_run_with_timeout(
+                self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders(12)))
+
+        self.assertEqual([5, 5, 2],
+                         [len(json.loads(call.kwargs["data"]["batchOrders"])) for call in api_post_mock.await_args_list])
+        self.assertEqual(12, len(self.exchange.in_flight_orders))
+        self.assertTrue(all(order.is_open for order in self.exchange.in_flight_orders.values()))
+
+    def test_batch_order_cancel_marks_not_found_and_failed_orders(self):
+        self._track_orders(3)
+        api_delete_mock = AsyncMock(return_value=[
+            {"clientOrderId": "OID0", "orderId": 100, "symbol": self.symbol, "status": "CANCELED"},
+            {"code": -2011, "msg": "Unknown order sent."},
+            {"code": -1000, "msg": "An unknown error occurred while processing the request."},
+        ])
+
+        with patch.object(self.exchange, "_api_delete", api_delete_mock):
+            cancellation_results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+                orders_to_cancel=[order.to_limit_order() for order in self.exchange.in_flight_orders.values()]))
+
+        api_delete_mock.assert_awaited_once()
+        request_kwargs = api_delete_mock.await_args.kwargs
+        self.assertEqual(CONSTANTS.BATCH_ORDERS_URL, request_kwargs["path_url"])
+        self.assertEqual(CONSTANTS.BATCH_CANCEL_ORDERS_LIMIT_ID, request_kwargs["limit_id"])
+        self.assertEqual(self.symbol, request_kwargs["params"]["symbol"])
+        self.assertEqual(["OID0", "OID1", "OID2"], json.loads(request_kwargs["params"]["origClientOrderIdList"]))
+        self.assertEqual(
+            [CancellationResult("OID0", True), CancellationResult("OID1", False), CancellationResult("OID2", False)],
+            cancellation_results)
+        self.assertNotIn("OID0", self.exchange.in_flight_orders)
+        self.assertEqual("OID0", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records["OID1"])
+        self.assertTrue(self._is_logged("WARNING", "Failed to cancel order OID1 (order not found)"))
+        self.assertTrue(self.exchange.in_flight_orders["OID2"].is_open)
+
+    def test_batch_order_cancel_splits_the_orders_in_chunks_of_the_exchange_limit(self):
+        self._track_orders(12)
+
+        async def batch_cancel_response(path_url, params, **kwargs):
+            return [{"clientOrderId": order_id, "status": "CANCELED"}
+                    for order_id in json.loads(params["origClientOrderIdList"])]
+
+        api_delete_mock = AsyncMock(side_effect=batch_cancel_response)
+        with patch.object(self.exchange, "_api_delete", api_delete_mock):
+            cancellation_results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+                orders_to_cancel=[order.to_limit_order() for order in self.exchange.in_flight_orders.values()]))
+
+        self.assertEqual([10, 2], [len(json.loads(call.kwargs["params"]["origClientOrderIdList"]))
+                                   for call in api_delete_mock.await_args_list])
+        self.assertTrue(all(result.success for result in cancellation_results))
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+
+    def test_batch_cancel_rate_limit_is_not_counted_as_orders(self):
+        rate_limits = {rate_limit.limit_id: rate_limit for rate_limit in CONSTANTS.RATE_LIMITS}
+
+        batch_cancel_limit = rate_limits[CONSTANTS.BATCH_CANCEL_ORDERS_LIMIT_ID]
+        self.assertEqual([(CONSTANTS.REQUEST_WEIGHT, 1)],
+                         [(limit.limit_id, limit.weight) for limit in batch_cancel_limit.linked_limits])
+        batch_orders_limit = rate_limits[CONSTANTS.BATCH_ORDERS_URL]
+        self.assertIn(CONSTANTS.ORDERS_1MIN, [limit.limit_id for limit in batch_orders_limit.linked_limits])
+
+    def test_amend_order_updates_the_tracked_order(self):
+        self._track_orders(1)
+        api_put_mock = AsyncMock(return_value={"orderId": 100, "clientOrderId": "OID0", "status": "NEW",
+                                               "price": "10002", "origQty": "6", "updateTime": 1640780001000})
+
+        with patch.object(self.exchange, "_api_put", api_put_mock):
+            amended = self.async_run_with_timeout(
+                self.exchange._execute_order_amend(self.trading_pair, "OID0", Decimal("10002.5"), Decimal("7")))
+
+        self.assertTrue(amended)
+        api_put_mock.assert_awaited_once_with(
+            path_url=CONSTANTS.ORDER_URL,
+            params={"origClientOrderId": "OID0", "symbol": self.symbol, "side": "BUY", "quantity": "6",
+                    "price": "10002"},
+            is_auth_required=True)
+        order = self.exchange.in_flight_orders["OID0"]
+        self.assertEqual(Decimal("10002"), order.price)
+        self.assertEqual(Decimal("6"), order.amount)
+        self.assertEqual("100", order.exchange_order_id)
+        self.assertEqual(1640780001, order.last_update_timestamp)
+
+    def test_rejected_amend_cancels_the_order(self):
+        self._track_orders(1)
+        api_put_mock = AsyncMock(return_value={"code": -5027, "msg": "No need to modify the order."})
+        place_cancel_mock = AsyncMock(return_value=True)
+
+        with patch.object(self.exchange, "_api_put", api_put_mock), \
+                patch.object(self.exchange, "_place_cancel", place_cancel_mock):
+            amended = self.async_run_with_timeout(
+                self.exchange._execute_order_amend(self.trading_pair, "OID0", Decimal("10002"), Decimal("6")))
+
+        self.assertFalse(amended)
+        api_put_mock.assert_awaited_once()
+        place_cancel_mock.assert_awaited_once()
+        self.assertNotIn("OID0", self.exchange.in_flight_orders)
+        self.assertEqual("OID0", self.order_cancelled_logger.event_log[0].order_id)
+
+    def test_amend_with_an_invalid_amount_cancels_the_order(self):
+        self._track_orders(2)
+        api_put_mock = AsyncMock()
+        place_cancel_mock = AsyncMock(return_value=True)
+
+        with patch.object(self.exchange, "_api_put", api_put_mock), \
+                patch.object(self.exchange, "_place_cancel", place_cancel_mock):
+            # The amount is quantized to zero with the amount increment of 3
+            quantized_to_zero = self.async_run_with_timeout(
+                self.exchange._execute_order_amend(self.trading_pair, "OID0", Decimal("10002"), Decimal("2")))
+            partially_filled_order = self.exchange.in_flight_orders["OID1"]
+            partially_filled_order.amount = Decimal("6")
+            partially_filled_order.executed_amount_base = Decimal("3")
+            below_executed_amount = self.async_run_with_timeout(
+                self.exchange._execute_order_amend(self.trading_pair, "OID1", Decimal("10002"), Decimal("3")))
+
+        self.assertFalse(quantized_to_zero)
+        self.assertFalse(below_executed_amount)
+        api_put_mock.assert_not_awaited()
+        self.assertEqual(2, place_cancel_mock.await_count)
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+
     def _simulate_trading_rules_initialized(self):
 
         margin_asset = self.quote_asset
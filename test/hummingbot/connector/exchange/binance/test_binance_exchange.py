@@ -3,10 +3,11 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Tuple
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, PropertyMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
+from bidict import bidict
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -16,7 +17,7 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -981,6 +982,214 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    def _start_tracking_orders(self, count: int) -> List[InFlightOrder]:
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=str(100000 + i),
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    def _open_order_update(self, order: InFlightOrder) -> OrderUpdate:
+        return OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=self.exchange.current_timestamp,
+            new_state=OrderState.OPEN,
+        )
+
+    def test_update_order_status_requests_orders_concurrently(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.ORDER_UPDATE_CONCURRENCY = 3
+        orders = self._start_tracking_orders(count=8)
+        in_flight_requests = []
+        max_in_flight_requests = []
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            in_flight_requests.append(tracked_order)
+            max_in_flight_requests.append(len(in_flight_requests))
+            await asyncio.sleep(0.01)
+            in_flight_requests.remove(tracked_order)
+            if tracked_order.client_order_id == "OID0":
+                raise IOError("Test error")
+            return self._open_order_update(tracked_order)
+
+        with patch.object(BinanceExchange, "is_bulk_order_status_request_supported", PropertyMock(return_value=False)):
+            with patch.object(self.exchange, "_all_trade_updates_for_order", AsyncMock(return_value=[])):
+                with patch.object(self.exchange, "_request_order_status", side_effect=request_order_status):
+                    self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(3, max(max_in_flight_requests))
+        self.assertTrue(all(order.current_state == OrderState.OPEN for order in orders[1:]))
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records["OID0"])
+        stats = self.exchange.order_update_cycle_stats
+        self.assertEqual(8, stats["orders"])
+        self.assertEqual(16, stats["requests"])
+        self.assertEqual(1, stats["errors"])
+        self.assertGreater(stats["duration"], 0)
+
+    def test_update_order_status_uses_bulk_requests_when_supported(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(count=3)
+        bulk_order_status_mock = AsyncMock(return_value=[self._open_order_update(order) for order in orders[:2]])
+        bulk_trade_updates_mock = AsyncMock(return_value=[])
+        order_status_mock = AsyncMock(return_value=self._open_order_update(orders[2]))
+        trade_updates_mock = AsyncMock(return_value=[])
+
+        with patch.multiple(
+            BinanceExchange,
+            is_bulk_order_status_request_supported=PropertyMock(return_value=True),
+            is_bulk_trade_updates_request_supported=PropertyMock(return_value=True),
+        ), patch.multiple(
+            self.exchange,
+            _request_order_status_in_bulk=bulk_order_status_mock,
+            _all_trade_updates_for_orders=bulk_trade_updates_mock,
+            _request_order_status=order_status_mock,
+            _all_trade_updates_for_order=trade_updates_mock,
+        ):
+            self.async_run_with_timeout(self.exchange._update_order_status())
+
+        bulk_trade_updates_mock.assert_awaited_once_with(orders=orders)
+        trade_updates_mock.assert_not_awaited()
+        bulk_order_status_mock.assert_awaited_once_with(orders=orders)
+        # Only the order missing from the bulk response is requested individually
+        order_status_mock.assert_awaited_once_with(tracked_order=orders[2])
+        self.assertTrue(all(order.current_state == OrderState.OPEN for order in orders))
+        self.assertEqual(3, self.exchange.order_update_cycle_stats["requests"])
+
+    def test_request_order_status_in_bulk_uses_the_open_orders_of_the_trading_pair(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(count=3)
+        api_get_mock = AsyncMock(return_value=[
+            {
+                "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                "orderId": 100000,
+                "clientOrderId": "OID0",
+                "status": "NEW",
+                "updateTime": 1640780000123,
+            },
+            {
+                "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                "orderId": 100001,
+                "clientOrderId": "OID1",
+                "status": "PARTIALLY_FILLED",
+                "updateTime": 1640780000456,
+            },
+            {
+                "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                "orderId": 200000,
+                "clientOrderId": "NOT_TRACKED",
+                "status": "NEW",
+                "updateTime": 1640780000789,
+            },
+        ])
+
+        with patch.object(self.exchange, "_api_get", api_get_mock):
+            order_updates = self.async_run_with_timeout(self.exchange._request_order_status_in_bulk(orders=orders))
+
+        api_get_mock.assert_awaited_once_with(
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            params={"symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)},
+            is_auth_required=True)
+        self.assertEqual(2, len(order_updates))
+        self.assertEqual("OID0", order_updates[0].client_order_id)
+        self.assertEqual("100000", order_updates[0].exchange_order_id)
+        self.assertEqual(self.trading_pair, order_updates[0].trading_pair)
+        self.assertAlmostEqual(1640780000.123, order_updates[0].update_timestamp, places=3)
+        self.assertEqual(OrderState.OPEN, order_updates[0].new_state)
+        self.assertEqual("OID1", order_updates[1].client_order_id)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, order_updates[1].new_state)
+
+    def test_request_order_status_in_bulk_skips_trading_pairs_with_a_single_order(self):
+        orders = self._start_tracking_orders(count=1)
+        api_get_mock = AsyncMock()
+
+        with patch.object(self.exchange, "_api_get", api_get_mock):
+            order_updates = self.async_run_with_timeout(self.exchange._request_order_status_in_bulk(orders=orders))
+
+        api_get_mock.assert_not_awaited()
+        self.assertEqual([], order_updates)
+
+    def test_update_order_status_requests_the_orders_missing_from_the_open_orders_individually(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders(count=3)
+        api_get_mock = AsyncMock(return_value=[
+            {
+                "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                "orderId": int(order.exchange_order_id),
+                "clientOrderId": order.client_order_id,
+                "status": "NEW",
+                "updateTime": 1640780000000,
+            }
+            for order in orders[:2]
+        ])
+        order_status_mock = AsyncMock(return_value=self._open_order_update(orders[2]))
+
+        with patch.multiple(
+            self.exchange,
+            _api_get=api_get_mock,
+            _request_order_status=order_status_mock,
+            _all_trade_updates_for_order=AsyncMock(return_value=[]),
+        ):
+            self.async_run_with_timeout(self.exchange._update_order_status())
+
+        api_get_mock.assert_awaited_once()
+        order_status_mock.assert_awaited_once_with(tracked_order=orders[2])
+        self.assertTrue(all(order.current_state == OrderState.OPEN for order in orders))
+
+    def test_order_book_messages_are_dispatched_directly_when_enabled_in_the_client_config(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.order_book_direct_dispatch = True
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        exchange._set_trading_pair_symbol_map(
+            bidict({self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset): self.trading_pair}))
+        order_book_tracker = exchange.order_book_tracker
+        diff_messages_queue = AsyncMock()
+        diff_messages_queue.get.side_effect = [
+            {
+                "e": "depthUpdate",
+                "E": 123456789,
+                "s": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                "U": 157,
+                "u": 160,
+                "b": [["0.0024", "10"]],
+                "a": [["0.0026", "100"]],
+            },
+            asyncio.CancelledError(),
+        ]
+        exchange._orderbook_ds._message_queue[CONSTANTS.DIFF_EVENT_TYPE] = diff_messages_queue
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(exchange._orderbook_ds.listen_for_order_book_diffs(
+                asyncio.get_event_loop(), order_book_tracker._message_dispatcher))
+
+        self.assertTrue(order_book_tracker.direct_dispatch)
+        self.assertFalse(self.exchange.order_book_tracker.direct_dispatch)
+        self.assertEqual(1, order_book_tracker._message_dispatcher.pending_messages(self.trading_pair))
+        self.assertEqual(1, order_book_tracker.dispatch_stats["messages_received"])
+
+    def test_time_synchronizer_is_updated_only_when_required(self):
+        update_time_synchronizer_mock = AsyncMock()
+
+        with patch.object(self.exchange, "_update_time_synchronizer", update_time_synchronizer_mock):
+            self.async_run_with_timeout(self.exchange._update_time_synchronizer_if_required())
+            update_time_synchronizer_mock.assert_not_awaited()
+
+            self.exchange._time_synchronizer.clear_time_offset_ms_samples()
+            self.async_run_with_timeout(self.exchange._update_time_synchronizer_if_required())
+            update_time_synchronizer_mock.assert_awaited_once()
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
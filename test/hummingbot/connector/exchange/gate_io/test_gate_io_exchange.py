@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import TokenAmount
@@ -1802,3 +1803,160 @@ class TestGateIoExchange(unittest.TestCase):
 
         self.assertEqual(expected_initial_dict, status_dict)
         self.assertFalse(self.exchange.ready)
+
+    def _limit_orders(self, count: int) -> List[LimitOrder]:
+        return [
+            LimitOrder(client_order_id=f"OID{i}", trading_pair=self.trading_pair, is_buy=i % 2 == 0,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000") + i, quantity=Decimal("1"))
+            for i in range(count)
+        ]
+
+    def _track_orders(self, count: int):
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=str(100 + i),
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+
+    def test_batch_order_create_sends_the_orders_in_a_single_request(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        api_post_mock = AsyncMock(return_value=[
+            {"succeeded": True, "text": "OID0", "id": "100", "status": "open"},
+            {"succeeded": False, "text": "OID1", "label": "BALANCE_NOT_ENOUGH", "message": "Not enough balance"},
+        ])
+
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            self.async_run_with_timeout(
+                self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders(2)))
+
+        api_post_mock.assert_awaited_once()
+        request_kwargs = api_post_mock.await_args.kwargs
+        self.assertEqual(CONSTANTS.BATCH_ORDERS_PATH_URL, request_kwargs["path_url"])
+        self.assertEqual(CONSTANTS.BATCH_ORDERS_PATH_URL, request_kwargs["limit_id"])
+        self.assertTrue(request_kwargs["is_auth_required"])
+        self.assertEqual(
+            [
+                {"text": "OID0", "currency_pair": self.ex_trading_pair, "side": "buy", "type": "limit",
+                 "amount": "1.000000", "price": "10000.0000", "time_in_force": "gtc"},
+                {"text": "OID1", "currency_pair": self.ex_trading_pair, "side": "sell", "type": "limit",
+                 "amount": "1.000000", "price": "10001.0000", "time_in_force": "gtc"},
+            ],
+            request_kwargs["data"])
+
+        self.assertEqual("100", self.exchange.in_flight_orders["OID0"].exchange_order_id)
+        self.assertEqual("OID0", self.buy_order_created_logger.event_log[0].order_id)
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("OID1", self.order_failure_logger.event_log[0].order_id)
+
+    def test_batch_order_create_splits_the_orders_in_chunks_of_the_exchange_limit(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        async def batch_orders_response(path_url, data, **kwargs):
+            return [{"succeeded": True, "text": order["text"], "id": order["text"][3:], "status": "open"}
+                    for order in data]
+
+        api_post_mock = AsyncMock(side_effect=batch_orders_response)
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            self.async_run_with_timeout(
+                self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders(25)))
+
+        self.assertEqual([10, 10, 5], [len(call.kwargs["data"]) for call in api_post_mock.await_args_list])
+        self.assertEqual(25, len(self.exchange.in_flight_orders))
+        self.assertTrue(all(order.is_open for order in self.exchange.in_flight_orders.values()))
+
+    def test_batch_order_cancel_marks_not_found_and_failed_orders(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self._track_orders(3)
+        api_post_mock = AsyncMock(return_value=[
+            {"currency_pair": self.ex_trading_pair, "id": "100", "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": "101", "succeeded": False,
+             "label": "ORDER_NOT_FOUND", "message": "Order not found"},
+            {"currency_pair": self.ex_trading_pair, "id": "102", "succeeded": False,
+             "label": "INVALID_PARAM_VALUE", "message": "Invalid order"},
+        ])
+
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            cancellation_results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+                orders_to_cancel=[order.to_limit_order() for order in self.exchange.in_flight_orders.values()]))
+
+        api_post_mock.assert_awaited_once()
+        request_kwargs = api_post_mock.await_args.kwargs
+        self.assertEqual(CONSTANTS.BATCH_ORDERS_CANCEL_PATH_URL, request_kwargs["path_url"])
+        self.assertEqual([{"currency_pair": self.ex_trading_pair, "id": str(100 + i)} for i in range(3)],
+                         request_kwargs["data"])
+        self.assertEqual(
+            [CancellationResult("OID0", True), CancellationResult("OID1", False), CancellationResult("OID2", False)],
+            cancellation_results)
+        self.assertNotIn("OID0", self.exchange.in_flight_orders)
+        self.assertEqual("OID0", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertEqual(1, self.exchange._order_tracker._order_not_found_records["OID1"])
+        self.assertTrue(self._is_logged("WARNING", "Failed to cancel order OID1 (order not found)"))
+        self.assertTrue(self.exchange.in_flight_orders["OID2"].is_open)
+        self.assertTrue(self._is_logged("ERROR", "Failed to cancel order OID2"))
+
+    def test_batch_order_cancel_splits_the_orders_in_chunks_of_the_exchange_limit(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self._track_orders(25)
+
+        async def cancel_batch_orders_response(path_url, data, **kwargs):
+            return [{"currency_pair": order["currency_pair"], "id": order["id"], "succeeded": True} for order in data]
+
+        api_post_mock = AsyncMock(side_effect=cancel_batch_orders_response)
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            cancellation_results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+                orders_to_cancel=[order.to_limit_order() for order in self.exchange.in_flight_orders.values()]))
+
+        self.assertEqual([20, 5], [len(call.kwargs["data"]) for call in api_post_mock.await_args_list])
+        self.assertTrue(all(result.success for result in cancellation_results))
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+
+    def test_amend_order_request_and_tracked_order_update(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self._track_orders(1)
+        api_patch_mock = AsyncMock(return_value={
+            "id": "100", "text": "OID0", "currency_pair": self.ex_trading_pair, "status": "open",
+            "amount": "2", "price": "10001", "update_time_ms": 1640780001500,
+        })
+
+        with patch.object(self.exchange, "_api_patch", api_patch_mock):
+            amended = self.async_run_with_timeout(
+                self.exchange._execute_order_amend(self.trading_pair, "OID0", Decimal("10001"), Decimal("2")))
+
+        self.assertTrue(amended)
+        api_patch_mock.assert_awaited_once_with(
+            path_url=CONSTANTS.ORDER_AMEND_PATH_URL.format(order_id="100"),
+            params={"currency_pair": self.ex_trading_pair},
+            data={"amount": "2.000000", "price": "10001.0000"},
+            is_auth_required=True,
+            limit_id=CONSTANTS.ORDER_AMEND_LIMIT_ID,
+        )
+        order = self.exchange.in_flight_orders["OID0"]
+        self.assertEqual(Decimal("10001"), order.price)
+        self.assertEqual(Decimal("2"), order.amount)
+        self.assertEqual(1640780001.5, order.last_update_timestamp)
+
+    def test_rejected_amend_order_cancels_the_order(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self._track_orders(1)
+        api_patch_mock = AsyncMock(return_value={"id": "100", "text": "OID0", "status": "cancelled"})
+        place_cancel_mock = AsyncMock(return_value=True)
+
+        with patch.object(self.exchange, "_api_patch", api_patch_mock), \
+                patch.object(self.exchange, "_place_cancel", place_cancel_mock):
+            amended = self.async_run_with_timeout(
+                self.exchange._execute_order_amend(self.trading_pair, "OID0", Decimal("10001"), Decimal("2")))
+
+        self.assertFalse(amended)
+        place_cancel_mock.assert_awaited_once()
+        self.assertNotIn("OID0", self.exchange.in_flight_orders)
+        self.assertEqual("OID0", self.order_cancelled_logger.event_log[0].order_id)
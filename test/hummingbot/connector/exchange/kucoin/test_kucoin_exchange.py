@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase, TradeFeeSchema
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -2627,3 +2628,68 @@ class KucoinExchangeTests(unittest.TestCase):
 
         self.assertEqual(expected_initial_dict, status_dict)
         self.assertFalse(self.exchange.ready)
+
+    def _limit_orders(self, count: int) -> List[LimitOrder]:
+        return [
+            LimitOrder(client_order_id=f"OID{i}", trading_pair=self.trading_pair, is_buy=i % 2 == 0,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000") + i, quantity=Decimal("1"))
+            for i in range(count)
+        ]
+
+    def test_batch_order_create_sends_the_orders_in_a_single_request(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        api_post_mock = AsyncMock(return_value={
+            "code": "200000",
+            "data": {"data": [
+                {"symbol": self.exchange_trading_pair, "clientOid": "OID0", "id": "100", "status": "success",
+                 "failMsg": None},
+                {"symbol": self.exchange_trading_pair, "clientOid": "OID1", "id": None, "status": "fail",
+                 "failMsg": "Balance insufficient!"},
+            ]},
+        })
+
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            self.async_run_with_timeout(
+                self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders(2)))
+
+        api_post_mock.assert_awaited_once()
+        request_kwargs = api_post_mock.await_args.kwargs
+        self.assertEqual(CONSTANTS.MULTI_ORDERS_PATH_URL, request_kwargs["path_url"])
+        self.assertEqual(CONSTANTS.POST_MULTI_ORDERS_LIMIT_ID, request_kwargs["limit_id"])
+        self.assertTrue(request_kwargs["is_auth_required"])
+        self.assertEqual(
+            {
+                "symbol": self.exchange_trading_pair,
+                "orderList": [
+                    {"size": "1.000000", "clientOid": "OID0", "side": "buy", "type": "limit", "price": "10000.0000"},
+                    {"size": "1.000000", "clientOid": "OID1", "side": "sell", "type": "limit", "price": "10001.0000"},
+                ],
+            },
+            request_kwargs["data"])
+
+        self.assertEqual("100", self.exchange.in_flight_orders["OID0"].exchange_order_id)
+        self.assertEqual("OID0", self.buy_order_created_logger.event_log[0].order_id)
+        self.assertNotIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("OID1", self.order_failure_logger.event_log[0].order_id)
+
+    def test_batch_order_create_splits_the_orders_in_chunks_of_the_exchange_limit(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        async def multi_orders_response(path_url, data, **kwargs):
+            return {"code": "200000", "data": {"data": [
+                {"symbol": data["symbol"], "clientOid": order["clientOid"], "id": order["clientOid"][3:],
+                 "status": "success"}
+                for order in data["orderList"]
+            ]}}
+
+        api_post_mock = AsyncMock(side_effect=multi_orders_response)
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            self.async_run_with_timeout(
+                self.exchange._execute_batch_order_create(orders_to_create=self._limit_orders(12)))
+
+        self.assertEqual([5, 5, 2], [len(call.kwargs["data"]["orderList"]) for call in api_post_mock.await_args_list])
+        self.assertEqual(12, len(self.exchange.in_flight_orders))
+        self.assertTrue(all(order.is_open for order in self.exchange.in_flight_orders.values()))
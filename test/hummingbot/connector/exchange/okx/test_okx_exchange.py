@@ -3,9 +3,9 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from aioresponses.core import RequestCall
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -15,9 +15,11 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
-from hummingbot.core.event.events import OrderCancelledEvent, OrderType, TradeType
+from hummingbot.core.event.events import MarketOrderFailureEvent, OrderCancelledEvent, OrderType, TradeType
 
 
 class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -1182,3 +1184,148 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             else:
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
+
+    @aioresponses()
+    def test_batch_order_create_places_all_orders_with_a_single_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+
+        def batch_orders_response(*args, **kwargs):
+            request_data = json.loads(kwargs["data"])
+            return CallbackResult(body=json.dumps({
+                "code": "2",
+                "msg": "",
+                "data": [
+                    {"clOrdId": request_data[0]["clOrdId"], "ordId": "1", "sCode": "0", "sMsg": ""},
+                    {"clOrdId": request_data[1]["clOrdId"], "ordId": "", "sCode": "51008",
+                     "sMsg": "Order failed. Insufficient balance."},
+                ]
+            }))
+
+        mock_api.post(url, callback=batch_orders_response)
+
+        orders = self.exchange.batch_order_create(orders_to_create=[
+            LimitOrder(client_order_id="", trading_pair=self.trading_pair, is_buy=True,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100")),
+            LimitOrder(client_order_id="", trading_pair=self.trading_pair, is_buy=False,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("11000"), quantity=Decimal("90")),
+        ])
+        self.async_run_with_timeout(self.order_failure_logger.wait_for(MarketOrderFailureEvent))
+
+        order_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(order_request)
+        request_data = json.loads(order_request.kwargs["data"])
+        self.assertEqual([order.client_order_id for order in orders], [data["clOrdId"] for data in request_data])
+        self.assertEqual(["buy", "sell"], [data["side"] for data in request_data])
+        self.assertEqual([Decimal("100"), Decimal("90")], [Decimal(data["sz"]) for data in request_data])
+
+        self.assertIn(orders[0].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual("1", self.exchange.in_flight_orders[orders[0].client_order_id].exchange_order_id)
+        self.assertEqual(orders[0].client_order_id, self.buy_order_created_logger.event_log[0].order_id)
+        self.assertNotIn(orders[1].client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(orders[1].client_order_id, self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_cancels_all_orders_with_a_single_request(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("11", "4"), ("12", "5")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": "11", "ordId": "4", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "12", "ordId": "5", "sCode": "1", "sMsg": "Error"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        cancellation_results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(
+            orders_to_cancel=[order.to_limit_order() for order in self.exchange.in_flight_orders.values()]))
+
+        cancel_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(cancel_request)
+        self.assertEqual(["11", "12"], [data["clOrdId"] for data in json.loads(cancel_request.kwargs["data"])])
+        self.assertEqual([CancellationResult("11", True), CancellationResult("12", False)], cancellation_results)
+        self.assertTrue(self.exchange.in_flight_orders["11"].is_pending_cancel_confirmation)
+        self.assertFalse(self.exchange.in_flight_orders["12"].is_pending_cancel_confirmation)
+
+    def test_amend_order_request_and_tracked_order_update(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        api_post_mock = AsyncMock(return_value={
+            "code": "0",
+            "msg": "",
+            "data": [{"clOrdId": "OID1", "ordId": "4", "reqId": "", "sCode": "0", "sMsg": ""}],
+        })
+
+        with patch.object(self.exchange, "_api_post", api_post_mock):
+            amended = self.async_run_with_timeout(
+                self.exchange._execute_order_amend(self.trading_pair, "OID1", Decimal("10001"), Decimal("90")))
+
+        self.assertTrue(amended)
+        api_post_mock.assert_awaited_once()
+        request_kwargs = api_post_mock.await_args.kwargs
+        self.assertEqual(CONSTANTS.OKX_AMEND_ORDER_PATH, request_kwargs["path_url"])
+        self.assertTrue(request_kwargs["is_auth_required"])
+        self.assertEqual(
+            {"clOrdId": "OID1", "instId": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)},
+            {key: request_kwargs["data"][key] for key in ("clOrdId", "instId")})
+        self.assertEqual(Decimal("10001"), Decimal(request_kwargs["data"]["newPx"]))
+        self.assertEqual(Decimal("90"), Decimal(request_kwargs["data"]["newSz"]))
+        order = self.exchange.in_flight_orders["OID1"]
+        self.assertEqual(Decimal("10001"), order.price)
+        self.assertEqual(Decimal("90"), order.amount)
+
+    def test_rejected_amend_order_cancels_the_order(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        api_post_mock = AsyncMock(return_value={
+            "code": "1",
+            "msg": "",
+            "data": [{"clOrdId": "OID1", "ordId": "4", "reqId": "", "sCode": "51503",
+                      "sMsg": "Order modification failed as the order does not exist."}],
+        })
+        place_cancel_mock = AsyncMock(return_value=True)
+
+        with patch.object(self.exchange, "_api_post", api_post_mock), \
+                patch.object(self.exchange, "_place_cancel", place_cancel_mock):
+            amended = self.async_run_with_timeout(
+                self.exchange._execute_order_amend(self.trading_pair, "OID1", Decimal("10001"), Decimal("90")))
+
+        self.assertFalse(amended)
+        place_cancel_mock.assert_awaited_once()
+        order = self.exchange.in_flight_orders["OID1"]
+        self.assertTrue(order.is_pending_cancel_confirmation)
+        self.assertEqual(Decimal("10000"), order.price)
+        self.assertEqual(Decimal("100"), order.amount)
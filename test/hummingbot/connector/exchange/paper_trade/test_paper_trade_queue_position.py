@@ -0,0 +1,138 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
+
+
+class PaperTradeQueuePositionTests(unittest.TestCase):
+    start_timestamp = 1640000000.0
+    trading_pair = "ETH-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 60)
+        self.exchange = self.create_exchange(queue_position_simulation=True,
+                                             order_submit_latency=1.0,
+                                             order_cancel_latency=2.0)
+        self.fill_logger = EventLogger()
+        self.completed_logger = EventLogger()
+        self.cancel_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.fill_logger)
+        self.exchange.add_listener(MarketEvent.BuyOrderCompleted, self.completed_logger)
+        self.exchange.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+
+    def create_exchange(self, **kwargs) -> MockPaperExchange:
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()), **kwargs)
+        # Bids at 99.5 (10), 98.5 (20), ... and asks at 100.5 (10), 101.5 (20), ...
+        exchange.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=100, min_price=50, max_price=150,
+                                         price_step_size=1, volume_step_size=10)
+        exchange.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        exchange.set_balance("ETH", Decimal("100"))
+        exchange.set_balance("USDT", Decimal("10000"))
+        self.clock.add_iterator(exchange)
+        self.clock.backtest_til(self.start_timestamp)
+        return exchange
+
+    def simulate_trade(self, price: str, amount: str, exchange: MockPaperExchange = None):
+        exchange = exchange or self.exchange
+        exchange.get_order_book(self.trading_pair).apply_trade(OrderBookTradeEvent(
+            self.trading_pair, self.clock.current_timestamp, TradeType.SELL, float(price), float(amount)))
+
+    def buy(self, price: str, amount: str, exchange: MockPaperExchange = None) -> str:
+        exchange = exchange or self.exchange
+        return exchange.buy(self.trading_pair, Decimal(amount), OrderType.LIMIT, Decimal(price))
+
+    def test_trades_at_the_order_price_fill_it_after_the_queue_ahead(self):
+        order_id = self.buy("99.5", "5")
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(Decimal("10"), self.exchange.order_queue_positions[order_id].queue_ahead)
+
+        self.simulate_trade("99.5", "8")
+        self.assertEqual(0, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("2"), self.exchange.order_queue_positions[order_id].queue_ahead)
+
+        self.simulate_trade("99.5", "6")
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("4"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(Decimal("4"), self.exchange.limit_orders[0].filled_quantity)
+        self.assertEqual(Decimal("99.5"), self.exchange.on_hold_balances["USDT"])
+        self.assertEqual(Decimal("4"), self.exchange.get_balance("ETH") - Decimal("100"))
+        self.assertEqual(0, len(self.completed_logger.event_log))
+
+        self.simulate_trade("99.5", "3")
+        self.assertEqual(2, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("1"), self.fill_logger.event_log[1].amount)
+        self.assertEqual(1, len(self.completed_logger.event_log))
+        self.assertEqual(Decimal("5"), self.completed_logger.event_log[0].base_asset_amount)
+        self.assertEqual(Decimal("497.5"), self.completed_logger.event_log[0].quote_asset_amount)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertEqual({}, self.exchange.order_queue_positions)
+
+    def test_queue_ahead_shrinks_with_the_cancels_at_the_order_price(self):
+        order_id = self.buy("99.5", "5")
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        self.exchange.get_order_book(self.trading_pair).apply_diffs([OrderBookRow(99.5, 3, 2)], [], 2)
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(Decimal("3"), self.exchange.order_queue_positions[order_id].queue_ahead)
+
+        self.exchange.get_order_book(self.trading_pair).apply_diffs([OrderBookRow(99.5, 7, 3)], [], 3)
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(Decimal("3"), self.exchange.order_queue_positions[order_id].queue_ahead)
+
+    def test_order_inside_the_spread_has_no_queue_ahead(self):
+        order_id = self.buy("100", "5")
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(Decimal("0"), self.exchange.order_queue_positions[order_id].queue_ahead)
+
+        self.simulate_trade("100", "2")
+        self.assertEqual(Decimal("2"), self.fill_logger.event_log[0].amount)
+
+    def test_orders_are_not_filled_before_the_submit_latency(self):
+        self.buy("99.5", "5")
+        self.simulate_trade("99", "20")
+        self.assertEqual(0, len(self.fill_logger.event_log))
+
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.simulate_trade("99", "1")
+        self.assertEqual(1, len(self.fill_logger.event_log))
+        self.assertEqual(Decimal("5"), self.fill_logger.event_log[0].amount)
+        self.assertEqual(1, len(self.completed_logger.event_log))
+
+    def test_orders_can_be_filled_until_the_cancel_is_effective(self):
+        first_order_id = self.buy("99.5", "5")
+        second_order_id = self.buy("98.5", "5")
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        self.exchange.cancel(self.trading_pair, first_order_id)
+        self.exchange.cancel(self.trading_pair, second_order_id)
+        self.simulate_trade("99", "1")
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(0, len(self.cancel_logger.event_log))
+        self.assertEqual([second_order_id], [order.client_order_id for order in self.exchange.limit_orders])
+
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual([first_order_id], [event.order_id for event in self.fill_logger.event_log])
+        self.assertEqual([second_order_id], [event.order_id for event in self.cancel_logger.event_log])
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        self.assertEqual({}, self.exchange.order_queue_positions)
+
+    def test_trades_at_the_order_price_do_not_fill_it_without_queue_position_simulation(self):
+        exchange = self.create_exchange()
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        self.buy("99.5", "5", exchange)
+
+        self.simulate_trade("99.5", "100", exchange)
+        self.assertEqual(0, len(fill_logger.event_log))
+        self.simulate_trade("99", "1", exchange)
+        self.assertEqual(Decimal("5"), fill_logger.event_log[0].amount)
+        self.assertEqual({}, exchange.order_queue_positions)
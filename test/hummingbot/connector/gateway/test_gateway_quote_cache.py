@@ -0,0 +1,141 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+
+
+class GatewayQuoteCacheTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = GatewayQuoteCache(ttl=5, amount_significant_digits=4, block_number_update_interval=5)
+        self.gateway = MagicMock()
+        self.gateway.get_price = AsyncMock(side_effect=self.price_response)
+        self.gateway.get_network_status = AsyncMock(return_value={"currentBlockNumber": 100})
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    async def price_response(chain, network, connector, base, quote, amount, side):
+        await asyncio.sleep(0.01)
+        return {"price": "10", "amount": str(amount), "side": side.name}
+
+    def get_price(self, amount: str, side: TradeType = TradeType.BUY, network: str = "mainnet"):
+        return self.cache.get_price(self.gateway, "ethereum", network, "uniswap", "WETH", "DAI", Decimal(amount), side)
+
+    def test_amount_bucket(self):
+        self.assertEqual(Decimal("1.235"), self.cache.amount_bucket(Decimal("1.23456")))
+        self.assertEqual(Decimal("12350"), self.cache.amount_bucket(Decimal("12345.6")))
+        self.assertEqual(Decimal("0.001000"), self.cache.amount_bucket(Decimal("0.001")))
+        self.assertEqual(Decimal("0"), self.cache.amount_bucket(Decimal("0")))
+
+    def test_quotes_of_the_same_amount_bucket_are_cached(self):
+        responses = [
+            self.async_run_with_timeout(self.get_price("1.00001")),
+            self.async_run_with_timeout(self.get_price("1")),
+            self.async_run_with_timeout(self.get_price("1", side=TradeType.SELL)),
+        ]
+
+        self.assertEqual(2, self.gateway.get_price.await_count)
+        self.assertEqual(responses[0], responses[1])
+        self.assertEqual("SELL", responses[2]["side"])
+        self.gateway.get_price.assert_any_await(
+            "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal("1.000"), TradeType.BUY)
+
+    def test_each_caller_gets_its_own_copy_of_the_quote(self):
+        response = self.async_run_with_timeout(self.get_price("1"))
+        response["price"] = "modified"
+
+        self.assertEqual("10", self.async_run_with_timeout(self.get_price("1"))["price"])
+        self.assertEqual(1, self.gateway.get_price.await_count)
+
+    def test_concurrent_requests_of_the_same_quote_share_the_gateway_request(self):
+        async def http_response(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            response = MagicMock()
+            response.status = 200
+            response.json = AsyncMock(return_value={"price": "10"})
+            return response
+
+        previous_instance = GatewayHttpClient._GatewayHttpClient__instance
+        GatewayHttpClient._GatewayHttpClient__instance = None
+        self.addCleanup(setattr, GatewayHttpClient, "_GatewayHttpClient__instance", previous_instance)
+        gateway = GatewayHttpClient(ClientConfigAdapter(ClientConfigMap()))
+        session = MagicMock()
+        session.request = AsyncMock(side_effect=http_response)
+
+        with patch.object(GatewayHttpClient, "_http_client", return_value=session):
+            responses = self.async_run_with_timeout(asyncio.gather(*[
+                self.cache.get_price(gateway, "ethereum", "mainnet", "uniswap", "WETH", "DAI", Decimal(amount),
+                                     TradeType.BUY)
+                for amount in ["1.00001", "1"]
+            ]))
+
+        self.assertEqual(1, session.request.await_count)
+        self.assertEqual(responses[0], responses[1])
+        self.assertIsNot(responses[0], responses[1])
+
+    def test_quotes_are_requested_again_after_the_ttl(self):
+        with patch.object(self.cache, "_time", return_value=1000):
+            self.async_run_with_timeout(self.get_price("1"))
+        with patch.object(self.cache, "_time", return_value=1005):
+            self.async_run_with_timeout(self.get_price("1"))
+        self.assertEqual(1, self.gateway.get_price.await_count)
+
+        with patch.object(self.cache, "_time", return_value=1005.1):
+            self.async_run_with_timeout(self.get_price("1"))
+        self.assertEqual(2, self.gateway.get_price.await_count)
+
+    def test_quotes_are_requested_again_on_a_new_block(self):
+        self.cache.update_block_number("ethereum", "mainnet", 100)
+        self.async_run_with_timeout(self.get_price("1"))
+        self.async_run_with_timeout(self.get_price("1", network="goerli"))
+
+        self.cache.update_block_number("ethereum", "mainnet", 99)
+        self.async_run_with_timeout(self.get_price("1"))
+        self.assertEqual(2, self.gateway.get_price.await_count)
+
+        self.cache.update_block_number("ethereum", "mainnet", 101)
+        self.async_run_with_timeout(self.get_price("1"))
+        self.async_run_with_timeout(self.get_price("1", network="goerli"))
+        self.assertEqual(3, self.gateway.get_price.await_count)
+        self.assertEqual(101, self.cache.block_number("ethereum", "mainnet"))
+
+    def test_failed_requests_are_not_cached(self):
+        self.gateway.get_price.side_effect = [IOError("Gateway error"), {"price": "10"}]
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.get_price("1"))
+        response = self.async_run_with_timeout(self.get_price("1"))
+
+        self.assertEqual({"price": "10"}, response)
+        self.assertEqual(2, self.gateway.get_price.await_count)
+
+    def test_block_number_is_requested_once_per_interval_for_all_the_connectors(self):
+        with patch.object(self.cache, "_time", return_value=1000):
+            self.async_run_with_timeout(asyncio.gather(
+                self.cache.request_block_number(self.gateway, "ethereum", "mainnet"),
+                self.cache.request_block_number(self.gateway, "ethereum", "mainnet"),
+                self.cache.request_block_number(self.gateway, "ethereum", "goerli"),
+            ))
+        with patch.object(self.cache, "_time", return_value=1004.9):
+            self.async_run_with_timeout(self.cache.request_block_number(self.gateway, "ethereum", "mainnet"))
+
+        self.assertEqual(2, self.gateway.get_network_status.await_count)
+        self.assertEqual(100, self.cache.block_number("ethereum", "mainnet"))
+
+        self.gateway.get_network_status.return_value = {"currentBlockNumber": 101}
+        with patch.object(self.cache, "_time", return_value=1005):
+            self.async_run_with_timeout(self.cache.request_block_number(self.gateway, "ethereum", "mainnet"))
+
+        self.assertEqual(3, self.gateway.get_network_status.await_count)
+        self.assertEqual(101, self.cache.block_number("ethereum", "mainnet"))
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import unittest
 from decimal import Decimal
 from typing import Awaitable, Dict
@@ -267,6 +268,77 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertIsNone(fetched_order)
 
+    def test_fetch_order_by_exchange_order_id_assigned_after_start_tracking(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order.update_exchange_order_id("someExchangeOrderId")
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["someExchangeOrderId"])
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id.get("someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_updatable_orders_by_exchange_order_id)
+
+        del self.tracker._cached_orders[order.client_order_id]
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertEqual({}, dict(self.tracker.all_fillable_orders_by_exchange_order_id))
+
+    def test_exchange_order_id_index_ignores_copies_of_tracked_orders(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order_copy = copy.copy(order)
+        order_copy.exchange_order_id = "otherExchangeOrderId"
+
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="otherExchangeOrderId"))
+
+    def test_fetch_active_orders_by_trading_pair_and_state(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                trading_pair=trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            for i, trading_pair in enumerate([self.trading_pair, self.trading_pair, "OTHER-HBOT"])
+        ]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+
+        self.assertEqual(orders[:2], self.tracker.fetch_active_orders_by_trading_pair(self.trading_pair))
+        self.assertEqual(orders, self.tracker.fetch_active_orders_by_state(OrderState.PENDING_CREATE))
+
+        orders[0].current_state = OrderState.OPEN
+        self.tracker.stop_tracking_order(orders[1].client_order_id)
+
+        self.assertEqual([orders[0]], self.tracker.fetch_active_orders_by_trading_pair(self.trading_pair))
+        self.assertEqual([orders[0]], self.tracker.fetch_active_orders_by_state(OrderState.OPEN))
+        self.assertEqual([orders[2]], self.tracker.fetch_active_orders_by_state(OrderState.PENDING_CREATE))
+        self.assertEqual([], self.tracker.fetch_active_orders_by_trading_pair("UNKNOWN-HBOT"))
+
     def test_process_order_update_invalid_order_update(self):
 
         order_creation_update: OrderUpdate = OrderUpdate(
@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -23,6 +25,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -87,6 +90,12 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -492,3 +501,135 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(len(executors_in_db), 1)
         executors_in_db = recorder.get_position_executors(controller_name="test_controller_2")
         self.assertEqual(len(executors_in_db), 1)
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_write_behind_commits_records_from_worker_thread(self, engine_mock):
+        # The worker thread needs a database shared between threads, which in-memory SQLite databases are not
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'test.sqlite')}")
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.addCleanup(manager.engine.dispose)
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+            ),
+            write_behind=True,
+            write_flush_interval=10,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        with patch.object(self, "add_trade_fills_from_market_recorder") as add_trade_fills_mock:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=db_dir.name):
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+                # The in memory trade fills are updated before the records are committed
+                add_trade_fills_mock.assert_called_once()
+                recorder.flush()
+
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = orders[0].status
+            trade_fills = orders[0].trade_fills
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(2, len(order_status))
+        self.assertEqual(MarketEvent.OrderFilled.name, orders[0].last_status)
+        self.assertEqual(1, len(trade_fills))
+        # The market states are saved once for both events
+        self.assertEqual(1, len(market_states))
+        metrics = recorder.write_queue_metrics
+        self.assertEqual(3, metrics["writes_queued"])
+        self.assertEqual(3, metrics["writes_committed"])
+        self.assertEqual(0, metrics["queue_depth"])
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def test_failed_write_behind_batch_writes_each_trade_csv_row_once(self, engine_mock):
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'test.sqlite')}")
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.addCleanup(manager.engine.dispose)
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+            ),
+            write_behind=True,
+            write_flush_interval=10,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        def fill_event(order_id: str, trade_id: str) -> OrderFilledEvent:
+            return OrderFilledEvent(
+                timestamp=1642020000,
+                order_id=order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id=trade_id,
+            )
+
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        failing_fill = fill_event("OID2", "TradeId2")
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=db_dir.name):
+            with patch("hummingbot.model.sql_write_queue.SQLWriteQueue.logger"):
+                with patch.object(failing_fill.trade_fee, "to_json", return_value=object()):
+                    recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event("OID1", "TradeId1"))
+                    # The trade fee can't be serialized, so the whole batch fails and the writes are retried
+                    recorder._did_fill_order(MarketEvent.OrderFilled.value, self, failing_fill)
+                    recorder._write_queue.put(failing_write)
+                    recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event("OID3", "TradeId3"))
+                recorder.flush()
+
+        with manager.get_new_session() as session:
+            trade_fills = session.query(TradeFill).all()
+        with open(os.path.join(db_dir.name, "trades_test_co.csv")) as csv_file:
+            csv_rows = csv_file.read().splitlines()
+
+        self.assertEqual({"OID1", "OID3"}, {trade_fill.order_id for trade_fill in trade_fills})
+        self.assertEqual(3, len(csv_rows))
+        self.assertTrue(csv_rows[0].startswith("exchange_trade_id"))
+        self.assertEqual(["TradeId1", "TradeId3"], [row.split(",")[0] for row in csv_rows[1:]])
+        self.assertEqual(2, recorder.write_queue_metrics["writes_failed"])
@@ -75,3 +75,75 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.numpy.median", wraps=numpy.median)
+    def test_offset_is_calculated_only_when_a_sample_is_registered(self, median_mock):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000)
+        time_provider.add_time_offset_ms_sample(3000)
+
+        first_time = time_provider.time()
+        second_time = time_provider.time()
+
+        self.assertEqual(2, median_mock.call_count)
+        self.assertLessEqual(first_time, second_time)
+        self.assertEqual(numpy.mean([2000, (1000 + 3000 * 3) / 4]), time_provider.time_offset_ms)
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertIsNone(time_provider._cached_time_offset_ms)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time")
+    def test_server_time_request_stats(self, time_mock, seconds_counter_mock):
+        now = 1640000020.0
+        time_mock.side_effect = [now + 0.4]
+        seconds_counter_mock.side_effect = [10, 10.2]
+
+        time_provider = TimeSynchronizer()
+        self.assertTrue(numpy.isnan(time_provider.stats["offset_ms"]))
+        self.assertTrue(numpy.isnan(time_provider.round_trip_time_ms))
+        self.async_run_with_timeout(
+            time_provider.update_server_time_offset_with_time_provider(
+                time_provider=self.configurable_timestamp_provider(now * 1e3)
+            ))
+
+        stats = time_provider.stats
+        self.assertAlmostEqual((now - 10.1) * 1e3, stats["offset_ms"])
+        self.assertAlmostEqual(200, stats["round_trip_time_ms"])
+        self.assertAlmostEqual(200, time_provider.round_trip_time_ms)
+        self.assertEqual(1, stats["samples"])
+        self.assertEqual(now + 0.4, stats["timestamp"])
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time")
+    def test_resync_required_when_samples_are_old_or_the_local_clock_drifts(self, time_mock, seconds_counter_mock):
+        now = 1640000020.0
+        time_provider = TimeSynchronizer()
+        self.assertTrue(time_provider.is_resync_required(max_sample_age=60, max_clock_drift_ms=100))
+
+        time_mock.side_effect = [now]
+        seconds_counter_mock.side_effect = [10, 10]
+        self.async_run_with_timeout(
+            time_provider.update_server_time_offset_with_time_provider(
+                time_provider=self.configurable_timestamp_provider(now * 1e3)
+            ))
+
+        time_mock.side_effect = [now + 30.05]
+        seconds_counter_mock.side_effect = [40]
+        self.assertFalse(time_provider.is_resync_required(max_sample_age=60, max_clock_drift_ms=100))
+
+        time_mock.side_effect = [now + 30.5]
+        seconds_counter_mock.side_effect = [40]
+        self.assertTrue(time_provider.is_resync_required(max_sample_age=60, max_clock_drift_ms=100))
+
+        seconds_counter_mock.side_effect = [71]
+        self.assertTrue(time_provider.is_resync_required(max_sample_age=60, max_clock_drift_ms=100))
+
+    def test_resync_not_required_with_registered_samples(self):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(0)
+
+        self.assertFalse(time_provider.is_resync_required(max_sample_age=60, max_clock_drift_ms=100))
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertTrue(time_provider.is_resync_required(max_sample_age=60, max_clock_drift_ms=100))
@@ -0,0 +1,89 @@
+import csv
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from hummingbot.connector.trades_csv_writer import TradesCSVWriter
+
+
+class TradesCSVWriterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "trades_test.csv")
+        self.header = ("exchange_trade_id", "price", "amount")
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+        super().tearDown()
+
+    def read_rows(self, path: str):
+        with open(path, newline="") as file:
+            return list(csv.reader(file))
+
+    def test_rows_are_written_on_flush(self):
+        writer = TradesCSVWriter()
+        writer.write_row(self.path, self.header, ("T1", 100, 1))
+        writer.write_row(self.path, self.header, ("T2", 101, 2))
+
+        self.assertEqual([], self.read_rows(self.path))
+
+        writer.flush()
+        self.assertEqual([list(self.header), ["T1", "100", "1"], ["T2", "101", "2"]], self.read_rows(self.path))
+        writer.close()
+
+    def test_existing_file_header_checked_once(self):
+        with open(self.path, "w", newline="") as file:
+            csv.writer(file).writerows([self.header, ("T0", 99, 1)])
+        writer = TradesCSVWriter()
+
+        with patch.object(TradesCSVWriter, "_file_matches_header", wraps=TradesCSVWriter._file_matches_header) as mock:
+            writer.write_row(self.path, self.header, ("T1", 100, 1))
+            writer.write_row(self.path, self.header, ("T2", 101, 2))
+            writer.close()
+
+        self.assertEqual(1, mock.call_count)
+        self.assertEqual([list(self.header), ["T0", "99", "1"], ["T1", "100", "1"], ["T2", "101", "2"]],
+                         self.read_rows(self.path))
+
+    def test_file_with_different_header_is_moved(self):
+        with open(self.path, "w", newline="") as file:
+            csv.writer(file).writerows([("exchange_trade_id", "price"), ("T0", 99)])
+        writer = TradesCSVWriter()
+
+        writer.write_row(self.path, self.header, ("T1", 100, 1))
+        writer.close()
+
+        old_files = [name for name in os.listdir(self.dir.name) if name.startswith("trades_test_old_")]
+        self.assertEqual(1, len(old_files))
+        self.assertEqual([["exchange_trade_id", "price"], ["T0", "99"]],
+                         self.read_rows(os.path.join(self.dir.name, old_files[0])))
+        self.assertEqual([list(self.header), ["T1", "100", "1"]], self.read_rows(self.path))
+
+    def test_rotation_by_size(self):
+        writer = TradesCSVWriter(max_file_size=1)
+
+        writer.write_row(self.path, self.header, ("T1", 100, 1))
+        writer.write_row(self.path, self.header, ("T2", 101, 2))
+        writer.close()
+
+        rotated_files = [name for name in os.listdir(self.dir.name) if name != "trades_test.csv"]
+        self.assertEqual(1, len(rotated_files))
+        self.assertEqual([list(self.header), ["T1", "100", "1"]],
+                         self.read_rows(os.path.join(self.dir.name, rotated_files[0])))
+        self.assertEqual([list(self.header), ["T2", "101", "2"]], self.read_rows(self.path))
+
+    def test_daily_rotation(self):
+        writer = TradesCSVWriter(rotate_daily=True)
+
+        with patch.object(TradesCSVWriter, "_current_date", return_value="20240101"):
+            writer.write_row(self.path, self.header, ("T1", 100, 1))
+        with patch.object(TradesCSVWriter, "_current_date", return_value="20240102"):
+            writer.write_row(self.path, self.header, ("T2", 101, 2))
+            writer.write_row(self.path, self.header, ("T3", 102, 3))
+        writer.close()
+
+        self.assertEqual(2, len(os.listdir(self.dir.name)))
+        self.assertEqual([list(self.header), ["T2", "101", "2"], ["T3", "102", "3"]], self.read_rows(self.path))
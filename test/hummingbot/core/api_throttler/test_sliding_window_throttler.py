@@ -0,0 +1,148 @@
+import asyncio
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+from unittest.mock import MagicMock
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+TEST_POOL_ID = "TEST"
+TEST_PATH_URL = "/hummingbot"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+TIME_INTERVAL = 0.1
+
+
+class SlidingWindowThrottlerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=TIME_INTERVAL),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=TIME_INTERVAL,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=TIME_INTERVAL),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID, limit=1000, time_interval=TIME_INTERVAL,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID, limit=1000, time_interval=TIME_INTERVAL,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits)
+        self.executed_tasks: List[str] = []
+
+    async def execute_task(self, limit_id: str):
+        async with self.throttler.execute_task(limit_id=limit_id):
+            self.executed_tasks.append(limit_id)
+
+    async def test_within_capacity(self):
+        context = self.throttler.execute_task(limit_id=TEST_PATH_URL)
+        self.assertTrue(context.within_capacity())
+
+        await context.acquire()
+
+        self.assertFalse(context.within_capacity())
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_POOL_ID).within_capacity())
+        self.assertEqual(1, self.throttler.capacity_used(TEST_POOL_ID))
+        self.assertEqual(1, self.throttler.capacity_used(TEST_PATH_URL))
+
+    async def test_unknown_limit_id_is_not_throttled(self):
+        for _ in range(3):
+            await asyncio.wait_for(self.execute_task("unknown_limit_id"), timeout=1)
+
+        self.assertEqual(3, len(self.executed_tasks))
+        self.assertEqual(0, self.throttler.capacity_used("unknown_limit_id"))
+
+    async def test_capacity_is_freed_after_time_window(self):
+        await self.execute_task(TEST_POOL_ID)
+        self.assertEqual(1, self.throttler.capacity_used(TEST_POOL_ID))
+
+        await asyncio.sleep(TIME_INTERVAL * 1.1)
+
+        self.assertEqual(0, self.throttler.capacity_used(TEST_POOL_ID))
+
+    async def test_waiting_task_is_released_when_capacity_frees(self):
+        start = time.time()
+        await self.execute_task(TEST_POOL_ID)
+        await asyncio.wait_for(self.execute_task(TEST_POOL_ID), timeout=1)
+        elapsed = time.time() - start
+
+        self.assertEqual(2, len(self.executed_tasks))
+        self.assertGreaterEqual(elapsed, TIME_INTERVAL * (1 + self.throttler._safety_margin_pct))
+        self.assertLess(elapsed, TIME_INTERVAL * 2)
+
+    async def test_linked_limits_with_weights(self):
+        # Task 1 uses 5 of the 10 units of the weighted pool, task 2 uses 1
+        await self.execute_task(TEST_WEIGHTED_TASK_1_ID)
+        await self.execute_task(TEST_WEIGHTED_TASK_2_ID)
+        self.assertEqual(6, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    async def test_waiting_tasks_are_served_in_arrival_order(self):
+        for _ in range(2):
+            await self.execute_task(TEST_WEIGHTED_TASK_1_ID)
+
+        first_task = asyncio.get_event_loop().create_task(self.execute_task(TEST_WEIGHTED_TASK_1_ID))
+        await asyncio.sleep(0)
+        second_task = asyncio.get_event_loop().create_task(self.execute_task(TEST_WEIGHTED_TASK_2_ID))
+        await asyncio.sleep(0)
+        # The pool is full, and the task 2 can not go ahead of the task 1 waiting for the same pool
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        self.assertEqual(2, len(self.executed_tasks))
+
+        await asyncio.wait_for(asyncio.gather(first_task, second_task), timeout=1)
+
+        self.assertEqual([TEST_WEIGHTED_TASK_1_ID] * 3 + [TEST_WEIGHTED_TASK_2_ID], self.executed_tasks)
+
+    async def test_waiting_task_does_not_block_tasks_with_other_limits(self):
+        await self.execute_task(TEST_POOL_ID)
+        waiting_task = asyncio.get_event_loop().create_task(self.execute_task(TEST_PATH_URL))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(self.execute_task(TEST_WEIGHTED_TASK_2_ID), timeout=TIME_INTERVAL / 2)
+
+        self.assertFalse(waiting_task.done())
+        await asyncio.wait_for(waiting_task, timeout=1)
+
+    async def test_cancelled_waiting_task_does_not_block_next_tasks(self):
+        for _ in range(2):
+            await self.execute_task(TEST_WEIGHTED_TASK_1_ID)
+        cancelled_task = asyncio.get_event_loop().create_task(self.execute_task(TEST_WEIGHTED_TASK_1_ID))
+        await asyncio.sleep(0)
+        next_task = asyncio.get_event_loop().create_task(self.execute_task(TEST_WEIGHTED_TASK_2_ID))
+        await asyncio.sleep(0)
+
+        cancelled_task.cancel()
+        await asyncio.wait_for(next_task, timeout=1)
+
+        self.assertTrue(cancelled_task.cancelled())
+        self.assertEqual([TEST_WEIGHTED_TASK_1_ID] * 2 + [TEST_WEIGHTED_TASK_2_ID], self.executed_tasks)
+        self.assertEqual(0, len(self.throttler._waiters))
+
+    async def test_burst_of_tasks_is_released_as_soon_as_each_window_frees(self):
+        # A longer window than the other tests, so the scheduling delays of a loaded machine stay within the margins
+        time_interval = 0.5
+        throttler = SlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=100, time_interval=time_interval)],
+            safety_margin_pct=0)
+        throttler._log_max_capacity_reached = MagicMock()
+        release_times: List[float] = []
+
+        async def execute_task():
+            async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                release_times.append(time.time())
+
+        await asyncio.wait_for(asyncio.gather(*[execute_task() for _ in range(250)]), timeout=5)
+
+        self.assertEqual(250, len(release_times))
+        first_window_start, second_window_start, third_window_start = release_times[0], release_times[100], release_times[200]
+        self.assertLess(release_times[99], first_window_start + time_interval)
+        self.assertGreaterEqual(second_window_start - first_window_start, time_interval)
+        self.assertLess(second_window_start - first_window_start, time_interval * 1.5)
+        self.assertGreaterEqual(third_window_start - second_window_start, time_interval)
+        self.assertLess(third_window_start - second_window_start, time_interval * 1.5)
+        throttler._log_max_capacity_reached.assert_called()
@@ -0,0 +1,88 @@
+import random
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.flat_order_book import FlatOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class FlatOrderBookTest(unittest.TestCase):
+
+    def assert_same_book(self, expected: OrderBook, actual: FlatOrderBook):
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        for is_buy in (True, False):
+            self.assertEqual(expected.get_price(is_buy), actual.get_price(is_buy))
+            for volume in (0.5, 5, 50):
+                self.assertEqual(expected.get_price_for_volume(is_buy, volume).result_price,
+                                 actual.get_price_for_volume(is_buy, volume).result_price)
+                self.assertEqual(expected.get_vwap_for_volume(is_buy, volume).result_price,
+                                 actual.get_vwap_for_volume(is_buy, volume).result_price)
+        self.assertEqual(expected.snapshot_uid, actual.snapshot_uid)
+        self.assertEqual(expected.last_diff_uid, actual.last_diff_uid)
+
+    def test_empty_book_raises_on_get_price(self):
+        order_book = FlatOrderBook()
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(True)
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(False)
+
+    def test_snapshot_sorts_and_deduplicates_levels(self):
+        order_book = FlatOrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(9, 1, 1), OrderBookRow(10, 2, 1), OrderBookRow(9, 5, 1), OrderBookRow(8, 1, 1)],
+            [OrderBookRow(12, 1, 1), OrderBookRow(11, 2, 1), OrderBookRow(13, 1, 1)],
+            1)
+
+        self.assertEqual([10, 9, 8], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([2, 1, 1], [row.amount for row in order_book.bid_entries()])
+        self.assertEqual([11, 12, 13], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+
+    def test_truncate_overlap_entries_cex(self):
+        order_book = FlatOrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64))
+        order_book.apply_numpy_diffs(np.array([[50, 0.01, 6]]), np.array([[2, 0.1, 5]]))
+
+        self.assertEqual([OrderBookRow(50., 0.01, 6)], list(order_book.bid_entries())[:1])
+        self.assertEqual([], list(order_book.ask_entries()))
+
+    def test_truncate_overlap_entries_dex(self):
+        order_book = FlatOrderBook(dex=True)
+        order_book.apply_numpy_snapshot(
+            np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3], [50, 0.01, 4]], dtype=np.float64),
+            np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64))
+        self.assertEqual(OrderBookRow(3., 1., 3), next(order_book.bid_entries()))
+        self.assertEqual(OrderBookRow(4., 1., 1), next(order_book.ask_entries()))
+
+        order_book.apply_numpy_diffs(np.array([[3.5, 1, 5]]), np.array([[2, 0.1, 5]]))
+        self.assertEqual(OrderBookRow(3.5, 1., 5), next(order_book.bid_entries()))
+        self.assertEqual(OrderBookRow(4., 1., 1), next(order_book.ask_entries()))
+
+    def test_random_updates_match_set_based_order_book(self):
+        random.seed(1)
+        expected = OrderBook()
+        actual = FlatOrderBook()
+        bids = [OrderBookRow(100 - i * 0.5, random.random() * 10, 1) for i in range(1, 60)]
+        asks = [OrderBookRow(100 + i * 0.5, random.random() * 10, 1) for i in range(1, 60)]
+        expected.apply_snapshot(bids, asks, 1)
+        actual.apply_snapshot(bids, asks, 1)
+        self.assert_same_book(expected, actual)
+
+        for update_id in range(2, 500):
+            diff_bids = [OrderBookRow(100 - random.randint(0, 80) * 0.5,
+                                      0 if random.random() < 0.3 else random.random() * 10,
+                                      update_id)
+                         for _ in range(random.randint(0, 10))]
+            diff_asks = [OrderBookRow(100 + random.randint(0, 80) * 0.5,
+                                      0 if random.random() < 0.3 else random.random() * 10,
+                                      update_id)
+                         for _ in range(random.randint(0, 10))]
+            expected.apply_diffs(diff_bids, diff_asks, update_id)
+            actual.apply_diffs(diff_bids, diff_asks, update_id)
+            self.assert_same_book(expected, actual)
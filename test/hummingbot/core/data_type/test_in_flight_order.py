@@ -631,6 +631,31 @@ class InFlightOrderPyUnitTests(unittest.TestCase):
         # Ignores duplicate trade update
         self.assertFalse(order.update_with_trade_update(trade_update))
 
+    def test_update_with_amend(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            exchange_order_id=self.exchange_order_id,
+            initial_state=OrderState.OPEN,
+        )
+
+        self.assertTrue(order.update_with_amend(price=Decimal("1.1"), amount=Decimal("500.0"), update_timestamp=2))
+        self.assertEqual(Decimal("1.1"), order.price)
+        self.assertEqual(Decimal("500.0"), order.amount)
+        self.assertEqual(2, order.last_update_timestamp)
+        self.assertEqual(self.client_order_id, order.client_order_id)
+        self.assertEqual(self.exchange_order_id, order.exchange_order_id)
+        self.assertEqual(OrderState.OPEN, order.current_state)
+
+        # Ignores an amend that does not change the order
+        self.assertFalse(order.update_with_amend(price=Decimal("1.1"), amount=Decimal("500.0"), update_timestamp=3))
+        self.assertEqual(2, order.last_update_timestamp)
+
     def test_update_with_trade_update_multiple_trade_updates(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id=self.client_order_id,
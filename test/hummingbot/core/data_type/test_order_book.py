@@ -1,8 +1,13 @@
 #!/usr/bin/env python
 
 import logging
+import math
+import random
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +55,126 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_raw_diffs_matches_order_book_row_path(self):
+        raw_bids = [["1.5", "2", "extra"], ["1.4", "3"], ["1.3", "0.5"]]
+        raw_asks = [["1.6", "1"], ["1.7", "4"]]
+        reference_book = OrderBook()
+        reference_book.apply_snapshot([OrderBookRow(1.5, 1, 1), OrderBookRow(1.0, 1, 1)],
+                                      [OrderBookRow(1.6, 5, 1), OrderBookRow(2.0, 1, 1)],
+                                      1)
+        raw_book = OrderBook()
+        raw_book.apply_raw_snapshot([["1.5", "1"], ["1.0", "1"]], [[1.6, 5], [2.0, 1]], 1)
+
+        reference_book.apply_diffs([OrderBookRow(float(p), float(a), 2) for p, a, *_ in raw_bids],
+                                   [OrderBookRow(float(p), float(a), 2) for p, a, *_ in raw_asks],
+                                   2)
+        raw_book.apply_raw_diffs(raw_bids, raw_asks, 2)
+        raw_book.apply_raw_diffs([["1.3", "0"]], [], 3)
+        reference_book.apply_diffs([OrderBookRow(1.3, 0, 3)], [], 3)
+
+        self.assertEqual(list(reference_book.bid_entries()), list(raw_book.bid_entries()))
+        self.assertEqual(list(reference_book.ask_entries()), list(raw_book.ask_entries()))
+        self.assertEqual(reference_book.get_price(True), raw_book.get_price(True))
+        self.assertEqual(reference_book.get_price(False), raw_book.get_price(False))
+        self.assertEqual(3, raw_book.last_diff_uid)
+
+    def test_apply_float64_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_float64_snapshot(np.array([[1.0, 1.0], [2.0, 1.0]]),
+                                          np.array([[3.0, 1.0], [4.0, 1.0]]),
+                                          10)
+        # Non contiguous views are accepted as well
+        bids = np.array([[2.0, 0.0, 99.0], [2.5, 3.0, 99.0]])[:, :2]
+        asks = np.empty((0, 2))
+        order_book.apply_float64_diffs(bids, asks, 11)
+
+        self.assertEqual([OrderBookRow(2.5, 3.0, 11), OrderBookRow(1.0, 1.0, 10)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(3.0, 1.0, 10), OrderBookRow(4.0, 1.0, 10)], list(order_book.ask_entries()))
+        self.assertEqual(2.5, order_book.get_price(False))
+        self.assertEqual(10, order_book.snapshot_uid)
+        self.assertEqual(11, order_book.last_diff_uid)
+
+    def test_apply_float64_diffs_rejects_buffers_without_amount_column(self):
+        order_book = OrderBook()
+        with self.assertRaises(ValueError):
+            order_book.apply_float64_diffs(np.array([[1.0], [2.0]]), np.empty((0, 2)), 1)
+
+    def test_volume_queries_use_updated_depth_after_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(9, 1, 1), OrderBookRow(8, 2, 1), OrderBookRow(7, 3, 1)],
+                                  [OrderBookRow(11, 1, 1), OrderBookRow(12, 2, 1), OrderBookRow(13, 3, 1)],
+                                  1)
+
+        self.assertEqual(12, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(8, order_book.get_price_for_volume(False, 2).result_price)
+        self.assertAlmostEqual((11 + 12) / 2, order_book.get_vwap_for_volume(True, 2).result_price)
+        self.assertEqual(3, order_book.get_volume_for_price(True, 12).result_volume)
+        self.assertEqual(3, order_book.get_volume_for_price(False, 8).result_volume)
+        self.assertEqual(11 + 24, order_book.get_quote_volume_for_price(True, 12).result_volume)
+        self.assertEqual(12, order_book.get_price_for_quote_volume(True, 20).result_price)
+        self.assertEqual(11 + 12 * 0.5, order_book.get_quote_volume_for_base_amount(True, 1.5).result_volume)
+
+        order_book.apply_diffs([OrderBookRow(9, 0, 2)], [OrderBookRow(11, 5, 2)], 2)
+
+        self.assertEqual(11, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(7, order_book.get_price_for_volume(False, 2.5).result_price)
+        self.assertEqual(5, order_book.get_volume_for_price(True, 11.5).result_volume)
+        self.assertEqual(2, order_book.get_volume_for_price(False, 8).result_volume)
+
+    def test_volume_queries_beyond_book_depth(self):
+        order_book = OrderBook()
+        self.assertTrue(math.isnan(order_book.get_price_for_volume(True, 1).result_price))
+        self.assertEqual(0, order_book.get_volume_for_price(True, 10).result_volume)
+        self.assertTrue(math.isnan(order_book.get_volume_for_price(True, 10).result_price))
+
+        order_book.apply_snapshot([OrderBookRow(9, 1, 1)], [OrderBookRow(11, 1, 1), OrderBookRow(12, 2, 1)], 1)
+        result = order_book.get_price_for_volume(True, 10)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_vwap_for_volume(True, 10)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(3, result.result_volume)
+        self.assertEqual(11 + 24, order_book.get_quote_volume_for_base_amount(True, 10).result_volume)
+        self.assertEqual(0, order_book.get_volume_for_price(True, 10).result_volume)
+
+    def test_batched_volume_queries_match_single_queries(self):
+        random.seed(7)
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, random.random() * 5, 1) for i in range(1, 50)],
+                                  [OrderBookRow(100 + i, random.random() * 5, 1) for i in range(1, 50)],
+                                  1)
+        volumes = np.array([0.1, 1, 10, 50, 100, 1000])
+        prices = np.array([50, 98.5, 100, 101.5, 150])
+
+        for is_buy in (True, False):
+            np.testing.assert_array_equal(
+                [order_book.get_price_for_volume(is_buy, volume).result_price for volume in volumes],
+                order_book.get_prices_for_volumes(is_buy, volumes))
+            np.testing.assert_array_equal(
+                [order_book.get_vwap_for_volume(is_buy, volume).result_price for volume in volumes],
+                order_book.get_vwaps_for_volumes(is_buy, volumes))
+            np.testing.assert_array_equal(
+                [order_book.get_volume_for_price(is_buy, price).result_volume for price in prices],
+                order_book.get_volumes_for_prices(is_buy, prices))
+
+    def test_top_of_book_changed_event(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangedEvent, event_logger)
+
+        order_book.apply_raw_snapshot([["10", "1"], ["9", "1"]], [["11", "1"]], 1)
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertIs(order_book, event_logger.event_log[0])
+
+        order_book.apply_raw_diffs([["9", "2"]], [["12", "1"]], 2)
+        self.assertEqual(1, len(event_logger.event_log))
+
+        order_book.apply_raw_diffs([], [["10.5", "1"]], 3)
+        self.assertEqual(2, len(event_logger.event_log))
+
+        order_book.apply_raw_snapshot([["10", "1"]], [["10.5", "1"]], 4)
+        self.assertEqual(2, len(event_logger.event_log))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,75 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_dispatcher import OrderBookMessageDispatcher
+
+
+class OrderBookMessageDispatcherTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dispatcher = OrderBookMessageDispatcher(buffer_size=3)
+
+    @staticmethod
+    def _diff_message(trading_pair: str, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": [],
+            "asks": [],
+        }, timestamp=update_id)
+
+    async def test_wait_returns_pending_trading_pairs_once(self):
+        wait_task = asyncio.get_event_loop().create_task(self.dispatcher.wait_for_pending_trading_pairs())
+        await asyncio.sleep(0)
+        self.assertFalse(wait_task.done())
+
+        self.dispatcher.put_nowait(self._diff_message("COINALPHA-HBOT", 1))
+        self.dispatcher.put_nowait(self._diff_message("COINBETA-HBOT", 1))
+        self.dispatcher.put_nowait(self._diff_message("COINALPHA-HBOT", 2))
+        pending = await asyncio.wait_for(wait_task, timeout=1)
+
+        self.assertEqual(["COINALPHA-HBOT", "COINBETA-HBOT"], list(pending.keys()))
+        self.assertEqual(2, self.dispatcher.pending_messages("COINALPHA-HBOT"))
+
+        wait_task = asyncio.get_event_loop().create_task(self.dispatcher.wait_for_pending_trading_pairs())
+        await asyncio.sleep(0)
+        self.assertFalse(wait_task.done())
+        wait_task.cancel()
+
+    async def test_drain_returns_messages_in_arrival_order(self):
+        await self.dispatcher.put(self._diff_message("COINALPHA-HBOT", 1))
+        await self.dispatcher.put(self._diff_message("COINALPHA-HBOT", 2))
+        pending = await self.dispatcher.wait_for_pending_trading_pairs()
+
+        messages, overflowed = self.dispatcher.drain("COINALPHA-HBOT", pending["COINALPHA-HBOT"])
+
+        self.assertEqual([1, 2], [message.update_id for message in messages])
+        self.assertFalse(overflowed)
+        self.assertEqual(0, self.dispatcher.pending_messages("COINALPHA-HBOT"))
+        self.assertEqual(2, self.dispatcher.stats["messages_drained"])
+        self.assertEqual(1, self.dispatcher.stats["batches_drained"])
+        self.assertGreaterEqual(self.dispatcher.stats["max_batch_latency"], 0)
+
+    async def test_full_buffer_drops_oldest_message_and_flags_overflow(self):
+        for update_id in range(1, 6):
+            self.dispatcher.put_nowait(self._diff_message("COINALPHA-HBOT", update_id))
+        pending = await self.dispatcher.wait_for_pending_trading_pairs()
+
+        messages, overflowed = self.dispatcher.drain("COINALPHA-HBOT", pending["COINALPHA-HBOT"])
+
+        self.assertEqual([3, 4, 5], [message.update_id for message in messages])
+        self.assertTrue(overflowed)
+        self.assertEqual(2, self.dispatcher.stats["messages_dropped"])
+        self.assertFalse(self.dispatcher.drain("COINALPHA-HBOT", pending["COINALPHA-HBOT"])[1])
+
+    async def test_notify_flags_trading_pair_with_buffered_messages(self):
+        self.dispatcher.put_nowait(self._diff_message("COINALPHA-HBOT", 1))
+        await self.dispatcher.wait_for_pending_trading_pairs()
+
+        self.dispatcher.notify("COINBETA-HBOT")
+        self.dispatcher.notify("COINALPHA-HBOT")
+        pending = await asyncio.wait_for(self.dispatcher.wait_for_pending_trading_pairs(), timeout=1)
+
+        self.assertEqual(["COINALPHA-HBOT"], list(pending.keys()))
@@ -0,0 +1,260 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.trading_pairs: List[str] = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+        self.snapshot_requests: Dict[str, asyncio.Future] = {}
+        self.data_source = MagicMock()
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._get_new_order_book)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    async def asyncTearDown(self) -> None:
+        self.tracker.stop()
+        await super().asyncTearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.snapshot_requests[trading_pair] = asyncio.get_event_loop().create_future()
+        return await self.snapshot_requests[trading_pair]
+
+    @staticmethod
+    async def _run_pending_tasks():
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    def _resolve_snapshot(self, trading_pair: str):
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["9", "1"]], [["11", "1"]], 1)
+        self.snapshot_requests[trading_pair].set_result(order_book)
+
+    async def test_init_order_books_requests_all_snapshots_concurrently(self):
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        await self._run_pending_tasks()
+
+        self.assertEqual(set(self.trading_pairs), set(self.snapshot_requests.keys()))
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+
+        self._resolve_snapshot("COINBETA-HBOT")
+        await self._run_pending_tasks()
+
+        self.assertEqual(["COINBETA-HBOT"], self.tracker.ready_trading_pairs)
+        self.assertTrue(self.tracker.is_trading_pair_ready("COINBETA-HBOT"))
+        self.assertFalse(self.tracker.is_trading_pair_ready("COINALPHA-HBOT"))
+        self.assertFalse(self.tracker.ready)
+        self.assertIn("COINBETA-HBOT", self.tracker.order_books)
+        self.assertIn("COINBETA-HBOT", self.tracker.order_book_init_durations)
+
+        self._resolve_snapshot("COINALPHA-HBOT")
+        self._resolve_snapshot("COINGAMMA-HBOT")
+        await init_task
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_book_init_durations.keys()))
+        self.assertTrue(self._is_logged("INFO", "Initialized order book for COINGAMMA-HBOT in "
+                                                f"{self.tracker.order_book_init_durations['COINGAMMA-HBOT']:.2f} "
+                                                "seconds. 3/3 completed."))
+
+    async def test_init_order_books_limits_concurrent_snapshot_requests(self):
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        await self._run_pending_tasks()
+
+        self.assertEqual(2, len(self.snapshot_requests))
+
+        self._resolve_snapshot(self.trading_pairs[0])
+        await self._run_pending_tasks()
+
+        self.assertEqual(3, len(self.snapshot_requests))
+
+        self._resolve_snapshot(self.trading_pairs[1])
+        self._resolve_snapshot(self.trading_pairs[2])
+        await init_task
+        self.assertTrue(self.tracker.ready)
+
+    async def test_init_order_books_retries_failed_snapshot_without_blocking_other_pairs(self):
+        self.tracker._sleep = AsyncMock()
+        failed_pairs = []
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            if trading_pair == "COINALPHA-HBOT" and not failed_pairs:
+                failed_pairs.append(trading_pair)
+                raise IOError("Test error")
+            return OrderBook()
+
+        self.data_source.get_new_order_book.side_effect = get_new_order_book
+
+        await self.tracker._init_order_books()
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(4, self.data_source.get_new_order_book.call_count)
+        self.tracker._sleep.assert_called_once_with(delay=self.tracker.SNAPSHOT_RETRY_INTERVAL)
+        self.assertTrue(self._is_logged("NETWORK", "Unexpected error initializing order book for COINALPHA-HBOT."))
+
+    async def test_wait_trading_pair_ready(self):
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        await self._run_pending_tasks()
+        wait_task = asyncio.get_event_loop().create_task(self.tracker.wait_trading_pair_ready("COINGAMMA-HBOT"))
+        await self._run_pending_tasks()
+        self.assertFalse(wait_task.done())
+
+        self._resolve_snapshot("COINGAMMA-HBOT")
+        await asyncio.wait_for(wait_task, timeout=1)
+        self.assertFalse(init_task.done())
+
+        init_task.cancel()
+
+    async def test_stop_clears_trading_pair_readiness(self):
+        self.data_source.get_new_order_book = AsyncMock(return_value=OrderBook())
+
+        await self.tracker._init_order_books()
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+
+        self.tracker.stop()
+
+        self.assertEqual([], self.tracker.ready_trading_pairs)
+        self.assertFalse(self.tracker.ready)
+
+    async def test_track_single_book_applies_raw_diff_rows(self):
+        self.data_source.get_new_order_book = AsyncMock(return_value=OrderBook())
+        await self.tracker._init_order_books()
+        trading_pair = self.trading_pairs[0]
+
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "update_id": 2,
+            "bids": [["10.5", "2"]],
+            "asks": [["11.5", "3", "ignored"]],
+        }, timestamp=1)
+        await self.tracker._tracking_message_queues[trading_pair].put(diff)
+        await asyncio.sleep(0.01)
+
+        order_book = self.tracker.order_books[trading_pair]
+        self.assertEqual(10.5, order_book.get_price(False))
+        self.assertEqual(11.5, order_book.get_price(True))
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def _diff_message(self, trading_pair: str, update_id: int, bids: List, asks: List) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=update_id)
+
+    async def _start_direct_dispatch(self) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs, direct_dispatch=True)
+        tracker.logger().addHandler(self)
+        self.data_source.get_new_order_book = AsyncMock(side_effect=lambda trading_pair: OrderBook())
+        tracker._order_book_dispatch_task = asyncio.get_event_loop().create_task(tracker._order_book_dispatch_loop())
+        return tracker
+
+    async def test_direct_dispatch_coalesces_diffs_of_the_same_batch(self):
+        tracker = await self._start_direct_dispatch()
+        await tracker._init_order_books()
+        trading_pair = self.trading_pairs[0]
+        dispatcher = tracker._message_dispatcher
+
+        dispatcher.put_nowait(self._diff_message(trading_pair, 2, [["10", "1"], ["9", "1"]], [["11", "1"]]))
+        dispatcher.put_nowait(self._diff_message(trading_pair, 3, [["10.0", "2"]], [["11", "0"], ["12", "3"]]))
+        dispatcher.put_nowait(self._diff_message(trading_pair, 4, [["9", "0"]], []))
+        await self._run_pending_tasks()
+
+        order_book = tracker.order_books[trading_pair]
+        self.assertEqual([(10, 2)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(12, 3)], [(row.price, row.amount) for row in order_book.ask_entries()])
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(3, len(tracker._past_diffs_windows[trading_pair]))
+
+        stats = tracker.dispatch_stats
+        self.assertEqual(3, stats["messages_received"])
+        self.assertEqual(3, stats["messages_drained"])
+        self.assertEqual(1, stats["batches_drained"])
+        self.assertEqual(3, stats["diffs_applied"])
+        self.assertEqual(3, stats["levels_coalesced"])
+        tracker.stop()
+
+    async def test_direct_dispatch_keeps_messages_until_order_book_is_initialized(self):
+        tracker = await self._start_direct_dispatch()
+        trading_pair = self.trading_pairs[0]
+        tracker._message_dispatcher.put_nowait(self._diff_message(trading_pair, 2, [["10", "1"]], [["11", "1"]]))
+        await self._run_pending_tasks()
+
+        self.assertEqual(1, tracker._message_dispatcher.pending_messages(trading_pair))
+
+        await tracker._init_order_books()
+        await self._run_pending_tasks()
+
+        self.assertEqual(0, tracker._message_dispatcher.pending_messages(trading_pair))
+        self.assertEqual(10, tracker.order_books[trading_pair].get_price(False))
+        tracker.stop()
+
+    async def test_direct_dispatch_rejects_diffs_older_than_snapshot_and_replays_diffs_after_snapshot(self):
+        tracker = await self._start_direct_dispatch()
+        await tracker._init_order_books()
+        trading_pair = self.trading_pairs[0]
+        dispatcher = tracker._message_dispatcher
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": 5,
+            "bids": [["9", "1"]],
+            "asks": [["12", "1"]],
+        }, timestamp=5)
+
+        dispatcher.put_nowait(self._diff_message(trading_pair, 6, [["10", "1"]], []))
+        dispatcher.put_nowait(snapshot)
+        dispatcher.put_nowait(self._diff_message(trading_pair, 4, [["8", "1"]], []))
+        dispatcher.put_nowait(self._diff_message(trading_pair, 7, [], [["11", "1"]]))
+        await self._run_pending_tasks()
+
+        order_book = tracker.order_books[trading_pair]
+        self.assertEqual([10, 9], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([11, 12], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(5, order_book.snapshot_uid)
+        self.assertEqual(1, tracker.dispatch_stats["diffs_rejected"])
+        self.assertEqual(1, tracker.dispatch_stats["snapshots_applied"])
+        tracker.stop()
+
+    async def test_direct_dispatch_requests_new_snapshot_when_buffer_overflows(self):
+        tracker = await self._start_direct_dispatch()
+        await tracker._init_order_books()
+        trading_pair = self.trading_pairs[0]
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": 100,
+            "bids": [["5", "1"]],
+            "asks": [["6", "1"]],
+        }, timestamp=100)
+        self.data_source._order_book_snapshot = AsyncMock(return_value=snapshot)
+
+        for update_id in range(1, tracker.DISPATCH_BUFFER_SIZE + 2):
+            tracker._message_dispatcher.put_nowait(self._diff_message(trading_pair, update_id, [["4", "1"]], []))
+        await self._run_pending_tasks()
+
+        self.data_source._order_book_snapshot.assert_awaited_once_with(trading_pair=trading_pair)
+        self.assertTrue(self._is_logged("WARNING", f"The order book messages buffer of {trading_pair} is full. "
+                                                   f"Requesting a new snapshot."))
+        order_book = tracker.order_books[trading_pair]
+        self.assertEqual(100, order_book.snapshot_uid)
+        self.assertEqual(5, order_book.get_price(False))
+        self.assertEqual(1, tracker.dispatch_stats["messages_dropped"])
+        tracker.stop()
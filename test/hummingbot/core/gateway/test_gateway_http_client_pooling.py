@@ -0,0 +1,128 @@
+import asyncio
+from typing import Awaitable
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+
+
+class GatewayHttpClientPoolingTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.previous_instance = GatewayHttpClient._GatewayHttpClient__instance
+        GatewayHttpClient._GatewayHttpClient__instance = None
+        self.client = GatewayHttpClient(ClientConfigAdapter(ClientConfigMap()))
+        self.session = MagicMock()
+        self.session.get = AsyncMock(side_effect=self.response)
+        self.session.request = AsyncMock(side_effect=self.response)
+        http_client_patch = patch.object(GatewayHttpClient, "_http_client", return_value=self.session)
+        http_client_patch.start()
+        self.addCleanup(http_client_patch.stop)
+
+    def tearDown(self) -> None:
+        GatewayHttpClient._GatewayHttpClient__instance = self.previous_instance
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    async def response(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        response = MagicMock()
+        response.status = 200
+        response.json = AsyncMock(return_value={"txHash": kwargs.get("json", {}).get("txHash"), "status": "ok"})
+        return response
+
+    def test_concurrent_identical_read_requests_are_coalesced(self):
+        responses = self.async_run_with_timeout(asyncio.gather(
+            self.client.api_request("get", "chain/status", {"chain": "ethereum", "network": "mainnet"}),
+            self.client.api_request("get", "chain/status", {"network": "mainnet", "chain": "ethereum"}),
+            self.client.api_request("get", "chain/status", {"chain": "ethereum", "network": "goerli"}),
+            self.client.api_request("post", "chain/poll", {"txHash": "0x1"}),
+            self.client.api_request("post", "chain/poll", {"txHash": "0x1"}),
+        ))
+
+        self.assertEqual(2, self.session.get.await_count)
+        self.assertEqual(1, self.session.request.await_count)
+        self.assertEqual(responses[0], responses[1])
+        self.assertIsNot(responses[0], responses[1])
+        self.assertEqual(responses[3], responses[4])
+        self.assertIsNot(responses[3], responses[4])
+        self.assertEqual({}, self.client._in_flight_requests)
+
+        self.async_run_with_timeout(self.client.api_request("post", "chain/poll", {"txHash": "0x1"}))
+        self.assertEqual(2, self.session.request.await_count)
+
+    def test_coalesced_responses_can_be_modified_by_each_caller(self):
+        async def modify_response():
+            response = await self.client.api_request("get", "chain/status")
+            response["status"] = "modified"
+            return response
+
+        responses = self.async_run_with_timeout(asyncio.gather(
+            modify_response(),
+            self.client.api_request("get", "chain/status"),
+        ))
+
+        self.assertEqual(1, self.session.get.await_count)
+        self.assertEqual("modified", responses[0]["status"])
+        self.assertEqual("ok", responses[1]["status"])
+
+    def test_requests_that_change_state_are_not_coalesced(self):
+        self.async_run_with_timeout(asyncio.gather(
+            self.client.api_request("post", "amm/trade", {"amount": "1"}),
+            self.client.api_request("post", "amm/trade", {"amount": "1"}),
+        ))
+
+        self.assertEqual(2, self.session.request.await_count)
+        self.session.request.assert_awaited_with("POST", "https://localhost:15888/amm/trade", json={"amount": "1"})
+
+    def test_get_transaction_statuses(self):
+        async def poll_response(method, url, json):
+            if json["txHash"] == "0x2":
+                raise IOError("Connection error")
+            return await self.response(json=json)
+
+        self.session.request.side_effect = poll_response
+
+        statuses = self.async_run_with_timeout(self.client.get_transaction_statuses(
+            "ethereum", "mainnet", ["0x1", "0x2", "0x1"], fail_silently=True
+        ))
+
+        self.assertEqual(2, self.session.request.await_count)
+        self.assertEqual("0x1", statuses[0]["txHash"])
+        self.assertEqual({}, statuses[1])
+        self.assertEqual(statuses[0], statuses[2])
+        self.assertIsNot(statuses[0], statuses[2])
+
+    def test_latency_histograms_by_endpoint(self):
+        self.async_run_with_timeout(asyncio.gather(
+            self.client.api_request("post", "chain/poll", {"txHash": "0x1"}),
+            self.client.api_request("post", "chain/poll", {"txHash": "0x2"}),
+            self.client.api_request("get", "chain/status"),
+        ))
+
+        histograms = self.client.latency_histograms
+        self.assertEqual({"POST chain/poll", "GET chain/status"}, set(histograms.keys()))
+        self.assertEqual(2, histograms["POST chain/poll"].count)
+        self.assertEqual(1, histograms["GET chain/status"].count)
+        self.assertGreater(histograms["GET chain/status"].mean_ms, 0)
+
+    def test_failed_requests_are_raised_to_all_the_callers(self):
+        self.session.get.side_effect = IOError("Connection error")
+
+        with patch.object(GatewayHttpClient, "logger"):
+            results = self.async_run_with_timeout(asyncio.gather(
+                self.client.api_request("get", "chain/status"),
+                self.client.api_request("get", "chain/status"),
+                return_exceptions=True,
+            ))
+
+        self.assertEqual(1, self.session.get.await_count)
+        self.assertTrue(all(isinstance(result, IOError) for result in results))
+        self.assertEqual(1, self.client.latency_histograms["GET chain/status"].count)
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from hummingbot.core.gateway.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTests(TestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.mean_ms)
+        self.assertEqual(0, histogram.percentile_ms(50))
+
+    def test_latencies_are_counted_in_buckets(self):
+        histogram = LatencyHistogram()
+        for latency in [3, 5, 7, 40, 120, 45000]:
+            histogram.add(latency)
+
+        buckets = histogram.buckets
+        self.assertEqual(2, buckets[5])
+        self.assertEqual(1, buckets[10])
+        self.assertEqual(1, buckets[50])
+        self.assertEqual(1, buckets[250])
+        self.assertEqual(1, buckets[float("inf")])
+        self.assertEqual(6, histogram.count)
+        self.assertEqual(45000, histogram.max_ms)
+        self.assertAlmostEqual((3 + 5 + 7 + 40 + 120 + 45000) / 6, histogram.mean_ms)
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for latency in [2] * 90 + [80] * 9 + [45000]:
+            histogram.add(latency)
+
+        self.assertEqual(5, histogram.percentile_ms(0))
+        self.assertEqual(5, histogram.percentile_ms(50))
+        self.assertEqual(5, histogram.percentile_ms(90))
+        self.assertEqual(100, histogram.percentile_ms(99))
+        self.assertEqual(45000, histogram.percentile_ms(100))
+        self.assertEqual(
+            {"count": 100, "mean_ms": 459.0, "p50_ms": 5, "p90_ms": 5, "p99_ms": 100, "max_ms": 45000},
+            histogram.to_dict())
@@ -7,9 +7,22 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class TickRecorder(PyTimeIterator):
+
+    def __init__(self):
+        super().__init__()
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +137,79 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def _run_event_driven_clock(self, clock: Clock, duration: float, actions):
+        async def run_actions():
+            for delay, action in actions:
+                await asyncio.sleep(delay)
+                action()
+
+        async def run():
+            with clock:
+                # run() only returns when the clock is stopped
+                with self.assertRaises(asyncio.TimeoutError):
+                    await asyncio.wait_for(asyncio.gather(clock.run(), run_actions()), duration)
+
+        self.ev_loop.run_until_complete(run())
+
+    def test_request_tick_ignored_without_event_driven_mode(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=1000)
+        iterator = TickRecorder()
+        clock.add_iterator(iterator)
+
+        self._run_event_driven_clock(clock, 0.2, [(0.05, lambda: clock.request_tick(iterator))])
+
+        self.assertFalse(clock.event_driven)
+        self.assertEqual([], iterator.ticks)
+
+    def test_event_driven_tick_runs_as_soon_as_requested(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=1000, event_driven=True, min_event_tick_interval=0.05)
+        iterator = TickRecorder()
+        other_iterator = TickRecorder()
+        clock.add_iterator(iterator)
+        clock.add_iterator(other_iterator)
+        requested_at = []
+
+        def request_tick():
+            requested_at.append(time.time())
+            clock.request_tick(iterator)
+
+        self._run_event_driven_clock(clock, 0.2, [(0.05, request_tick)])
+
+        self.assertEqual(1, len(iterator.ticks))
+        self.assertGreaterEqual(iterator.ticks[0], requested_at[0])
+        self.assertLess(iterator.ticks[0] - requested_at[0], 0.05)
+        self.assertEqual([], other_iterator.ticks)
+
+    def test_event_driven_ticks_are_coalesced_and_spaced_by_min_interval(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=1000, event_driven=True, min_event_tick_interval=0.1)
+        iterator = TickRecorder()
+        clock.add_iterator(iterator)
+
+        def request_ticks():
+            for _ in range(3):
+                clock.request_tick(iterator)
+
+        self._run_event_driven_clock(clock, 0.35, [(0.02, request_ticks), (0.01, request_ticks), (0, request_ticks)])
+
+        self.assertEqual(2, len(iterator.ticks))
+        self.assertGreaterEqual(iterator.ticks[1] - iterator.ticks[0], 0.1)
+
+    def test_event_driven_ticks_on_subscribed_events(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=1000, event_driven=True, min_event_tick_interval=0.01)
+        iterator = TickRecorder()
+        clock.add_iterator(iterator)
+        order_book = OrderBook()
+        order_book.apply_raw_snapshot([["10", "1"], ["9", "1"]], [["11", "1"]], 1)
+        clock.subscribe_iterator_to_events(iterator, order_book, [OrderBookEvent.TopOfBookChangedEvent])
+
+        self._run_event_driven_clock(clock, 0.3, [
+            # Changes below the top of the book do not trigger a tick
+            (0.05, lambda: order_book.apply_raw_diffs([["9", "2"]], [], 2)),
+            (0.05, lambda: order_book.apply_raw_diffs([["10.5", "1"]], [], 3)),
+        ])
+
+        self.assertEqual(1, len(iterator.ticks))
+
+        clock.remove_iterator(iterator)
+        self.assertEqual([], order_book.get_listeners(OrderBookEvent.TopOfBookChangedEvent))
@@ -89,6 +89,59 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_trigger_event_reaches_listeners_added_after_previous_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+    def test_trigger_event_skips_listeners_removed_after_previous_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(2, len(self.listener_one.event_log))
+        self.assertEqual(2, self.pubsub.get_dispatch_stats(self.event_tag_zero)["events_triggered"])
+        self.assertEqual(3, self.pubsub.get_dispatch_stats(self.event_tag_zero)["listener_calls"])
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_dispatch_stats(self):
+        self.assertEqual(0, self.pubsub.get_dispatch_stats(self.event_tag_zero)["events_triggered"])
+
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_one, self.event)
+
+        stats = self.pubsub.get_dispatch_stats(self.event_tag_zero)
+        self.assertEqual(2, stats["events_triggered"])
+        self.assertEqual(4, stats["listener_calls"])
+        self.assertGreater(stats["total_dispatch_time"], 0)
+        self.assertLessEqual(stats["max_dispatch_time"], stats["total_dispatch_time"])
+        stats = self.pubsub.get_dispatch_stats(self.event_tag_one)
+        self.assertEqual(1, stats["events_triggered"])
+        self.assertEqual(0, stats["listener_calls"])
+
+        self.pubsub.reset_dispatch_stats()
+        self.assertEqual(0, self.pubsub.get_dispatch_stats(self.event_tag_zero)["events_triggered"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -136,6 +136,21 @@ class TestKrakenSpotCandles(unittest.TestCase):
     def test_candles_empty(self):
         self.assertTrue(self.data_feed.candles_df.empty)
 
+    def test_candles_df_and_candles_df_view_have_the_timestamp_in_milliseconds(self):
+        self.data_feed._candles.append([1706378400, 41793.3, 41800.0, 41780.0, 41790.0, 1.0, 0, 10, 0, 0])
+        self.data_feed._candles.appendleft([1706374800, 41803.5, 41849.7, 41782.9, 41784.0, 0.5, 0, 87, 0, 0])
+
+        view = self.data_feed.candles_df_view
+        self.assertEqual([1706374800000, 1706378400000], view["timestamp"].tolist())
+        self.assertEqual(view["timestamp"].tolist(), self.data_feed.candles_df["timestamp"].tolist())
+        self.assertIs(view, self.data_feed.candles_df_view)
+
+        self.data_feed._candles.update_last([1706378400, 41793.3, 41800.0, 41780.0, 41795.0, 2.0, 0, 11, 0, 0])
+
+        self.assertIsNot(view, self.data_feed.candles_df_view)
+        self.assertEqual(41795.0, self.data_feed.candles_df_view["close"].iloc[-1])
+        self.assertEqual([1706374800000, 1706378400000], self.data_feed.candles_df_view["timestamp"].tolist())
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_subscriptions_subscribes_to_klines(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
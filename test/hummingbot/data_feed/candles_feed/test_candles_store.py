@@ -0,0 +1,81 @@
+from collections import deque
+from unittest import TestCase
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.columns = ["timestamp", "open", "close"]
+        self.store = CandlesStore(columns=self.columns, max_records=3)
+
+    @staticmethod
+    def candle(timestamp: float):
+        return [timestamp, timestamp + 0.1, timestamp + 0.2]
+
+    def test_behaves_like_a_deque_with_maxlen(self):
+        candles_deque = deque(maxlen=3)
+        operations = [
+            ("append", self.candle(3)),
+            ("extendleft", [self.candle(2), self.candle(1)]),
+            ("append", self.candle(4)),
+            ("append", self.candle(5)),
+            ("extendleft", [self.candle(2)]),
+            ("pop", None),
+            ("appendleft", self.candle(1)),
+            ("extend", [self.candle(2), self.candle(3)]),
+            ("extend", [self.candle(i) for i in range(4, 9)]),
+            ("extendleft", [self.candle(i) for i in range(1, 6)]),
+            ("popleft", None),
+            ("extend", np.array([self.candle(9)])),
+        ]
+        for operation, argument in operations:
+            args = () if argument is None else (argument,)
+            getattr(candles_deque, operation)(*args)
+            getattr(self.store, operation)(*args)
+            self.assertEqual(len(candles_deque), len(self.store))
+            self.assertEqual(np.array(candles_deque).tolist(), self.store.to_array().tolist())
+
+        self.assertEqual(3, self.store.maxlen)
+        self.assertEqual(self.candle(4), self.store[0].tolist())
+        self.assertEqual(self.candle(9), self.store[-1].tolist())
+        with self.assertRaises(IndexError):
+            self.store[3]
+
+    def test_update_last_replaces_newest_candle(self):
+        self.store.extend([self.candle(1), self.candle(2)])
+
+        self.store.update_last([2, 5, 6])
+
+        self.assertEqual([self.candle(1), [2, 5, 6]], self.store.to_array().tolist())
+        with self.assertRaises(IndexError):
+            CandlesStore(columns=self.columns, max_records=3).update_last(self.candle(1))
+
+    def test_dataframe_cached_until_store_changes(self):
+        self.store.extend([self.candle(1), self.candle(2)])
+        version = self.store.version
+
+        df = self.store.dataframe
+
+        self.assertIs(df, self.store.dataframe)
+        self.assertEqual(version, self.store.version)
+        self.assertEqual(self.columns, list(df.columns))
+        self.assertEqual([1, 2], df["timestamp"].tolist())
+
+        self.store.update_last([2, 5, 6])
+
+        self.assertGreater(self.store.version, version)
+        self.assertIsNot(df, self.store.dataframe)
+        self.assertEqual([0.2 + 1, 6], self.store.dataframe["close"].tolist())
+
+    def test_clear(self):
+        self.store.extend([self.candle(1), self.candle(2)])
+
+        self.store.clear()
+
+        self.assertEqual(0, len(self.store))
+        self.assertTrue(self.store.dataframe.empty)
@@ -0,0 +1,180 @@
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_queue import SQLWriteQueue, call_after_commit
+
+
+class SQLWriteQueueTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        # The worker thread needs a database shared between threads, which in-memory SQLite databases are not
+        self.db_dir = tempfile.TemporaryDirectory()
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(self.db_dir.name, 'test.sqlite')}")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.write_queue = SQLWriteQueue(self.manager, max_queue_size=100, max_batch_size=10, flush_interval=0.1)
+
+    def tearDown(self) -> None:
+        self.write_queue.stop()
+        self.manager.engine.dispose()
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def market_state_write(market: str, timestamp: int):
+        def write(session):
+            record = (session.query(MarketState)
+                      .filter(MarketState.market == market)
+                      .one_or_none())
+            if record is None:
+                session.add(MarketState(config_file_path="test_config",
+                                        market=market,
+                                        timestamp=timestamp,
+                                        saved_state={"timestamp": timestamp}))
+            else:
+                record.timestamp = timestamp
+                record.saved_state = {"timestamp": timestamp}
+        return write
+
+    def stored_market_states(self):
+        with self.manager.get_new_session() as session:
+            return {record.market: record.timestamp for record in session.query(MarketState).all()}
+
+    def test_writes_applied_immediately_when_not_running(self):
+        self.write_queue.put(self.market_state_write("market_1", 1))
+
+        self.assertEqual({"market_1": 1}, self.stored_market_states())
+        self.assertEqual(1, self.write_queue.metrics["writes_committed"])
+
+    def test_writes_committed_in_batches_on_flush(self):
+        self.write_queue.start()
+        for i in range(25):
+            self.write_queue.put(self.market_state_write(f"market_{i}", i))
+
+        self.assertTrue(self.write_queue.flush(timeout=5))
+
+        self.assertEqual(25, len(self.stored_market_states()))
+        metrics = self.write_queue.metrics
+        self.assertEqual(25, metrics["writes_queued"])
+        self.assertEqual(25, metrics["writes_committed"])
+        self.assertGreaterEqual(metrics["batches_committed"], 3)
+        self.assertEqual(0, metrics["queue_depth"])
+        self.assertGreater(metrics["max_commit_latency"], 0)
+
+    def test_keyed_writes_are_coalesced(self):
+        worker_blocked = threading.Event()
+        release_worker = threading.Event()
+
+        def blocking_write(session):
+            worker_blocked.set()
+            release_worker.wait(5)
+
+        self.write_queue.start()
+        self.write_queue.put(blocking_write)
+        self.assertTrue(worker_blocked.wait(5))
+        for timestamp in range(1, 4):
+            self.write_queue.put(self.market_state_write("market_1", timestamp), key="market_1")
+        release_worker.set()
+
+        self.assertTrue(self.write_queue.flush(timeout=5))
+
+        self.assertEqual({"market_1": 3}, self.stored_market_states())
+        self.assertEqual(2, self.write_queue.metrics["writes_committed"])
+
+    def test_stop_commits_pending_writes(self):
+        self.write_queue.start()
+        for i in range(5):
+            self.write_queue.put(self.market_state_write(f"market_{i}", i))
+
+        self.write_queue.stop()
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual(5, len(self.stored_market_states()))
+
+    def test_failing_write_does_not_discard_batch(self):
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        self.write_queue.start()
+        with patch.object(SQLWriteQueue, "logger"):
+            self.write_queue.put(self.market_state_write("market_1", 1))
+            self.write_queue.put(failing_write)
+            self.write_queue.put(self.market_state_write("market_2", 2))
+            self.assertTrue(self.write_queue.flush(timeout=5))
+
+        self.assertEqual({"market_1": 1, "market_2": 2}, self.stored_market_states())
+        self.assertEqual(2, self.write_queue.metrics["writes_committed"])
+        self.assertEqual(1, self.write_queue.metrics["writes_failed"])
+
+    def test_after_commit_callbacks_called_once_for_committed_writes(self):
+        committed = []
+
+        def write_with_callback(market: str, fail: bool = False):
+            def write(session):
+                self.market_state_write(market, 1)(session)
+                call_after_commit(session, lambda: committed.append(market))
+                if fail:
+                    raise ValueError("Invalid record")
+            return write
+
+        self.write_queue.start()
+        with patch.object(SQLWriteQueue, "logger"):
+            self.write_queue.put(write_with_callback("market_1"))
+            self.write_queue.put(write_with_callback("market_2", fail=True))
+            self.write_queue.put(write_with_callback("market_3"))
+            self.assertTrue(self.write_queue.flush(timeout=5))
+
+        self.assertEqual({"market_1": 1, "market_3": 1}, self.stored_market_states())
+        self.assertEqual(["market_1", "market_3"], committed)
+
+    def test_put_waits_a_bounded_time_when_the_queue_is_full(self):
+        worker_blocked = threading.Event()
+        release_worker = threading.Event()
+
+        def blocking_write(session):
+            worker_blocked.set()
+            release_worker.wait(5)
+
+        write_queue = SQLWriteQueue(self.manager, max_queue_size=2, max_batch_size=1, flush_interval=0.1,
+                                    max_put_wait=0.05)
+        write_queue.start()
+        self.addCleanup(write_queue.stop)
+        write_queue.put(blocking_write)
+        self.assertTrue(worker_blocked.wait(5))
+
+        with patch.object(SQLWriteQueue, "logger"):
+            start = time.perf_counter()
+            for i in range(4):
+                write_queue.put(self.market_state_write(f"market_{i}", i))
+            elapsed = time.perf_counter() - start
+        release_worker.set()
+
+        self.assertLess(elapsed, 1)
+        self.assertEqual(2, write_queue.metrics["queue_full_count"])
+        self.assertTrue(write_queue.flush(timeout=5))
+        self.assertEqual(4, len(self.stored_market_states()))
+
+    def test_on_commit_called_after_each_batch(self):
+        on_commit = MagicMock()
+        write_queue = SQLWriteQueue(self.manager, max_batch_size=10, flush_interval=0.1, on_commit=on_commit)
+        write_queue.start()
+        self.addCleanup(write_queue.stop)
+        for i in range(15):
+            write_queue.put(self.market_state_write(f"market_{i}", i))
+
+        self.assertTrue(write_queue.flush(timeout=5))
+
+        self.assertEqual(write_queue.metrics["batches_committed"], on_commit.call_count)
@@ -148,6 +148,30 @@ class TestPositionExecutor(IsolatedAsyncioWrapperTestCase):
         position_executor._strategy.cancel.assert_not_called()
         position_executor.stop()
 
+    def test_amend_open_order(self):
+        position_config = self.get_position_config_market_short()
+        position_executor = PositionExecutor(self.strategy, position_config)
+        position_executor.open_order.order_id = "OID-SELL-1"
+        new_position_config = PositionExecutorConfig(id="new", timestamp=1234567900, trading_pair="ETH-USDT",
+                                                     exchange="binance", side=TradeType.SELL,
+                                                     entry_price=Decimal("101"), amount=Decimal("2"),
+                                                     stop_loss=Decimal("0.05"), take_profit=Decimal("0.1"),
+                                                     time_limit=60, take_profit_order_type=OrderType.LIMIT,
+                                                     stop_loss_order_type=OrderType.MARKET)
+
+        position_executor.amend_open_order(new_position_config)
+
+        position_executor._strategy.amend.assert_called_once_with(
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            order_id="OID-SELL-1",
+            price=Decimal("101"),
+            amount=Decimal("2"))
+        self.assertEqual("test-2", position_executor.config.id)
+        self.assertEqual(1234567900, position_executor.config.timestamp)
+        self.assertEqual("OID-SELL-1", position_executor.open_order.order_id)
+        self.assertEqual(PositionExecutorStatus.NOT_STARTED, position_executor.executor_status)
+
     @patch("hummingbot.smart_components.executors.position_executor.position_executor.PositionExecutor.get_price", return_value=Decimal("101"))
     async def test_control_position_active_position_create_take_profit(self, _):
         position_config = self.get_position_config_market_short()
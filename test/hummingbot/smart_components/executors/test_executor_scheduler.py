@@ -0,0 +1,144 @@
+import asyncio
+import time
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import BuyOrderCreatedEvent, MarketEvent, OrderCancelledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.smart_components.executors.data_types import ExecutorConfigBase
+from hummingbot.smart_components.executors.executor_base import ExecutorBase
+from hummingbot.smart_components.executors.executor_scheduler import ExecutorScheduler
+from hummingbot.smart_components.models.base import SmartComponentStatus
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class RecordingExecutor(ExecutorBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+        self.events = []
+
+    def on_start(self):
+        self.calls.append("on_start")
+
+    def on_stop(self):
+        self.calls.append("on_stop")
+
+    async def control_task(self):
+        self.calls.append("control_task")
+
+    def process_order_created_event(self, event_tag, market, event):
+        self.events.append(event)
+
+    def process_order_canceled_event(self, event_tag, market, event):
+        self.events.append(event)
+
+
+class SlowExecutor(RecordingExecutor):
+    async def control_task(self):
+        await asyncio.sleep(0.2)
+        self.calls.append("control_task")
+
+
+class TestExecutorScheduler(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.scheduler = ExecutorScheduler()
+        # The passes are run manually by the tests
+        self.scheduler._tick_loop = AsyncMock()
+        self.connector = PubSub()
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.connectors = {"connector1": self.connector}
+        self.strategy.buy.side_effect = ["OID-1", "OID-2"]
+
+    def create_executor(self, executor_id: str, executor_class=RecordingExecutor) -> RecordingExecutor:
+        executor = executor_class(strategy=self.strategy, connectors=["connector1"],
+                                  config=ExecutorConfigBase(id=executor_id, type="test", timestamp=1234567890),
+                                  update_interval=0.5)
+        executor._scheduler = self.scheduler
+        return executor
+
+    def buy(self, executor: ExecutorBase) -> str:
+        return executor.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                    side=TradeType.BUY, amount=Decimal("1"), price=Decimal("1000"))
+
+    async def test_tick_runs_all_executors(self):
+        executors = [self.create_executor("1"), self.create_executor("2")]
+        for executor in executors:
+            executor.start()
+
+        await self.scheduler.tick(0.5)
+        await self.scheduler.tick(0.5)
+
+        for executor in executors:
+            self.assertEqual(["on_start", "control_task", "control_task"], executor.calls)
+            self.assertEqual(2, executor.timing_stats.ticks)
+            self.assertGreaterEqual(executor.timing_stats.max_time, executor.timing_stats.average_time)
+        self.assertEqual(["1", "2"], list(self.scheduler.timing_stats.keys()))
+
+    async def test_slow_executor_does_not_delay_the_other_executors(self):
+        slow_executors = [self.create_executor("1", SlowExecutor), self.create_executor("2", SlowExecutor)]
+        fast_executor = self.create_executor("3")
+        for executor in slow_executors + [fast_executor]:
+            executor.start()
+
+        start = time.perf_counter()
+        await self.scheduler.tick(0.5)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.35)
+        for executor in slow_executors:
+            self.assertEqual(["on_start", "control_task"], executor.calls)
+            self.assertGreaterEqual(executor.timing_stats.last_time, 0.2)
+        self.assertEqual(["on_start", "control_task"], fast_executor.calls)
+        self.assertLess(fast_executor.timing_stats.last_time, 0.1)
+
+    async def test_starting_an_executor_twice_schedules_it_once(self):
+        executor = self.create_executor("1")
+        executor.start()
+        executor.start()
+
+        self.assertEqual(SmartComponentStatus.RUNNING, executor.status)
+        self.assertEqual([executor], self.scheduler.executors)
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderCancelled)))
+        executor.stop()
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderCancelled)))
+
+    async def test_terminated_executor_is_stopped_and_removed(self):
+        executor = self.create_executor("1")
+        executor.start()
+        await self.scheduler.tick(0.5)
+
+        executor.stop()
+        await self.scheduler.tick(0.5)
+        await self.scheduler.tick(0.5)
+
+        self.assertEqual(SmartComponentStatus.TERMINATED, executor.status)
+        self.assertEqual(["on_start", "control_task", "on_stop"], executor.calls)
+        self.assertEqual([], self.scheduler.executors)
+
+    async def test_order_events_are_routed_to_the_executor_that_placed_the_order(self):
+        first_executor = self.create_executor("1")
+        second_executor = self.create_executor("2")
+        first_executor.start()
+        second_executor.start()
+        order_id = self.buy(first_executor)
+
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.BuyOrderCreated)))
+        created_event = BuyOrderCreatedEvent(1, OrderType.LIMIT, "ETH-USDT", Decimal("1"), Decimal("1000"), order_id, 1)
+        self.connector.trigger_event(MarketEvent.BuyOrderCreated, created_event)
+        self.connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(1, "OID-OTHER"))
+
+        self.assertEqual([created_event], first_executor.events)
+        self.assertEqual([], second_executor.events)
+
+        first_executor.stop()
+        self.connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(1, order_id))
+
+        self.assertEqual([created_event], first_executor.events)
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderCancelled)))
+        second_executor.stop()
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderCancelled)))
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.smart_components.indicators import BBANDS, MACD, CandlesIndicators
+
+
+class CandlesFeedStub:
+    def __init__(self, max_records: int):
+        self.candles_store = CandlesStore(columns=CandlesBase.columns, max_records=max_records)
+
+    @property
+    def candles_version(self):
+        return self.candles_store.version
+
+    @property
+    def candles_df(self):
+        return self.candles_store.dataframe.copy()
+
+
+class CandlesIndicatorsTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.feed = CandlesFeedStub(max_records=50)
+        self.engine = CandlesIndicators([BBANDS(length=10, std=2.0), MACD(fast=3, slow=6, signal=4)])
+        rng = np.random.default_rng(7)
+        self.closes = 100 + np.cumsum(rng.normal(0, 1, 80))
+
+    @staticmethod
+    def candle(timestamp: int, close: float):
+        return [timestamp, close, close + 1, close - 1, close, 1, 1, 1, 1, 1]
+
+    def recomputed_df(self) -> pd.DataFrame:
+        engine = CandlesIndicators([BBANDS(length=10, std=2.0), MACD(fast=3, slow=6, signal=4)])
+        return engine.get_processed_candles_df(self.feed)
+
+    def test_updates_of_the_last_candle_are_applied(self):
+        final_candles_feed = CandlesFeedStub(max_records=50)
+        final_candles_engine = CandlesIndicators([BBANDS(length=10, std=2.0), MACD(fast=3, slow=6, signal=4)])
+        for i, close in enumerate(self.closes):
+            final_candles_feed.candles_store.append(self.candle(i, close))
+            final_candles_engine.update(final_candles_feed)
+            self.feed.candles_store.append(self.candle(i, close - 0.5))
+            self.engine.update(self.feed)
+            self.feed.candles_store.update_last(self.candle(i, close))
+            if i % 3 == 0:
+                self.engine.update(self.feed)
+
+        with patch.object(CandlesIndicators, "_recompute", wraps=self.engine._recompute) as recompute_mock:
+            result = self.engine.get_processed_candles_df(self.feed)
+            recompute_mock.assert_not_called()
+
+        self.assertEqual(50, len(result))
+        self.assertIn("BBP_10_2.0", result.columns)
+        self.assertIn("MACDh_3_6_4", result.columns)
+        pd.testing.assert_frame_equal(final_candles_engine.get_processed_candles_df(final_candles_feed), result)
+
+    def test_indicators_keep_the_history_dropped_from_the_candles(self):
+        for i, close in enumerate(self.closes):
+            self.feed.candles_store.append(self.candle(i, close))
+            self.engine.update(self.feed)
+
+        result = self.engine.get_processed_candles_df(self.feed)
+
+        # The first candles of the window have values, computed with the candles that were dropped from the store
+        self.assertFalse(result["BBP_10_2.0"].isna().any())
+        bb_columns = [column for column in result.columns if column.startswith("BB")]
+        pd.testing.assert_frame_equal(self.recomputed_df()[bb_columns].iloc[9:], result[bb_columns].iloc[9:])
+
+    def test_history_change_triggers_recomputation(self):
+        for i, close in enumerate(self.closes[40:60]):
+            self.feed.candles_store.append(self.candle(40 + i, close))
+        self.engine.update(self.feed)
+
+        # Historical candles added before the existing ones
+        self.feed.candles_store.extendleft(self.candle(i, close) for i, close in reversed(list(enumerate(self.closes[:40]))))
+        result = self.engine.get_processed_candles_df(self.feed)
+
+        self.assertEqual(50, len(result))
+        pd.testing.assert_frame_equal(self.recomputed_df(), result)
+
+    def test_processed_candles_are_a_copy(self):
+        self.feed.candles_store.extend(self.candle(i, close) for i, close in enumerate(self.closes[:20]))
+
+        result = self.engine.get_processed_candles_df(self.feed)
+        result["signal"] = 1
+
+        self.assertNotIn("signal", self.engine.get_processed_candles_df(self.feed).columns)
@@ -0,0 +1,123 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.smart_components.indicators import BBANDS, EMA, MACD, NATR, RSI, SMA, STDEV
+
+
+def reference_ema(close: pd.Series, length: int) -> pd.Series:
+    # pandas_ta.ema with sma=True and adjust=False
+    close = close.copy()
+    sma_nth = close[0:length].mean()
+    close[:length - 1] = np.nan
+    close.iloc[length - 1] = sma_nth
+    return close.ewm(span=length, adjust=False).mean()
+
+
+def reference_rma(close: pd.Series, length: int) -> pd.Series:
+    return close.ewm(alpha=1.0 / length, min_periods=length).mean()
+
+
+def reference_bbands(close: pd.Series, length: int, std: float) -> pd.DataFrame:
+    mid = close.rolling(length).mean()
+    deviations = std * close.rolling(length).std(ddof=0)
+    lower = mid - deviations
+    upper = mid + deviations
+    return pd.DataFrame({"lower": lower, "mid": mid, "upper": upper,
+                         "bandwidth": 100 * (upper - lower) / mid, "percent": (close - lower) / (upper - lower)})
+
+
+def reference_macd(close: pd.Series, fast: int, slow: int, signal: int) -> pd.DataFrame:
+    macd = reference_ema(close, fast) - reference_ema(close, slow)
+    signal_ma = reference_ema(macd.loc[macd.first_valid_index():], signal)
+    return pd.DataFrame({"macd": macd, "histogram": macd - signal_ma, "signal": signal_ma})
+
+
+def reference_rsi(close: pd.Series, length: int) -> pd.Series:
+    negative = close.diff()
+    positive = negative.copy()
+    positive[positive < 0] = 0
+    negative[negative > 0] = 0
+    positive_avg = reference_rma(positive, length)
+    negative_avg = reference_rma(negative, length)
+    return 100 * positive_avg / (positive_avg + negative_avg.abs())
+
+
+def reference_natr(high: pd.Series, low: pd.Series, close: pd.Series, length: int) -> pd.Series:
+    previous_close = close.shift(1)
+    true_range = pd.concat([high - low, high - previous_close, previous_close - low], axis=1).abs().max(axis=1)
+    true_range.iloc[:1] = np.nan
+    return 100 / close * reference_ema(true_range, length)
+
+
+class StreamingIndicatorsTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        rng = np.random.default_rng(42)
+        close = 30000 + np.cumsum(rng.normal(0, 20, 600))
+        cls.candles = pd.DataFrame({
+            "close": close,
+            "high": close + rng.uniform(0, 30, 600),
+            "low": close - rng.uniform(0, 30, 600),
+        })
+
+    def stream(self, indicator, columns=("close",), updates_per_candle: int = 3) -> np.ndarray:
+        """
+        Feeds the candles one at a time, updating each one a few times with intermediate values before its final one.
+        """
+        values = []
+        rows = self.candles[list(columns)].to_numpy()
+        for row in rows:
+            indicator.add(*(row * 0.999))
+            for i in range(1, updates_per_candle):
+                indicator.update_last(*(row * (1 + 0.001 * i)))
+            indicator.update_last(*row)
+            values.append(indicator.values)
+        return np.array(values)
+
+    def assert_matches(self, expected, actual):
+        np.testing.assert_allclose(np.asarray(expected, dtype=float), actual, rtol=1e-9, atol=1e-9)
+
+    def test_sma_and_stdev(self):
+        close = self.candles["close"]
+        self.assert_matches(close.rolling(20).mean().to_numpy()[:, None], self.stream(SMA(20)))
+        self.assert_matches(close.rolling(20).std().to_numpy()[:, None], self.stream(STDEV(20)))
+        self.assertEqual(["SMA_20"], SMA(20).columns)
+
+    def test_ema(self):
+        self.assert_matches(reference_ema(self.candles["close"], 21).to_numpy()[:, None], self.stream(EMA(21)))
+
+    def test_bbands(self):
+        indicator = BBANDS(length=100, std=2)
+
+        self.assert_matches(reference_bbands(self.candles["close"], 100, 2.0).to_numpy(), self.stream(indicator))
+        self.assertEqual(["BBL_100_2.0", "BBM_100_2.0", "BBU_100_2.0", "BBB_100_2.0", "BBP_100_2.0"], indicator.columns)
+
+    def test_macd(self):
+        indicator = MACD(fast=12, slow=26, signal=9)
+
+        self.assert_matches(reference_macd(self.candles["close"], 12, 26, 9).to_numpy(), self.stream(indicator))
+        self.assertEqual(["MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9"], indicator.columns)
+
+    def test_rsi(self):
+        self.assert_matches(reference_rsi(self.candles["close"], 14).to_numpy()[:, None], self.stream(RSI(14)))
+
+    def test_natr(self):
+        expected = reference_natr(self.candles["high"], self.candles["low"], self.candles["close"], 14)
+
+        self.assert_matches(expected.to_numpy()[:, None], self.stream(NATR(14), columns=("high", "low", "close")))
+
+    def test_reset(self):
+        indicator = MACD()
+        self.stream(indicator)
+
+        indicator.reset()
+
+        self.assert_matches(reference_macd(self.candles["close"], 12, 26, 9).to_numpy(), self.stream(indicator))
+
+    def test_update_last_requires_a_candle(self):
+        with self.assertRaises(ValueError):
+            SMA(5).update_last(1.0)
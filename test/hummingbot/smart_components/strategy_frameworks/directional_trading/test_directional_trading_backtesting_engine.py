@@ -94,3 +94,17 @@ class TestDirectionalTradingBacktestingEngine(unittest.TestCase):
         backtesting_results = engine.run_backtesting()
         executors_df = backtesting_results["executors_df"]
         self.assertEqual(2, len(executors_df))
+
+    def test_filter_by_cooldown(self):
+        open_times = pd.to_datetime([0, 60, 120, 180, 240, 300, 360], unit="s")
+        close_times = pd.Series(open_times + pd.Timedelta(seconds=90))
+
+        positions = DirectionalTradingBacktestingEngine.filter_by_cooldown(
+            open_times, close_times, last_close_time=pd.Timestamp.min, cooldown_time=30)
+
+        # Each executor closes after 90 seconds and the next one can be opened 30 seconds later
+        self.assertEqual([0, 2, 4, 6], positions)
+
+        positions = DirectionalTradingBacktestingEngine.filter_by_cooldown(
+            open_times, close_times, last_close_time=open_times[3], cooldown_time=0)
+        self.assertEqual([3, 5], positions)
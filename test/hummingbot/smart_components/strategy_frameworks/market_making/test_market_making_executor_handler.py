@@ -2,7 +2,8 @@ from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import MagicMock, patch
 
-from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.smart_components.executors.position_executor.data_types import (
     PositionExecutorStatus,
     TrailingStop,
@@ -22,6 +23,9 @@ class TestMarketMakingExecutorHandler(IsolatedAsyncioWrapperTestCase):
     def setUp(self):
         # Mocking the necessary components
         self.mock_strategy = MagicMock(spec=ScriptStrategyBase)
+        self.mock_connector = MagicMock()
+        self.mock_connector.is_amend_order_supported = False
+        self.mock_strategy.connectors = {"binance": self.mock_connector}
         self.mock_controller = MagicMock(spec=MarketMakingControllerBase)
         triple_barrier_conf = TripleBarrierConf(
             stop_loss=Decimal("0.03"), take_profit=Decimal("0.02"),
@@ -100,6 +104,7 @@ class TestMarketMakingExecutorHandler(IsolatedAsyncioWrapperTestCase):
         self.mock_controller.all_candles_ready = True
         mock_executor = MagicMock()
         mock_executor.is_closed = False
+        mock_executor.exchange = "binance"
         mock_executor.executor_status = PositionExecutorStatus.NOT_STARTED
         self.handler.position_executors["BUY_1"] = mock_executor
         self.handler.position_executors["SELL_1"] = mock_executor
@@ -107,6 +112,37 @@ class TestMarketMakingExecutorHandler(IsolatedAsyncioWrapperTestCase):
 
         await self.handler.control_task()
         mock_executor.early_stop.assert_called()
+        mock_executor.amend_open_order.assert_not_called()
+
+    @patch("hummingbot.smart_components.strategy_frameworks.executor_handler_base.ExecutorHandlerBase.create_position_executor")
+    async def test_control_task_executor_not_started_refresh_order_with_amend(self, _):
+        self.mock_connector.is_amend_order_supported = True
+        self.mock_controller.all_candles_ready = True
+        mock_executor = MagicMock()
+        mock_executor.is_closed = False
+        mock_executor.exchange = "binance"
+        mock_executor.side = TradeType.BUY
+        mock_executor.open_order_type = OrderType.LIMIT
+        mock_executor.executor_status = PositionExecutorStatus.NOT_STARTED
+        mock_executor.open_order.order = InFlightOrder(
+            client_order_id="OID-1", trading_pair="BTC-USDT", order_type=OrderType.LIMIT, trade_type=TradeType.BUY,
+            amount=Decimal("1"), creation_timestamp=1, price=Decimal("100"), initial_state=OrderState.OPEN)
+        position_config = MagicMock()
+        position_config.side = TradeType.BUY
+        position_config.open_order_type = OrderType.LIMIT
+        self.mock_controller.get_position_config.return_value = position_config
+        self.handler.position_executors["BUY_1"] = mock_executor
+        self.mock_controller.refresh_order_condition.return_value = True
+
+        await self.handler.control_task()
+        mock_executor.amend_open_order.assert_called_once_with(position_config)
+        mock_executor.early_stop.assert_not_called()
+
+        # A partially filled order is refreshed by stopping the executor
+        mock_executor.open_order.order.executed_amount_base = Decimal("0.5")
+        await self.handler.control_task()
+        mock_executor.amend_open_order.assert_called_once()
+        mock_executor.early_stop.assert_called_once()
 
     @patch("hummingbot.smart_components.strategy_frameworks.executor_handler_base.ExecutorHandlerBase.create_position_executor")
     async def test_control_task_no_executor(self, mock_create_executor):
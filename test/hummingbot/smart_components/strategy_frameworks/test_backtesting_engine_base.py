@@ -2,6 +2,7 @@ import unittest
 from datetime import datetime, timezone
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.smart_components.strategy_frameworks.backtesting_engine_base import BacktestingEngineBase
@@ -36,6 +37,48 @@ class TestBacktestingEngineBase(unittest.TestCase):
         self.assertEqual(df["timestamp"].min(), pd.Timestamp("2021-01-02"))
         self.assertEqual(df["timestamp"].max(), pd.Timestamp("2021-01-04"))
 
+    def test_apply_tp_sl_on_tl(self):
+        df = pd.DataFrame({
+            "timestamp": [i * 60000 for i in range(6)],
+            "close": [100, 102, 98, 101, 97, 104],
+            "signal": [1, -1, 0, 1, 0, 0],
+            "target": [0.01] * 6,
+        })
+        df.index = pd.to_datetime(df["timestamp"], unit="ms")
+        df["tl"] = df.index + pd.Timedelta(minutes=2)
+
+        df = self.backtesting_engine.apply_tp_sl_on_tl(df, tp=1.5, sl=1.0)
+
+        self.assertEqual(df.index[1], df["take_profit_time"].iloc[0])
+        self.assertEqual(df.index[2], df["stop_loss_time"].iloc[0])
+        self.assertEqual(["tp", "tp", "tl", "sl", "tl", "tl"], df["close_type"].tolist())
+        self.assertEqual([df.index[1], df.index[2], df.index[4], df.index[4], df.index[4] + pd.Timedelta(minutes=2),
+                          df.index[5] + pd.Timedelta(minutes=2)], df["close_time"].tolist())
+        # Both barriers are reported even if the position was closed by the other one before
+        self.assertEqual(df.index[5], df["take_profit_time"].iloc[3])
+        self.assertTrue(df["take_profit_time"].iloc[[2, 4, 5]].isna().all())
+
+    def test_get_barrier_hits_matches_a_loop_over_the_events(self):
+        rng = np.random.default_rng(3)
+        close = 100 + np.cumsum(rng.normal(0, 0.5, 500))
+        starts = np.sort(rng.choice(500, 100, replace=False))
+        ends = np.minimum(starts + rng.integers(0, 60, 100), 499)
+        signal = rng.choice([-1, 1], 100)
+        take_profit = rng.uniform(0.001, 0.02, 100)
+        stop_loss = -rng.uniform(0.001, 0.02, 100)
+
+        take_profit_positions, stop_loss_positions = self.backtesting_engine.get_barrier_hits(
+            close, signal, starts, ends, take_profit, stop_loss, max_block_size=64)
+
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            returns = (close[start:end + 1] / close[start] - 1) * signal[i]
+            expected_take_profit = np.flatnonzero(returns > take_profit[i])
+            expected_stop_loss = np.flatnonzero(returns < stop_loss[i])
+            self.assertEqual(start + expected_take_profit[0] if len(expected_take_profit) else -1,
+                             take_profit_positions[i])
+            self.assertEqual(start + expected_stop_loss[0] if len(expected_stop_loss) else -1,
+                             stop_loss_positions[i])
+
     def test_summarize_results(self):
         initial_date = datetime(2023, 3, 16, 0, 0, tzinfo=timezone.utc)
         initial_timestamp = int(initial_date.timestamp())
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.smart_components.controllers.bollinger_v1 import BollingerV1, BollingerV1Config
+from hummingbot.smart_components.executors.position_executor.data_types import TripleBarrierConf
+from hummingbot.smart_components.order_level_distributions.order_level_builder import OrderLevel
+from hummingbot.smart_components.strategy_frameworks.backtesting_sweep import BacktestingSweep
+from hummingbot.smart_components.strategy_frameworks.directional_trading import DirectionalTradingBacktestingEngine
+
+
+class TestBacktestingSweep(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = self.temp_dir.name
+        self.results_path = os.path.join(self.data_path, "results.csv")
+        rng = np.random.default_rng(5)
+        close = 30000 + np.cumsum(rng.normal(0, 30, 2000))
+        candles = pd.DataFrame({column: 1.0 for column in CandlesBase.columns}, index=range(2000))
+        candles["timestamp"] = 1672531200000 + np.arange(2000) * 60000
+        candles["open"] = candles["close"] = close
+        candles["high"] = close + 10
+        candles["low"] = close - 10
+        candles.to_csv(os.path.join(self.data_path, "candles_binance_perpetual_BTC-USDT_1m.csv"), index=False)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def get_config(bb_length: int) -> BollingerV1Config:
+        return BollingerV1Config(
+            exchange="binance_perpetual",
+            trading_pair="BTC-USDT",
+            bb_length=bb_length,
+            order_levels=[
+                OrderLevel(level=0, side=side, order_amount_usd=Decimal("10"), cooldown_time=300,
+                           triple_barrier_conf=TripleBarrierConf(take_profit=Decimal("0.01"),
+                                                                 stop_loss=Decimal("0.005"),
+                                                                 time_limit=3600))
+                for side in (TradeType.BUY, TradeType.SELL)
+            ],
+            candles_config=[CandlesConfig(connector="binance_perpetual", trading_pair="BTC-USDT", interval="1m",
+                                          max_records=5000)],
+        )
+
+    def get_sweep(self, configs) -> BacktestingSweep:
+        return BacktestingSweep(controller_class=BollingerV1,
+                                engine_class=DirectionalTradingBacktestingEngine,
+                                configs=configs,
+                                results_path=self.results_path,
+                                data_path=self.data_path,
+                                max_workers=2)
+
+    def test_config_hash_ignores_the_id(self):
+        self.assertEqual(BacktestingSweep.config_hash(self.get_config(20)),
+                         BacktestingSweep.config_hash(self.get_config(20)))
+        self.assertNotEqual(BacktestingSweep.config_hash(self.get_config(20)),
+                            BacktestingSweep.config_hash(self.get_config(30)))
+
+    def test_run_matches_sequential_backtesting(self):
+        configs = [self.get_config(bb_length) for bb_length in (20, 50, 100)]
+
+        results = self.get_sweep(configs).run()
+
+        self.assertEqual(3, len(results))
+        for config in configs:
+            engine = DirectionalTradingBacktestingEngine(BollingerV1(config))
+            engine.load_controller_data(self.data_path)
+            expected = engine.run_backtesting()["results"]
+            row = results[results["config_hash"] == BacktestingSweep.config_hash(config)].iloc[0]
+            self.assertEqual(expected["total_executors"], row["total_executors"])
+            self.assertAlmostEqual(expected["net_pnl_quote"], row["net_pnl_quote"])
+            for close_type, count in expected["close_types"].items():
+                self.assertEqual(count, row[f"close_types_{close_type}"])
+
+    def test_run_resumes_from_the_results_file(self):
+        configs = [self.get_config(bb_length) for bb_length in (20, 50, 100)]
+        first_rows = list(self.get_sweep(configs[:2]).iter_results())
+
+        sweep = self.get_sweep(configs)
+
+        self.assertEqual([BacktestingSweep.config_hash(configs[2])], sweep.pending_config_hashes())
+        rows = list(sweep.iter_results())
+        self.assertEqual(1, len(rows))
+        self.assertEqual(2, len(first_rows))
+        self.assertEqual(3, len(sweep.run()))
+        self.assertEqual([], sweep.pending_config_hashes())
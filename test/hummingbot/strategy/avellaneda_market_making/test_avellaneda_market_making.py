@@ -19,6 +19,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TradeFeeSchema
+from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     MarketEvent,
@@ -46,6 +47,20 @@ s_decimal_nan = Decimal("NaN")
 s_decimal_neg_one = Decimal(-1)
 
 
+class AmendableMockPaperExchange(MockPaperExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.amended_orders = []
+
+    @property
+    def is_amend_order_supported(self) -> bool:
+        return True
+
+    def amend_order(self, trading_pair: str, client_order_id: str, price: Decimal, amount: Decimal):
+        self.amended_orders.append((client_order_id, price, amount))
+        return client_order_id
+
+
 class AvellanedaMarketMakingUnitTests(unittest.TestCase):
 
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
@@ -1365,6 +1380,66 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
 
         self.assertEqual(0, len(self.strategy.active_orders))
 
+    def create_amending_strategy(self) -> Tuple[AvellanedaMarketMakingStrategy, AmendableMockPaperExchange]:
+        market = AmendableMockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=self.initial_mid_price, min_price=1,
+                                       max_price=200, price_step_size=1, volume_step_size=10)
+        market.set_balance("COINALPHA", 1)
+        market.set_balance("HBOT", 500)
+        market.set_quantization_param(QuantizationParams(self.trading_pair.split("-")[0], 6, 6, 6, 6))
+        market_info = MarketTradingPairTuple(market, self.trading_pair, *self.trading_pair.split("-"))
+        strategy = AvellanedaMarketMakingStrategy()
+        strategy.init_params(config_map=self.config_map, market_info=market_info)
+        self.clock.add_iterator(market)
+        self.clock.add_iterator(strategy)
+        strategy.start(self.clock, self.start_timestamp)
+        self.addCleanup(strategy.stop, self.clock)
+        return strategy, market
+
+    def test_active_orders_are_amended_on_refresh_when_supported(self):
+        strategy, market = self.create_amending_strategy()
+        market_info = strategy.market_info
+        cancel_order_logger = EventLogger()
+        market.add_listener(MarketEvent.OrderCancelled, cancel_order_logger)
+        buy_id = self.simulate_place_limit_order(strategy, market_info, LimitOrder(
+            "", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("99.5"), self.order_amount))
+        sell_id = self.simulate_place_limit_order(strategy, market_info, LimitOrder(
+            "", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("101.5"), self.order_amount))
+        self.config_map.order_refresh_tolerance_pct = Decimal("0")
+        self.clock.backtest_til(strategy.current_timestamp + strategy.order_refresh_time + 1)
+
+        proposal = Proposal([PriceSize(Decimal("98.5"), Decimal("8"))], [PriceSize(Decimal("101.5"), Decimal("9"))])
+        strategy.cancel_active_orders(proposal)
+
+        self.assertEqual(0, len(cancel_order_logger.event_log))
+        self.assertEqual([(buy_id, Decimal("98.5"), Decimal("8")), (sell_id, Decimal("101.5"), Decimal("9"))],
+                         market.amended_orders)
+        self.assertEqual([(buy_id, Decimal("98.5"), Decimal("8"))],
+                         [(o.client_order_id, o.price, o.quantity) for o in strategy.active_buys])
+        self.assertEqual([(sell_id, Decimal("101.5"), Decimal("9"))],
+                         [(o.client_order_id, o.price, o.quantity) for o in strategy.active_sells])
+        # The refresh timers are restarted, so the amended orders are not refreshed again before the next cycle
+        strategy.cancel_active_orders(
+            Proposal([PriceSize(Decimal("97.5"), Decimal("8"))], [PriceSize(Decimal("102.5"), Decimal("9"))]))
+        self.assertEqual(2, len(market.amended_orders))
+
+    def test_active_orders_are_canceled_on_refresh_when_the_levels_change(self):
+        strategy, market = self.create_amending_strategy()
+        market_info = strategy.market_info
+        self.simulate_place_limit_order(strategy, market_info, LimitOrder(
+            "", self.trading_pair, True, self.base_asset, self.quote_asset, Decimal("99.5"), self.order_amount))
+        self.simulate_place_limit_order(strategy, market_info, LimitOrder(
+            "", self.trading_pair, False, self.base_asset, self.quote_asset, Decimal("101.5"), self.order_amount))
+        self.config_map.order_refresh_tolerance_pct = Decimal("0")
+        self.clock.backtest_til(strategy.current_timestamp + strategy.order_refresh_time + 1)
+
+        proposal = Proposal([PriceSize(Decimal("98.5"), Decimal("8")), PriceSize(Decimal("97.5"), Decimal("8"))],
+                            [PriceSize(Decimal("101.5"), Decimal("9"))])
+        strategy.cancel_active_orders(proposal)
+
+        self.assertEqual([], market.amended_orders)
+        self.assertEqual(0, len(strategy.active_orders))
+
     def test_to_create_orders(self):
         # Simulate order being placed. Placing an order updates create_timestamp = next_cycle
         limit_buy_order: LimitOrder = LimitOrder(client_order_id="test",
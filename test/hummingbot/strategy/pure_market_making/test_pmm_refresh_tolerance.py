@@ -20,6 +20,20 @@ from hummingbot.strategy.pure_market_making.pure_market_making import PureMarket
 logging.basicConfig(level=logging.ERROR)
 
 
+class AmendableMockPaperExchange(MockPaperExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.amended_orders = []
+
+    @property
+    def is_amend_order_supported(self) -> bool:
+        return True
+
+    def amend_order(self, trading_pair: str, client_order_id: str, price: Decimal, amount: Decimal):
+        self.amended_orders.append((client_order_id, price, amount))
+        return client_order_id
+
+
 class PMMRefreshToleranceUnitTest(unittest.TestCase):
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
     end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
@@ -174,6 +188,50 @@ class PMMRefreshToleranceUnitTest(unittest.TestCase):
         self.assertNotEqual([o.client_order_id for o in old_sells], [o.client_order_id for o in new_sells])
         self.assertNotEqual([o.client_order_id for o in old_buys], [o.client_order_id for o in new_buys])
 
+    def test_multi_levels_active_orders_are_amended_when_mid_price_moves(self):
+        market = AmendableMockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=self.mid_price, min_price=1,
+                                       max_price=200, price_step_size=1, volume_step_size=10)
+        market.set_balance("HBOT", 500)
+        market.set_balance("ETH", 5000)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock.add_iterator(market)
+        cancel_order_logger = EventLogger()
+        market.add_listener(MarketEvent.OrderCancelled, cancel_order_logger)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_levels=5,
+            order_level_spread=Decimal("0.01"),
+            order_refresh_time=4,
+            filled_order_delay=8,
+            order_refresh_tolerance_pct=0
+        )
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        old_buys = strategy.active_buys
+        old_sells = strategy.active_sells
+        market.order_books[self.trading_pair].apply_diffs([OrderBookRow(99.5, 30, 2)],
+                                                          [OrderBookRow(100.1, 30, 2)], 2)
+        self.clock.backtest_til(self.start_timestamp + 6 * self.clock_tick_size)
+
+        new_buys = strategy.active_buys
+        new_sells = strategy.active_sells
+        self.assertEqual(0, len(cancel_order_logger.event_log))
+        self.assertEqual(10, len(market.amended_orders))
+        self.assertEqual([o.client_order_id for o in old_buys], [o.client_order_id for o in new_buys])
+        self.assertEqual([o.client_order_id for o in old_sells], [o.client_order_id for o in new_sells])
+        self.assertEqual([o.creation_timestamp for o in old_buys], [o.creation_timestamp for o in new_buys])
+        for old_order, new_order in zip(old_buys + old_sells, new_buys + new_sells):
+            self.assertLess(new_order.price, old_order.price)
+            self.assertIn((new_order.client_order_id, new_order.price, new_order.quantity), market.amended_orders)
+        # The amended orders are refreshed again in the next cycle, not before
+        self.clock.backtest_til(self.start_timestamp + 9 * self.clock_tick_size)
+        self.assertEqual(10, len(market.amended_orders))
+
     def test_multiple_active_orders_are_kept_when_within_tolerance(self):
         strategy = self.multi_levels_strategy
         self.clock.add_iterator(strategy)
@@ -107,3 +107,22 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_get_first_value_and_size(self):
+        buffer = RingBuffer(3)
+        self.assertTrue(np.isnan(buffer.get_first_value()))
+        self.assertEqual(0, buffer.size)
+
+        for i in range(5):
+            buffer.add_value(i)
+            self.assertEqual(buffer.get_as_numpy_array()[0], buffer.get_first_value())
+            self.assertEqual(min(i + 1, 3), buffer.size)
+
+    def test_numpy_array_of_long_buffer(self):
+        length = 40000
+        buffer = RingBuffer(length)
+
+        for i in range(length + 10):
+            buffer.add_value(i)
+
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.arange(10, length + 10)))
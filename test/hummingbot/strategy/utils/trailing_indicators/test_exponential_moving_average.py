@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_processing_length_should_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(30, 2)
+
+    def test_ema_matches_the_pandas_ewm_of_the_sampling_buffer(self):
+        samples = np.random.normal(100, 10, 100)
+        indicator = ExponentialMovingAverageIndicator(30)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            buffer = indicator._sampling_buffer.get_as_numpy_array()
+            expected = pd.Series(buffer).ewm(span=indicator.sampling_length, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 4)
+            if i == 50:
+                indicator.sampling_length = 20
@@ -66,3 +66,15 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_incremental_volatility_matches_the_whole_buffer(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 100)))
+        indicator = HistoricalVolatilityIndicator(30, 1)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            buffer = indicator._sampling_buffer.get_as_numpy_array()
+            expected = np.sqrt(np.var(np.diff(np.log(buffer)))) if buffer.size > 1 else 0
+            self.assertAlmostEqual(expected, indicator.current_value, 8)
+            if i == 50:
+                indicator.sampling_length = 20
@@ -20,3 +20,15 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_incremental_volatility_matches_the_whole_buffer(self):
+        samples = np.random.normal(100, 10, 100)
+        indicator = InstantVolatilityIndicator(30, 1)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            buffer = indicator._sampling_buffer.get_as_numpy_array()
+            expected = np.sqrt(np.sum(np.square(np.diff(buffer))) / buffer.size)
+            self.assertAlmostEqual(expected, indicator.current_value, 4)
+            if i == 50:
+                indicator.sampling_length = 20
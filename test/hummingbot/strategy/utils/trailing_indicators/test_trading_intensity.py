@@ -4,6 +4,7 @@ from decimal import Decimal
 
 import numpy as np
 import pandas as pd
+from scipy.optimize import curve_fit
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -224,8 +225,19 @@ class TradingIntensityTest(unittest.TestCase):
             self.indicator.last_quotes = [{"timestamp": timestamp, "price": mid}] + self.indicator.last_quotes
             timestamp += 1
 
-        self.assertAlmostEqual(self.indicator.current_value[0], 1.0032422566402444, 4)
-        self.assertAlmostEqual(self.indicator.current_value[1], 0.0001595577045670909, 4)
+        self.assertAlmostEqual(self.indicator.current_value[0], 1.0034590783173871, 4)
+        self.assertAlmostEqual(self.indicator.current_value[1], 0.0001538137795166053, 4)
+
+        # The log-linear fit is comparable with the least squares fit of the exponential over the same price levels
+        price_levels = self.indicator.price_levels
+        (alpha, kappa), _ = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                                      list(price_levels.keys()),
+                                      list(price_levels.values()),
+                                      p0=(0, 0),
+                                      method="dogbox",
+                                      bounds=([0, 0], [np.inf, np.inf]))
+        self.assertAlmostEqual(alpha, self.indicator.current_value[0], 3)
+        self.assertAlmostEqual(kappa, self.indicator.current_value[1], 4)
 
     def test_calculate_trading_intensity_deterministic(self):
         def curve_fn(t_, a_, b_):  # see curve fit in `TradingIntensityIndicator.c_estimate_intensity`
@@ -259,3 +271,25 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_trades_leave_the_price_levels_with_their_sample(self):
+        timestamp = self.start_timestamp
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        for price in (2, 3, 2):
+            timestamp += 1
+            trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=price,
+                amount=1,
+                type=TradeType.SELL,
+            ))
+            trading_intensity_indicator.calculate(timestamp)
+            trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        # Only the trades of the last two samples, at 3 and 2, are in the sampling window
+        self.assertEqual({1: 1, 2: 1}, trading_intensity_indicator.price_levels)
+        self.assertTrue(trading_intensity_indicator.is_sampling_buffer_full)
+        self.assertAlmostEqual(0, trading_intensity_indicator.current_value[1], 10)